@@ -1,4 +1,5 @@
 import asyncio
+import base64
 import json
 import os
 import sys
@@ -6,15 +7,17 @@ import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import psutil
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.websockets import WebSocketState
 
+from chart_series import ChartSeriesStore
+from response_cache import ResponseCache
 from supabase import Client, create_client
 
 # Load .env file from the project root
@@ -33,6 +36,15 @@ supabase: Client = create_client(supabase_url, supabase_key)
 CHART_CACHE_DIR = Path("/tmp/charts")
 CHART_CACHE_DIR.mkdir(exist_ok=True)
 
+# Chart file -> (table, date columns counted per day)
+CHART_SERIES = {
+    "dioceses_records_over_time.png": ("Dioceses", ["extracted_at"]),
+    "diocesesparishdirectory_records_over_time.png": ("DiocesesParishDirectory", ["created_at"]),
+    "parishes_records_over_time.png": ("Parishes", ["extracted_at"]),
+    "parishdata_records_over_time.png": ("ParishData", ["created_at"]),
+}
+chart_series_store = ChartSeriesStore(CHART_CACHE_DIR / "chart_series.json")
+
 # Chart generation lock to prevent concurrent generation
 import threading
 
@@ -534,14 +546,6 @@ origins = [
     "http://localhost:5173",  # Vite development server
 ]
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
 SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
 
@@ -551,6 +555,58 @@ if not SUPABASE_URL or not SUPABASE_KEY:
 
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
+# Read API response cache: (path pattern, TTL seconds). Data only changes when the
+# pipeline writes, which invalidates the cache, so TTLs just bound staleness.
+RESPONSE_CACHE_TTLS = [
+    (r"^/api/summary$", 30),
+    (r"^/api/dioceses(/\d+(/parishes)?)?$", 300),
+    (r"^/api/parishes$", 120),
+    (r"^/api/parish$", 120),
+]
+response_cache = ResponseCache(RESPONSE_CACHE_TTLS, max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512")))
+
+
+@app.middleware("http")
+async def cache_read_responses(request: Request, call_next):
+    """Serve cached read API responses with ETag revalidation."""
+    ttl = response_cache.ttl_for(request.url.path) if request.method == "GET" else None
+    if ttl is None:
+        return await call_next(request)
+
+    key = response_cache.make_key(request.url.path, request.query_params.multi_items())
+    entry = response_cache.get(key)
+    cache_status = "HIT"
+
+    if entry is None:
+        cache_status = "MISS"
+        generation = response_cache.generation
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        # Endpoints report failures as {"error": ...} with a 200 status; never cache those
+        if body.startswith(b'{"error"'):
+            return Response(content=body, status_code=200, media_type=response.media_type or "application/json")
+        entry = response_cache.set(key, body, ttl, generation=generation)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache", "X-Cache": cache_status}
+    if response_cache.etag_matches(request.headers.get("if-none-match"), entry.etag):
+        response_cache.stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+
+
+# Added after the response cache so CORS is the outermost middleware and also
+# decorates cached and rebuilt responses
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
 
 @app.get("/api")
 def read_root():
@@ -563,30 +619,14 @@ async def get_summary():
     Provides a summary of dioceses and their parish directory URLs.
     """
     try:
-        # Dioceses summary
-        total_dioceses_response = supabase.table("Dioceses").select("count", count="exact").execute()
-        total_dioceses_processed = total_dioceses_response.count
+        summary = supabase.table("extraction_summary").select("*").execute().data[0]
 
-        dir_response = supabase.table("DiocesesParishDirectory").select("diocese_id").execute()
-        dir_data = dir_response.data
-        dioceses_with_parish_directories_found = len(set(item["diocese_id"] for item in dir_data))
+        total_dioceses_processed = summary["total_dioceses_processed"]
+        dioceses_with_parish_directories_found = summary["found_parish_directories"]
         dioceses_without_parish_directories_found = total_dioceses_processed - dioceses_with_parish_directories_found
 
-        # Parishes summary
-        parishes_count_response = supabase.table("Parishes").select("count", count="exact").execute()
-        parishes_extracted = parishes_count_response.count
-
-        parish_data_response = supabase.table("ParishData").select("parish_id, fact_value").execute()
-        parish_data = parish_data_response.data
-
-        parishes_with_data_extracted = len(
-            set(
-                item["parish_id"]
-                for item in parish_data
-                if item["fact_value"] and item["fact_value"] != "Information not found"
-            )
-        )
-
+        parishes_extracted = summary["parishes_extracted"]
+        parishes_with_data_extracted = summary["parishes_with_data_extracted"]
         parishes_with_data_not_extracted = parishes_extracted - parishes_with_data_extracted
 
         return {
@@ -652,26 +692,12 @@ def get_dioceses(
             for item in all_dir_response.data
         }
 
-        parishes_response = supabase.table("Parishes").select("id, diocese_url").execute()
-        parishes_map = {p["id"]: p["diocese_url"] for p in parishes_response.data}
-        parish_counts = {}
-        for parish in parishes_response.data:
-            url = parish["diocese_url"]
-            parish_counts[url] = parish_counts.get(url, 0) + 1
-
-        parish_data_response = supabase.table("ParishData").select("parish_id, fact_value").execute()
-        parishes_with_data = {
-            item["parish_id"]
-            for item in parish_data_response.data
-            if item["fact_value"] and item["fact_value"] != "Information not found"
+        counts_response = supabase.table("diocese_parish_counts").select("*").execute()
+        parish_counts = {row["diocese_url"]: row["parishes_in_db_count"] for row in counts_response.data}
+        parishes_with_data_extracted_counts = {
+            row["diocese_url"]: row["parishes_with_data_extracted_count"] for row in counts_response.data
         }
 
-        parishes_with_data_extracted_counts = {}
-        for parish_id in parishes_with_data:
-            if parish_id in parishes_map:
-                diocese_url = parishes_map[parish_id]
-                parishes_with_data_extracted_counts[diocese_url] = parishes_with_data_extracted_counts.get(diocese_url, 0) + 1
-
         for diocese in dioceses:
             diocese["parish_directory_url"] = dir_url_map.get(diocese["id"])
             diocese["parishes_in_db_count"] = parish_counts.get(diocese["Website"], 0)
@@ -717,6 +743,144 @@ def get_diocese(diocese_id: int):
         return {"error": str(e)}
 
 
+# Parish listing helpers: filtering, sorting and keyset pagination run in Postgres
+# against the parishes_with_extraction_status view.
+PARISH_SORT_COLUMNS = {
+    "Name": "Name",
+    "DioceseName": "diocese_name",
+    "Web": "Web",
+    "Website": "Web",
+    "is_blocked": "is_blocked",
+    "data_extracted": "data_extracted",
+}
+
+
+def _parse_bool_filter(value: Optional[str]) -> Optional[bool]:
+    """Interpret a 'true'/'false' query parameter; anything else means no filter."""
+    if not value:
+        return None
+    if value.lower() == "true":
+        return True
+    if value.lower() == "false":
+        return False
+    return None
+
+
+def _encode_cursor(sort_value, parish_id: int) -> str:
+    """Opaque keyset cursor for the row after which the next page starts."""
+    payload = json.dumps({"v": sort_value, "id": parish_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[object, int]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return payload["v"], int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _postgrest_value(value) -> str:
+    """Format a value for use inside a PostgREST logical filter."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _keyset_filter(column: str, sort_value, last_id: int, descending: bool) -> str:
+    """PostgREST or-filter for rows after (sort_value, last_id) in ORDER BY column NULLS LAST, id."""
+    if sort_value is None:
+        return f"and({column}.is.null,id.gt.{last_id})"
+    value = _postgrest_value(sort_value)
+    operator = "lt" if descending else "gt"
+    return f"{column}.{operator}.{value},and({column}.eq.{value},id.gt.{last_id}),{column}.is.null"
+
+
+def _query_parishes(
+    diocese_id: Optional[int],
+    page: int,
+    page_size: int,
+    sort_by: str,
+    sort_order: str,
+    cursor: Optional[str],
+    filter_name: Optional[str],
+    filter_website: Optional[str],
+    filter_data_extracted: Optional[str],
+    filter_data_available: Optional[str],
+    filter_blocked: Optional[str],
+    filter_diocese_name: Optional[str],
+) -> Tuple[List[Dict], Optional[int], Optional[str]]:
+    """
+    Run a filtered, sorted, paginated parish listing query.
+
+    Uses keyset pagination when a cursor is given (total count is then not
+    recomputed and returned as None), otherwise offset pagination by page.
+
+    Returns:
+        Tuple of (parishes, total_count, next_cursor)
+    """
+    query = supabase.table("parishes_with_extraction_status").select("*", count=None if cursor else "exact")
+    if diocese_id is not None:
+        query = query.eq("diocese_id", diocese_id)
+
+    # Apply filters
+    if filter_name:
+        query = query.ilike("Name", f"%{filter_name}%")
+    if filter_diocese_name:
+        query = query.ilike("diocese_name", f"%{filter_diocese_name}%")
+    if filter_website:
+        query = query.ilike("Web", f"%{filter_website}%")  # Use 'Web' for website column
+
+    is_blocked = _parse_bool_filter(filter_blocked)
+    if is_blocked is not None:
+        query = query.eq("is_blocked", is_blocked)
+
+    data_extracted = _parse_bool_filter(filter_data_extracted)
+    if data_extracted is None:
+        data_extracted = _parse_bool_filter(filter_data_available)
+    if data_extracted is not None:
+        query = query.eq("data_extracted", data_extracted)
+
+    # Apply sorting with id as a stable tie-breaker, then pagination
+    column = PARISH_SORT_COLUMNS.get(sort_by, "Name")
+    descending = sort_order.lower() == "desc"
+    query = query.order(column, desc=descending, nullsfirst=False).order("id")
+
+    if cursor:
+        sort_value, last_id = _decode_cursor(cursor)
+        query = query.or_(_keyset_filter(column, sort_value, last_id, descending)).limit(page_size)
+    else:
+        offset = (page - 1) * page_size
+        query = query.range(offset, offset + page_size - 1)
+
+    response = query.execute()
+    parishes = response.data
+
+    next_cursor = None
+    if len(parishes) == page_size:
+        next_cursor = _encode_cursor(parishes[-1].get(column), parishes[-1]["id"])
+
+    return parishes, response.count, next_cursor
+
+
+def _add_parish_display_fields(parish: Dict):
+    """Map database column names to frontend expectations and default blocking fields."""
+    if "Web" in parish:
+        parish["Website"] = parish["Web"]
+
+    # Ensure blocking detection fields are present
+    parish["is_blocked"] = parish.get("is_blocked", False)
+    parish["blocking_type"] = parish.get("blocking_type")
+    parish["blocking_evidence"] = parish.get("blocking_evidence", {})
+    parish["status_code"] = parish.get("status_code")
+    parish["robots_txt_check"] = parish.get("robots_txt_check", {})
+    parish["respectful_automation_used"] = parish.get("respectful_automation_used", False)
+    parish["status_description"] = parish.get("status_description", "Not tested")
+
+
 @app.get("/api/dioceses/{diocese_id}/parishes")
 def get_parishes_for_diocese(
     diocese_id: int,
@@ -730,89 +894,35 @@ def get_parishes_for_diocese(
     filter_data_available: str = None,
     filter_blocked: str = None,
     filter_diocese_name: str = None,
+    cursor: str = None,
 ):
     """
     Fetches all parishes for a given diocese ID with pagination, sorting, and filtering.
+
+    Pass the returned next_cursor as cursor to fetch the following page by keyset.
     """
     try:
-        offset = (page - 1) * page_size
-
-        # First, get the diocese's website using its ID
-        diocese_response = supabase.table("Dioceses").select("Website").eq("id", diocese_id).execute()
+        diocese_response = supabase.table("Dioceses").select("id").eq("id", diocese_id).execute()
         if not diocese_response.data:
             raise HTTPException(status_code=404, detail="Diocese not found")
-        diocese_website = diocese_response.data[0]["Website"]
-
-        query = supabase.table("parishes_with_diocese_name").select("*", count="exact").eq("diocese_id", diocese_id)
 
-        # Apply filters
-        if filter_name:
-            query = query.ilike("Name", f"%{filter_name}%")
-        if filter_diocese_name:
-            query = query.ilike("diocese_name", f"%{filter_diocese_name}%")
-
-        if filter_website:
-            query = query.ilike("Web", f"%{filter_website}%")  # Use 'Web' for website column
-
-        if filter_blocked:
-            if filter_blocked.lower() == "true":
-                query = query.eq("is_blocked", True)
-            elif filter_blocked.lower() == "false":
-                query = query.eq("is_blocked", False)
-
-        # Handle data_extracted and data_available filters by pre-filtering parish IDs
-        if filter_data_extracted or filter_data_available:
-            # Get all parishes with data
-            all_parish_data_response = supabase.table("ParishData").select("parish_id, fact_value").execute()
-            parishes_with_data = {
-                item["parish_id"]
-                for item in all_parish_data_response.data
-                if item["fact_value"] and item["fact_value"] != "Information not found"
-            }
-
-            # Determine which parish IDs to filter by
-            filter_parish_ids = None
-            if filter_data_extracted:
-                if filter_data_extracted.lower() == "true":
-                    filter_parish_ids = list(parishes_with_data)
-                elif filter_data_extracted.lower() == "false":
-                    # Get all parish IDs for this diocese, then subtract those with data
-                    all_parishes_response = (
-                        supabase.table("parishes_with_diocese_name").select("id").eq("diocese_id", diocese_id).execute()
-                    )
-                    all_parish_ids = {p["id"] for p in all_parishes_response.data}
-                    filter_parish_ids = list(all_parish_ids - parishes_with_data)
-            elif filter_data_available:
-                if filter_data_available.lower() == "true":
-                    filter_parish_ids = list(parishes_with_data)
-                elif filter_data_available.lower() == "false":
-                    # Get all parish IDs for this diocese, then subtract those with data
-                    all_parishes_response = (
-                        supabase.table("parishes_with_diocese_name").select("id").eq("diocese_id", diocese_id).execute()
-                    )
-                    all_parish_ids = {p["id"] for p in all_parishes_response.data}
-                    filter_parish_ids = list(all_parish_ids - parishes_with_data)
-
-            # Apply the parish ID filter to the query
-            if filter_parish_ids is not None:
-                if len(filter_parish_ids) == 0:
-                    # No parishes match the criteria, return empty result
-                    return {"data": [], "total_count": 0, "page": page, "page_size": page_size}
-                query = query.in_("id", filter_parish_ids)
-
-        # Apply sorting and pagination
-        if sort_by == "Name":
-            query = query.order("Name", desc=sort_order.lower() == "desc")
-        elif sort_by == "DioceseName":
-            query = query.order("diocese_name", desc=sort_order.lower() == "desc")
-
-        parishes_response = query.range(offset, offset + page_size - 1).execute()
-
-        parishes = parishes_response.data
-        total_count = parishes_response.count
+        parishes, total_count, next_cursor = _query_parishes(
+            diocese_id,
+            page,
+            page_size,
+            sort_by,
+            sort_order,
+            cursor,
+            filter_name,
+            filter_website,
+            filter_data_extracted,
+            filter_data_available,
+            filter_blocked,
+            filter_diocese_name,
+        )
 
         if not parishes:
-            return {"data": [], "total_count": 0, "page": page, "page_size": page_size}
+            return {"data": [], "total_count": total_count or 0, "page": page, "page_size": page_size, "next_cursor": None}
 
         parish_ids = [parish["id"] for parish in parishes]
 
@@ -824,68 +934,29 @@ def get_parishes_for_diocese(
             .in_("fact_type", ["ReconciliationSchedule", "AdorationSchedule"])
             .execute()
         )
-        parish_data = parish_data_response.data
 
         # Create a lookup for parish facts
         parish_facts = {}
-        for fact in parish_data:
-            pid = fact["parish_id"]
-            if pid not in parish_facts:
-                parish_facts[pid] = {}
+        for fact in parish_data_response.data:
+            facts = parish_facts.setdefault(fact["parish_id"], {})
             if fact["fact_type"] == "ReconciliationSchedule":
-                parish_facts[pid]["reconciliation_facts"] = fact["fact_value"]
+                facts["reconciliation_facts"] = fact["fact_value"]
             elif fact["fact_type"] == "AdorationSchedule":
-                parish_facts[pid]["adoration_facts"] = fact["fact_value"]
-
-        # Add facts to parishes and data_extracted flag
-        all_parishes_with_data = {
-            item["parish_id"] for item in parish_data if item["fact_value"] and item["fact_value"] != "Information not found"
-        }
+                facts["adoration_facts"] = fact["fact_value"]
 
         for parish in parishes:
             facts = parish_facts.get(parish["id"], {})
             parish["reconciliation_facts"] = facts.get("reconciliation_facts")
             parish["adoration_facts"] = facts.get("adoration_facts")
-            parish["data_extracted"] = parish["id"] in all_parishes_with_data
-
-            # Map database column names to frontend expectations
-            if "Web" in parish:
-                parish["Website"] = parish["Web"]
-
-            # Ensure blocking detection fields are present
-            parish["is_blocked"] = parish.get("is_blocked", False)
-            parish["blocking_type"] = parish.get("blocking_type")
-            parish["blocking_evidence"] = parish.get("blocking_evidence", {})
-            parish["status_code"] = parish.get("status_code")
-            parish["robots_txt_check"] = parish.get("robots_txt_check", {})
-            parish["respectful_automation_used"] = parish.get("respectful_automation_used", False)
-            parish["status_description"] = parish.get("status_description", "Not tested")
-
-        if filter_data_extracted:
-            if filter_data_extracted.lower() == "true":
-                parishes = [p for p in parishes if p["data_extracted"]]
-            elif filter_data_extracted.lower() == "false":
-                parishes = [p for p in parishes if not p["data_extracted"]]
-
-        if filter_data_available:
-            if filter_data_available.lower() == "true":
-                parishes = [p for p in parishes if p["data_extracted"]]
-            elif filter_data_available.lower() == "false":
-                parishes = [p for p in parishes if not p["data_extracted"]]
-
-        if filter_blocked:
-            if filter_blocked.lower() == "true":
-                parishes = [p for p in parishes if p.get("is_blocked", False)]
-            elif filter_blocked.lower() == "false":
-                parishes = [p for p in parishes if not p.get("is_blocked", False)]
-
-        # Apply Python-side sorting for data_extracted and is_blocked if requested
-        if sort_by == "data_extracted":
-            parishes.sort(key=lambda p: p.get("data_extracted", False), reverse=sort_order.lower() == "desc")
-        elif sort_by == "is_blocked":
-            parishes.sort(key=lambda p: p.get("is_blocked", False), reverse=sort_order.lower() == "desc")
-
-        return {"data": parishes, "total_count": total_count, "page": page, "page_size": page_size}
+            _add_parish_display_fields(parish)
+
+        return {
+            "data": parishes,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
     except Exception as e:
         return {"error": str(e)}
 
@@ -902,136 +973,39 @@ def get_all_parishes(
     filter_data_available: str = None,
     filter_blocked: str = None,
     filter_diocese_name: str = None,
+    cursor: str = None,
 ):
     """
     Fetches all parishes with pagination, sorting, and filtering.
+
+    Pass the returned next_cursor as cursor to fetch the following page by keyset.
     """
     try:
-        offset = (page - 1) * page_size
-
-        query = supabase.table("parishes_with_diocese_name").select("*", count="exact")
-
-        # Apply filters
-        if filter_name:
-            query = query.ilike("Name", f"%{filter_name}%")
-        if filter_diocese_name:
-            query = query.ilike("diocese_name", f"%{filter_diocese_name}%")
-
-        if filter_website:
-            query = query.ilike("Website", f"%{filter_website}%")
-
-        if filter_blocked:
-            if filter_blocked.lower() == "true":
-                query = query.eq("is_blocked", True)
-            elif filter_blocked.lower() == "false":
-                query = query.eq("is_blocked", False)
-
-        # Handle data_extracted and data_available filters by pre-filtering parish IDs
-        if filter_data_extracted or filter_data_available:
-            # Get all parishes with data
-            all_parish_data_response = supabase.table("ParishData").select("parish_id, fact_value").execute()
-            parishes_with_data = {
-                item["parish_id"]
-                for item in all_parish_data_response.data
-                if item["fact_value"] and item["fact_value"] != "Information not found"
-            }
-
-            # Determine which parish IDs to filter by
-            filter_parish_ids = None
-            if filter_data_extracted:
-                if filter_data_extracted.lower() == "true":
-                    filter_parish_ids = list(parishes_with_data)
-                elif filter_data_extracted.lower() == "false":
-                    # Get all parish IDs from the current query, then subtract those with data
-                    all_parishes_response = supabase.table("parishes_with_diocese_name").select("id").execute()
-                    all_parish_ids = {p["id"] for p in all_parishes_response.data}
-                    filter_parish_ids = list(all_parish_ids - parishes_with_data)
-            elif filter_data_available:
-                if filter_data_available.lower() == "true":
-                    filter_parish_ids = list(parishes_with_data)
-                elif filter_data_available.lower() == "false":
-                    # Get all parish IDs from the current query, then subtract those with data
-                    all_parishes_response = supabase.table("parishes_with_diocese_name").select("id").execute()
-                    all_parish_ids = {p["id"] for p in all_parishes_response.data}
-                    filter_parish_ids = list(all_parish_ids - parishes_with_data)
-
-            # Apply the parish ID filter to the query
-            if filter_parish_ids is not None:
-                if len(filter_parish_ids) == 0:
-                    # No parishes match the criteria, return empty result
-                    return {"data": [], "total_count": 0, "page": page, "page_size": page_size}
-                query = query.in_("id", filter_parish_ids)
-
-        # Apply sorting and pagination
-        if sort_by == "Name":
-            query = query.order("Name", desc=sort_order.lower() == "desc")
-        elif sort_by == "DioceseName":
-            query = query.order("diocese_name", desc=sort_order.lower() == "desc")
-        elif sort_by == "Web":
-            query = query.order("Web", desc=sort_order.lower() == "desc")
-        elif sort_by == "is_blocked":
-            query = query.order("is_blocked", desc=sort_order.lower() == "desc")
-        # Add other sortable columns as needed
-
-        parishes_response = query.range(offset, offset + page_size - 1).execute()
-
-        parishes = parishes_response.data
-        total_count = parishes_response.count
-
-        # Fetch parish data for 'data_extracted' filter and add data_extracted flag
-        all_parish_ids = [p["id"] for p in parishes]
-        all_parish_data_response = (
-            supabase.table("ParishData").select("parish_id, fact_value").in_("parish_id", all_parish_ids).execute()
+        parishes, total_count, next_cursor = _query_parishes(
+            None,
+            page,
+            page_size,
+            sort_by,
+            sort_order,
+            cursor,
+            filter_name,
+            filter_website,
+            filter_data_extracted,
+            filter_data_available,
+            filter_blocked,
+            filter_diocese_name,
         )
-        all_parishes_with_data = {
-            item["parish_id"]
-            for item in all_parish_data_response.data
-            if item["fact_value"] and item["fact_value"] != "Information not found"
-        }
 
         for parish in parishes:
-            parish["data_extracted"] = parish["id"] in all_parishes_with_data
-
-            # Map database column names to frontend expectations
-
-            if "Web" in parish:
-                parish["Website"] = parish["Web"]
-
-            # Ensure blocking detection fields are present
-            parish["is_blocked"] = parish.get("is_blocked", False)
-            parish["blocking_type"] = parish.get("blocking_type")
-            parish["blocking_evidence"] = parish.get("blocking_evidence", {})
-            parish["status_code"] = parish.get("status_code")
-            parish["robots_txt_check"] = parish.get("robots_txt_check", {})
-            parish["respectful_automation_used"] = parish.get("respectful_automation_used", False)
-            parish["status_description"] = parish.get("status_description", "Not tested")
-
-        # Apply filter for data_extracted after computing the flag
-        if filter_data_extracted:
-            if filter_data_extracted.lower() == "true":
-                parishes = [p for p in parishes if p["data_extracted"]]
-            elif filter_data_extracted.lower() == "false":
-                parishes = [p for p in parishes if not p["data_extracted"]]
-
-        if filter_data_available:
-            if filter_data_available.lower() == "true":
-                parishes = [p for p in parishes if p["data_extracted"]]
-            elif filter_data_available.lower() == "false":
-                parishes = [p for p in parishes if not p["data_extracted"]]
-
-        if filter_blocked:
-            if filter_blocked.lower() == "true":
-                parishes = [p for p in parishes if p.get("is_blocked", False)]
-            elif filter_blocked.lower() == "false":
-                parishes = [p for p in parishes if not p.get("is_blocked", False)]
-
-        # Apply Python-side sorting for data_extracted and is_blocked if requested
-        if sort_by == "data_extracted":
-            parishes.sort(key=lambda p: p.get("data_extracted", False), reverse=sort_order.lower() == "desc")
-        elif sort_by == "is_blocked":
-            parishes.sort(key=lambda p: p.get("is_blocked", False), reverse=sort_order.lower() == "desc")
-
-        return {"data": parishes, "total_count": total_count, "page": page, "page_size": page_size}
+            _add_parish_display_fields(parish)
+
+        return {
+            "data": parishes,
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
     except Exception as e:
         return {"error": str(e)}
 
@@ -1159,11 +1133,28 @@ async def report_extraction_complete_endpoint(extraction_data: dict):
     """Report completed extraction (for async extraction scripts to call)"""
     try:
         await monitoring_manager.add_extraction_complete(extraction_data)
+        response_cache.invalidate()
         return {"status": "success"}
     except Exception as e:
         return {"error": str(e)}
 
 
+@app.post("/api/monitoring/data_changed")
+async def report_data_changed_endpoint(change_data: dict):
+    """Invalidate cached read API responses after a pipeline write"""
+    try:
+        removed = response_cache.invalidate()
+        return {"status": "success", "invalidated": removed}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@app.get("/api/monitoring/response_cache")
+async def get_response_cache_stats():
+    """Get read API response cache statistics"""
+    return response_cache.get_stats()
+
+
 @app.post("/api/monitoring/log")
 async def send_log_endpoint(log_data: dict):
     """Send live log entry (for async extraction scripts to call)"""
@@ -1174,6 +1165,51 @@ async def send_log_endpoint(log_data: dict):
         return {"error": str(e)}
 
 
+async def _apply_monitoring_update(endpoint: str, data: dict, worker_id: Optional[str]) -> bool:
+    """Apply one update from a monitoring batch the same way its individual endpoint would"""
+    if worker_id and endpoint == "/extraction_status":
+        await monitoring_manager.update_worker_extraction_status(worker_id, data)
+    elif worker_id and endpoint == "/circuit_breakers":
+        await monitoring_manager.update_worker_circuit_breakers(worker_id, data)
+    elif endpoint == "/extraction_status":
+        await monitoring_manager.update_extraction_status(data)
+    elif endpoint == "/circuit_breakers":
+        await monitoring_manager.update_circuit_breakers(data)
+    elif endpoint == "/performance":
+        await monitoring_manager.update_performance_metrics(data)
+    elif endpoint == "/error":
+        await monitoring_manager.add_error(data)
+    elif endpoint == "/extraction_complete":
+        await monitoring_manager.add_extraction_complete(data)
+    elif endpoint == "/log":
+        await monitoring_manager.send_live_log(data)
+    elif endpoint != "/data_changed":
+        return False
+    return True
+
+
+@app.post("/api/monitoring/batch")
+async def ingest_monitoring_batch(batch: dict):
+    """Apply a batch of monitoring updates queued by MonitoringClient's background sender"""
+    applied, rejected, data_changed = 0, 0, False
+    for item in batch.get("items", []):
+        endpoint = item.get("endpoint")
+        try:
+            if await _apply_monitoring_update(endpoint, item.get("data") or {}, batch.get("worker_id")):
+                applied += 1
+                data_changed = data_changed or endpoint in ("/extraction_complete", "/data_changed")
+            else:
+                rejected += 1
+        except Exception as e:
+            print(f"⚠️ Failed to apply monitoring update for {endpoint}: {e}")
+            rejected += 1
+
+    # One invalidation covers every write reported in the batch
+    if data_changed:
+        response_cache.invalidate()
+    return {"status": "success", "applied": applied, "rejected": rejected}
+
+
 # Multi-worker endpoints
 @app.post("/api/monitoring/worker/{worker_id}/extraction_status")
 async def update_worker_extraction_status(worker_id: str, status_data: dict):
@@ -1449,65 +1485,32 @@ def generate_all_charts_background():
             import matplotlib
             import matplotlib.dates as mdates
             import matplotlib.pyplot as plt
-            import pandas as pd
 
             matplotlib.use("Agg")
 
-            table_map = {
-                "dioceses_records_over_time.png": "Dioceses",
-                "diocesesparishdirectory_records_over_time.png": "DiocesesParishDirectory",
-                "parishes_records_over_time.png": "Parishes",
-                "parishdata_records_over_time.png": "ParishData",
-            }
-
-            print(f"📊 Generating {len(table_map)} charts...")
+            print(f"📊 Generating {len(CHART_SERIES)} charts...")
             start_time = time.time()
 
-            for chart_name, table_name in table_map.items():
+            for chart_name, (table_name, date_cols) in CHART_SERIES.items():
                 try:
-                    # Fetch data with pagination
-                    all_data = []
-                    batch_size = 1000
-                    offset = 0
-
-                    while True:
-                        response = supabase.table(table_name).select("*").range(offset, offset + batch_size - 1).execute()
-                        batch_data = response.data
-                        if not batch_data:
-                            break
-                        all_data.extend(batch_data)
-                        if len(batch_data) < batch_size:
-                            break
-                        offset += batch_size
-
-                    if not all_data:
-                        print(f"⚠️ No data for {table_name}, skipping chart")
+                    new_rows = chart_series_store.update(supabase, table_name, date_cols)
+                    chart_path = CHART_CACHE_DIR / chart_name
+                    if new_rows == 0 and chart_path.exists():
+                        print(f"✅ {chart_name} is up to date")
                         continue
 
-                    df = pd.DataFrame(all_data)
-
-                    # Convert date columns
-                    date_cols = []
-                    if "created_at" in df.columns:
-                        df["created_at"] = pd.to_datetime(df["created_at"], utc=True, errors="coerce")
-                        date_cols.append("created_at")
-                    if "extracted_at" in df.columns:
-                        df["extracted_at"] = pd.to_datetime(df["extracted_at"], utc=True, errors="coerce")
-                        date_cols.append("extracted_at")
-
-                    # Exclude created_at for specific tables
-                    if table_name in ["Dioceses", "Parishes"] and "created_at" in date_cols:
-                        date_cols.remove("created_at")
-
-                    if not date_cols:
-                        print(f"⚠️ No date columns for {table_name}, skipping chart")
+                    series = {}
+                    for col in date_cols:
+                        counts = chart_series_store.cumulative_series(chart_series_store.daily_counts(table_name, col))
+                        if not counts.empty:
+                            series[col] = counts
+                    if not series:
+                        print(f"⚠️ No data for {table_name}, skipping chart")
                         continue
 
                     # Generate chart
                     fig, ax = plt.subplots(figsize=(10, 6))
-                    for col in date_cols:
-                        df_col = df.dropna(subset=[col])
-                        counts = df_col.set_index(col).resample("D").size().cumsum()
+                    for counts in series.values():
                         ax.plot(counts.index, counts.values, marker="o", linewidth=2, markersize=4)
 
                     ax.set_title(f"{table_name} Records Over Time", fontsize=16, fontweight="bold")
@@ -1516,15 +1519,17 @@ def generate_all_charts_background():
                     plt.xticks(rotation=45)
 
                     # Save to cache
-                    chart_path = CHART_CACHE_DIR / chart_name
                     plt.savefig(chart_path, format="png", dpi=150, bbox_inches="tight")
                     plt.close(fig)
 
-                    print(f"✅ Generated and cached: {chart_name} ({len(all_data)} records)")
+                    total_records = max(int(counts.iloc[-1]) for counts in series.values())
+                    print(f"✅ Generated and cached: {chart_name} ({total_records} records, {new_rows} new)")
 
                 except Exception as e:
                     print(f"❌ Error generating {chart_name}: {e}")
 
+            chart_series_store.save()
+
             elapsed = time.time() - start_time
             print(f"📊 Chart generation completed in {elapsed:.1f}s")
 
@@ -1538,14 +1543,7 @@ async def get_chart(chart_name: str, background_tasks: BackgroundTasks):
     import time
 
     # Validate chart name
-    allowed_charts = [
-        "dioceses_records_over_time.png",
-        "diocesesparishdirectory_records_over_time.png",
-        "parishes_records_over_time.png",
-        "parishdata_records_over_time.png",
-    ]
-
-    if chart_name not in allowed_charts:
+    if chart_name not in CHART_SERIES:
         raise HTTPException(status_code=404, detail="Chart not found")
 
     chart_path = CHART_CACHE_DIR / chart_name
@@ -0,0 +1,128 @@
+"""
+In-process response cache for the dashboard read API.
+
+Caches serialized JSON bodies keyed on the request path and normalized query
+parameters, bounded by an LRU limit and per-route TTLs. Each entry carries an
+ETag so that clients revalidating with If-None-Match receive 304 responses.
+The whole cache is invalidated when the pipeline reports new data.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body and its validator."""
+
+    body: bytes
+    etag: str
+    media_type: str
+    expires_at: float
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of GET response bodies with per-route TTLs.
+
+    Invalidation bumps a generation counter so that responses computed from
+    data read before the invalidation are never stored afterwards.
+    """
+
+    def __init__(self, route_ttls: List[Tuple[str, float]], max_entries: int = 512):
+        """
+        Args:
+            route_ttls: (path regex, TTL seconds) pairs; the first matching pattern wins
+            max_entries: Maximum number of cached responses before LRU eviction
+        """
+        self.route_ttls: List[Tuple[Pattern, float]] = [(re.compile(pattern), ttl) for pattern, ttl in route_ttls]
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "evictions": 0, "invalidations": 0}
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """TTL for a request path, or None if the path is not cached."""
+        for pattern, ttl in self.route_ttls:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    @staticmethod
+    def make_key(path: str, params: Iterable[Tuple[str, str]]) -> str:
+        """Cache key from the path and query parameters, ignoring order and empty values."""
+        normalized = sorted((name, value) for name, value in params if value != "")
+        return path + "?" + "&".join(f"{name}={value}" for name, value in normalized)
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Whether an If-None-Match header value matches an ETag (weak comparison)."""
+        if not if_none_match:
+            return False
+        candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+        return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry
+
+    def set(
+        self, key: str, body: bytes, ttl: float, media_type: str = "application/json", generation: Optional[int] = None
+    ) -> CachedResponse:
+        """
+        Store a response body and return its cache entry.
+
+        If generation is given and the cache has been invalidated since, the
+        entry is returned (so the caller can still serve it) but not stored.
+        """
+        entry = CachedResponse(body=body, etag=self.make_etag(body), media_type=media_type, expires_at=time.monotonic() + ttl)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+        return entry
+
+    def invalidate(self, path_prefix: Optional[str] = None) -> int:
+        """
+        Drop cached responses, optionally only those whose path starts with a prefix.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self.generation += 1
+            self.stats["invalidations"] += 1
+            if path_prefix is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if key.startswith(path_prefix)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries), "max_entries": self.max_entries}
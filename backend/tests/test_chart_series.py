@@ -0,0 +1,92 @@
+"""
+Tests for incremental chart series aggregation.
+"""
+
+from chart_series import ChartSeriesStore
+
+
+class PagedTable:
+    """Serves rows in id order with gt/limit, recording the selected columns."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.selects = []
+
+    def table(self, name):
+        self.last_id = None
+        return self
+
+    def select(self, columns):
+        self.selects.append(columns)
+        return self
+
+    def order(self, column):
+        return self
+
+    def limit(self, count):
+        self.count = count
+        return self
+
+    def gt(self, column, value):
+        self.last_id = value
+        return self
+
+    def execute(self):
+        rows = [row for row in self.rows if self.last_id is None or row["id"] > self.last_id][: self.count]
+        return type("Response", (), {"data": rows})()
+
+
+def test_incremental_updates_only_read_new_rows(tmp_path):
+    client = PagedTable(
+        [
+            {"id": 1, "created_at": "2026-01-01T10:00:00+00:00"},
+            {"id": 2, "created_at": "2026-01-01T23:00:00+00:00"},
+            {"id": 3, "created_at": "2026-01-03T08:00:00+00:00"},
+        ]
+    )
+    store = ChartSeriesStore(tmp_path / "series.json", page_size=2)
+
+    assert store.update(client, "ParishData", ["created_at"]) == 3
+    assert client.selects[0] == "id, created_at"
+    store.save()
+
+    client.rows.append({"id": 4, "created_at": "2026-01-03T09:00:00+00:00"})
+    reloaded = ChartSeriesStore(tmp_path / "series.json", page_size=2)
+    assert reloaded.update(client, "ParishData", ["created_at"]) == 1
+    assert reloaded.daily_counts("ParishData", "created_at") == {"2026-01-01": 2, "2026-01-03": 2}
+
+
+def test_cumulative_series_fills_missing_days():
+    series = ChartSeriesStore.cumulative_series({"2026-01-03": 2, "2026-01-01": 2})
+
+    assert list(series.values) == [2, 2, 4]
+    assert str(series.index[1].date()) == "2026-01-02"
+
+
+def test_failed_page_leaves_checkpoint_unchanged(tmp_path):
+    client = PagedTable([{"id": i, "created_at": "2026-01-01T10:00:00+00:00"} for i in range(1, 4)])
+    store = ChartSeriesStore(tmp_path / "series.json", page_size=2)
+    store.update(client, "ParishData", ["created_at"])
+
+    client.rows.extend({"id": i, "created_at": "2026-01-02T10:00:00+00:00"} for i in range(4, 8))
+    pages = {"served": 0}
+    original_execute = client.execute
+
+    def fail_on_second_page():
+        pages["served"] += 1
+        if pages["served"] == 2:
+            raise ConnectionError("page fetch failed")
+        return original_execute()
+
+    client.execute = fail_on_second_page
+    try:
+        store.update(client, "ParishData", ["created_at"])
+    except ConnectionError:
+        pass
+
+    assert store.tables["ParishData"]["last_id"] == 3
+    assert store.daily_counts("ParishData", "created_at") == {"2026-01-01": 3}
+
+    client.execute = original_execute
+    assert store.update(client, "ParishData", ["created_at"]) == 4
+    assert store.daily_counts("ParishData", "created_at") == {"2026-01-01": 3, "2026-01-02": 4}
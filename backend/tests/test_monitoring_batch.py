@@ -0,0 +1,39 @@
+"""
+Tests for the batched monitoring ingest route.
+"""
+
+import os
+
+os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+
+
+def test_batch_applies_each_update_like_its_endpoint():
+    client = TestClient(main.app)
+    main.response_cache.set("/api/summary", b"{}", 60)
+
+    response = client.post(
+        "/api/monitoring/batch",
+        json={
+            "worker_id": "batch-worker",
+            "items": [
+                {"endpoint": "/log", "data": {"message": "hello", "level": "INFO"}},
+                {"endpoint": "/error", "data": {"type": "Timeout", "message": "slow site"}},
+                {"endpoint": "/extraction_status", "data": {"status": "running", "parishes_processed": 7}},
+                {"endpoint": "/performance", "data": {"parishes_per_minute": 3.5}},
+                {"endpoint": "/data_changed", "data": {"source": "step4"}},
+                {"endpoint": "/unknown", "data": {}},
+            ],
+        },
+    )
+
+    assert response.json() == {"status": "success", "applied": 5, "rejected": 1}
+    manager = main.monitoring_manager
+    assert manager.workers["batch-worker"]["extraction_status"]["parishes_processed"] == 7
+    assert manager.recent_errors[0]["message"] == "slow site"
+    assert manager.performance_metrics["parishes_per_minute"] == 3.5
+    assert main.response_cache.get("/api/summary") is None
@@ -0,0 +1,99 @@
+"""
+Tests for the server-side parish listing and summary queries.
+"""
+
+import asyncio
+import os
+from unittest.mock import patch
+
+os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+import main  # noqa: E402
+
+
+class RecordingQuery:
+    """Supabase query builder stand-in that records every call."""
+
+    def __init__(self, client, table, data):
+        self.client = client
+        self.table = table
+        self.data = data
+        self.calls = []
+        client.queries.append(self)
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return record
+
+    def execute(self):
+        return type("Response", (), {"data": self.data, "count": len(self.data)})()
+
+
+class RecordingSupabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = []
+
+    def table(self, name):
+        return RecordingQuery(self, name, self.tables.get(name, []))
+
+
+def _parishes(count):
+    return [{"id": i, "Name": f"Parish {i}", "Web": f"https://p{i}.org", "data_extracted": i % 2 == 0} for i in range(count)]
+
+
+def test_summary_reads_aggregate_view():
+    db = RecordingSupabase(
+        {
+            "extraction_summary": [
+                {
+                    "total_dioceses_processed": 10,
+                    "found_parish_directories": 7,
+                    "parishes_extracted": 100,
+                    "parishes_with_data_extracted": 40,
+                }
+            ]
+        }
+    )
+    with patch.object(main, "supabase", db):
+        summary = asyncio.run(main.get_summary())
+
+    assert [q.table for q in db.queries] == ["extraction_summary"]
+    assert summary["not_found_parish_directories"] == 3
+    assert summary["parishes_with_data_not_extracted"] == 60
+
+
+def test_data_extracted_filter_and_sort_are_pushed_down():
+    db = RecordingSupabase({"parishes_with_extraction_status": _parishes(2)})
+    with patch.object(main, "supabase", db):
+        result = main.get_all_parishes(page_size=2, sort_by="data_extracted", sort_order="desc", filter_data_extracted="true")
+
+    assert [q.table for q in db.queries] == ["parishes_with_extraction_status"]
+    calls = db.queries[0].calls
+    assert ("eq", ("data_extracted", True), {}) in calls
+    assert ("order", ("data_extracted",), {"desc": True, "nullsfirst": False}) in calls
+    assert result["data"][0]["Website"] == "https://p0.org"
+    assert result["next_cursor"] is not None
+
+
+def test_keyset_cursor_round_trip():
+    db = RecordingSupabase({"parishes_with_extraction_status": _parishes(2)})
+    with patch.object(main, "supabase", db):
+        first = main.get_all_parishes(page_size=2)
+        main.get_all_parishes(page_size=2, cursor=first["next_cursor"])
+
+    keyset_calls = [call for call in db.queries[1].calls if call[0] == "or_"]
+    assert keyset_calls == [("or_", ('Name.gt."Parish 1",and(Name.eq."Parish 1",id.gt.1),Name.is.null',), {})]
+    assert not any(call[0] == "range" for call in db.queries[1].calls)
+
+
+def test_invalid_cursor_is_reported():
+    db = RecordingSupabase({"parishes_with_extraction_status": []})
+    with patch.object(main, "supabase", db):
+        result = main.get_all_parishes(cursor="not-a-cursor")
+
+    assert "error" in result
@@ -0,0 +1,97 @@
+"""
+Tests for the read API response cache.
+"""
+
+import os
+from unittest.mock import patch
+
+os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from response_cache import ResponseCache  # noqa: E402
+
+
+class CountingSupabase:
+    """Returns a fixed parish row and counts round trips."""
+
+    def __init__(self):
+        self.executions = 0
+
+    def table(self, name):
+        return self
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        self.executions += 1
+        return type("Response", (), {"data": [{"id": 1, "Name": "St. Anne"}], "count": 1})()
+
+
+def test_lru_eviction_and_generation_guard():
+    cache = ResponseCache([(r"^/api/parishes$", 60)], max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key.encode(), 60)
+    assert cache.get("a") is None
+    assert cache.get("c").body == b"c"
+    assert cache.get_stats()["evictions"] == 1
+
+    generation = cache.generation
+    cache.invalidate()
+    cache.set("d", b"d", 60, generation=generation)
+    assert cache.get("d") is None
+
+
+def test_key_ignores_parameter_order_and_empty_values():
+    key1 = ResponseCache.make_key("/api/parishes", [("page", "2"), ("filter_name", ""), ("sort_by", "Name")])
+    key2 = ResponseCache.make_key("/api/parishes", [("sort_by", "Name"), ("page", "2")])
+    assert key1 == key2
+
+
+def test_cached_responses_revalidate_and_invalidate():
+    db = CountingSupabase()
+    main.response_cache.invalidate()
+    with patch.object(main, "supabase", db):
+        client = TestClient(main.app)
+
+        first = client.get("/api/parishes?page=1")
+        second = client.get("/api/parishes?page=1")
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == first.json()
+        executions = db.executions
+
+        not_modified = client.get("/api/parishes?page=1", headers={"If-None-Match": first.headers["ETag"]})
+        assert not_modified.status_code == 304
+        assert db.executions == executions
+
+        client.post("/api/monitoring/extraction_complete", json={"diocese_name": "Test"})
+        assert client.get("/api/parishes?page=1").headers["X-Cache"] == "MISS"
+        assert db.executions > executions
+
+
+def test_error_responses_are_not_cached():
+    main.response_cache.invalidate()
+    with patch.object(main, "supabase", None):
+        client = TestClient(main.app)
+        response = client.get("/api/parish?parish_id=1")
+
+    assert "error" in response.json()
+    assert "ETag" not in response.headers
+    assert main.response_cache.get_stats()["entries"] == 0
+
+
+def test_cached_responses_keep_cors_headers():
+    main.response_cache.invalidate()
+    origin = {"Origin": "http://localhost:3000"}
+    with patch.object(main, "supabase", CountingSupabase()):
+        client = TestClient(main.app)
+        miss = client.get("/api/parishes?page=1", headers=origin)
+        hit = client.get("/api/parishes?page=1", headers=origin)
+
+    assert (miss.headers["X-Cache"], hit.headers["X-Cache"]) == ("MISS", "HIT")
+    assert miss.headers["Access-Control-Allow-Origin"] == "http://localhost:3000"
+    assert hit.headers["Access-Control-Allow-Origin"] == "http://localhost:3000"
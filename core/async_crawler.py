@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Async HTTP crawler with per-domain politeness for concurrent schedule extraction.
+Replaces global blocking sleeps with non-blocking per-domain request timers so many
+parish frontiers can be crawled from a single event loop.
+"""
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+from urllib.parse import urlparse
+
+import httpx
+
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CRAWLER_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Upgrade-Insecure-Requests": "1",
+    "Cache-Control": "max-age=0",
+}
+
+
+@dataclass
+class PolitenessConfig:
+    """Per-domain politeness settings"""
+
+    min_delay: float = 0.5  # Minimum seconds between request starts on one domain
+    max_delay: float = 2.0  # Maximum seconds between request starts on one domain
+    max_concurrent_per_domain: int = 1
+
+
+class DomainPolitenessScheduler:
+    """
+    Schedules request start times per domain without blocking the event loop.
+
+    Each domain keeps its own "next allowed start" timestamp. A request to a
+    domain waits only for that domain's timer, so requests to other domains
+    proceed immediately instead of sharing one global sleep.
+    """
+
+    def __init__(self, config: PolitenessConfig = None):
+        self.config = config or PolitenessConfig()
+        self._next_slot: Dict[str, float] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {"requests": 0, "delayed_requests": 0, "total_wait_time": 0.0}
+
+    @staticmethod
+    def domain_key(url: str) -> str:
+        """Normalize a URL to the domain used for politeness accounting."""
+        netloc = urlparse(url).netloc.lower()
+        return netloc[4:] if netloc.startswith("www.") else netloc
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Wait for this URL's domain to allow another request, then hold a concurrency slot."""
+        domain = self.domain_key(url)
+        semaphore = self._semaphores.get(domain)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_per_domain)
+            self._semaphores[domain] = semaphore
+
+        async with semaphore:
+            now = asyncio.get_running_loop().time()
+            start_at = max(now, self._next_slot.get(domain, now))
+            self._next_slot[domain] = start_at + random.uniform(self.config.min_delay, self.config.max_delay)
+
+            wait_time = start_at - now
+            self.stats["requests"] += 1
+            if wait_time > 0:
+                self.stats["delayed_requests"] += 1
+                self.stats["total_wait_time"] += wait_time
+                await asyncio.sleep(wait_time)
+
+            yield
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get politeness statistics"""
+        return {**self.stats, "tracked_domains": len(self._next_slot)}
+
+
+class AsyncCrawler:
+    """
+    Async page fetcher built on a pooled httpx client.
+
+    Requests are throttled per domain by DomainPolitenessScheduler and retried
+    with non-blocking exponential backoff on transient failures.
+    """
+
+    def __init__(
+        self,
+        user_agents: Sequence[str],
+        politeness: PolitenessConfig = None,
+        max_connections: int = 100,
+        max_retries: int = 2,
+        backoff_factor: float = 2.0,
+        retry_statuses: Sequence[int] = (403, 429, 500, 502, 503, 504),
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize the async crawler.
+
+        Args:
+            user_agents: User agents rotated per request
+            politeness: Per-domain politeness settings
+            max_connections: Maximum pooled connections across all domains
+            max_retries: Retry attempts for transient failures
+            backoff_factor: Base backoff in seconds, doubled per attempt
+            retry_statuses: HTTP statuses that trigger a retry
+            headers: Default request headers
+            transport: Optional httpx transport (used by tests)
+        """
+        self.user_agents = list(user_agents)
+        self.scheduler = DomainPolitenessScheduler(politeness)
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = set(retry_statuses)
+        self.headers = headers or DEFAULT_CRAWLER_HEADERS
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self.stats = {"fetches": 0, "successful_fetches": 0, "failed_fetches": 0, "retries": 0}
+
+    async def __aenter__(self) -> "AsyncCrawler":
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            transport=self.transport,
+        )
+        logger.info(f"🕸️ Async crawler started (max_connections={self.max_connections})")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP client and log statistics."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self.log_stats()
+
+    async def fetch(self, url: str, timeout: float = 10.0, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """
+        Fetch a URL, respecting the per-domain politeness timer.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            headers: Extra request headers (e.g. conditional If-None-Match)
+
+        Returns:
+            httpx.Response (callers decide how to treat non-2xx statuses)
+
+        Raises:
+            httpx.HTTPError: On transport failure after retries
+        """
+        if self._client is None:
+            raise RuntimeError("AsyncCrawler must be used as an async context manager")
+
+        self.stats["fetches"] += 1
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self.scheduler.slot(url):
+                    response = await self._client.get(
+                        url, headers={**(headers or {}), "User-Agent": random.choice(self.user_agents)}, timeout=timeout
+                    )
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    self.stats["failed_fetches"] += 1
+                    raise
+                logger.debug(f"Transient error fetching {url} ({e}), retrying")
+            else:
+                if response.status_code not in self.retry_statuses or attempt >= self.max_retries:
+                    if response.is_success or response.status_code == 304:
+                        self.stats["successful_fetches"] += 1
+                    else:
+                        self.stats["failed_fetches"] += 1
+                    return response
+                logger.debug(f"HTTP {response.status_code} from {url}, retrying")
+
+            self.stats["retries"] += 1
+            await asyncio.sleep(self.backoff_factor * (2**attempt))
+
+        raise AssertionError("unreachable")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get crawler statistics"""
+        return {**self.stats, "politeness": self.scheduler.get_stats()}
+
+    def log_stats(self):
+        """Log crawler statistics"""
+        stats = self.get_stats()
+        politeness = stats["politeness"]
+        logger.info(
+            f"🕸️ Async crawler: {stats['fetches']} fetches, {stats['successful_fetches']} ok, "
+            f"{stats['failed_fetches']} failed, {stats['retries']} retries, "
+            f"{politeness['tracked_domains']} domains, {politeness['total_wait_time']:.1f}s politeness wait"
+        )
@@ -2,18 +2,46 @@
 """
 Circuit Breaker Pattern implementation for external service protection.
 Prevents cascade failures and provides intelligent retry mechanisms.
+
+Timeouts are enforced by running the protected call on a watchdog thread and
+waiting for it with a deadline, so breakers work from worker threads, event
+loop threads and the main thread alike. The deadline is published through a
+context variable: nested breakers never wait longer than their caller, and
+long-running code can call check_deadline() / remaining_time() to give up
+cooperatively once its caller has stopped waiting.
 """
 
+import asyncio
+import contextvars
+import inspect
 import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
 
 from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Monotonic deadline of the innermost circuit breaker call, if any
+_call_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("circuit_breaker_deadline", default=None)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the enclosing circuit breaker call times out (None outside a breaker)"""
+    deadline = _call_deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def check_deadline():
+    """Raise TimeoutError if the enclosing circuit breaker call has already timed out"""
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise TimeoutError("Circuit breaker deadline exceeded")
+
 
 class CircuitState(Enum):
     """Circuit breaker states"""
@@ -30,7 +58,7 @@ class CircuitBreakerConfig:
     failure_threshold: int = 5  # Failures before opening circuit
     recovery_timeout: int = 60  # Seconds before trying half-open
     success_threshold: int = 3  # Successes needed to close from half-open
-    request_timeout: int = 30  # Seconds before timing out requests
+    request_timeout: float = 30  # Seconds before timing out requests (0 or None disables the timeout)
     max_retries: int = 3  # Maximum retry attempts
     retry_delay: float = 1.0  # Base delay between retries (exponential backoff)
 
@@ -96,24 +124,7 @@ class CircuitBreaker:
             TimeoutError: When request times out
             Exception: Original exception from the protected function
         """
-        with self._lock:
-            self.total_requests += 1
-
-            # Check if circuit should remain open
-            if self.state == CircuitState.OPEN:
-                if time.time() < self.next_attempt_time:
-                    self.total_blocked += 1
-                    logger.warning(f"🚫 Circuit breaker '{self.name}' OPEN - blocking request")
-                    raise CircuitBreakerOpenError(f"Circuit breaker '{self.name}' is OPEN")
-                else:
-                    # Time to try half-open
-                    logger.info(f"🔄 Circuit breaker '{self.name}' transitioning to HALF-OPEN")
-                    self.state = CircuitState.HALF_OPEN
-                    self.success_count = 0
-
-            # In HALF_OPEN state, limit concurrent requests
-            if self.state == CircuitState.HALF_OPEN:
-                logger.debug(f"🟡 Circuit breaker '{self.name}' in HALF-OPEN state - testing request")
+        self._admit()
 
         # Execute the function with retry logic
         last_exception = None
@@ -130,46 +141,188 @@ class CircuitBreaker:
                 self._on_success()
                 return result
 
-            except TimeoutError as e:
-                last_exception = e
-                self.total_timeouts += 1
-                logger.warning(
-                    f"⏰ Timeout in circuit breaker '{self.name}' (attempt {attempt + 1}/{self.config.max_retries + 1})"
-                )
-
             except Exception as e:
                 last_exception = e
-                logger.warning(
-                    f"❌ Error in circuit breaker '{self.name}' (attempt {attempt + 1}/{self.config.max_retries + 1}): {str(e)}"
-                )
+                self._log_attempt_failure(e, attempt)
 
             # Don't retry on the last attempt
             if attempt < self.config.max_retries:
-                retry_delay = self.config.retry_delay * (2**attempt)  # Exponential backoff
-                logger.debug(f"🔄 Retrying in {retry_delay:.1f}s...")
-                time.sleep(retry_delay)
+                time.sleep(self._retry_delay(attempt))
+                if not self._can_retry(last_exception):
+                    break
 
         # All retries failed
         self._on_failure()
         raise last_exception
 
+    async def call_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Async variant of call() for use inside an event loop.
+
+        Coroutine functions are awaited with a deadline; plain functions run in a
+        worker thread. Retry backoff uses asyncio.sleep, so the loop keeps running.
+
+        Raises:
+            CircuitBreakerOpenError: When circuit is open and blocking requests
+            TimeoutError: When request times out
+            Exception: Original exception from the protected function
+        """
+        self._admit()
+        last_exception = None
+
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                result = await self._await_with_timeout(func, *args, **kwargs)
+                self._on_success()
+                return result
+
+            except Exception as e:
+                last_exception = e
+                self._log_attempt_failure(e, attempt)
+
+            if attempt < self.config.max_retries:
+                await asyncio.sleep(self._retry_delay(attempt))
+                if not self._can_retry(last_exception):
+                    break
+
+        self._on_failure()
+        raise last_exception
+
+    def _admit(self):
+        """Count a request and raise CircuitBreakerOpenError if the circuit is blocking it"""
+        with self._lock:
+            self.total_requests += 1
+
+            # Check if circuit should remain open
+            if self.state == CircuitState.OPEN:
+                if time.time() < self.next_attempt_time:
+                    self.total_blocked += 1
+                    logger.warning(f"🚫 Circuit breaker '{self.name}' OPEN - blocking request")
+                    raise CircuitBreakerOpenError(f"Circuit breaker '{self.name}' is OPEN")
+                else:
+                    # Time to try half-open
+                    logger.info(f"🔄 Circuit breaker '{self.name}' transitioning to HALF-OPEN")
+                    self.state = CircuitState.HALF_OPEN
+                    self.success_count = 0
+
+            # In HALF_OPEN state, limit concurrent requests
+            if self.state == CircuitState.HALF_OPEN:
+                logger.debug(f"🟡 Circuit breaker '{self.name}' in HALF-OPEN state - testing request")
+
+    def _log_attempt_failure(self, error: Exception, attempt: int):
+        attempts = f"attempt {attempt + 1}/{self.config.max_retries + 1}"
+        if isinstance(error, TimeoutError):
+            with self._lock:
+                self.total_timeouts += 1
+            logger.warning(f"⏰ Timeout in circuit breaker '{self.name}' ({attempts})")
+        else:
+            logger.warning(f"❌ Error in circuit breaker '{self.name}' ({attempts}): {str(error)}")
+
+    def _retry_delay(self, attempt: int) -> float:
+        retry_delay = self.config.retry_delay * (2**attempt)  # Exponential backoff
+        remaining = remaining_time()
+        if remaining is not None:
+            retry_delay = min(retry_delay, remaining)  # Never back off past the enclosing deadline
+        logger.debug(f"🔄 Retrying in {retry_delay:.1f}s...")
+        return retry_delay
+
+    def _call_timeout(self) -> Optional[float]:
+        """This breaker's timeout, shortened to whatever is left of an enclosing breaker's deadline"""
+        timeout = self.config.request_timeout or None
+        remaining = remaining_time()
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        if timeout is not None and timeout <= 0:
+            raise TimeoutError(f"No time left for '{self.name}' within the enclosing deadline")
+        return timeout
+
+    def _timeout_error(self, timeout: float) -> TimeoutError:
+        return TimeoutError(f"Function call timed out after {timeout:.2f} seconds")
+
+    @staticmethod
+    def _still_running(error: Optional[Exception]) -> bool:
+        """Whether error is a timeout whose abandoned call has not returned yet"""
+        finished = getattr(error, "call_finished", None)
+        return finished is not None and not finished.is_set()
+
+    def _can_retry(self, error: Optional[Exception]) -> bool:
+        """Whether another attempt may start after error and the backoff sleep"""
+        if self._still_running(error):
+            # A retry would run alongside the abandoned call, e.g. two commands
+            # racing on one WebDriver session, so the timeout is final.
+            logger.warning(f"⏰ Not retrying '{self.name}': the timed-out call is still running")
+            return False
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            logger.warning(f"⏰ Not retrying '{self.name}': the enclosing deadline has passed")
+            return False
+        return True
+
     def _execute_with_timeout(self, func: Callable, *args, **kwargs) -> Any:
-        """Execute function with timeout protection"""
-        import signal
+        """
+        Execute function with timeout protection.
 
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Function call timed out after {self.config.request_timeout} seconds")
+        The call runs on a daemon watchdog thread while this thread waits for it
+        with a deadline. A call that overruns cannot be killed; it is abandoned
+        and keeps running until it returns or notices check_deadline(). The
+        TimeoutError carries the call's ``call_finished`` event so call() does
+        not retry while the abandoned call is still running.
+        """
+        timeout = self._call_timeout()
+        if timeout is None:
+            return func(*args, **kwargs)
 
-        # Set up timeout
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(self.config.request_timeout)
+        context = contextvars.copy_context()
+        context.run(_call_deadline.set, time.monotonic() + timeout)
+        outcome: Dict[str, Any] = {}
+        finished = threading.Event()
 
+        def run():
+            try:
+                outcome["result"] = context.run(func, *args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                finished.set()
+
+        threading.Thread(target=run, name=f"circuit-{self.name}", daemon=True).start()
+        if not finished.wait(timeout):
+            error = self._timeout_error(timeout)
+            error.call_finished = finished
+            raise error
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+    async def _await_with_timeout(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Await a coroutine function (or run a plain function in a thread) with the breaker's timeout"""
+        timeout = self._call_timeout()
+        token = _call_deadline.set(None if timeout is None else time.monotonic() + timeout)
         try:
-            result = func(*args, **kwargs)
-            signal.alarm(0)  # Cancel timeout
-            return result
+            # wait_for cancels a coroutine on timeout, but a worker thread keeps
+            # running; its finished event keeps call_async from retrying over it
+            finished: Optional[threading.Event] = None
+            if inspect.iscoroutinefunction(func):
+                awaitable: Awaitable = func(*args, **kwargs)
+            else:
+                finished = threading.Event()
+
+                def run():
+                    try:
+                        return func(*args, **kwargs)
+                    finally:
+                        finished.set()
+
+                awaitable = asyncio.to_thread(run)
+            try:
+                return await asyncio.wait_for(awaitable, timeout)
+            except asyncio.TimeoutError:
+                error = self._timeout_error(timeout)
+                if finished is not None:
+                    error.call_finished = finished
+                raise error from None
         finally:
-            signal.signal(signal.SIGALRM, old_handler)
+            _call_deadline.reset(token)
 
     def _on_success(self):
         """Handle successful request"""
@@ -331,13 +484,22 @@ def circuit_breaker(name: str, config: Optional[CircuitBreakerConfig] = None):
         @circuit_breaker('diocese_website')
         def fetch_diocese_page(url):
             return requests.get(url)
+
+    Coroutine functions are wrapped with call_async().
     """
 
     def decorator(func):
         cb = circuit_manager.get_circuit_breaker(name, config)
 
-        def wrapper(*args, **kwargs):
-            return cb.call(func, *args, **kwargs)
+        if inspect.iscoroutinefunction(func):
+
+            async def wrapper(*args, **kwargs):
+                return await cb.call_async(func, *args, **kwargs)
+
+        else:
+
+            def wrapper(*args, **kwargs):
+                return cb.call(func, *args, **kwargs)
 
         wrapper.__name__ = func.__name__
         wrapper.__doc__ = func.__doc__
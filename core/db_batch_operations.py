@@ -4,136 +4,426 @@ Database Batch Operations for improved performance.
 Provides batch upsert functionality to reduce database round trips.
 """
 
+import atexit
+import itertools
+import json
+import threading
 import time
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bounds (seconds) of the flush latency histogram buckets
+FLUSH_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+# Dead-lettered records kept per table for inspection
+MAX_DEAD_LETTERS = 1000
+
+
+@dataclass
+class PendingRecord:
+    """A queued record with its serialized size and the callbacks waiting on its write."""
+
+    record: Dict[str, Any]
+    size: int
+    callbacks: List[Callable[[Dict[str, Any], bool], None]] = field(default_factory=list)
+
 
 class DatabaseBatchManager:
     """
     Manages batch database operations for improved performance.
     Accumulates records and performs batch upserts when thresholds are met.
+
+    Records sharing a conflict key are coalesced while queued: the fields of the
+    later write win, which is what two upserts in a row would have stored.
+    A failed batch is retried with backoff, then bisected so only the records
+    the database keeps rejecting are dead-lettered.
+
+    In write-behind mode a background thread does the flushing: a table is
+    flushed once it reaches batch_size records, max_batch_bytes of payload or
+    its oldest record is max_batch_age seconds old. Callers only block when
+    max_queue_records are already waiting (backpressure).
     """
 
-    def __init__(self, supabase_client, batch_size: int = 25):
+    def __init__(
+        self,
+        supabase_client,
+        batch_size: int = 25,
+        write_behind: bool = False,
+        max_batch_bytes: int = 512 * 1024,
+        max_batch_age: float = 2.0,
+        max_queue_records: int = 5000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        backpressure_timeout: float = 30.0,
+    ):
         """
         Initialize batch manager.
 
         Args:
             supabase_client: Supabase client instance
             batch_size: Number of records per batch (default: 25)
+            write_behind: Flush from a background thread instead of the caller
+            max_batch_bytes: Serialized payload size that triggers a flush
+            max_batch_age: Seconds a record may wait before its table is flushed
+            max_queue_records: Queued plus in-flight records before add_record blocks
+            max_retries: Retries of a failed batch before it is bisected
+            retry_backoff: Base delay in seconds, doubled on each retry
+            backpressure_timeout: Longest add_record waits for queue space
         """
         self.supabase = supabase_client
         self.batch_size = batch_size
-        self.pending_records = defaultdict(list)  # table_name -> [records]
+        self.write_behind = write_behind
+        self.max_batch_bytes = max_batch_bytes
+        self.max_batch_age = max_batch_age
+        self.max_queue_records = max_queue_records
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.backpressure_timeout = backpressure_timeout
+
+        self.pending_records = defaultdict(dict)  # table_name -> {conflict key: PendingRecord}
+        self.pending_bytes = defaultdict(int)  # table_name -> serialized size of pending records
+        self.pending_since = {}  # table_name -> monotonic time of oldest pending record
         self.batch_configs = {}  # table_name -> config
-        self.stats = {"total_batches": 0, "total_records": 0, "total_time": 0.0}
-
-        logger.info(f"📦 Database batch manager initialized (batch_size={batch_size})")
-
-    def configure_table(self, table_name: str, conflict_columns: str):
+        self.failed_records = defaultdict(list)  # table_name -> dead-lettered records
+        self.stats = {
+            "total_batches": 0,
+            "total_records": 0,
+            "total_time": 0.0,
+            "coalesced": 0,
+            "retries": 0,
+            "bisections": 0,
+            "dead_letters": 0,
+            "backpressure_waits": 0,
+            "max_queue_depth": 0,
+            "flush_triggers": defaultdict(int),
+        }
+        self.flush_latency_histogram = {bucket: 0 for bucket in FLUSH_LATENCY_BUCKETS}
+
+        self._lock = threading.Condition()
+        self._table_locks = defaultdict(threading.Lock)
+        self._uncoalesced_keys = itertools.count()
+        self._in_flight = 0
+        self._closed = False
+        self._flusher = None
+
+        if write_behind:
+            self._flusher = threading.Thread(target=self._flush_loop, name="db-write-behind", daemon=True)
+            self._flusher.start()
+
+        mode = "write-behind" if write_behind else "synchronous"
+        logger.info(f"📦 Database batch manager initialized (batch_size={batch_size}, {mode})")
+
+    def configure_table(
+        self,
+        table_name: str,
+        conflict_columns: str,
+        timestamp_column: Optional[str] = "updated_at",
+        recover: Optional[Callable[[Any, Dict[str, Any], Any], bool]] = None,
+    ):
         """
         Configure table-specific batch settings.
 
         Args:
             table_name: Name of the database table
             conflict_columns: Columns to use for conflict resolution
+            timestamp_column: Column stamped with the current time if missing, or None
+            recover: Called as recover(supabase, record, error) for a record the
+                database keeps rejecting; True means it was saved another way
         """
-        self.batch_configs[table_name] = {"on_conflict": conflict_columns}
+        self.batch_configs[table_name] = {
+            "on_conflict": conflict_columns,
+            "key_columns": [column.strip() for column in conflict_columns.split(",")],
+            "timestamp_column": timestamp_column,
+            "recover": recover,
+        }
         logger.debug(f"📋 Configured table '{table_name}' with conflict columns: {conflict_columns}")
 
-    def add_record(self, table_name: str, record: Dict[str, Any], auto_flush: bool = True) -> bool:
+    def add_record(
+        self,
+        table_name: str,
+        record: Dict[str, Any],
+        auto_flush: bool = True,
+        on_result: Optional[Callable[[Dict[str, Any], bool], None]] = None,
+    ) -> bool:
         """
         Add a record to the batch queue.
 
         Args:
             table_name: Target table name
             record: Record data to insert/update
-            auto_flush: Whether to auto-flush when batch size reached
+            auto_flush: Whether to auto-flush when a flush threshold is reached
+            on_result: Called as on_result(record, saved) once the record is written or dead-lettered
 
         Returns:
-            bool: True if batch was flushed, False otherwise
+            bool: True if batch was flushed, False otherwise (always False in write-behind mode)
         """
         # Ensure table is configured
         if table_name not in self.batch_configs:
             logger.warning(f"Table '{table_name}' not configured, using default settings")
             self.configure_table(table_name, "id")
+        config = self.batch_configs[table_name]
 
         # Add timestamp if not present
-        if "updated_at" not in record:
-            record["updated_at"] = datetime.now(timezone.utc).isoformat()
+        if config["timestamp_column"] and config["timestamp_column"] not in record:
+            record[config["timestamp_column"]] = datetime.now(timezone.utc).isoformat()
+
+        size = len(json.dumps(record, default=str))
+        key = tuple(record.get(column) for column in config["key_columns"])
+        if any(value is None for value in key):
+            key = ("__uncoalesced__", next(self._uncoalesced_keys))
+
+        with self._lock:
+            if self.write_behind:
+                self._wait_for_queue_space()
+
+            table_pending = self.pending_records[table_name]
+            callbacks = [on_result] if on_result else []
+            previous = table_pending.pop(key, None)
+            if previous is not None:
+                # Later fields win; earlier callers hear about the merged write
+                self.stats["coalesced"] += 1
+                self.pending_bytes[table_name] -= previous.size
+                callbacks = previous.callbacks + callbacks
+                record = {**previous.record, **record}
+                size = len(json.dumps(record, default=str))
+
+            table_pending[key] = PendingRecord(record, size, callbacks)
+            self.pending_bytes[table_name] += size
+            self.pending_since.setdefault(table_name, time.monotonic())
+            self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self._queue_depth())
+            trigger = self._flush_trigger(table_name)
+
+            logger.debug(
+                f"📝 Added record to batch queue for '{table_name}' ({len(table_pending)}/{self.batch_size})"
+            )
 
-        self.pending_records[table_name].append(record)
-        logger.debug(
-            f"📝 Added record to batch queue for '{table_name}' "
-            f"({len(self.pending_records[table_name])}/{self.batch_size})"
-        )
+            if self.write_behind:
+                self._lock.notify_all()
+                return False
 
-        # Auto-flush if batch size reached
-        if auto_flush and len(self.pending_records[table_name]) >= self.batch_size:
-            return self.flush_table(table_name)
+        # Auto-flush if a threshold is reached
+        if auto_flush and trigger:
+            return self.flush_table(table_name, trigger=trigger)
 
         return False
 
-    def flush_table(self, table_name: str) -> bool:
+    def flush_table(self, table_name: str, trigger: str = "manual") -> bool:
         """
         Flush all pending records for a specific table.
 
         Args:
             table_name: Table to flush
+            trigger: What caused the flush (count, bytes, age, backpressure or manual)
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if every record was saved, False if any were dead-lettered
         """
-        if table_name not in self.pending_records or not self.pending_records[table_name]:
-            logger.debug(f"No pending records for table '{table_name}'")
-            return True
-
-        records = self.pending_records[table_name].copy()
-        record_count = len(records)
-
-        try:
-            start_time = time.time()
-            config = self.batch_configs.get(table_name, {"on_conflict": "id"})
-
-            logger.info(f"📦 Batch upserting {record_count} records to '{table_name}'...")
-
-            response = self.supabase.table(table_name).upsert(records, on_conflict=config["on_conflict"]).execute()
-
-            if hasattr(response, "error") and response.error:
-                error_msg = response.error.message if hasattr(response.error, "message") else str(response.error)
-                logger.error(f"❌ Batch upsert failed for '{table_name}': {error_msg}")
-                return False
-
-            # Success - clear pending records and update stats
-            self.pending_records[table_name].clear()
-            elapsed = time.time() - start_time
-
+        with self._table_locks[table_name]:
+            with self._lock:
+                entries = list(self.pending_records[table_name].values())
+                self.pending_records[table_name].clear()
+                self.pending_bytes[table_name] = 0
+                self.pending_since.pop(table_name, None)
+                self._in_flight += len(entries)
+
+            if not entries:
+                logger.debug(f"No pending records for table '{table_name}'")
+                return True
+
+            # PostgREST bulk upserts use the union of the rows' columns and would overwrite a
+            # column missing from one row with its default, so each upsert carries one row shape
+            shapes = defaultdict(list)
+            for entry in entries:
+                shapes[tuple(sorted(entry.record))].append(entry)
+
+            all_saved = True
+            with self._lock:
+                self.stats["flush_triggers"][trigger] += 1
+            try:
+                for shaped in shapes.values():
+                    for start in range(0, len(shaped), self.batch_size):
+                        if not self._flush_batch(table_name, shaped[start : start + self.batch_size]):
+                            all_saved = False
+            finally:
+                with self._lock:
+                    self._in_flight -= len(entries)
+                    self._lock.notify_all()
+
+            return all_saved
+
+    def _flush_batch(self, table_name: str, entries: List[PendingRecord]) -> bool:
+        """Write one batch, record its metrics and notify its callbacks."""
+        record_count = len(entries)
+        start_time = time.time()
+
+        logger.info(f"📦 Batch upserting {record_count} records to '{table_name}'...")
+        saved, failed = self._write_batch(table_name, entries, self.max_retries)
+        elapsed = time.time() - start_time
+
+        with self._lock:
             self.stats["total_batches"] += 1
-            self.stats["total_records"] += record_count
+            self.stats["total_records"] += len(saved)
             self.stats["total_time"] += elapsed
-
+            self.flush_latency_histogram[next(b for b in FLUSH_LATENCY_BUCKETS if elapsed <= b)] += 1
+            if failed:
+                self.stats["dead_letters"] += len(failed)
+                dead_letters = self.failed_records[table_name]
+                dead_letters.extend(entry.record for entry in failed)
+                del dead_letters[:-MAX_DEAD_LETTERS]
+
+        if failed:
+            logger.error(f"❌ Batch upsert for '{table_name}': {len(failed)} of {record_count} records rejected")
+        else:
             avg_time_per_record = (elapsed / record_count) * 1000  # ms per record
-
             logger.info(
                 f"✅ Successfully batch upserted {record_count} records to '{table_name}' "
                 f"({elapsed:.2f}s, {avg_time_per_record:.1f}ms/record)"
             )
 
-            return True
+        for entries_done, saved_flag in ((saved, True), (failed, False)):
+            for entry in entries_done:
+                for callback in entry.callbacks:
+                    try:
+                        callback(entry.record, saved_flag)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Batch write callback for '{table_name}' failed: {e}")
 
+        return not failed
+
+    def _write_batch(
+        self, table_name: str, entries: List[PendingRecord], retries: int
+    ) -> Tuple[List[PendingRecord], List[PendingRecord]]:
+        """
+        Upsert records, retrying the whole batch and then bisecting it to isolate poison records.
+
+        Returns:
+            tuple: (saved entries, failed entries)
+        """
+        error = None
+        for attempt in range(retries + 1):
+            error = self._upsert(table_name, [entry.record for entry in entries])
+            if error is None:
+                return entries, []
+            if attempt < retries:
+                with self._lock:
+                    self.stats["retries"] += 1
+                delay = self.retry_backoff * (2**attempt)
+                logger.warning(f"⚠️ Batch upsert to '{table_name}' failed ({error}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+        if len(entries) == 1:
+            entry = entries[0]
+            recover = self.batch_configs[table_name]["recover"]
+            if recover is not None:
+                try:
+                    if recover(self.supabase, entry.record, error):
+                        return entries, []
+                except Exception as e:
+                    logger.warning(f"⚠️ Recovery of rejected '{table_name}' record failed: {e}")
+            logger.error(f"❌ Batch upsert failed for '{table_name}' record: {error}")
+            return [], entries
+
+        # Transient failures were ruled out by the retries above; halves get one attempt each
+        with self._lock:
+            self.stats["bisections"] += 1
+        middle = len(entries) // 2
+        saved_left, failed_left = self._write_batch(table_name, entries[:middle], 0)
+        saved_right, failed_right = self._write_batch(table_name, entries[middle:], 0)
+        return saved_left + saved_right, failed_left + failed_right
+
+    def _upsert(self, table_name: str, records: List[Dict[str, Any]]) -> Optional[str]:
+        """Run one upsert; returns the error message, or None on success."""
+        config = self.batch_configs.get(table_name, {"on_conflict": "id"})
+        try:
+            response = self.supabase.table(table_name).upsert(records, on_conflict=config["on_conflict"]).execute()
         except Exception as e:
-            logger.error(f"❌ Batch upsert error for '{table_name}': {str(e)}")
-            return False
+            return str(e)
+
+        if hasattr(response, "error") and response.error:
+            return response.error.message if hasattr(response.error, "message") else str(response.error)
+        return None
+
+    def _queue_depth(self) -> int:
+        """Records queued or being written (caller holds the lock)."""
+        return sum(len(records) for records in self.pending_records.values()) + self._in_flight
+
+    def _flush_trigger(self, table_name: str) -> Optional[str]:
+        """The threshold a table's pending records have reached, if any (caller holds the lock)."""
+        if not self.pending_records[table_name]:
+            return None
+        if len(self.pending_records[table_name]) >= self.batch_size:
+            return "count"
+        if self.pending_bytes[table_name] >= self.max_batch_bytes:
+            return "bytes"
+        if time.monotonic() - self.pending_since[table_name] >= self.max_batch_age:
+            return "age"
+        return None
+
+    def _wait_for_queue_space(self):
+        """Block the caller while the queue is full (caller holds the lock)."""
+        if self._queue_depth() < self.max_queue_records or self._closed:
+            return
+
+        self.stats["backpressure_waits"] += 1
+        deadline = time.monotonic() + self.backpressure_timeout
+        while self._queue_depth() >= self.max_queue_records and not self._closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(f"⚠️ Write-behind queue still full after {self.backpressure_timeout:.0f}s, queueing anyway")
+                return
+            self._lock.notify_all()
+            self._lock.wait(timeout=remaining)
+
+    def _next_flush(self) -> Tuple[Optional[str], Optional[str], Optional[float]]:
+        """
+        Pick the table the flusher should write next (caller holds the lock).
+
+        Returns:
+            tuple: (table_name, trigger, None) when a table is due, otherwise
+            (None, None, seconds until the oldest pending table ages out or None)
+        """
+        for table_name in list(self.pending_records):
+            trigger = self._flush_trigger(table_name)
+            if trigger:
+                return table_name, trigger, None
+
+        if self._queue_depth() >= self.max_queue_records:
+            waiting = [name for name, records in self.pending_records.items() if records]
+            if waiting:
+                return max(waiting, key=lambda name: len(self.pending_records[name])), "backpressure", None
+
+        if not self.pending_since:
+            return None, None, None
+        oldest = min(self.pending_since.values())
+        return None, None, max(oldest + self.max_batch_age - time.monotonic(), 0.01)
+
+    def _flush_loop(self):
+        """Background flusher for write-behind mode."""
+        while True:
+            with self._lock:
+                while True:
+                    table_name, trigger, wait_time = self._next_flush()
+                    if table_name or self._closed:
+                        break
+                    self._lock.wait(timeout=wait_time)
+
+            if table_name is None:
+                return
+
+            try:
+                self.flush_table(table_name, trigger=trigger)
+            except Exception as e:
+                logger.error(f"❌ Write-behind flush of '{table_name}' failed: {e}")
 
     def flush_all(self) -> Dict[str, bool]:
         """
-        Flush all pending records for all tables.
+        Flush all pending records for all tables, waiting for any background writes in progress.
 
         Returns:
             dict: Table name -> success status
@@ -144,8 +434,27 @@ class DatabaseBatchManager:
             if self.pending_records[table_name]:  # Only flush if has records
                 results[table_name] = self.flush_table(table_name)
 
+        with self._lock:
+            while self._in_flight:
+                self._lock.wait()
+
         return results
 
+    def close(self) -> Dict[str, bool]:
+        """
+        Stop the background flusher and write everything still queued.
+
+        Returns:
+            dict: Table name -> success status of the final flush
+        """
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        return self.flush_all()
+
     def get_pending_count(self, table_name: Optional[str] = None) -> int:
         """
         Get count of pending records.
@@ -156,20 +465,29 @@ class DatabaseBatchManager:
         Returns:
             int: Number of pending records
         """
-        if table_name:
-            return len(self.pending_records.get(table_name, []))
-        else:
-            return sum(len(records) for records in self.pending_records.values())
+        with self._lock:
+            if table_name:
+                return len(self.pending_records.get(table_name, {}))
+            else:
+                return sum(len(records) for records in self.pending_records.values())
 
     def get_stats(self) -> Dict[str, Any]:
         """
         Get batch operation statistics.
 
         Returns:
-            dict: Statistics including batches, records, timing
+            dict: Statistics including batches, records, timing, queue depth and flush latency histogram
         """
-        stats = self.stats.copy()
-        stats["pending_records"] = self.get_pending_count()
+        with self._lock:
+            stats = self.stats.copy()
+            stats["flush_triggers"] = dict(self.stats["flush_triggers"])
+            stats["pending_records"] = sum(len(records) for records in self.pending_records.values())
+            stats["in_flight_records"] = self._in_flight
+            stats["queue_depth"] = self._queue_depth()
+            stats["flush_latency_histogram"] = {
+                ("+Inf" if bucket == float("inf") else f"{bucket}s"): count
+                for bucket, count in self.flush_latency_histogram.items()
+            }
         stats["avg_batch_time"] = self.stats["total_time"] / max(self.stats["total_batches"], 1)
         stats["avg_record_time"] = (
             self.stats["total_time"] / max(self.stats["total_records"], 1)
@@ -182,11 +500,10 @@ class DatabaseBatchManager:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Auto-flush all pending records when exiting context."""
-        results = self.flush_all()
+        results = self.close()
 
         # Log summary
-        total_pending = sum(len(records) for records in self.pending_records.values())
-        if total_pending > 0:
+        if results:
             logger.info(f"🔄 Context exit: flushed pending records for {len(results)} tables")
 
         stats = self.get_stats()
@@ -197,6 +514,11 @@ class DatabaseBatchManager:
         )
 
 
+def when_saved(callback: Callable[[], Any]) -> Callable[[Dict[str, Any], bool], None]:
+    """An add_record on_result callback that runs callback() only once the record was written"""
+    return lambda record, saved: callback() if saved else None
+
+
 # Global batch manager instance
 _batch_manager = None
 
@@ -230,3 +552,50 @@ def cleanup_batch_manager():
         _batch_manager.flush_all()
         _batch_manager = None
         logger.debug("🧹 Global batch manager cleaned up")
+
+
+# Global write-behind manager shared by the Step 3 and Step 4 writers
+_write_behind_manager = None
+_write_behind_lock = threading.Lock()
+
+
+def get_write_behind_manager(supabase_client=None) -> DatabaseBatchManager:
+    """
+    Get or create the process-wide write-behind batch manager, configured from pipeline config.
+
+    Args:
+        supabase_client: Supabase client (required for first call)
+
+    Returns:
+        DatabaseBatchManager: Global write-behind manager instance
+    """
+    global _write_behind_manager
+
+    with _write_behind_lock:
+        if _write_behind_manager is None:
+            if supabase_client is None:
+                raise ValueError("supabase_client is required for first call to get_write_behind_manager")
+            from pipeline import config
+
+            _write_behind_manager = DatabaseBatchManager(
+                supabase_client,
+                batch_size=config.WRITE_BEHIND_BATCH_SIZE,
+                write_behind=True,
+                max_batch_bytes=config.WRITE_BEHIND_MAX_BYTES,
+                max_batch_age=config.WRITE_BEHIND_MAX_AGE_SECONDS,
+                max_queue_records=config.WRITE_BEHIND_MAX_QUEUE,
+                max_retries=config.WRITE_BEHIND_MAX_RETRIES,
+            )
+            atexit.register(close_write_behind_manager)
+        return _write_behind_manager
+
+
+def close_write_behind_manager():
+    """Flush and stop the global write-behind manager."""
+    global _write_behind_manager
+
+    with _write_behind_lock:
+        manager, _write_behind_manager = _write_behind_manager, None
+    if manager is not None:
+        manager.close()
+        logger.info(f"📊 Write-behind summary: {manager.get_stats()}")
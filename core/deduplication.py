@@ -7,9 +7,88 @@ identifying information.
 """
 
 import re
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+# Address abbreviations applied before address comparison
+ADDRESS_ABBREVIATIONS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in {
+        r"\bstreet\b": "st",
+        r"\bavenue\b": "ave",
+        r"\bdriver\b": "dr",
+        r"\broad\b": "rd",
+        r"\bboulevard\b": "blvd",
+        r"\blane\b": "ln",
+        r"\bcourt\b": "ct",
+        r"\bcircle\b": "cir",
+        r"\bplace\b": "pl",
+        r"\bapartment\b": "apt",
+        r"\bsuite\b": "ste",
+        r"\bnorth\b": "n",
+        r"\bsouth\b": "s",
+        r"\beast\b": "e",
+        r"\bwest\b": "w",
+    }.items()
+]
+
+# Name tokens too common to be useful as blocking keys
+NAME_STOPWORDS = {
+    "saint",
+    "saints",
+    "church",
+    "parish",
+    "catholic",
+    "chapel",
+    "mission",
+    "community",
+    "shrine",
+    "of",
+    "the",
+    "and",
+    "ol",
+}
+
+ZIP_CODE_PATTERN = re.compile(r"\b(\d{5})(?:-\d{4})?\b")
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# Lowest name similarity at which any duplicate rule can fire
+MIN_RULE_NAME_SIMILARITY = 0.60
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"),
+    **dict.fromkeys("cgjkqsxz", "2"),
+    **dict.fromkeys("dt", "3"),
+    "l": "4",
+    **dict.fromkeys("mn", "5"),
+    "r": "6",
+}
+
+
+def soundex(word: str) -> str:
+    """Return the American Soundex code for a word (empty string if it has no letters)."""
+    letters = [c for c in word.lower() if c.isalpha()]
+    if not letters:
+        return ""
+
+    code = letters[0].upper()
+    previous = _SOUNDEX_CODES.get(letters[0], "")
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w do not separate letters with the same code
+        if letter not in "hw":
+            previous = digit
+
+    return code.ljust(4, "0")
 
 
 @dataclass
@@ -20,6 +99,7 @@ class DeduplicationMetrics:
     deduplicated_count: int
     duplicates_removed: int
     similarity_threshold: float
+    comparisons: int = 0
 
     @property
     def deduplication_rate(self) -> float:
@@ -29,6 +109,38 @@ class DeduplicationMetrics:
         return (self.duplicates_removed / self.original_count) * 100
 
 
+@dataclass
+class ParishFeatures:
+    """Normalized comparison fields for one parish, computed once per deduplication pass."""
+
+    name: str
+    address: str
+    phone: str
+    website: str
+    website_host: str
+    zip_code: str
+    name_tokens: List[str] = field(default_factory=list)
+
+
+class _UnionFind:
+    """Disjoint-set forest with path halving and union by lowest index."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the earliest parish as the group representative
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
 class ParishDeduplicator:
     """
     Advanced parish deduplication using multiple similarity metrics.
@@ -39,18 +151,32 @@ class ParishDeduplicator:
     - Phone number matching
     - Website URL matching
     - Normalized name patterns
+
+    Candidate pairs are generated from a blocking index (phone, website host,
+    phonetic name tokens, ZIP code and street number) rather than comparing
+    every pair, and duplicates are merged transitively with union-find.
     """
 
-    def __init__(self, name_similarity_threshold: float = 0.85, address_similarity_threshold: float = 0.80):
+    def __init__(
+        self,
+        name_similarity_threshold: float = 0.85,
+        address_similarity_threshold: float = 0.80,
+        max_block_size: int = 50,
+        neighborhood_window: int = 10,
+    ):
         """
         Initialize the deduplicator.
 
         Args:
             name_similarity_threshold: Threshold for name similarity (0.0-1.0)
             address_similarity_threshold: Threshold for address similarity (0.0-1.0)
+            max_block_size: Blocks larger than this are compared with a sorted-neighborhood window
+            neighborhood_window: Window size used for oversized blocks
         """
         self.name_similarity_threshold = name_similarity_threshold
         self.address_similarity_threshold = address_similarity_threshold
+        self.max_block_size = max_block_size
+        self.neighborhood_window = neighborhood_window
 
         # Common parish name variations for normalization
         self.name_normalizations = {
@@ -69,6 +195,9 @@ class ParishDeduplicator:
             # Remove extra whitespace
             r"\s+": " ",
         }
+        self._compiled_name_normalizations = [
+            (re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in self.name_normalizations.items()
+        ]
 
     def normalize_name(self, name: str) -> str:
         """
@@ -87,12 +216,12 @@ class ParishDeduplicator:
         normalized = name.lower().strip()
 
         # Apply normalizations
-        for pattern, replacement in self.name_normalizations.items():
-            normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
+        for pattern, replacement in self._compiled_name_normalizations:
+            normalized = pattern.sub(replacement, normalized)
 
         # Remove punctuation and extra spaces
-        normalized = re.sub(r"[^\w\s]", "", normalized)
-        normalized = re.sub(r"\s+", " ", normalized).strip()
+        normalized = PUNCTUATION_PATTERN.sub("", normalized)
+        normalized = WHITESPACE_PATTERN.sub(" ", normalized).strip()
 
         return normalized
 
@@ -154,34 +283,69 @@ class ParishDeduplicator:
         # Convert to lowercase and strip
         normalized = address.lower().strip()
 
-        # Common address abbreviations
-        abbreviations = {
-            r"\bstreet\b": "st",
-            r"\bavenue\b": "ave",
-            r"\bdriver\b": "dr",
-            r"\broad\b": "rd",
-            r"\bboulevard\b": "blvd",
-            r"\blane\b": "ln",
-            r"\bcourt\b": "ct",
-            r"\bcircle\b": "cir",
-            r"\bplace\b": "pl",
-            r"\bapartment\b": "apt",
-            r"\bsuite\b": "ste",
-            r"\bnorth\b": "n",
-            r"\bsouth\b": "s",
-            r"\beast\b": "e",
-            r"\bwest\b": "w",
-        }
-
-        for pattern, replacement in abbreviations.items():
-            normalized = re.sub(pattern, replacement, normalized)
+        for pattern, replacement in ADDRESS_ABBREVIATIONS:
+            normalized = pattern.sub(replacement, normalized)
 
         # Remove punctuation and extra spaces
-        normalized = re.sub(r"[^\w\s]", "", normalized)
-        normalized = re.sub(r"\s+", " ", normalized).strip()
+        normalized = PUNCTUATION_PATTERN.sub("", normalized)
+        normalized = WHITESPACE_PATTERN.sub(" ", normalized).strip()
 
         return normalized
 
+    def extract_features(self, parish) -> ParishFeatures:
+        """
+        Precompute the normalized fields used to compare a parish.
+
+        Args:
+            parish: Parish object
+
+        Returns:
+            ParishFeatures for the parish
+        """
+        name = self.normalize_name(getattr(parish, "name", None) or "")
+
+        raw_address = (
+            getattr(parish, "street_address", None)
+            or getattr(parish, "full_address", None)
+            or getattr(parish, "address", None)
+            or ""
+        )
+        address = self._normalize_address(raw_address)
+
+        phone = NON_DIGIT_PATTERN.sub("", getattr(parish, "phone", None) or "")
+
+        website = (getattr(parish, "website", None) or "").lower().strip()
+        website_host = ""
+        if website:
+            parsed = urlparse(website if "://" in website else f"http://{website}")
+            website_host = (parsed.netloc or "").split(":")[0]
+            if website_host.startswith("www."):
+                website_host = website_host[4:]
+
+        zip_code = str(getattr(parish, "zip_code", None) or "")[:5]
+        if not zip_code:
+            zip_match = ZIP_CODE_PATTERN.search(getattr(parish, "full_address", None) or raw_address)
+            zip_code = zip_match.group(1) if zip_match else ""
+
+        name_tokens = []
+        for token in name.split():
+            if token in NAME_STOPWORDS or len(token) < 2:
+                continue
+            # Treat possessive and plural forms alike ("marys" vs "mary")
+            if token.endswith("s") and len(token) > 3:
+                token = token[:-1]
+            name_tokens.append(token)
+
+        return ParishFeatures(
+            name=name,
+            address=address,
+            phone=phone,
+            website=website,
+            website_host=website_host,
+            zip_code=zip_code,
+            name_tokens=name_tokens,
+        )
+
     def are_parishes_duplicate(self, parish1, parish2) -> Tuple[bool, dict]:
         """
         Determine if two parishes are duplicates.
@@ -190,6 +354,19 @@ class ParishDeduplicator:
             parish1: First Parish object
             parish2: Second Parish object
 
+        Returns:
+            Tuple of (is_duplicate: bool, similarity_metrics: dict)
+        """
+        return self.compare_features(self.extract_features(parish1), self.extract_features(parish2))
+
+    def compare_features(self, features1: ParishFeatures, features2: ParishFeatures) -> Tuple[bool, dict]:
+        """
+        Determine if two parishes are duplicates from their precomputed features.
+
+        Args:
+            features1: Features of the first parish
+            features2: Features of the second parish
+
         Returns:
             Tuple of (is_duplicate: bool, similarity_metrics: dict)
         """
@@ -203,38 +380,20 @@ class ParishDeduplicator:
         }
 
         # Calculate name similarity
-        name_sim = self.calculate_name_similarity(parish1.name, parish2.name)
+        name_sim = self._similarity(features1.name, features2.name)
         metrics["name_similarity"] = name_sim
 
         # Calculate address similarity
-        addr1 = (
-            getattr(parish1, "street_address", None)
-            or getattr(parish1, "full_address", None)
-            or getattr(parish1, "address", None)
-        )
-        addr2 = (
-            getattr(parish2, "street_address", None)
-            or getattr(parish2, "full_address", None)
-            or getattr(parish2, "address", None)
-        )
-
-        addr_sim = self.calculate_address_similarity(addr1 or "", addr2 or "")
+        addr_sim = self._similarity(features1.address, features2.address)
         metrics["address_similarity"] = addr_sim
 
         # Check phone match
-        phone1 = getattr(parish1, "phone", None)
-        phone2 = getattr(parish2, "phone", None)
-        if phone1 and phone2:
-            # Normalize phones (remove non-digits)
-            norm_phone1 = re.sub(r"\D", "", phone1)
-            norm_phone2 = re.sub(r"\D", "", phone2)
-            metrics["phone_match"] = norm_phone1 == norm_phone2 and len(norm_phone1) >= 10
+        if features1.phone and features2.phone:
+            metrics["phone_match"] = features1.phone == features2.phone and len(features1.phone) >= 10
 
         # Check website match
-        website1 = getattr(parish1, "website", None)
-        website2 = getattr(parish2, "website", None)
-        if website1 and website2:
-            metrics["website_match"] = website1.lower().strip() == website2.lower().strip()
+        if features1.website and features2.website:
+            metrics["website_match"] = features1.website == features2.website
 
         # Determine if duplicate based on criteria
         is_duplicate = False
@@ -267,10 +426,98 @@ class ParishDeduplicator:
 
         return is_duplicate, metrics
 
+    @staticmethod
+    def _similarity(normalized1: str, normalized2: str) -> float:
+        """Similarity of two already-normalized strings (0.0 when either is missing)."""
+        if not normalized1 or not normalized2:
+            return 0.0
+        if normalized1 == normalized2:
+            return 1.0
+        return SequenceMatcher(None, normalized1, normalized2).ratio()
+
+    def _could_be_duplicate(self, features1: ParishFeatures, features2: ParishFeatures) -> bool:
+        """Cheap upper-bound check that rules out pairs whose names are too different for any rule."""
+        floor = min(self.name_similarity_threshold, MIN_RULE_NAME_SIMILARITY)
+        if floor <= 0 or features1.name == features2.name:
+            return True
+        if not features1.name or not features2.name:
+            return False
+        matcher = SequenceMatcher(None, features1.name, features2.name)
+        return matcher.real_quick_ratio() >= floor and matcher.quick_ratio() >= floor
+
+    def blocking_keys(self, features: ParishFeatures) -> Set[str]:
+        """
+        Blocking keys for a parish; only parishes sharing a key are compared.
+
+        Args:
+            features: Precomputed parish features
+
+        Returns:
+            Set of blocking keys
+        """
+        keys = set()
+
+        if len(features.phone) >= 10:
+            keys.add(f"phone:{features.phone[-10:]}")
+        if features.website_host:
+            keys.add(f"host:{features.website_host}")
+        if features.zip_code:
+            keys.add(f"zip:{features.zip_code}")
+
+        # House number plus first street word ("123 main")
+        address_parts = features.address.split()
+        if len(address_parts) >= 2 and address_parts[0].isdigit():
+            keys.add(f"street:{address_parts[0]} {address_parts[1]}")
+
+        for token in features.name_tokens:
+            code = soundex(token)
+            if code:
+                keys.add(f"name:{code}")
+        if features.name and not features.name_tokens:
+            keys.add(f"name:{features.name}")
+
+        return keys
+
+    def _candidate_pairs(self, features: List[ParishFeatures]) -> List[Tuple[int, int]]:
+        """
+        Generate candidate index pairs from the blocking index.
+
+        Blocks larger than max_block_size are sorted (by address for address
+        keys, by name otherwise) and only compared within a sliding window.
+        """
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for index, parish_features in enumerate(features):
+            for key in self.blocking_keys(parish_features):
+                blocks[key].append(index)
+
+        pairs: Set[Tuple[int, int]] = set()
+        for key, members in blocks.items():
+            if len(members) < 2:
+                continue
+
+            if len(members) <= self.max_block_size:
+                for position, i in enumerate(members):
+                    for j in members[position + 1 :]:
+                        pairs.add((i, j))
+                continue
+
+            if key.startswith(("zip:", "street:")):
+                ordered = sorted(members, key=lambda index: (features[index].address, index))
+            else:
+                ordered = sorted(members, key=lambda index: (features[index].name, index))
+            for position, i in enumerate(ordered):
+                for j in ordered[position + 1 : position + self.neighborhood_window]:
+                    pairs.add((min(i, j), max(i, j)))
+
+        return sorted(pairs)
+
     def deduplicate_parishes(self, parishes: List) -> Tuple[List, DeduplicationMetrics]:
         """
         Remove duplicate parishes from a list.
 
+        Duplicates are merged transitively: if A matches B and B matches C, all
+        three collapse into the earliest of them.
+
         Args:
             parishes: List of Parish objects
 
@@ -281,42 +528,41 @@ class ParishDeduplicator:
             return [], DeduplicationMetrics(0, 0, 0, self.name_similarity_threshold)
 
         original_count = len(parishes)
-        unique_parishes = []
-        duplicates_removed = 0
+        features = [self.extract_features(parish) for parish in parishes]
+        groups = _UnionFind(original_count)
+        comparisons = 0
 
-        # Track parishes we've already processed
-        processed_indices: Set[int] = set()
-
-        for i, parish in enumerate(parishes):
-            if i in processed_indices:
+        for i, j in self._candidate_pairs(features):
+            if groups.find(i) == groups.find(j):
+                continue
+            if not self._could_be_duplicate(features[i], features[j]):
                 continue
 
-            # This parish is unique so far
-            unique_parishes.append(parish)
-            processed_indices.add(i)
-
-            # Check remaining parishes for duplicates
-            for j, other_parish in enumerate(parishes[i + 1 :], start=i + 1):
-                if j in processed_indices:
-                    continue
-
-                is_duplicate, metrics = self.are_parishes_duplicate(parish, other_parish)
+            comparisons += 1
+            is_duplicate, _ = self.compare_features(features[i], features[j])
+            if is_duplicate:
+                groups.union(i, j)
 
-                if is_duplicate:
-                    # Mark as processed (duplicate)
-                    processed_indices.add(j)
-                    duplicates_removed += 1
+        members_by_root: Dict[int, List[int]] = defaultdict(list)
+        for index in range(original_count):
+            members_by_root[groups.find(index)].append(index)
 
-                    # Optionally merge information from duplicate
-                    self._merge_parish_info(parish, other_parish)
+        unique_parishes = []
+        for root in sorted(members_by_root):
+            primary = parishes[root]
+            for member in members_by_root[root][1:]:
+                # Optionally merge information from duplicate
+                self._merge_parish_info(primary, parishes[member])
+            unique_parishes.append(primary)
 
         deduplicated_count = len(unique_parishes)
 
         metrics = DeduplicationMetrics(
             original_count=original_count,
             deduplicated_count=deduplicated_count,
-            duplicates_removed=duplicates_removed,
+            duplicates_removed=original_count - deduplicated_count,
             similarity_threshold=self.name_similarity_threshold,
+            comparisons=comparisons,
         )
 
         return unique_parishes, metrics
@@ -331,10 +577,10 @@ class ParishDeduplicator:
         # Merge missing fields from duplicate to primary
         fields_to_merge = ["phone", "website", "street_address", "full_address", "address", "city", "state", "zip_code"]
 
-        for field in fields_to_merge:
-            primary_value = getattr(primary_parish, field, None)
-            duplicate_value = getattr(duplicate_parish, field, None)
+        for field_name in fields_to_merge:
+            primary_value = getattr(primary_parish, field_name, None)
+            duplicate_value = getattr(duplicate_parish, field_name, None)
 
             # If primary is missing this field but duplicate has it, use duplicate's value
             if not primary_value and duplicate_value:
-                setattr(primary_parish, field, duplicate_value)
+                setattr(primary_parish, field_name, duplicate_value)
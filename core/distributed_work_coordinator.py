@@ -135,12 +135,12 @@ class DistributedWorkCoordinator:
             await self._cleanup_stale_workers()
 
             # Get dioceses that need processing (not currently assigned to active workers)
-            available_dioceses = await self._get_unassigned_dioceses(max_dioceses)
+            candidate_dioceses = await self._get_unassigned_dioceses()
 
-            if available_dioceses:
-                # Assign dioceses to this worker
-                await self._assign_dioceses_to_worker(available_dioceses)
+            # Claim atomically so concurrent workers can never double-assign a diocese
+            available_dioceses = await self._claim_dioceses(candidate_dioceses, max_dioceses)
 
+            if available_dioceses:
                 logger.info(f"📋 Assigned {len(available_dioceses)} dioceses to worker {self.worker_id}")
                 for diocese in available_dioceses:
                     logger.debug(f"   • {diocese['name']} (ID: {diocese['id']})")
@@ -153,7 +153,26 @@ class DistributedWorkCoordinator:
             logger.error(f"❌ Error getting available work: {e}")
             return []
 
-    async def _get_unassigned_dioceses(self, limit: int) -> List[Dict[str, Any]]:
+    def _fetch_all_rows(
+        self, table: str, columns: str, order_by: Optional[str] = None, page_size: int = 1000, **eq_filters
+    ) -> List[Dict[str, Any]]:
+        """Fetch every matching row of a table, paging past the PostgREST row limit."""
+        rows = []
+        start = 0
+        while True:
+            query = self.supabase.table(table).select(columns)
+            for column, value in eq_filters.items():
+                query = query.eq(column, value)
+            if order_by:
+                query = query.order(order_by, desc=False)
+
+            page = query.range(start, start + page_size - 1).execute().data or []
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            start += page_size
+
+    async def _get_unassigned_dioceses(self) -> List[Dict[str, Any]]:
         """
         Get dioceses that are not currently assigned to any active worker.
 
@@ -162,59 +181,52 @@ class DistributedWorkCoordinator:
         2. Skip dioceses currently assigned to active workers
         3. Only include dioceses with parish directory URLs
 
+        Directory URLs, overrides and active assignments are each fetched in bulk
+        and joined in memory, so selection costs a constant number of queries
+        regardless of how many dioceses exist.
+
         Note: Future enhancement could add last_extraction_attempt and parish_count
         columns to support cooldown periods and better prioritization.
         """
         try:
             # Get all dioceses ordered by ID (deterministic, ensures all dioceses eventually processed)
-            dioceses_response = (
-                self.supabase.table("Dioceses")
-                .select("id, Name, Website")
-                .order("id", desc=False)  # Process in ID order
-                .execute()
-            )
+            dioceses = self._fetch_all_rows("Dioceses", "id, Name, Website", order_by="id")
 
-            logger.debug(f"🔍 Fetched {len(dioceses_response.data)} total dioceses from database")
+            logger.debug(f"🔍 Fetched {len(dioceses)} total dioceses from database")
 
-            if not dioceses_response.data:
+            if not dioceses:
                 logger.warning("⚠️ No dioceses found in database")
                 return []
 
+            directory_urls: Dict[str, str] = {}
+            for row in self._fetch_all_rows("DiocesesParishDirectory", "diocese_url, parish_directory_url"):
+                if row.get("diocese_url") and row.get("parish_directory_url"):
+                    directory_urls.setdefault(row["diocese_url"], row["parish_directory_url"])
+
+            override_urls: Dict[int, str] = {}
+            for row in self._fetch_all_rows("DioceseParishDirectoryOverride", "diocese_id, parish_directory_url"):
+                if row.get("parish_directory_url"):
+                    override_urls.setdefault(row["diocese_id"], row["parish_directory_url"])
+
+            assigned_ids = {
+                row["diocese_id"]
+                for row in self._fetch_all_rows("diocese_work_assignments", "diocese_id", status="processing")
+            }
+
             # Filter to only those with parish directory URLs available
             available_dioceses = []
             skipped_no_directory = 0
             skipped_assigned = 0
 
-            for diocese in dioceses_response.data:
-                # Check if this diocese has a parish directory URL
-                parish_dir_response = (
-                    self.supabase.table("DiocesesParishDirectory")
-                    .select("parish_directory_url")
-                    .eq("diocese_url", diocese["Website"])
-                    .execute()
-                )
-
-                override_response = (
-                    self.supabase.table("DioceseParishDirectoryOverride")
-                    .select("parish_directory_url")
-                    .eq("diocese_id", diocese["id"])
-                    .execute()
-                )
-
-                if not (parish_dir_response.data or override_response.data):
+            for diocese in dioceses:
+                # Overrides take precedence over discovered directory URLs
+                parish_directory_url = override_urls.get(diocese["id"]) or directory_urls.get(diocese["Website"])
+                if not parish_directory_url:
                     skipped_no_directory += 1
                     continue
 
                 # Check if currently assigned to an active worker
-                assignment_response = (
-                    self.supabase.table("diocese_work_assignments")
-                    .select("worker_id, assigned_at")
-                    .eq("diocese_id", diocese["id"])
-                    .eq("status", "processing")
-                    .execute()
-                )
-
-                if assignment_response.data:
+                if diocese["id"] in assigned_ids:
                     skipped_assigned += 1
                     continue
 
@@ -223,12 +235,6 @@ class DistributedWorkCoordinator:
                 # and continuously cycle through all steps without artificial delays
 
                 # Available for processing!
-                parish_directory_url = (
-                    override_response.data[0]["parish_directory_url"]
-                    if override_response.data
-                    else parish_dir_response.data[0]["parish_directory_url"]
-                )
-
                 available_dioceses.append(
                     {
                         "id": diocese["id"],
@@ -240,14 +246,12 @@ class DistributedWorkCoordinator:
 
             # Log selection summary
             logger.info("📋 Diocese selection summary:")
-            logger.info(f"   • Total dioceses checked: {len(dioceses_response.data)}")
+            logger.info(f"   • Total dioceses checked: {len(dioceses)}")
             logger.info(f"   • Skipped (no directory): {skipped_no_directory}")
             logger.info(f"   • Skipped (assigned/cooldown): {skipped_assigned}")
             logger.info(f"   ✅ Available for processing: {len(available_dioceses)}")
             if available_dioceses:
                 logger.info(f"   • Selected IDs: {[d['id'] for d in available_dioceses[:10]]}")
-                logger.info(f"   📂 Skipped (no directory): {skipped_no_directory}")
-                logger.info(f"   🔒 Skipped (already assigned): {skipped_assigned}")
 
                 # Show what was selected
                 for i, d in enumerate(available_dioceses[:3], 1):
@@ -261,29 +265,80 @@ class DistributedWorkCoordinator:
             logger.error(f"❌ Error getting unassigned dioceses: {e}")
             return []
 
-    async def _assign_dioceses_to_worker(self, dioceses: List[Dict[str, Any]]):
-        """Assign dioceses to this worker"""
-        try:
-            assignments = []
-            for diocese in dioceses:
-                assignment = {
-                    "diocese_id": diocese["id"],
-                    "worker_id": self.worker_id,
-                    "status": "processing",
-                    "assigned_at": datetime.utcnow().isoformat(),
-                    "estimated_completion": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
-                }
-                assignments.append(assignment)
-
-            if assignments:
-                response = self.supabase.table("diocese_work_assignments").insert(assignments).execute()
-                if response.data:
-                    logger.debug(f"✅ Successfully assigned {len(assignments)} dioceses")
-                else:
-                    logger.error(f"❌ Failed to assign dioceses: {response}")
+    def _assignment_row(self, diocese_id: int) -> Dict[str, Any]:
+        """Build a work assignment row for this worker"""
+        return {
+            "diocese_id": diocese_id,
+            "worker_id": self.worker_id,
+            "status": "processing",
+            "assigned_at": datetime.utcnow().isoformat(),
+            "estimated_completion": (datetime.utcnow() + timedelta(hours=1)).isoformat(),
+        }
+
+    async def _claim_dioceses(self, candidates: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """
+        Atomically claim up to ``limit`` candidate dioceses for this worker.
 
+        Uses the ``claim_diocese_work`` RPC, which inserts assignments in candidate
+        order and relies on a partial unique index so only one 'processing'
+        assignment can exist per diocese. Falls back to conditional inserts when the
+        RPC has not been deployed.
+        """
+        if not candidates or limit <= 0:
+            return []
+
+        candidate_ids = [diocese["id"] for diocese in candidates]
+        try:
+            response = self.supabase.rpc(
+                "claim_diocese_work", {"p_worker_id": self.worker_id, "p_diocese_ids": candidate_ids, "p_limit": limit}
+            ).execute()
+            claimed_ids = {row["claimed_diocese_id"] for row in response.data or []}
         except Exception as e:
-            logger.error(f"❌ Error assigning dioceses to worker: {e}")
+            logger.debug(f"claim_diocese_work RPC unavailable ({e}), claiming with conditional inserts")
+            claimed_ids = self._claim_with_conditional_inserts(candidate_ids, limit)
+
+        return [diocese for diocese in candidates if diocese["id"] in claimed_ids]
+
+    def _claim_with_conditional_inserts(self, candidate_ids: List[int], limit: int) -> set:
+        """Claim dioceses one insert at a time, then release any claim another worker won."""
+        claimed = set()
+        for diocese_id in candidate_ids:
+            if len(claimed) >= limit:
+                break
+            try:
+                response = self.supabase.table("diocese_work_assignments").insert(self._assignment_row(diocese_id)).execute()
+            except Exception as e:
+                # Unique violation: another worker holds an active assignment
+                logger.debug(f"Diocese {diocese_id} already claimed: {e}")
+                continue
+            if response.data:
+                claimed.add(diocese_id)
+
+        if not claimed:
+            return claimed
+
+        # Without the unique index two workers can insert concurrently; the earliest assignment wins
+        contested = (
+            self.supabase.table("diocese_work_assignments")
+            .select("diocese_id, worker_id, assigned_at")
+            .in_("diocese_id", list(claimed))
+            .eq("status", "processing")
+            .execute()
+        )
+        winners: Dict[int, tuple] = {}
+        for row in contested.data or []:
+            key = (row["assigned_at"], row["worker_id"])
+            if row["diocese_id"] not in winners or key < winners[row["diocese_id"]]:
+                winners[row["diocese_id"]] = key
+
+        lost = {diocese_id for diocese_id in claimed if winners.get(diocese_id, (None, self.worker_id))[1] != self.worker_id}
+        if lost:
+            self.supabase.table("diocese_work_assignments").update(
+                {"status": "failed", "completed_at": datetime.utcnow().isoformat()}
+            ).in_("diocese_id", list(lost)).eq("worker_id", self.worker_id).eq("status", "processing").execute()
+            logger.info(f"🔒 Released {len(lost)} dioceses claimed concurrently by other workers")
+
+        return claimed - lost
 
     async def mark_diocese_completed(self, diocese_id: int, status: str = "completed"):
         """
@@ -519,6 +574,10 @@ CREATE INDEX IF NOT EXISTS idx_diocese_assignments_status ON diocese_work_assign
 CREATE INDEX IF NOT EXISTS idx_diocese_assignments_diocese ON diocese_work_assignments(diocese_id);
 CREATE INDEX IF NOT EXISTS idx_diocese_assignments_worker ON diocese_work_assignments(worker_id);
 
+-- At most one active assignment per diocese (enables atomic claims, see claim_diocese_work)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_diocese_assignments_processing
+    ON diocese_work_assignments(diocese_id) WHERE status = 'processing';
+
 -- Update trigger for pipeline_workers
 CREATE OR REPLACE FUNCTION update_pipeline_workers_updated_at()
 RETURNS TRIGGER AS $$
@@ -1,7 +1,13 @@
+import atexit
 import shutil
 import subprocess
+import threading
 import time
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+from urllib.parse import urlparse
 
+import psutil
 from selenium import webdriver
 from selenium.common.exceptions import SessionNotCreatedException, TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -285,6 +291,10 @@ class ProtectedWebDriver:
         # Initialize enhanced element wait strategy
         self.element_wait_strategy = ElementWaitStrategy(driver, base_timeout=5.0)
 
+        # Usage tracking for BrowserPool resets and recycling
+        self.pages_loaded = 0
+        self.visited_origins = set()
+
         logger.info(f"🛡️ Protected WebDriver initialized with optimized configs (timeout: {default_timeout}s)")
         logger.debug(f"   • Element interaction threshold: {self.element_cb_config.failure_threshold}")
         logger.debug(f"   • Page load threshold: {self.page_load_cb_config.failure_threshold}")
@@ -296,6 +306,10 @@ class ProtectedWebDriver:
         logger.debug(f"🌐 Loading page: {url} (timeout: {timeout}s)")
 
         cb = circuit_manager.get_circuit_breaker("webdriver_page_load", self.page_load_cb_config)
+        self.pages_loaded += 1
+        parsed = urlparse(url)
+        if parsed.scheme in ("http", "https"):
+            self.visited_origins.add(f"{parsed.scheme}://{parsed.netloc}")
 
         def _load_page():
             # Set page load timeout
@@ -400,3 +414,254 @@ def get_protected_driver(timeout=30):
     if raw_driver:
         return ProtectedWebDriver(raw_driver, timeout)
     return None
+
+
+# Clears storage for the page the browser is on; other visited origins are cleared over CDP
+_CLEAR_PAGE_STORAGE_SCRIPT = "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+
+
+class BrowserPool:
+    """
+    Long-lived pool of protected WebDrivers shared across dioceses.
+
+    Launching Chrome takes seconds and hundreds of MB, so browsers are leased
+    and returned rather than quit after every diocese. On return a browser has
+    its extra tabs closed and its cookies, cache and storage cleared, so the
+    next lease starts clean; it is quit instead once it has loaded
+    ``max_pages`` pages or its process tree has grown past ``max_rss_mb``.
+    Leases health-check idle browsers and replace any whose session died.
+    Several leases can be held at once for parallel page work.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages: int = 200,
+        max_rss_mb: float = 1500.0,
+        timeout: int = 30,
+        factory: Optional[Callable] = None,
+    ):
+        """
+        Args:
+            size: Maximum number of live browsers
+            max_pages: Page loads after which a browser is recycled
+            max_rss_mb: Browser process tree RSS above which it is recycled (0 disables)
+            timeout: Default page load timeout for the ProtectedWebDriver wrappers
+            factory: Creates a raw WebDriver, or returns None on failure
+        """
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.timeout = timeout
+        self._factory = factory or _setup_driver_with_retry
+        self._idle: List[ProtectedWebDriver] = []
+        self._leased = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self.stats = {
+            "leases": 0,
+            "launched": 0,
+            "reused": 0,
+            "recycled_pages": 0,
+            "recycled_memory": 0,
+            "unhealthy": 0,
+            "reset_failures": 0,
+            "launch_failures": 0,
+            "wait_time": 0.0,
+        }
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[ProtectedWebDriver]:
+        """
+        Lease a browser, launching one if the pool is below size.
+
+        Returns:
+            A ProtectedWebDriver, or None if no browser became free within
+            ``timeout`` seconds or a new one could not be launched
+        """
+        started = time.monotonic()
+        driver = None
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    break
+                if self._leased < self.size:
+                    break
+                remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            self._leased += 1
+            self.stats["leases"] += 1
+            self.stats["wait_time"] += time.monotonic() - started
+
+        if driver is not None and not self._is_healthy(driver):
+            logger.warning("⚠️ Pooled browser is unresponsive, replacing it")
+            self.stats["unhealthy"] += 1
+            self._quit(driver)
+            driver = None
+
+        if driver is None:
+            driver = self._launch()
+            if driver is None:
+                self._return_slot(None)
+                return None
+        else:
+            self.stats["reused"] += 1
+        return driver
+
+    def release(self, driver: Optional[ProtectedWebDriver]):
+        """Return a leased browser, resetting or recycling it."""
+        if driver is None:
+            return
+
+        keep = not self._closed and not self._should_recycle(driver)
+        if keep and not self._reset(driver):
+            self.stats["reset_failures"] += 1
+            keep = False
+        if not keep:
+            self._quit(driver)
+
+        self._return_slot(driver if keep else None)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """Context manager form of acquire/release; yields None if no browser is available."""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Quit idle browsers; browsers still leased are quit when released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._quit(driver)
+        if self.stats["leases"]:
+            logger.info(f"🧭 Browser pool closed: {self.get_stats()}")
+
+    def get_stats(self) -> dict:
+        with self._condition:
+            stats = dict(self.stats)
+            stats.update(size=self.size, idle=len(self._idle), leased=self._leased)
+        stats["reuse_rate"] = stats["reused"] / stats["leases"] if stats["leases"] else 0.0
+        return stats
+
+    def _return_slot(self, driver: Optional[ProtectedWebDriver]):
+        with self._condition:
+            self._leased -= 1
+            if driver is not None and not self._closed:
+                self._idle.append(driver)
+                driver = None
+            self._condition.notify()
+        if driver is not None:
+            # The pool closed while this browser was being reset
+            self._quit(driver)
+
+    def _launch(self) -> Optional[ProtectedWebDriver]:
+        try:
+            raw_driver = self._factory()
+        except Exception as e:
+            logger.warning(f"⚠️ Browser launch failed: {e}")
+            raw_driver = None
+        if raw_driver is None:
+            self.stats["launch_failures"] += 1
+            return None
+        self.stats["launched"] += 1
+        return ProtectedWebDriver(raw_driver, self.timeout)
+
+    def _is_healthy(self, driver: ProtectedWebDriver) -> bool:
+        try:
+            return driver.driver is not None and bool(driver.driver.window_handles)
+        except Exception:
+            return False
+
+    def _should_recycle(self, driver: ProtectedWebDriver) -> bool:
+        if driver.pages_loaded >= self.max_pages:
+            self.stats["recycled_pages"] += 1
+            return True
+        if self.max_rss_mb and self._browser_rss_mb(driver) > self.max_rss_mb:
+            self.stats["recycled_memory"] += 1
+            return True
+        return False
+
+    def _browser_rss_mb(self, driver: ProtectedWebDriver) -> float:
+        """Resident memory of the driver service and the browser processes it started."""
+        try:
+            process = psutil.Process(driver.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+        except Exception:
+            return 0.0
+        total = 0
+        for proc in processes:
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    def _reset(self, driver: ProtectedWebDriver) -> bool:
+        """Close extra tabs and clear cookies, storage and cache left by the previous lease."""
+        raw_driver = driver.driver
+        try:
+            handles = raw_driver.window_handles
+            for handle in handles[1:]:
+                raw_driver.switch_to.window(handle)
+                raw_driver.close()
+            raw_driver.switch_to.window(handles[0])
+
+            raw_driver.execute_script(_CLEAR_PAGE_STORAGE_SCRIPT)
+            raw_driver.delete_all_cookies()
+            if hasattr(raw_driver, "execute_cdp_cmd"):
+                raw_driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                raw_driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                for origin in driver.visited_origins:
+                    raw_driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.visited_origins.clear()
+
+            raw_driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.debug(f"Browser reset failed: {e}")
+            return False
+
+    def _quit(self, driver: ProtectedWebDriver):
+        try:
+            driver.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Error quitting pooled browser: {e}")
+
+
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool, sized from pipeline config."""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            from pipeline import config
+
+            _browser_pool = BrowserPool(
+                size=config.BROWSER_POOL_SIZE,
+                max_pages=config.BROWSER_MAX_PAGES,
+                max_rss_mb=config.BROWSER_MAX_RSS_MB,
+            )
+            atexit.register(close_browser_pool)
+        return _browser_pool
+
+
+def close_browser_pool():
+    """Quit the process-wide browser pool's browsers."""
+    global _browser_pool
+    with _browser_pool_lock:
+        pool, _browser_pool = _browser_pool, None
+    if pool is not None:
+        pool.close()
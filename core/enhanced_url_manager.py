@@ -12,7 +12,9 @@ to dramatically improve extraction success rates by:
 5. Improved Timeout Strategy - Context-aware timeout management
 """
 
+import concurrent.futures
 import re
+import socket
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -33,6 +35,12 @@ from supabase import Client
 
 logger = get_logger(__name__)
 
+# Hosts verified concurrently by _verify_url_candidates
+VERIFICATION_MAX_WORKERS = 16
+# Seconds a DNS answer stays in the shared cache; failures expire sooner
+DNS_POSITIVE_TTL = 3600.0
+DNS_NEGATIVE_TTL = 300.0
+
 
 @dataclass
 class URLCandidate:
@@ -464,70 +472,104 @@ class EnhancedURLManager:
             return 0
 
     def _verify_url_candidates(self, candidates: List[URLCandidate]) -> List[URLCandidate]:
-        """Verify URL candidates with protocol detection and DNS resolution using intelligent caching."""
-        verified = []
+        """
+        Verify URL candidates with DNS resolution and protocol detection, one check per host.
 
+        Candidates are grouped by host. Each distinct host is resolved once and its
+        scheme probed once (HTTPS, then HTTP) using its highest-priority URL; hosts are
+        verified concurrently, one probe at a time per host. DNS answers, including
+        failures, and scheme decisions are kept in the shared cache manager.
+        """
+        hosts: Dict[str, List[URLCandidate]] = defaultdict(list)
         for candidate in candidates:
-            error_context = ErrorContext(operation="url_verification", url=candidate.url, parish_id=candidate.parish_id)
-
-            try:
-                verified_candidate = self.error_handler.handle_with_fallback(
-                    "url_verification", self._verify_single_candidate, error_context, candidate=candidate
-                )
-
-                if verified_candidate and verified_candidate.dns_resolvable:
-                    verified.append(verified_candidate)
+            host = urlparse(candidate.url).netloc.lower()
+            if host:
+                hosts[host].append(candidate)
+
+        host_results: Dict[str, Tuple[bool, Optional[str]]] = {}
+        if hosts:
+            max_workers = min(VERIFICATION_MAX_WORKERS, len(hosts))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="url-verify") as executor:
+                futures = {
+                    executor.submit(self._verify_host_with_fallback, host, host_candidates[0]): host
+                    for host, host_candidates in hosts.items()
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    host = futures[future]
+                    try:
+                        host_results[host] = future.result()
+                    except Exception as e:
+                        logger.debug(f"🔗 Error verifying host {host}: {e}")
 
-            except Exception as e:
-                logger.debug(f"🔗 Error verifying candidate {candidate.url}: {e}")
+        verified = []
+        for candidate in candidates:
+            host = urlparse(candidate.url).netloc.lower()
+            resolvable, scheme = host_results.get(host, (False, None))
+            candidate.dns_resolvable = resolvable
+            if not resolvable:
                 continue
 
-        logger.info(f"🔗 Verified {len(verified)}/{len(candidates)} URL candidates")
+            parsed = urlparse(candidate.url)
+            if scheme and parsed.scheme != scheme:
+                candidate.url = urlunparse(parsed._replace(scheme=scheme))
+                candidate.protocol_verified = True
+            verified.append(candidate)
+
+        logger.info(f"🔗 Verified {len(verified)}/{len(candidates)} URL candidates across {len(hosts)} hosts")
         return verified
 
-    def _verify_single_candidate(self, error_context: ErrorContext, candidate: URLCandidate) -> URLCandidate:
-        """Verify a single URL candidate with intelligent caching."""
-        # Check DNS resolution using intelligent cache
-        domain = urlparse(candidate.url).netloc
-
-        # Use cache manager for DNS resolution
-        cache_key = f"dns_resolution:{domain}"
-        candidate.dns_resolvable = self.cache_manager.get(cache_key, default=None)
-
-        if candidate.dns_resolvable is None:
-            # Perform DNS resolution check
-            candidate.dns_resolvable = self._check_dns_resolution(domain)
-            # Cache result with 1 hour TTL
-            self.cache_manager.set(cache_key, candidate.dns_resolvable, ttl=3600.0, content_type=ContentType.DNS_RESULT)
-
-        # Protocol verification with intelligent caching
-        if candidate.dns_resolvable:
-            protocol_cache_key = f"protocol_verification:{candidate.url}"
-            verified_url = self.cache_manager.get(protocol_cache_key, default=None)
-
-            if verified_url is None:
-                verified_url = self._verify_and_fix_protocol_with_timeout(candidate)
-                # Cache result with 30 minute TTL
-                self.cache_manager.set(protocol_cache_key, verified_url, ttl=1800.0, content_type=ContentType.URL_VERIFICATION)
-
-            if verified_url != candidate.url:
-                candidate.url = verified_url
-                candidate.protocol_verified = True
+    def _verify_host_with_fallback(self, host: str, sample: URLCandidate) -> Tuple[bool, Optional[str]]:
+        error_context = ErrorContext(operation="url_verification", url=sample.url, parish_id=sample.parish_id)
+        result = self.error_handler.handle_with_fallback(
+            "url_verification", self._verify_host, error_context, host=host, sample=sample
+        )
+        return result if isinstance(result, tuple) else (False, None)
 
-        return candidate
+    def _verify_host(self, error_context: ErrorContext, host: str, sample: URLCandidate) -> Tuple[bool, Optional[str]]:
+        """
+        Resolve a host and find the scheme it serves, using the cache where possible.
+
+        Returns:
+            (dns_resolvable, scheme) where scheme is None if neither HTTPS nor HTTP answered
+        """
+        dns_cache_key = f"dns_resolution:{host}"
+        resolvable = self.cache_manager.get(dns_cache_key, default=None)
+        if resolvable is None:
+            resolvable = self._check_dns_resolution(urlparse(sample.url).hostname or host)
+            # Failures are cached briefly so a transient resolver problem does not hide a parish for an hour
+            ttl = DNS_POSITIVE_TTL if resolvable else DNS_NEGATIVE_TTL
+            self.cache_manager.set(dns_cache_key, resolvable, ttl=ttl, content_type=ContentType.DNS_RESULT)
+
+        if not resolvable:
+            return False, None
+
+        scheme_cache_key = f"protocol_scheme:{host}"
+        scheme = self.cache_manager.get(scheme_cache_key, default=None)
+        if scheme is None:
+            # An empty string records "neither scheme answered" so the probe is not repeated
+            scheme = self._probe_scheme(sample) or ""
+            self.cache_manager.set(scheme_cache_key, scheme, ttl=1800.0, content_type=ContentType.URL_VERIFICATION)
+
+        return True, scheme or None
 
     def _check_dns_resolution(self, domain: str) -> bool:
         """Quick DNS resolution check."""
         try:
-            import socket
-
-            socket.gethostbyname(domain)
+            socket.getaddrinfo(domain, None)
             return True
-        except socket.gaierror:
+        except (socket.gaierror, UnicodeError):
             return False
 
     def _verify_and_fix_protocol_with_timeout(self, candidate: URLCandidate) -> str:
         """Verify URL protocol with adaptive timeouts."""
+        scheme = self._probe_scheme(candidate)
+        if scheme is None:
+            # If both fail, return original
+            return candidate.url
+        return urlunparse(urlparse(candidate.url)._replace(scheme=scheme))
+
+    def _probe_scheme(self, candidate: URLCandidate) -> Optional[str]:
+        """Return the first of HTTPS/HTTP that answers a HEAD request for the candidate, or None."""
         parsed = urlparse(candidate.url)
 
         # Get adaptive timeout for verification
@@ -545,14 +587,13 @@ class EnhancedURLManager:
                 if response.status_code < 400:
                     # Record successful response for timeout optimization
                     self.timeout_manager.record_response(test_url, "head_request", response.elapsed.total_seconds(), True)
-                    return test_url
+                    return scheme
             except Exception as e:
                 # Record failed response for timeout optimization
                 self.timeout_manager.record_response(test_url, "head_request", verification_timeout, False, str(e))
                 continue
 
-        # If both fail, return original
-        return candidate.url
+        return None
 
     def _verify_and_fix_protocol(self, url: str) -> str:
         """Legacy method for backward compatibility."""
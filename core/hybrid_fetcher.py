@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Hybrid page fetching: plain HTTP for static pages, the browser only when needed.
+
+Most diocese and parish pages render their content server-side, so loading
+them through Selenium costs seconds per page for nothing. HybridPageFetcher
+tries the pooled HTTP client first and falls back to a browser loader when the
+request fails, the page looks JavaScript-driven, or the expected content is
+missing. The path that worked is remembered per domain in the cache manager,
+so later runs go straight to the browser for sites that need it. A domain is
+only pinned to the browser once a static copy came back unusable and the
+browser then succeeded; that decision expires much sooner than an HTTP one so
+the site is re-probed. Failed requests are treated as transient and pin nothing.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from core.http_client import get_http_client
+from core.intelligent_cache_manager import ContentType, get_cache_manager
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+PATH_HTTP = "http"
+PATH_BROWSER = "browser"
+
+# Visible text below this many characters is treated as an empty shell waiting for scripts
+MIN_STATIC_TEXT_LENGTH = 200
+
+
+def has_static_content(html: str, selectors: Optional[str] = None) -> bool:
+    """
+    Check that statically fetched HTML carries real content.
+
+    Args:
+        html: Page HTML
+        selectors: Optional CSS selector list that must match at least one element
+
+    Returns:
+        True if the page has enough body text and, when given, a selector match
+    """
+    soup = BeautifulSoup(html, "lxml")
+    if selectors and soup.select_one(selectors) is None:
+        return False
+    body = soup.body or soup
+    return len(body.get_text(" ", strip=True)) >= MIN_STATIC_TEXT_LENGTH
+
+
+class HybridPageFetcher:
+    """Fetches pages over pooled HTTP when a site allows it, otherwise through a browser callback."""
+
+    def __init__(
+        self,
+        http_client=None,
+        cache=None,
+        ttl_days: float = 14,
+        enabled: bool = True,
+        browser_ttl_hours: float = 24,
+    ):
+        """
+        Args:
+            http_client: HTTPClientPool used for static fetches (defaults to the global client)
+            cache: Cache manager holding per-domain path decisions (defaults to the global cache)
+            ttl_days: How long a domain's HTTP decision is trusted
+            enabled: When False every fetch goes to the browser
+            browser_ttl_hours: How long a domain stays pinned to the browser before HTTP is tried again
+        """
+        self.http_client = http_client or get_http_client()
+        self.cache = cache or get_cache_manager()
+        self.ttl_seconds = ttl_days * 86400
+        self.browser_ttl_seconds = browser_ttl_hours * 3600
+        self.enabled = enabled
+        self.stats = {"http": 0, "browser": 0, "fallbacks": 0, "skipped_http": 0}
+        # Domains whose static copy came back unusable, awaiting a browser success
+        self._static_rejected = set()
+        self._lock = threading.Lock()
+
+    def _key(self, url: str) -> str:
+        return f"fetch_path:{urlparse(url).netloc.lower()}"
+
+    def preferred_path(self, url: str) -> Optional[str]:
+        """The path that last worked for the URL's domain, or None if unknown."""
+        return self.cache.get(self._key(url), default=None)
+
+    def record_path(self, url: str, path: str):
+        """Remember which path works for the URL's domain."""
+        if self.preferred_path(url) != path:
+            logger.debug(f"🔀 {urlparse(url).netloc}: using {path} fetches")
+        ttl = self.browser_ttl_seconds if path == PATH_BROWSER else self.ttl_seconds
+        self.cache.set(self._key(url), path, ttl=ttl, content_type=ContentType.STATIC_CONTENT)
+
+    def record_browser_success(self, url: str):
+        """
+        Pin the URL's domain to the browser after a browser fetch succeeded,
+        but only if its static copy was rejected as script-driven or incomplete.
+        """
+        domain = urlparse(url).netloc.lower()
+        with self._lock:
+            if domain not in self._static_rejected:
+                return
+            self._static_rejected.discard(domain)
+        self.record_path(url, PATH_BROWSER)
+
+    def fetch_static(self, url: str, timeout: Optional[int] = None) -> Optional[str]:
+        """GET the page over HTTP; None if the request fails or the response is not HTML."""
+        try:
+            response = self.http_client.get(url, timeout=timeout)
+        except Exception as e:
+            logger.debug(f"🔀 Static fetch failed for {url}: {e}")
+            return None
+        if "html" not in response.headers.get("Content-Type", "text/html").lower():
+            return None
+        return response.text
+
+    def try_static(
+        self,
+        url: str,
+        requires_javascript: Optional[Callable[[str], bool]] = None,
+        is_usable: Callable[[str], bool] = has_static_content,
+        timeout: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Fetch a page over HTTP if the domain is not known to need the browser.
+
+        A static copy that is script-driven or unusable marks the domain as a
+        browser candidate; callers confirm it with record_browser_success()
+        once their browser fetch works. Request failures mark nothing.
+
+        Args:
+            url: Page to fetch
+            requires_javascript: Called with the lowercased HTML; True rejects the static copy
+            is_usable: Called with the HTML; False rejects the static copy
+            timeout: Request timeout override
+
+        Returns:
+            The HTML, or None if the caller should use the browser
+        """
+        if not self.enabled:
+            return None
+        if self.preferred_path(url) == PATH_BROWSER:
+            self._count("skipped_http")
+            return None
+
+        html = self.fetch_static(url, timeout=timeout)
+        if html is None:
+            self._count("fallbacks")
+            return None
+        if (requires_javascript is not None and requires_javascript(html.lower())) or not is_usable(html):
+            self._count("fallbacks")
+            with self._lock:
+                self._static_rejected.add(urlparse(url).netloc.lower())
+            return None
+
+        self._count("http")
+        with self._lock:
+            self._static_rejected.discard(urlparse(url).netloc.lower())
+        self.record_path(url, PATH_HTTP)
+        return html
+
+    def fetch(
+        self,
+        url: str,
+        browser_fetch: Callable[[], str],
+        requires_javascript: Optional[Callable[[str], bool]] = None,
+        is_usable: Callable[[str], bool] = has_static_content,
+        timeout: Optional[int] = None,
+    ) -> Tuple[str, str]:
+        """
+        Fetch a page, over HTTP when possible and through ``browser_fetch`` otherwise.
+
+        Returns:
+            (html, path) where path is PATH_HTTP or PATH_BROWSER
+        """
+        html = self.try_static(url, requires_javascript, is_usable, timeout)
+        if html is not None:
+            return html, PATH_HTTP
+
+        self._count("browser")
+        html = browser_fetch()
+        self.record_browser_success(url)
+        return html, PATH_BROWSER
+
+    def _count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        fetched = stats["http"] + stats["browser"]
+        stats["http_rate"] = stats["http"] / fetched if fetched else 0.0
+        return stats
+
+
+class DeferredPageDriver:
+    """
+    WebDriver proxy for a page that was already fetched over HTTP.
+
+    The browser only loads the page when something first touches the driver,
+    so extractors that work from the static soup never trigger a page load.
+    A get() to another URL goes straight through, since the deferred page is
+    no longer needed once the browser navigates elsewhere.
+    """
+
+    def __init__(self, driver, url: str, load_page: Callable[[Any, str], Any]):
+        self._driver = driver
+        self._url = url
+        self._load_page = load_page
+        self.page_loaded = False
+
+    def get(self, url: str, *args, **kwargs):
+        self.page_loaded = True
+        return self._driver.get(url, *args, **kwargs)
+
+    def __getattr__(self, name):
+        if not self.page_loaded:
+            self.page_loaded = True
+            logger.debug(f"🔀 Loading {self._url} in the browser on first driver use ({name})")
+            self._load_page(self._driver, self._url)
+        return getattr(self._driver, name)
+
+
+_hybrid_fetcher: Optional[HybridPageFetcher] = None
+
+
+def get_hybrid_fetcher() -> HybridPageFetcher:
+    """Get the global hybrid page fetcher."""
+    global _hybrid_fetcher
+    if _hybrid_fetcher is None:
+        from pipeline import config
+
+        _hybrid_fetcher = HybridPageFetcher(
+            ttl_days=config.FETCH_PATH_TTL_DAYS,
+            enabled=config.STATIC_FETCH_ENABLED,
+            browser_ttl_hours=config.FETCH_BROWSER_PATH_TTL_HOURS,
+        )
+    return _hybrid_fetcher
@@ -12,6 +12,8 @@ import hashlib
 import json
 import os
 import pickle
+import re
+import sqlite3
 import threading
 import time
 from collections import OrderedDict, defaultdict
@@ -98,18 +100,282 @@ class CacheStatistics:
     total_size_bytes: int = 0
     avg_lookup_time: float = 0.0
     hit_rate_by_type: Dict[str, float] = field(default_factory=dict)
+    disk_hits: int = 0
+    disk_writes: int = 0
+
+
+class DiskCacheTier:
+    """
+    Persistent SQLite cache tier shared by all processes on a node.
+
+    Entry metadata and payloads are stored separately: payloads are keyed by
+    the SHA-256 of their serialized bytes, so identical values cached under
+    different keys (e.g. the same page reached through several URLs) are
+    stored once. WAL mode lets concurrent workers read while one writes.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            blob_hash TEXT NOT NULL,
+            content_hash TEXT,
+            created_at REAL NOT NULL,
+            last_accessed REAL NOT NULL,
+            access_count INTEGER NOT NULL DEFAULT 0,
+            ttl REAL NOT NULL,
+            content_type TEXT NOT NULL,
+            metadata TEXT,
+            compression INTEGER NOT NULL DEFAULT 0,
+            size_bytes INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_last_accessed ON entries(last_accessed);
+        CREATE INDEX IF NOT EXISTS idx_entries_blob_hash ON entries(blob_hash);
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            data BLOB NOT NULL,
+            size_bytes INTEGER NOT NULL
+        );
+    """
+
+    def __init__(
+        self, db_path: str, max_size_bytes: int, warm_start_from: Optional[str] = None, size_check_interval: int = 100
+    ):
+        self.db_path = db_path
+        self.max_size_bytes = max_size_bytes
+        self.size_check_interval = size_check_interval
+        self._writes_since_size_check = 0
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+        if warm_start_from and os.path.abspath(warm_start_from) != os.path.abspath(db_path):
+            self.warm_start(warm_start_from)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Load an unexpired entry, updating its access time; expired entries are deleted."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT e.key, e.content_hash, e.created_at, e.access_count, e.ttl, e.content_type,
+                       e.metadata, e.compression, e.size_bytes, b.data
+                FROM entries e JOIN blobs b ON b.hash = e.blob_hash
+                WHERE e.key = ?
+                """,
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            key, content_hash, created_at, access_count, ttl, content_type, metadata, compression, size_bytes, data = row
+            now = time.time()
+            if now > created_at + ttl:
+                self.delete([key])
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_accessed = ?, access_count = access_count + 1 WHERE key = ?", (now, key)
+            )
+
+        try:
+            value = pickle.loads(data)
+        except Exception as e:
+            logger.debug(f"💾 Discarding unreadable disk cache entry {key}: {e}")
+            self.delete([key])
+            return None
+
+        return CacheEntry(
+            key=key,
+            value=value,
+            created_at=created_at,
+            last_accessed=now,
+            access_count=access_count + 1,
+            ttl=ttl,
+            content_type=ContentType(content_type),
+            content_hash=content_hash,
+            metadata=json.loads(metadata) if metadata else {},
+            compression=bool(compression),
+            size_bytes=size_bytes,
+        )
+
+    def put(self, entry: CacheEntry) -> bool:
+        """Persist an entry, storing its payload once per content hash."""
+        try:
+            data = pickle.dumps(entry.value)
+        except Exception as e:
+            logger.debug(f"💾 Value for {entry.key} is not picklable, keeping it in memory only: {e}")
+            return False
+
+        blob_hash = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO blobs (hash, data, size_bytes) VALUES (?, ?, ?)", (blob_hash, data, len(data))
+                )
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO entries
+                        (key, blob_hash, content_hash, created_at, last_accessed, access_count, ttl,
+                         content_type, metadata, compression, size_bytes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        entry.key,
+                        blob_hash,
+                        entry.content_hash,
+                        entry.created_at,
+                        entry.last_accessed,
+                        entry.access_count,
+                        entry.ttl,
+                        entry.content_type.value,
+                        json.dumps(entry.metadata, default=str),
+                        int(entry.compression),
+                        entry.size_bytes,
+                    ),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            self._writes_since_size_check += 1
+            if self._writes_since_size_check >= self.size_check_interval:
+                self.enforce_size_limit()
+
+        return True
+
+    def touch(self, key: str, ttl: float, metadata: Dict[str, Any]):
+        """Refresh TTL and metadata of an unchanged entry."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET ttl = ?, last_accessed = ?, metadata = ? WHERE key = ?",
+                (ttl, time.time(), json.dumps(metadata, default=str), key),
+            )
+
+    def delete(self, keys: List[str]) -> int:
+        """Delete entries and any payloads no longer referenced."""
+        if not keys:
+            return 0
+        with self._lock:
+            deleted = 0
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                deleted += self._conn.execute(f"DELETE FROM entries WHERE key IN ({placeholders})", chunk).rowcount
+            self._delete_orphan_blobs()
+            return deleted
+
+    def keys_by_content_type(self) -> List[Tuple[str, str]]:
+        """All (key, content_type) pairs on disk."""
+        with self._lock:
+            return self._conn.execute("SELECT key, content_type FROM entries").fetchall()
+
+    def delete_expired(self) -> int:
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM entries WHERE created_at + ttl < ?", (time.time(),)).rowcount
+            self._delete_orphan_blobs()
+            return deleted
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM blobs").fetchone()[0]
+
+    def enforce_size_limit(self) -> int:
+        """Drop expired entries, then least recently used ones, until payloads fit in max_size_bytes."""
+        with self._lock:
+            self._writes_since_size_check = 0
+            evicted = self.delete_expired()
+            total = self.total_size()
+            while total > self.max_size_bytes:
+                lru_keys = [
+                    row[0]
+                    for row in self._conn.execute("SELECT key FROM entries ORDER BY last_accessed LIMIT 100").fetchall()
+                ]
+                if not lru_keys:
+                    break
+                evicted += self.delete(lru_keys)
+                total = self.total_size()
+            return evicted
+
+    def warm_start(self, source_path: str) -> int:
+        """Copy unexpired entries missing locally from another cache database (e.g. on a shared volume)."""
+        if not os.path.exists(source_path):
+            logger.info(f"💾 No warm-start cache found at {source_path}")
+            return 0
+
+        with self._lock:
+            self._conn.execute("ATTACH DATABASE ? AS warm", (source_path,))
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                copied = self._conn.execute(
+                    "INSERT OR IGNORE INTO entries SELECT * FROM warm.entries WHERE created_at + ttl >= ?", (time.time(),)
+                ).rowcount
+                self._conn.execute(
+                    """
+                    INSERT OR IGNORE INTO blobs
+                    SELECT * FROM warm.blobs WHERE hash IN (SELECT blob_hash FROM entries)
+                    """
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            finally:
+                self._conn.execute("DETACH DATABASE warm")
+
+        logger.info(f"💾 Warm-started {copied} cache entries from {source_path}")
+        return copied
+
+    def get_statistics(self) -> Dict:
+        with self._lock:
+            entries, logical_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM entries"
+            ).fetchone()
+            blobs, stored_bytes = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM blobs").fetchone()
+        return {
+            "path": self.db_path,
+            "entries": entries,
+            "unique_payloads": blobs,
+            "stored_size_mb": stored_bytes / (1024 * 1024),
+            "logical_size_mb": logical_bytes / (1024 * 1024),
+            "max_size_mb": self.max_size_bytes / (1024 * 1024),
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _delete_orphan_blobs(self):
+        self._conn.execute("DELETE FROM blobs WHERE hash NOT IN (SELECT blob_hash FROM entries)")
 
 
 class IntelligentCacheManager:
     """
     Advanced caching system with intelligent TTL management and content-aware strategies.
+
+    Entries live in a bounded in-memory LRU tier backed by a persistent SQLite
+    tier in cache_dir. Writes go through to disk, memory misses are served and
+    promoted from disk, so cached values survive restarts and are shared by
+    workers on the same node.
     """
 
-    def __init__(self, max_size: int = 1000, max_memory_mb: int = 500, default_ttl: float = 3600.0, cache_dir: str = None):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        max_memory_mb: int = 500,
+        default_ttl: float = 3600.0,
+        cache_dir: str = None,
+        persistent: bool = True,
+        max_disk_mb: int = 2048,
+        warm_start_from: Optional[str] = None,
+    ):
         self.max_size = max_size
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
         self.default_ttl = default_ttl
-        self.cache_dir = cache_dir or "/tmp/usccb_cache"
+        self.cache_dir = cache_dir or os.getenv("CACHE_DIR", "/tmp/usccb_cache")
 
         # Cache storage
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
@@ -142,7 +408,22 @@ class IntelligentCacheManager:
         # Ensure cache directory exists
         os.makedirs(self.cache_dir, exist_ok=True)
 
-        logger.info(f"💾 Intelligent Cache Manager initialized (max_size: {max_size}, max_memory: {max_memory_mb}MB)")
+        # Persistent disk tier
+        self.disk: Optional[DiskCacheTier] = None
+        if persistent:
+            try:
+                self.disk = DiskCacheTier(
+                    os.path.join(self.cache_dir, "cache.sqlite3"),
+                    max_size_bytes=max_disk_mb * 1024 * 1024,
+                    warm_start_from=warm_start_from or os.getenv("CACHE_WARM_START_PATH"),
+                )
+            except Exception as e:
+                logger.warning(f"💾 Disk cache tier unavailable, using memory only: {e}")
+
+        logger.info(
+            f"💾 Intelligent Cache Manager initialized (max_size: {max_size}, max_memory: {max_memory_mb}MB, "
+            f"disk: {f'{max_disk_mb}MB' if self.disk else 'disabled'})"
+        )
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -153,24 +434,27 @@ class IntelligentCacheManager:
         with self._lock:
             self.stats.total_requests += 1
 
-            if key not in self._cache:
-                self.stats.cache_misses += 1
-                return default
-
-            entry = self._cache[key]
+            entry = self._cache.get(key)
 
             # Check expiration
-            if entry.is_expired:
+            if entry is not None and entry.is_expired:
                 self._remove_entry(key)
-                self.stats.cache_misses += 1
-                return default
+                entry = None
+
+            # Fall back to the disk tier (another worker may have refreshed the entry)
+            if entry is None:
+                entry = self._promote_from_disk(key)
+                if entry is None:
+                    self.stats.cache_misses += 1
+                    return default
 
             # Update access metadata
             entry.last_accessed = time.time()
             entry.access_count += 1
 
             # Move to end (most recently used)
-            self._cache.move_to_end(key)
+            if key in self._cache:
+                self._cache.move_to_end(key)
 
             # Probabilistic refresh for soon-to-expire items
             if self._should_probabilistic_refresh(entry):
@@ -247,15 +531,22 @@ class IntelligentCacheManager:
                         old_entry.ttl = effective_ttl
                         old_entry.last_accessed = time.time()
                         old_entry.metadata.update(metadata or {})
+                        if self.disk:
+                            self.disk.touch(key, effective_ttl, old_entry.metadata)
                         logger.debug(f"💾 Refreshed TTL for unchanged content: {key}")
                         return True
 
                 # Add/update entry
+                self._remove_entry(key)
                 self._cache[key] = entry
 
                 # Update statistics
                 self.stats.total_size_bytes += entry.size_bytes
 
+                # Write through to the persistent tier
+                if self.disk and self.disk.put(entry):
+                    self.stats.disk_writes += 1
+
                 # Maintain cache size limits
                 self._enforce_size_limits()
 
@@ -269,22 +560,26 @@ class IntelligentCacheManager:
     def invalidate(self, key: str) -> bool:
         """Invalidate a specific cache entry."""
         with self._lock:
-            if key in self._cache:
-                self._remove_entry(key)
+            removed = key in self._cache
+            self._remove_entry(key)
+            if self.disk:
+                removed = self.disk.delete([key]) > 0 or removed
+
+            if removed:
                 self.stats.invalidations += 1
                 logger.debug(f"💾 Invalidated cache entry: {key}")
-                return True
-            return False
+            return removed
 
     def invalidate_pattern(self, pattern: str) -> int:
         """Invalidate all entries matching a pattern."""
-        import re
-
         count = 0
 
         with self._lock:
             regex = re.compile(pattern)
-            keys_to_remove = [key for key in self._cache.keys() if regex.search(key)]
+            keys_to_remove = {key for key in self._cache.keys() if regex.search(key)}
+            if self.disk:
+                keys_to_remove.update(key for key, _ in self.disk.keys_by_content_type() if regex.search(key))
+                self.disk.delete(list(keys_to_remove))
 
             for key in keys_to_remove:
                 self._remove_entry(key)
@@ -300,7 +595,12 @@ class IntelligentCacheManager:
         count = 0
 
         with self._lock:
-            keys_to_remove = [key for key, entry in self._cache.items() if entry.content_type == content_type]
+            keys_to_remove = {key for key, entry in self._cache.items() if entry.content_type == content_type}
+            if self.disk:
+                keys_to_remove.update(
+                    key for key, type_name in self.disk.keys_by_content_type() if type_name == content_type.value
+                )
+                self.disk.delete(list(keys_to_remove))
 
             for key in keys_to_remove:
                 self._remove_entry(key)
@@ -323,6 +623,9 @@ class IntelligentCacheManager:
                 self._remove_entry(key)
                 count += 1
 
+            if self.disk:
+                count += self.disk.delete_expired()
+
         if count > 0:
             logger.info(f"💾 Cleaned up {count} expired cache entries")
 
@@ -382,6 +685,9 @@ class IntelligentCacheManager:
                 "avg_lookup_time_ms": self.stats.avg_lookup_time * 1000,
                 "hit_rate_by_type": hit_rate_by_type,
                 "memory_usage_percent": (self.stats.total_size_bytes / self.max_memory_bytes) * 100,
+                "disk_hits": self.stats.disk_hits,
+                "disk_writes": self.stats.disk_writes,
+                "disk": self.disk.get_statistics() if self.disk else None,
             }
 
     def _calculate_intelligent_ttl(self, key: str, content_type: ContentType, value: Any) -> float:
@@ -513,8 +819,27 @@ class IntelligentCacheManager:
             self._remove_entry(lru_key)
             self.stats.evictions += 1
 
+    def _promote_from_disk(self, key: str) -> Optional[CacheEntry]:
+        """Load an entry from the disk tier into memory."""
+        if not self.disk:
+            return None
+
+        try:
+            entry = self.disk.get(key)
+        except Exception as e:
+            logger.debug(f"💾 Disk cache lookup failed for {key}: {e}")
+            return None
+        if entry is None:
+            return None
+
+        self._cache[key] = entry
+        self.stats.total_size_bytes += entry.size_bytes
+        self.stats.disk_hits += 1
+        self._enforce_size_limits()
+        return entry
+
     def _remove_entry(self, key: str):
-        """Remove entry and update statistics."""
+        """Remove entry from the memory tier and update statistics."""
         if key in self._cache:
             entry = self._cache.pop(key)
             self.stats.total_size_bytes -= entry.size_bytes
@@ -646,6 +971,12 @@ class IntelligentCacheManager:
             logger.error(f"💾 Error loading cache from disk: {e}")
             return False
 
+    def close(self):
+        """Close the persistent tier."""
+        if self.disk:
+            self.disk.close()
+            self.disk = None
+
 
 # Global cache manager instance
 _global_cache_manager = None
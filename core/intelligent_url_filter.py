@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Set, Tuple
 
+from core.keyword_matcher import KeywordMatcher
 from core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -160,6 +161,22 @@ class IntelligentURLFilter:
             ".wmv",
         }
 
+        # Compiled once; URLs are lower-cased before matching, so inline (?i) flags are not needed
+        self._blacklisted_domain_matcher = KeywordMatcher(self.blacklisted_domains)
+        self._blacklist_regex = re.compile(
+            "|".join(f"(?:{pattern.removeprefix('(?i)')})" for pattern in self.blacklisted_patterns)
+        )
+        self._compiled_patterns = {
+            tier: [(pattern, re.compile(pattern)) for pattern in patterns]
+            for tier, patterns in (
+                ("blacklisted", self.blacklisted_patterns),
+                ("high", self.high_value_patterns),
+                ("medium", self.medium_value_patterns),
+                ("low", self.low_value_patterns),
+            )
+        }
+        self._blacklisted_extensions = tuple(sorted(self.blacklisted_extensions))
+
     def analyze_urls(self, urls: List[str], ml_predictions: Dict[str, float] = None) -> List[URLAnalysis]:
         """
         Analyze a list of URLs and return quality assessments.
@@ -211,40 +228,41 @@ class IntelligentURLFilter:
             return URLAnalysis(url, URLQuality.SKIP, 0.0, ["Invalid URL format"], 0.0)
 
         # Check blacklisted domains
-        if any(blacklisted in domain for blacklisted in self.blacklisted_domains):
+        if self._blacklisted_domain_matcher.contains_any(domain):
             return URLAnalysis(url, URLQuality.SKIP, 0.0, ["Blacklisted domain"], 0.0)
 
-        # Check blacklisted patterns
-        for pattern in self.blacklisted_patterns:
-            if re.search(pattern, full_url_lower):
-                return URLAnalysis(url, URLQuality.SKIP, 0.0, [f"Blacklisted pattern: {pattern}"], 0.0)
+        # Check blacklisted patterns (one combined scan; the individual patterns only name the reason)
+        if self._blacklist_regex.search(full_url_lower):
+            for pattern, regex in self._compiled_patterns["blacklisted"]:
+                if regex.search(full_url_lower):
+                    return URLAnalysis(url, URLQuality.SKIP, 0.0, [f"Blacklisted pattern: {pattern}"], 0.0)
 
         # Check file extensions
         path_lower = path.lower()
-        for ext in self.blacklisted_extensions:
-            if path_lower.endswith(ext):
-                return URLAnalysis(url, URLQuality.SKIP, 0.0, [f"Blacklisted extension: {ext}"], 0.0)
+        if path_lower.endswith(self._blacklisted_extensions):
+            ext = next(ext for ext in self._blacklisted_extensions if path_lower.endswith(ext))
+            return URLAnalysis(url, URLQuality.SKIP, 0.0, [f"Blacklisted extension: {ext}"], 0.0)
 
         # Analyze high-value patterns
         high_value_matches = 0
-        for pattern in self.high_value_patterns:
-            if re.search(pattern, full_url_lower):
+        for pattern, regex in self._compiled_patterns["high"]:
+            if regex.search(full_url_lower):
                 high_value_matches += 1
                 confidence_score += 25.0
                 reasons.append(f"High-value pattern: {pattern}")
 
         # Analyze medium-value patterns
         medium_value_matches = 0
-        for pattern in self.medium_value_patterns:
-            if re.search(pattern, full_url_lower):
+        for pattern, regex in self._compiled_patterns["medium"]:
+            if regex.search(full_url_lower):
                 medium_value_matches += 1
                 confidence_score += 15.0
                 reasons.append(f"Medium-value pattern: {pattern}")
 
         # Analyze low-value patterns
         low_value_matches = 0
-        for pattern in self.low_value_patterns:
-            if re.search(pattern, full_url_lower):
+        for pattern, regex in self._compiled_patterns["low"]:
+            if regex.search(full_url_lower):
                 low_value_matches += 1
                 confidence_score += 5.0
                 reasons.append(f"Low-value pattern: {pattern}")
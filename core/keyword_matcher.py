@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Compiled multi-keyword matching for URL scoring and page relevance checks.
+
+Keyword tests used to loop over every keyword with a substring check, once
+per URL or page. A KeywordMatcher compiles the whole keyword set into one
+regular expression shaped like a prefix tree, so the regex engine finds every
+keyword occurrence in a single scan of the text. A KeywordScorer adds the
+positive weights and negative penalties on top of that scan.
+
+Matching follows the semantics of ``keyword in text``. Each keyword counts
+once however often it appears, overlapping keywords are all reported, and
+matching is case-sensitive, so callers lower-case the text as before.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Set
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex source for a prefix tree of the keywords that prefers the longest keyword at a position."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}  # End-of-keyword marker
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            # A shorter keyword ends here; the longer continuation is optional and tried first
+            body = f"(?:{body})?" if len(branches) == 1 else f"{body}?"
+        return body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of keywords occur in a text with one compiled pattern."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: FrozenSet[str] = frozenset(keyword for keyword in keywords if keyword)
+        self._pattern = re.compile(_trie_pattern(self.keywords)) if self.keywords else None
+        # Every keyword that is a prefix of another one also occurs wherever the longer one matched
+        self._prefixes = {
+            keyword: frozenset(other for other in self.keywords if keyword.startswith(other)) for keyword in self.keywords
+        }
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords occurring anywhere in text."""
+        found: Set[str] = set()
+        if self._pattern is None or not text:
+            return found
+
+        search = self._pattern.search
+        position = 0
+        while (match := search(text, position)) is not None:
+            found |= self._prefixes[match.group()]
+            # Restart one character later so keywords starting inside this match are found too
+            position = match.start() + 1
+        return found
+
+    def contains_any(self, text: str) -> bool:
+        """Whether at least one keyword occurs in text."""
+        return self._pattern is not None and bool(text) and self._pattern.search(text) is not None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+class KeywordScorer:
+    """Scores a text by the weights of the keywords it contains, minus a penalty per negative keyword."""
+
+    def __init__(self, weights: Mapping[str, float], negative_keywords: Iterable[str] = (), negative_weight: float = 2):
+        """
+        Args:
+            weights: Positive keywords and the score each adds when present
+            negative_keywords: Keywords that each subtract negative_weight when present
+            negative_weight: Penalty per negative keyword found
+        """
+        self.weights = dict(weights)
+        self.negative_keywords = frozenset(negative_keywords)
+        self.negative_weight = negative_weight
+        self.matcher = KeywordMatcher(set(self.weights) | self.negative_keywords)
+
+    def score(self, text: str, found: Optional[Set[str]] = None) -> float:
+        """
+        Score a text (typically a lower-cased URL path or page text).
+
+        Args:
+            text: Text to scan
+            found: Keywords already found in text by this scorer's matcher, to skip the scan
+        """
+        if found is None:
+            found = self.matcher.find(text)
+        score = 0
+        for keyword in found:
+            score += self.weights.get(keyword, 0)
+            if keyword in self.negative_keywords:
+                score -= self.negative_weight
+        return score
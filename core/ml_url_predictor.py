@@ -22,11 +22,26 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import classification_report
 from sklearn.model_selection import train_test_split
 
+from core.keyword_matcher import KeywordMatcher
 from core.logger import get_logger
 from supabase import Client
 
 logger = get_logger(__name__)
 
+# Words behind the path features of extract_url_features, matched in one scan of the path
+URL_FEATURE_WORDS = {
+    "has_reconciliation": ("reconciliation", "confession"),
+    "has_adoration": ("adoration", "eucharist"),
+    "has_mass": ("mass",),
+    "has_schedule": ("schedule", "times"),
+    "has_hours": ("hours",),
+    "has_sacrament": ("sacrament",),
+    "has_worship": ("worship", "liturgy"),
+    "contains_time_words": ("time", "hour", "when"),
+    "has_negative_words": ("donate", "giving", "about", "contact", "news"),
+}
+URL_FEATURE_MATCHER = KeywordMatcher(word for words in URL_FEATURE_WORDS.values() for word in words)
+
 
 @dataclass
 class URLPattern:
@@ -211,16 +226,20 @@ class MLURLPredictor:
         """Extract features from URL for ML prediction."""
         parsed = urlparse(url)
         path = parsed.path.lower()
+        words = URL_FEATURE_MATCHER.find(path)
+
+        def has_any(feature: str) -> float:
+            return float(not words.isdisjoint(URL_FEATURE_WORDS[feature]))
 
         features = {
             # Path-based features
-            "has_reconciliation": float("reconciliation" in path or "confession" in path),
-            "has_adoration": float("adoration" in path or "eucharist" in path),
-            "has_mass": float("mass" in path),
-            "has_schedule": float("schedule" in path or "times" in path),
-            "has_hours": float("hours" in path),
-            "has_sacrament": float("sacrament" in path),
-            "has_worship": float("worship" in path or "liturgy" in path),
+            "has_reconciliation": has_any("has_reconciliation"),
+            "has_adoration": has_any("has_adoration"),
+            "has_mass": has_any("has_mass"),
+            "has_schedule": has_any("has_schedule"),
+            "has_hours": has_any("has_hours"),
+            "has_sacrament": has_any("has_sacrament"),
+            "has_worship": has_any("has_worship"),
             # Structure features
             "path_depth": float(len([p for p in path.split("/") if p])),
             "path_length": float(len(path)),
@@ -231,9 +250,9 @@ class MLURLPredictor:
             "has_subdomain": float(len(parsed.netloc.split(".")) > 2),
             # Pattern matching
             "ends_with_schedule": float(path.endswith("schedule") or path.endswith("schedules")),
-            "contains_time_words": float(any(word in path for word in ["time", "hour", "when"])),
+            "contains_time_words": has_any("contains_time_words"),
             # Negative indicators
-            "has_negative_words": float(any(word in path for word in ["donate", "giving", "about", "contact", "news"])),
+            "has_negative_words": has_any("has_negative_words"),
         }
 
         return features
@@ -2,10 +2,18 @@
 """
 Monitoring Client for Real-time Dashboard Integration.
 Provides easy integration for async extraction scripts to send updates to the monitoring dashboard.
+
+Updates are queued and shipped by a background sender thread so the extraction
+loop never waits on the dashboard backend. Status-style updates coalesce
+(last value wins), events such as log lines go through a bounded ring buffer,
+and everything pending is posted in one request to /api/monitoring/batch.
 """
 
+import atexit
+import collections
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -13,6 +21,11 @@ from core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Endpoints whose payloads describe current state; only the latest value matters
+COALESCED_ENDPOINTS = ("/extraction_status", "/circuit_breakers", "/performance")
+# Log levels that may be sampled away when the buffer is under pressure
+SAMPLED_LOG_LEVELS = ("DEBUG", "INFO")
+
 
 class MonitoringClient:
     """
@@ -20,13 +33,55 @@ class MonitoringClient:
     Provides easy integration for async extraction scripts.
     """
 
-    def __init__(self, base_url: str = "http://localhost:8000", worker_id: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        worker_id: Optional[str] = None,
+        background: bool = True,
+        max_buffer: int = 1000,
+        max_batch_size: int = 200,
+        flush_interval: float = 1.0,
+        pressure_sample_rate: int = 10,
+    ):
+        """
+        Args:
+            base_url: Dashboard backend URL
+            worker_id: Worker identifier for multi-worker dashboards
+            background: Queue updates for the background sender (False sends each one synchronously)
+            max_buffer: Ring buffer capacity for events; the oldest are dropped when full
+            max_batch_size: Events per batch request
+            flush_interval: Seconds between background flushes
+            pressure_sample_rate: Once the buffer is 80% full, keep 1 in N DEBUG/INFO log lines
+        """
         self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
         self.session.timeout = 5  # 5 second timeout for monitoring calls
         self.enabled = True
         self.worker_id = worker_id
 
+        self.background = background
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.pressure_sample_rate = max(1, pressure_sample_rate)
+        self._events: collections.deque = collections.deque(maxlen=max_buffer)
+        self._coalesced: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._sender: Optional[threading.Thread] = None
+        self._closed = False
+        self._batch_supported = True
+        self._sampled_logs = 0
+        self.telemetry_stats = {
+            "queued": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "batches_sent": 0,
+            "send_failures": 0,
+        }
+
         if worker_id:
             logger.info(f"🖥️ Monitoring client initialized for worker {worker_id}: {base_url}")
         else:
@@ -43,10 +98,15 @@ class MonitoringClient:
         logger.debug("📊 Monitoring enabled")
 
     def _make_request(self, endpoint: str, data: Dict[str, Any]) -> bool:
-        """Make monitoring request with error handling"""
+        """Queue a monitoring update (or send it right away when background sending is off)"""
         if not self.enabled:
             return True
+        if not self.background or self._closed:
+            return self._post(endpoint, data)
+        return self._enqueue(endpoint, data)
 
+    def _post(self, endpoint: str, data: Dict[str, Any]) -> bool:
+        """Make monitoring request with error handling"""
         try:
             # Use worker-specific endpoint if worker_id is set
             if self.worker_id and endpoint in ["/extraction_status", "/circuit_breakers"]:
@@ -61,6 +121,127 @@ class MonitoringClient:
             logger.debug(f"Failed to send monitoring update to {endpoint}: {e}")
             return False
 
+    def _enqueue(self, endpoint: str, data: Dict[str, Any]) -> bool:
+        """Add an update to the pending batch; returns False if it was dropped or sampled away"""
+        with self._lock:
+            if endpoint in COALESCED_ENDPOINTS:
+                if endpoint in self._coalesced:
+                    self.telemetry_stats["coalesced"] += 1
+                # The backend merges status payloads into its current state, so merging here is equivalent
+                self._coalesced[endpoint] = {**self._coalesced.get(endpoint, {}), **data}
+            else:
+                under_pressure = len(self._events) >= self._events.maxlen * 0.8
+                if under_pressure and endpoint == "/log" and data.get("level", "INFO") in SAMPLED_LOG_LEVELS:
+                    self._sampled_logs += 1
+                    if self._sampled_logs % self.pressure_sample_rate:
+                        self.telemetry_stats["sampled_out"] += 1
+                        return False
+                if len(self._events) == self._events.maxlen:
+                    self.telemetry_stats["dropped"] += 1
+                self._events.append((endpoint, data))
+            self.telemetry_stats["queued"] += 1
+            self._idle.clear()
+
+        self._ensure_sender()
+        if len(self._events) >= self.max_batch_size:
+            self._wakeup.set()
+        return True
+
+    def _ensure_sender(self):
+        """Start the background sender thread on first use"""
+        if self._sender is not None and self._sender.is_alive():
+            return
+        with self._lock:
+            if self._sender is None or not self._sender.is_alive():
+                self._sender = threading.Thread(target=self._sender_loop, name="monitoring-sender", daemon=True)
+                self._sender.start()
+                atexit.register(self.close)
+
+    def _take_batch(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            events = [self._events.popleft() for _ in range(min(len(self._events), self.max_batch_size))]
+            coalesced, self._coalesced = self._coalesced, {}
+            return events, coalesced
+
+    def _sender_loop(self):
+        """Flush pending updates every flush_interval (sooner when a full batch is waiting)"""
+        backoff = self.flush_interval
+        while True:
+            self._wakeup.wait(timeout=backoff)
+            self._wakeup.clear()
+
+            sent = self._flush_pending()
+            # Back off while the backend is unreachable instead of retrying every interval
+            backoff = self.flush_interval if sent else min(backoff * 2, 30.0)
+            if self._closed:
+                return
+
+    def _flush_pending(self) -> bool:
+        """Send everything pending; returns False if a send failed"""
+        ok = True
+        while True:
+            events, coalesced = self._take_batch()
+            if not events and not coalesced:
+                break
+            items = [{"endpoint": endpoint, "data": data} for endpoint, data in events]
+            items.extend({"endpoint": endpoint, "data": data} for endpoint, data in coalesced.items())
+
+            if self._send_batch(items):
+                self.telemetry_stats["batches_sent"] += 1
+                continue
+
+            ok = False
+            self.telemetry_stats["send_failures"] += 1
+            with self._lock:
+                # Keep the latest state for the next attempt unless something newer arrived; events are dropped
+                for endpoint, data in coalesced.items():
+                    self._coalesced.setdefault(endpoint, data)
+                self.telemetry_stats["dropped"] += len(events)
+            break
+
+        with self._lock:
+            if not self._events and not self._coalesced:
+                self._idle.set()
+        return ok
+
+    def _send_batch(self, items: List[Dict[str, Any]]) -> bool:
+        """POST items to the batch endpoint, falling back to per-update requests on older backends"""
+        if self._batch_supported:
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/api/monitoring/batch", json={"worker_id": self.worker_id, "items": items}
+                )
+                if response.status_code not in (404, 405):
+                    response.raise_for_status()
+                    return True
+                logger.info("📊 Monitoring backend has no batch endpoint, sending updates individually")
+                self._batch_supported = False
+            except Exception as e:
+                logger.debug(f"Failed to send monitoring batch of {len(items)} updates: {e}")
+                return False
+        return all([self._post(item["endpoint"], item["data"]) for item in items])
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been handed to the backend; returns False on timeout"""
+        if self._sender is None:
+            return True
+        self._wakeup.set()
+        return self._idle.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Flush pending updates and stop the background sender"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._sender is not None and self._sender.is_alive():
+            self._wakeup.set()
+            self._sender.join(timeout)
+
+    def get_telemetry_stats(self) -> Dict[str, Any]:
+        """Background sender counters plus the current queue depth"""
+        with self._lock:
+            return {**self.telemetry_stats, "pending_events": len(self._events), "pending_status": len(self._coalesced)}
+
     def update_extraction_status(
         self,
         status: str,
@@ -161,6 +342,11 @@ class MonitoringClient:
 
         return self._make_request("/extraction_complete", data)
 
+    def report_data_changed(self, source: str) -> bool:
+        """Tell the dashboard backend that pipeline writes changed the data it serves"""
+        data = {"source": source, "timestamp": datetime.now(timezone.utc).isoformat()}
+        return self._make_request("/data_changed", data)
+
     def send_log(
         self, message: str, level: str = "INFO", module: Optional[str] = None, worker_type: Optional[str] = None
     ) -> bool:
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+HTTP validator store and page change detection for recurring crawls.
+
+For every fetched page we remember its ETag, Last-Modified and a hash of the
+body, together with what the crawl learned from it (schedule types found and
+links queued). The next cycle sends a conditional request; when the server
+answers 304 or returns a byte-identical body, the stored outcome is replayed
+instead of re-parsing the page and re-running AI extraction.
+
+Entries live in the shared IntelligentCacheManager, so they persist across
+runs through its SQLite tier.
+"""
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+from pipeline import config
+from core.intelligent_cache_manager import ContentType, IntelligentCacheManager, get_cache_manager
+from core.logger import get_logger
+from core.utils import normalize_url
+
+logger = get_logger(__name__)
+
+PAGE_VALIDATOR_PREFIX = "page_validators"
+
+
+@dataclass
+class PageSnapshot:
+    """Result of resolving a (possibly conditional) fetch against stored validators."""
+
+    url: str
+    content: bytes
+    unchanged: bool  # True for a 304 or a body identical to the last one seen
+    outcome: Optional[Dict[str, Any]] = None  # What the crawl recorded last time, if unchanged
+
+
+class PageChangeTracker:
+    """Stores per-URL validators and tells the crawler whether a page changed since the last run."""
+
+    def __init__(self, cache: Optional[IntelligentCacheManager] = None, ttl_days: float = 30, enabled: bool = True):
+        """
+        Args:
+            cache: Cache manager holding the validators (defaults to the shared one)
+            ttl_days: How long validators and stored bodies are kept
+            enabled: When False, no conditional headers are sent and every page counts as changed
+        """
+        self.cache = cache
+        self.ttl = ttl_days * 86400
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.stats = {"not_modified": 0, "unchanged": 0, "changed": 0, "new": 0}
+
+    def _cache(self) -> IntelligentCacheManager:
+        if self.cache is None:
+            self.cache = get_cache_manager()
+        return self.cache
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return f"{PAGE_VALIDATOR_PREFIX}:{normalize_url(url)}"
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content or b"").hexdigest()
+
+    def _get(self, url: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        entry = self._cache().get(self._key(url))
+        return dict(entry) if entry else None
+
+    def _put(self, url: str, entry: Dict[str, Any]):
+        self._cache().set(self._key(url), entry, ttl=self.ttl, content_type=ContentType.HTML_PAGE)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Request headers that let the server answer 304 for a page we already hold."""
+        entry = self._get(url)
+        if not entry or entry.get("body") is None:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def has_outcome(self, url: str) -> bool:
+        """Whether a crawl outcome is stored for this URL."""
+        entry = self._get(url)
+        return bool(entry and entry.get("outcome") is not None)
+
+    def resolve(self, url: str, status_code: int, headers: Mapping[str, str], content: bytes) -> PageSnapshot:
+        """
+        Compare a response with the stored validators and update them.
+
+        Args:
+            url: Requested URL
+            status_code: Response status (304 or a 2xx)
+            headers: Response headers
+            content: Response body (empty for a 304)
+
+        Returns:
+            PageSnapshot whose content is the stored body for a 304
+        """
+        if not self.enabled:
+            return PageSnapshot(url, content, unchanged=False)
+
+        entry = self._get(url)
+
+        if status_code == 304:
+            if entry and entry.get("body") is not None:
+                self._count("not_modified")
+                return PageSnapshot(url, entry["body"], unchanged=True, outcome=entry.get("outcome"))
+            logger.debug(f"304 for {url} without a stored body")
+            return PageSnapshot(url, content, unchanged=False)
+
+        digest = self.content_hash(content)
+        unchanged = bool(entry and entry.get("content_hash") == digest)
+        self._count("unchanged" if unchanged else "changed" if entry else "new")
+
+        self._put(
+            url,
+            {
+                "etag": headers.get("etag"),
+                "last_modified": headers.get("last-modified"),
+                "content_hash": digest,
+                "body": content,
+                "outcome": entry.get("outcome") if unchanged else None,
+                "checked_at": time.time(),
+            },
+        )
+        return PageSnapshot(url, content, unchanged=unchanged, outcome=entry.get("outcome") if unchanged else None)
+
+    def record_outcome(self, url: str, outcome: Dict[str, Any]):
+        """Remember what the crawl derived from the current version of a page."""
+        entry = self._get(url)
+        if entry is None:
+            return
+        entry["outcome"] = outcome
+        self._put(url, entry)
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts of pages served as 304, unchanged, changed and new since startup."""
+        with self._lock:
+            stats = dict(self.stats)
+        seen = sum(stats.values())
+        stats["skipped_rate"] = round((stats["not_modified"] + stats["unchanged"]) / seen, 3) if seen else 0.0
+        return stats
+
+
+# Global page change tracker instance
+_page_change_tracker = None
+_page_change_tracker_lock = threading.Lock()
+
+
+def get_page_change_tracker() -> PageChangeTracker:
+    """Get global page change tracker instance."""
+    global _page_change_tracker
+    with _page_change_tracker_lock:
+        if _page_change_tracker is None:
+            _page_change_tracker = PageChangeTracker(
+                ttl_days=getattr(config, "PAGE_VALIDATOR_TTL_DAYS", 30),
+                enabled=getattr(config, "PAGE_CHANGE_TRACKING_ENABLED", True),
+            )
+        return _page_change_tracker
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Fetch-once page store for a single parish crawl.
+
+Every page the crawl downloads is kept here, keyed by normalized URL, so the
+AI extractor, the keyword fallback and quality scoring all work from the
+first response instead of downloading and parsing the page again. Bodies and
+cleaned text are kept for the whole run; parsed trees are the expensive part,
+so only the most recently used ones are held and older ones are re-parsed on
+demand.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+from core.logger import get_logger
+from core.utils import normalize_url
+
+logger = get_logger(__name__)
+
+
+class StoredPage:
+    """A fetched page with its parsed tree and cleaned text built lazily on first use."""
+
+    def __init__(self, url: str, content: bytes, store: "PageStore"):
+        self.url = url
+        self.content = content
+        self._store = store
+        self._text: Optional[str] = None
+
+    @property
+    def html(self) -> str:
+        """Response body decoded as text."""
+        return self.content.decode("utf-8", errors="replace")
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Parsed tree for the page; treat it as read-only, it is shared by every consumer."""
+        return self._store._soup_for(self)
+
+    @property
+    def text(self) -> str:
+        """Visible text of the page."""
+        if self._text is None:
+            self._text = self.soup.get_text()
+        return self._text
+
+
+class PageStore:
+    """Per-run cache of fetched pages keyed by normalized URL."""
+
+    def __init__(self, max_parsed: int = 16):
+        """
+        Args:
+            max_parsed: Number of parsed trees kept in memory at once
+        """
+        self.max_parsed = max(1, max_parsed)
+        self._pages: Dict[str, StoredPage] = {}
+        self._soups: "OrderedDict[str, BeautifulSoup]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"stored": 0, "hits": 0, "fetches": 0, "parses": 0}
+
+    def put(self, url: str, content: bytes) -> StoredPage:
+        """Store a fetched body, replacing any earlier copy of the same page."""
+        key = normalize_url(url)
+        page = StoredPage(url, content or b"", self)
+        with self._lock:
+            existing = self._pages.get(key)
+            if existing is not None and existing.content == page.content:
+                return existing
+            self._pages[key] = page
+            self._soups.pop(key, None)
+            self.stats["stored"] += 1
+        return page
+
+    def get(self, url: str) -> Optional[StoredPage]:
+        """Return the stored page for a URL, or None if it has not been fetched this run."""
+        with self._lock:
+            page = self._pages.get(normalize_url(url))
+            if page is not None:
+                self.stats["hits"] += 1
+        return page
+
+    def get_or_fetch(self, url: str, fetch: Callable[[str], bytes]) -> StoredPage:
+        """
+        Return the stored page, downloading it with ``fetch`` on a miss.
+
+        Errors raised by ``fetch`` propagate to the caller.
+        """
+        page = self.get(url)
+        if page is not None:
+            return page
+        content = fetch(url)
+        with self._lock:
+            self.stats["fetches"] += 1
+        return self.put(url, content)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return normalize_url(url) in self._pages
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+    def _soup_for(self, page: StoredPage) -> BeautifulSoup:
+        key = normalize_url(page.url)
+        with self._lock:
+            soup = self._soups.get(key)
+            if soup is not None and self._pages.get(key) is page:
+                self._soups.move_to_end(key)
+                return soup
+
+        soup = BeautifulSoup(page.content, "html.parser")
+
+        with self._lock:
+            self.stats["parses"] += 1
+            if self._pages.get(key) is page:
+                self._soups[key] = soup
+                self._soups.move_to_end(key)
+                while len(self._soups) > self.max_parsed:
+                    self._soups.popitem(last=False)
+        return soup
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counts of pages stored, store hits, fetches made on a miss and trees parsed."""
+        with self._lock:
+            return dict(self.stats, pages=len(self._pages))
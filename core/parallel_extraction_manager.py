@@ -8,6 +8,10 @@ throughput while respecting server limits and maintaining system stability.
 """
 
 import asyncio
+import hashlib
+import heapq
+import itertools
+import json
 import logging
 import random
 import threading
@@ -16,13 +20,15 @@ from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from queue import PriorityQueue, Queue
+from queue import Empty, PriorityQueue, Queue
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from core.adaptive_timeout_manager import get_adaptive_timeout_manager
 from core.intelligent_cache_manager import get_cache_manager
 from core.logger import get_logger
+from core.token_bucket import TokenBucket
+from core.utils import normalize_url
 
 logger = get_logger(__name__)
 
@@ -138,6 +144,114 @@ class WorkerStats:
         return self.total_time / self.tasks_completed
 
 
+@dataclass
+class DomainQueue:
+    """Pending tasks for one domain in the async scheduler."""
+
+    domain: str
+    limits: DomainLimits
+    bucket: TokenBucket
+    tasks: List[ExtractionTask] = field(default_factory=list)  # heap, highest priority first
+    token_reserved: bool = False
+    scheduled: bool = False
+
+
+class AsyncDomainScheduler:
+    """
+    Dispatches extraction tasks across domains in order of domain readiness.
+
+    Each domain with pending work sits once in a heap keyed by the time it can
+    next accept a request (token bucket refill or failure cooldown), then by its
+    best task priority. Workers share the heap rather than owning domains, so an
+    idle worker always takes the earliest-ready domain and never waits on a
+    throttled one while another domain has work. Domains at their concurrency
+    limit leave the heap until one of their requests finishes.
+
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, limits_for: Callable[[str], DomainLimits], bucket_for: Callable[[str], TokenBucket]):
+        self._limits_for = limits_for
+        self._bucket_for = bucket_for
+        self._domains: Dict[str, DomainQueue] = {}
+        self._ready: List[Tuple[float, float, int, str]] = []
+        self._sequence = itertools.count()
+        self._changed = asyncio.Event()
+        self.outstanding = 0  # queued, running or waiting to retry
+        self.throttled = 0  # times a domain was pushed back to wait for its rate limit
+        self.closed = False
+
+    def add(self, task: ExtractionTask):
+        """Queue a new task."""
+        self.outstanding += 1
+        self._push(task)
+
+    def task_done(self, task: ExtractionTask, retry_after: Optional[float] = None):
+        """Release the task's domain slot; requeue it after ``retry_after`` seconds if given."""
+        queue = self._domains[task.domain]
+        queue.limits.active_requests -= 1
+        if retry_after is None:
+            self.outstanding -= 1
+        else:
+            asyncio.get_running_loop().call_later(retry_after, self._push, task)
+        self._schedule(queue, time.monotonic())
+        self._changed.set()
+
+    async def next_task(self) -> Optional[ExtractionTask]:
+        """Wait for the next task that may run now; None once all work is done or the scheduler is closed."""
+        while not self.closed and self.outstanding > 0:
+            now = time.monotonic()
+            if self._ready and self._ready[0][0] <= now:
+                queue = self._domains[heapq.heappop(self._ready)[3]]
+                queue.scheduled = False
+
+                delay = self._admission_delay(queue)
+                if delay > 0:
+                    self.throttled += 1
+                    self._schedule(queue, now + delay)
+                    continue
+
+                task = heapq.heappop(queue.tasks)
+                queue.token_reserved = False
+                queue.limits.active_requests += 1
+                self._schedule(queue, now)
+                return task
+
+            # Wake when a domain becomes ready or work is added/finished; the cap lets close() take effect
+            wait = min(self._ready[0][0] - now, 1.0) if self._ready else 1.0
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+        return None
+
+    def _push(self, task: ExtractionTask):
+        queue = self._domains.get(task.domain)
+        if queue is None:
+            queue = DomainQueue(task.domain, self._limits_for(task.domain), self._bucket_for(task.domain))
+            self._domains[task.domain] = queue
+        heapq.heappush(queue.tasks, task)
+        self._schedule(queue, time.monotonic())
+
+    def _schedule(self, queue: DomainQueue, ready_at: float):
+        if queue.scheduled or not queue.tasks or queue.limits.active_requests >= queue.limits.max_concurrent:
+            return
+        queue.scheduled = True
+        heapq.heappush(self._ready, (ready_at, -queue.tasks[0].priority, next(self._sequence), queue.domain))
+        self._changed.set()
+
+    def _admission_delay(self, queue: DomainQueue) -> float:
+        """Seconds until the domain may send its next request; reserves a rate-limit token once."""
+        cooldown = queue.limits.blocked_until - time.time()
+        if cooldown > 0:
+            return cooldown
+        if not queue.token_reserved:
+            queue.token_reserved = True
+            return queue.bucket.reserve()
+        return 0.0
+
+
 class ParallelExtractionManager:
     """
     Intelligent parallel extraction manager with adaptive concurrency control.
@@ -159,6 +273,8 @@ class ParallelExtractionManager:
 
         # Domain rate limiting
         self.domain_limits: Dict[str, DomainLimits] = {}
+        self.domain_buckets: Dict[str, TokenBucket] = {}
+        self._async_scheduler: Optional[AsyncDomainScheduler] = None
         self.default_domain_config = DomainLimits(domain="default")
 
         # Global statistics
@@ -187,6 +303,7 @@ class ParallelExtractionManager:
             self.domain_limits[domain] = DomainLimits(
                 domain=domain, max_concurrent=max_concurrent, requests_per_second=requests_per_second, **kwargs
             )
+            self.domain_buckets.pop(domain, None)
         logger.info(f"⚡ Configured limits for {domain}: {max_concurrent} concurrent, {requests_per_second} RPS")
 
     def add_task(self, task: ExtractionTask) -> bool:
@@ -226,7 +343,11 @@ class ParallelExtractionManager:
         return added_count
 
     def extract_parallel(
-        self, extraction_func: Callable, max_concurrent_domains: int = 10, timeout_per_task: float = 120.0
+        self,
+        extraction_func: Callable,
+        max_concurrent_domains: int = 10,
+        timeout_per_task: float = 120.0,
+        mode: str = "threads",
     ) -> Dict[str, Any]:
         """
         Execute parallel extraction with intelligent resource management.
@@ -235,6 +356,8 @@ class ParallelExtractionManager:
             extraction_func: Function to call for each task
             max_concurrent_domains: Maximum domains to process simultaneously
             timeout_per_task: Timeout for individual tasks
+            mode: "threads" for the thread pool workers, "async" for the asyncio scheduler
+                (see extract_parallel_async)
 
         Returns:
             Dictionary with extraction results and statistics
@@ -242,6 +365,9 @@ class ParallelExtractionManager:
         if self._shutdown:
             raise RuntimeError("Manager is shutdown")
 
+        if mode == "async":
+            return asyncio.run(self.extract_parallel_async(extraction_func, timeout_per_task))
+
         start_time = time.time()
         logger.info(f"⚡ Starting parallel extraction with {self.max_workers} workers")
 
@@ -289,6 +415,178 @@ class ParallelExtractionManager:
 
         return results
 
+    async def extract_parallel_async(self, extraction_func: Callable, timeout_per_task: float = 120.0) -> Dict[str, Any]:
+        """
+        Execute queued tasks on asyncio workers scheduled by domain readiness.
+
+        Per-domain token buckets and concurrency limits decide when a domain may
+        send its next request, and workers pick whichever domain is ready first
+        (see AsyncDomainScheduler), so rate-limited domains cost no worker time.
+        Failed tasks wait out their retry backoff off-worker. Tasks added with
+        add_task while the run is in progress are picked up.
+
+        Args:
+            extraction_func: Coroutine function or plain function called as
+                ``extraction_func(task, timeout=...)``; plain functions run in a thread
+            timeout_per_task: Timeout for individual tasks
+
+        Returns:
+            Dictionary with extraction results and statistics
+        """
+        if self._shutdown:
+            raise RuntimeError("Manager is shutdown")
+
+        start_time = time.time()
+        scheduler = AsyncDomainScheduler(self._get_domain_limits, self._get_domain_bucket)
+        self._async_scheduler = scheduler
+        self._drain_task_queue(scheduler)
+
+        worker_count = max(1, min(self.max_workers, scheduler.outstanding))
+        logger.info(f"⚡ Starting async extraction with {worker_count} workers")
+
+        workers = [
+            asyncio.create_task(self._async_worker_loop(worker_id, scheduler, extraction_func, timeout_per_task))
+            for worker_id in range(worker_count)
+        ]
+        monitor = asyncio.create_task(self._monitor_progress_async())
+        try:
+            for outcome in await asyncio.gather(*workers, return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    logger.error(f"⚡ Async worker error: {outcome}")
+        finally:
+            monitor.cancel()
+            self._async_scheduler = None
+
+        duration = time.time() - start_time
+        results = self._compile_results(duration)
+        results["throttled_dispatches"] = scheduler.throttled
+
+        logger.info(
+            f"⚡ Async extraction completed in {duration:.1f}s: "
+            f"{results['completed']} completed, {results['failed']} failed, "
+            f"{results['worker_utilization']:.0%} worker utilization"
+        )
+
+        return results
+
+    async def _async_worker_loop(
+        self, worker_id: int, scheduler: AsyncDomainScheduler, extraction_func: Callable, task_timeout: float
+    ):
+        """Worker coroutine: run whatever task the scheduler hands out until the work runs out."""
+        stats = WorkerStats(worker_id)
+        self.worker_stats[worker_id] = stats
+
+        while not self._shutdown:
+            self._drain_task_queue(scheduler)
+            task = await scheduler.next_task()
+            if task is None:
+                break
+
+            stats.current_task = task.task_id
+            task_start_time = time.time()
+            self._record_concurrency()
+            domain_limits = self._get_domain_limits(task.domain)
+            success = False
+            retry_after = None
+
+            try:
+                result = await self._execute_task_async(task, extraction_func, task_timeout)
+
+                with self._lock:
+                    self.completed_tasks[task.task_id] = result
+                    self.global_stats["completed_tasks"] += 1
+
+                success = True
+                stats.tasks_completed += 1
+
+            except Exception as e:
+                logger.warning(f"⚡ Worker {worker_id} failed task {task.task_id}: {e}")
+
+                task.retry_count += 1
+                if task.retry_count <= task.max_retries:
+                    task.priority *= 0.8  # Lower priority for retries
+                    retry_after = min(30.0, 2.0**task.retry_count)
+                else:
+                    with self._lock:
+                        self.failed_tasks[task.task_id] = task
+                        self.global_stats["failed_tasks"] += 1
+                    stats.tasks_failed += 1
+
+            finally:
+                # Runs on cancellation too, so the domain slot is never leaked
+                task_duration = time.time() - task_start_time
+                stats.total_time += task_duration
+                stats.last_active = time.time()
+                stats.current_task = None
+
+                with self._lock:
+                    domain_limits.register_request(success)
+                scheduler.task_done(task, retry_after)
+
+                if success:
+                    self._update_avg_completion_time(task_duration)
+
+    async def _execute_task_async(self, task: ExtractionTask, extraction_func: Callable, timeout: float) -> Any:
+        """Async counterpart of _execute_task_with_timeout; the timeout cancels coroutine extraction functions."""
+        effective_timeout = self._effective_timeout(task, timeout)
+
+        cache_key = self._extraction_cache_key(task)
+        cached_result = self.cache_manager.get(cache_key)
+        if cached_result is not None:
+            logger.debug(f"⚡ Cache hit for task {task.task_id}")
+            return cached_result
+
+        start_time = time.time()
+
+        if asyncio.iscoroutinefunction(extraction_func):
+            call = extraction_func(task, timeout=effective_timeout)
+        else:
+            # A thread cannot be interrupted, so plain functions should honor the timeout they are given
+            call = asyncio.to_thread(extraction_func, task, timeout=effective_timeout)
+
+        try:
+            result = await asyncio.wait_for(call, effective_timeout)
+        except asyncio.TimeoutError:
+            self.timeout_manager.record_response(task.url, time.time() - start_time, False, timeout_occurred=True)
+            raise TimeoutError(f"Task {task.task_id} timed out after {effective_timeout:.1f}s")
+        except Exception:
+            self.timeout_manager.record_response(task.url, time.time() - start_time, False)
+            raise
+
+        self._record_task_success(task, cache_key, result, time.time() - start_time)
+        return result
+
+    def _drain_task_queue(self, scheduler: AsyncDomainScheduler):
+        """Move tasks added through add_task into the async scheduler."""
+        while True:
+            try:
+                task = self.task_queue.get_nowait()
+            except Empty:
+                return
+            self.task_queue.task_done()
+            if task is not None:
+                scheduler.add(task)
+
+    async def _monitor_progress_async(self):
+        """Log a progress report every 30 seconds during an async run."""
+        while True:
+            await asyncio.sleep(30.0)
+            self._log_progress_report()
+
+    def _record_concurrency(self):
+        with self._lock:
+            self.active_workers = max(
+                self.active_workers, sum(limits.active_requests for limits in self.domain_limits.values())
+            )
+            self.global_stats["peak_concurrency"] = max(self.global_stats["peak_concurrency"], self.active_workers)
+
+    def _update_avg_completion_time(self, task_duration: float):
+        old_avg = self.global_stats["avg_completion_time"]
+        completed = self.global_stats["completed_tasks"]
+        self.global_stats["avg_completion_time"] = (
+            (old_avg * (completed - 1) + task_duration) / completed if completed > 0 else task_duration
+        )
+
     def _worker_loop(self, worker_id: int, extraction_func: Callable, task_timeout: float):
         """Main worker loop for processing tasks."""
         stats = WorkerStats(worker_id)
@@ -319,10 +617,7 @@ class ParallelExtractionManager:
                     # Update domain tracking
                     with self._lock:
                         domain_limits.active_requests += 1
-                        self.active_workers = max(
-                            self.active_workers, sum(limits.active_requests for limits in self.domain_limits.values())
-                        )
-                        self.global_stats["peak_concurrency"] = max(self.global_stats["peak_concurrency"], self.active_workers)
+                    self._record_concurrency()
 
                     success = False
                     try:
@@ -369,11 +664,7 @@ class ParallelExtractionManager:
 
                         # Update global average
                         if success:
-                            old_avg = self.global_stats["avg_completion_time"]
-                            completed = self.global_stats["completed_tasks"]
-                            self.global_stats["avg_completion_time"] = (
-                                (old_avg * (completed - 1) + task_duration) / completed if completed > 0 else task_duration
-                            )
+                            self._update_avg_completion_time(task_duration)
 
                         self.task_queue.task_done()
 
@@ -389,16 +680,10 @@ class ParallelExtractionManager:
 
     def _execute_task_with_timeout(self, task: ExtractionTask, extraction_func: Callable, timeout: float) -> Any:
         """Execute a single task with intelligent timeout."""
-        # Use adaptive timeout if available
-        adaptive_timeout = self.timeout_manager.get_optimal_timeout(
-            task.url, operation_type="page_load", retry_count=task.retry_count, context=task.metadata
-        )
-
-        # Use the minimum of configured and adaptive timeout
-        effective_timeout = min(timeout, adaptive_timeout)
+        effective_timeout = self._effective_timeout(task, timeout)
 
         # Check cache first
-        cache_key = f"extraction:{task.url}:{hash(str(sorted(task.metadata.items())))}"
+        cache_key = self._extraction_cache_key(task)
         cached_result = self.cache_manager.get(cache_key)
         if cached_result is not None:
             logger.debug(f"⚡ Cache hit for task {task.task_id}")
@@ -411,30 +696,6 @@ class ParallelExtractionManager:
             # Execute extraction function
             result = extraction_func(task, timeout=effective_timeout)
 
-            # Record successful response time
-            response_time = time.time() - start_time
-            self.timeout_manager.record_response(
-                task.url,
-                response_time,
-                True,
-                complexity_indicators=task.metadata.get("complexity_indicators"),
-                timeout_occurred=False,
-            )
-
-            # Cache successful result
-            if result:
-                from core.intelligent_cache_manager import ContentType
-
-                self.cache_manager.set(
-                    cache_key,
-                    result,
-                    content_type=ContentType.SCHEDULE_DATA,
-                    ttl=1800.0,  # 30 minutes for schedule data
-                    metadata={"parish_id": task.parish_id, "url": task.url},
-                )
-
-            return result
-
         except TimeoutError:
             # Record timeout
             response_time = time.time() - start_time
@@ -447,6 +708,46 @@ class ParallelExtractionManager:
             self.timeout_manager.record_response(task.url, response_time, False)
             raise
 
+        self._record_task_success(task, cache_key, result, time.time() - start_time)
+        return result
+
+    def _effective_timeout(self, task: ExtractionTask, timeout: float) -> float:
+        # Use adaptive timeout if available
+        adaptive_timeout = self.timeout_manager.get_optimal_timeout(
+            task.url, operation_type="page_load", retry_count=task.retry_count, context=task.metadata
+        )
+
+        # Use the minimum of configured and adaptive timeout
+        return min(timeout, adaptive_timeout)
+
+    def _extraction_cache_key(self, task: ExtractionTask) -> str:
+        # A stable digest, unlike hash(), so keys match across runs in the persistent cache
+        params = json.dumps(task.metadata, sort_keys=True, default=str)
+        digest = hashlib.sha256(f"{normalize_url(task.url)}\n{params}".encode()).hexdigest()
+        return f"extraction:{digest}"
+
+    def _record_task_success(self, task: ExtractionTask, cache_key: str, result: Any, response_time: float):
+        # Record successful response time
+        self.timeout_manager.record_response(
+            task.url,
+            response_time,
+            True,
+            complexity_indicators=task.metadata.get("complexity_indicators"),
+            timeout_occurred=False,
+        )
+
+        # Cache successful result
+        if result:
+            from core.intelligent_cache_manager import ContentType
+
+            self.cache_manager.set(
+                cache_key,
+                result,
+                content_type=ContentType.SCHEDULE_DATA,
+                ttl=1800.0,  # 30 minutes for schedule data
+                metadata={"parish_id": task.parish_id, "url": task.url},
+            )
+
     def _get_domain_limits(self, domain: str) -> DomainLimits:
         """Get domain limits, creating default if not exists."""
         with self._lock:
@@ -457,6 +758,14 @@ class ParallelExtractionManager:
 
             return self.domain_limits[domain]
 
+    def _get_domain_bucket(self, domain: str) -> TokenBucket:
+        """Get the token bucket enforcing a domain's request rate in async mode."""
+        limits = self._get_domain_limits(domain)
+        with self._lock:
+            if domain not in self.domain_buckets:
+                self.domain_buckets[domain] = TokenBucket(limits.requests_per_second, limits.burst_limit)
+            return self.domain_buckets[domain]
+
     def _create_domain_limits(self, domain: str) -> DomainLimits:
         """Create domain limits based on domain characteristics."""
         # Known domain patterns
@@ -564,6 +873,9 @@ class ParallelExtractionManager:
                     "avg_rps": limits.current_rps,
                 }
 
+            busy_time = sum(stats.total_time for stats in self.worker_stats.values())
+            capacity = len(self.worker_stats) * duration
+
             return {
                 "duration": duration,
                 "total_tasks": total_tasks,
@@ -573,6 +885,7 @@ class ParallelExtractionManager:
                 "avg_completion_time": self.global_stats["avg_completion_time"],
                 "peak_concurrency": self.global_stats["peak_concurrency"],
                 "tasks_per_second": completed / duration if duration > 0 else 0,
+                "worker_utilization": busy_time / capacity if capacity > 0 else 0.0,
                 "completed_tasks": dict(self.completed_tasks),
                 "failed_tasks": {k: {"url": v.url, "retries": v.retry_count} for k, v in self.failed_tasks.items()},
                 "worker_stats": worker_stats,
@@ -585,6 +898,8 @@ class ParallelExtractionManager:
 
         with self._lock:
             self._shutdown = True
+            if self._async_scheduler is not None:
+                self._async_scheduler.closed = True
 
             # Signal shutdown to workers
             for _ in range(self.max_workers):
@@ -4,8 +4,11 @@ AI-powered schedule extraction for accurate parish schedule parsing.
 Uses Google Gemini AI to extract structured schedule information.
 """
 
+import concurrent.futures
+import hashlib
 import json
 import re
+import threading
 import warnings
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
@@ -14,13 +17,104 @@ import google.generativeai as genai
 
 from pipeline import config
 from core.db import get_supabase_client
+from core.db_batch_operations import get_write_behind_manager
 from core.logger import get_logger
 from core.ai_auth_manager import get_ai_auth_manager, AIAuthManager
 from core.ai_model_factory import get_ai_model_factory, AIModelFactory
 from core.ai_config import get_ai_config, AIConfig
+from core.intelligent_cache_manager import ContentType, get_cache_manager
+from core.token_bucket import TokenBucket
 
 logger = get_logger(__name__)
 
+_ai_rate_limiter: Optional[TokenBucket] = None
+_ai_rate_limiter_lock = threading.Lock()
+
+
+def get_ai_rate_limiter() -> TokenBucket:
+    """Process-wide token bucket pacing schedule AI requests at config.AI_REQUESTS_PER_MINUTE."""
+    global _ai_rate_limiter
+    with _ai_rate_limiter_lock:
+        if _ai_rate_limiter is None:
+            _ai_rate_limiter = TokenBucket.per_minute(config.AI_REQUESTS_PER_MINUTE, config.AI_REQUEST_BURST)
+        return _ai_rate_limiter
+
+
+# Per schedule type prompt pieces shared by single-page and batched prompts
+SCHEDULE_PROMPT_SPECS = {
+    "adoration": {
+        "subject": "Eucharistic Adoration schedule",
+        "label": "adoration schedule",
+        "look_for": """- Adoration, Exposition, Blessed Sacrament, Holy Hour schedules
+- Perpetual Adoration availability
+- Weekly recurring schedules (e.g., "Wednesdays 6-7 PM")
+- Daily schedules if offered
+- Special adoration events""",
+        "json_fields": '''    "has_weekly_schedule": true/false,
+    "schedule_found": true/false,
+    "days_offered": ["Monday", "Tuesday", etc.],
+    "times": ["6:00 PM - 7:00 PM", "9:00 AM - 10:00 AM", etc.],
+    "frequency": "weekly" | "daily" | "monthly" | "special_events" | "unknown",
+    "schedule_details": "Full text description of the schedule",
+    "is_perpetual": true/false,
+    "confidence_score": 0-100,
+    "notes": "Any additional relevant information"''',
+    },
+    "reconciliation": {
+        "subject": "Reconciliation/Confession schedule",
+        "label": "reconciliation schedule",
+        "look_for": """- Confession times and schedules
+- Reconciliation service schedules
+- Sacrament of Penance availability
+- Weekly recurring schedules (e.g., "Saturdays 3:30-4:30 PM")
+- "By appointment" availability
+- Before/after Mass schedules""",
+        "json_fields": '''    "has_weekly_schedule": true/false,
+    "schedule_found": true/false,
+    "days_offered": ["Saturday", "Sunday", etc.],
+    "times": ["3:30 PM - 4:30 PM", "Before 5:00 PM Mass", etc.],
+    "frequency": "weekly" | "daily" | "by_appointment" | "before_mass" | "unknown",
+    "schedule_details": "Full text description of the schedule",
+    "by_appointment": true/false,
+    "confidence_score": 0-100,
+    "notes": "Any additional relevant information"''',
+    },
+    "mass": {
+        "subject": "Mass schedule",
+        "label": "Mass schedule",
+        "look_for": """- Mass times and schedules
+- Sunday Mass schedules
+- Weekday Mass schedules
+- Saturday Vigil Mass schedules
+- Holy Day schedules
+- Liturgy and Eucharistic celebration times
+- Weekly recurring schedules (e.g., "Sunday 8:00 AM, 10:30 AM, 12:00 PM")
+- Daily Mass offerings
+- Special liturgical schedules""",
+        "json_fields": '''    "has_weekly_schedule": true/false,
+    "schedule_found": true/false,
+    "days_offered": ["Sunday", "Monday", "Tuesday", etc.],
+    "times": ["8:00 AM", "10:30 AM", "12:00 PM", etc.],
+    "frequency": "weekly" | "daily" | "weekends_only" | "special_events" | "unknown",
+    "schedule_details": "Full text description of the Mass schedule",
+    "has_vigil_mass": true/false,
+    "has_daily_mass": true/false,
+    "confidence_score": 0-100,
+    "notes": "Any additional relevant information"''',
+    },
+}
+
+# Bump when the prompt templates change in a way SCHEDULE_PROMPT_SPECS does not capture
+SCHEDULE_PROMPT_VERSION = 1
+SCHEDULE_PROMPT_FINGERPRINT = hashlib.sha256(
+    f"{SCHEDULE_PROMPT_VERSION}:{json.dumps(SCHEDULE_PROMPT_SPECS, sort_keys=True)}".encode("utf-8")
+).hexdigest()[:12]
+
+SCHEDULE_MODEL_NAME = "gemini-1.5-flash"
+AI_RESULT_CACHE_PREFIX = "ai_schedule"
+# Per-call fields that are filled in on every hit rather than stored
+AI_RESULT_UNCACHED_FIELDS = ("url", "content", "source_url", "parish_id", "cache_hit")
+
 
 class ScheduleAIExtractor:
     """AI-powered extractor for parish schedules using Google Gemini."""
@@ -67,6 +161,11 @@ class ScheduleAIExtractor:
             self.model = None
             self._auth_method = "failed"
 
+        self.model_id = SCHEDULE_MODEL_NAME
+        self.ai_result_cache = get_cache_manager() if config.AI_RESULT_CACHE_ENABLED else None
+        self._ai_cache_stats = {"hits": 0, "misses": 0, "stores": 0}
+        self._ai_cache_lock = threading.Lock()
+
     def _use_legacy_auth(self, genai_api_key: str) -> None:
         """
         Use legacy API key authentication for backward compatibility.
@@ -76,7 +175,7 @@ class ScheduleAIExtractor:
         """
         logger.info("AI Schedule Extractor using legacy API key authentication (deprecated)")
         genai.configure(api_key=genai_api_key)
-        self.model = genai.GenerativeModel("gemini-1.5-flash")
+        self.model = genai.GenerativeModel(SCHEDULE_MODEL_NAME)
         self._auth_method = "api_key_legacy"
         self._model_factory = None
 
@@ -134,7 +233,7 @@ class ScheduleAIExtractor:
         # Get model for schedule extractor component
         self.model = self._model_factory.get_model(
             component_name="schedule_extractor",
-            model_name="gemini-1.5-flash",
+            model_name=SCHEDULE_MODEL_NAME,
         )
         self._auth_method = self._auth_manager.active_strategy_name or "unknown"
         logger.info(f"AI Schedule Extractor initialized with {self._auth_method} authentication")
@@ -219,34 +318,38 @@ class ScheduleAIExtractor:
         if not self.model:
             return self._get_empty_result(f"AI model not available")
 
+        cleaned_content = self._clean_content_for_ai(content or "")
+        cache_key = self._ai_cache_key(cleaned_content, schedule_type)
+        cached = self._get_cached_result(cache_key, content, url)
+        if cached is not None:
+            return cached
+
+        return self._extract_single(content, url, schedule_type, cleaned_content, cache_key)
+
+    def _extract_single(
+        self,
+        content: str,
+        url: str,
+        schedule_type: str,
+        cleaned_content: str,
+        cache_key: str,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> Dict:
+        """Run the single-type prompt for a page whose cache lookup already missed."""
         try:
             # Create targeted prompt for schedule extraction
-            prompt = self._create_extraction_prompt(content, schedule_type)
+            prompt = self._create_extraction_prompt(content, schedule_type, cleaned_content=cleaned_content)
 
             # Calculate timeout based on content size (larger content = longer timeout)
             content_size = len(content)
-            if content_size > 20000:
-                timeout_seconds = 120  # 2 minutes for very large content
-            elif content_size > 10000:
-                timeout_seconds = 90  # 1.5 minutes for large content
-            else:
-                timeout_seconds = 60  # 1 minute for normal content
+            timeout_seconds = self._timeout_for_content_size(content_size)
 
             logger.info(f"Processing {content_size} chars with {timeout_seconds}s timeout for {schedule_type}")
 
-            # Get AI response with timeout handling using concurrent.futures
-            import concurrent.futures
-
-            def generate_with_timeout():
-                return self.model.generate_content(prompt)
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(generate_with_timeout)
-                try:
-                    response = future.result(timeout=timeout_seconds)
-                except concurrent.futures.TimeoutError:
-                    logger.warning(f"AI processing timeout ({timeout_seconds}s) for {schedule_type} at {url}")
-                    return self._get_empty_result(f"AI processing timeout after {timeout_seconds}s")
+            response = self._generate_with_timeout(prompt, timeout_seconds, rate_limiter)
+            if response is None:
+                logger.warning(f"AI processing timeout ({timeout_seconds}s) for {schedule_type} at {url}")
+                return self._get_empty_result(f"AI processing timeout after {timeout_seconds}s")
 
             # Parse AI response into structured data
             result = self._parse_ai_response(response.text, url, schedule_type)
@@ -255,6 +358,7 @@ class ScheduleAIExtractor:
             result["url"] = url
             result["content"] = content[:1000]  # Store first 1000 chars for threshold calculation
 
+            self._store_cached_result(cache_key, result)
             logger.info(f"AI extraction completed for {schedule_type} at {url}")
             return result
 
@@ -262,109 +366,271 @@ class ScheduleAIExtractor:
             logger.error(f"AI extraction failed for {schedule_type} at {url}: {e}")
             return self._get_empty_result(f"AI extraction error: {str(e)}")
 
-    def _create_extraction_prompt(self, content: str, schedule_type: str) -> str:
+    def extract_schedules_from_content(
+        self,
+        content: str,
+        url: str,
+        schedule_types: Optional[List[str]] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Extract several schedule types from one page with a single AI request.
+
+        The page is cleaned once and sent with one prompt that asks for every
+        requested type. Each type still gets its own result, confidence score
+        and cache entry. Types that are already cached are not asked for again,
+        and a type missing from the answer is retried with the single-type prompt.
+
+        Args:
+            content: HTML content or text from the webpage
+            url: Source URL for context
+            schedule_types: Types to extract (default: every type in SCHEDULE_PROMPT_SPECS)
+            rate_limiter: Token bucket taken from before each model request (cache hits take nothing)
+
+        Returns:
+            Results keyed by schedule type
+        """
+        schedule_types = [t for t in (schedule_types or SCHEDULE_PROMPT_SPECS) if t in SCHEDULE_PROMPT_SPECS]
+        if not self.model:
+            return {schedule_type: self._get_empty_result("AI model not available") for schedule_type in schedule_types}
+
+        content = content or ""
+        cleaned_content = self._clean_content_for_ai(content)
+        cache_keys = {schedule_type: self._ai_cache_key(cleaned_content, schedule_type) for schedule_type in schedule_types}
+
+        results = {}
+        for schedule_type in schedule_types:
+            cached = self._get_cached_result(cache_keys[schedule_type], content, url)
+            if cached is not None:
+                results[schedule_type] = cached
+
+        pending = [schedule_type for schedule_type in schedule_types if schedule_type not in results]
+        if len(pending) > 1 and config.AI_COMBINED_EXTRACTION_ENABLED:
+            results.update(self._extract_combined(content, url, cleaned_content, pending, cache_keys, rate_limiter))
+        else:
+            for schedule_type in pending:
+                results[schedule_type] = self._extract_single(
+                    content, url, schedule_type, cleaned_content, cache_keys[schedule_type], rate_limiter
+                )
+
+        return {schedule_type: results[schedule_type] for schedule_type in schedule_types}
+
+    def _extract_combined(
+        self,
+        content: str,
+        url: str,
+        cleaned_content: str,
+        schedule_types: List[str],
+        cache_keys: Dict[str, str],
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> Dict[str, Dict]:
+        """Run one prompt covering several schedule types and split the answer per type."""
+        prompt = self._create_combined_prompt(cleaned_content, schedule_types)
+        timeout_seconds = self._timeout_for_content_size(len(content))
+        type_list = ", ".join(schedule_types)
+
+        logger.info(f"Processing {len(content)} chars with {timeout_seconds}s timeout for {type_list} in one request")
+
+        try:
+            response = self._generate_with_timeout(prompt, timeout_seconds, rate_limiter)
+            if response is None:
+                logger.warning(f"AI processing timeout ({timeout_seconds}s) for {type_list} at {url}")
+                return {t: self._get_empty_result(f"AI processing timeout after {timeout_seconds}s") for t in schedule_types}
+            json_match = re.search(r"\{.*\}", response.text, re.DOTALL)
+            answer = json.loads(json_match.group(0)) if json_match else {}
+        except Exception as e:
+            logger.error(f"Combined AI extraction failed for {type_list} at {url}: {e}")
+            return {t: self._get_empty_result(f"AI extraction error: {str(e)}") for t in schedule_types}
+
+        results = {}
+        for schedule_type in schedule_types:
+            section = answer.get(schedule_type) if isinstance(answer, dict) else None
+            if not isinstance(section, dict):
+                logger.info(f"{schedule_type} missing from combined answer, extracting it on its own: {url}")
+                results[schedule_type] = self._extract_single(
+                    content, url, schedule_type, cleaned_content, cache_keys[schedule_type], rate_limiter
+                )
+                continue
+
+            result = self._parse_ai_response(json.dumps(section), url, schedule_type)
+            result["url"] = url
+            result["content"] = content[:1000]
+            self._store_cached_result(cache_keys[schedule_type], result)
+            results[schedule_type] = result
+
+        logger.info(f"Combined AI extraction completed for {type_list} at {url}")
+        return results
+
+    @staticmethod
+    def _timeout_for_content_size(content_size: int) -> int:
+        """AI call timeout in seconds, longer for larger prompts."""
+        if content_size > 20000:
+            return 120  # 2 minutes for very large content
+        elif content_size > 10000:
+            return 90  # 1.5 minutes for large content
+        return 60  # 1 minute for normal content
+
+    def _generate_with_timeout(self, prompt: str, timeout_seconds: int, rate_limiter: Optional[TokenBucket] = None):
+        """Call the model, returning None if it does not answer within timeout_seconds."""
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.model.generate_content, prompt)
+        try:
+            return future.result(timeout=timeout_seconds)
+        except concurrent.futures.TimeoutError:
+            return None
+        finally:
+            executor.shutdown(wait=False)
+
+    def _create_extraction_prompt(self, content: str, schedule_type: str, cleaned_content: Optional[str] = None) -> str:
         """Create a targeted prompt for schedule extraction."""
+        spec = SCHEDULE_PROMPT_SPECS.get(schedule_type)
+        if spec is None:
+            return None
 
         # Clean and truncate content to fit within token limits
-        cleaned_content = self._clean_content_for_ai(content)
+        if cleaned_content is None:
+            cleaned_content = self._clean_content_for_ai(content)
 
-        if schedule_type == "adoration":
-            return f"""
+        return f"""
 You are an expert at extracting Catholic parish schedule information.
-Analyze the following webpage content and extract ONLY Eucharistic Adoration schedule information.
+Analyze the following webpage content and extract ONLY {spec["subject"]} information.
 
 Look for:
-- Adoration, Exposition, Blessed Sacrament, Holy Hour schedules
-- Perpetual Adoration availability
-- Weekly recurring schedules (e.g., "Wednesdays 6-7 PM")
-- Daily schedules if offered
-- Special adoration events
+{spec["look_for"]}
 
 WEBPAGE CONTENT:
 {cleaned_content}
 
 Please respond ONLY in this JSON format:
 {{
-    "has_weekly_schedule": true/false,
-    "schedule_found": true/false,
-    "days_offered": ["Monday", "Tuesday", etc.],
-    "times": ["6:00 PM - 7:00 PM", "9:00 AM - 10:00 AM", etc.],
-    "frequency": "weekly" | "daily" | "monthly" | "special_events" | "unknown",
-    "schedule_details": "Full text description of the schedule",
-    "is_perpetual": true/false,
-    "confidence_score": 0-100,
-    "notes": "Any additional relevant information"
+{spec["json_fields"]}
 }}
 
-If no adoration schedule is found, return has_weekly_schedule: false and schedule_found: false.
+If no {spec["label"]} is found, return has_weekly_schedule: false and schedule_found: false.
 """
-        elif schedule_type == "reconciliation":
-            return f"""
+
+    def _create_combined_prompt(self, cleaned_content: str, schedule_types: List[str]) -> str:
+        """Create one prompt asking for several schedule types from the same page."""
+        sections = "\n\n".join(
+            f'{SCHEDULE_PROMPT_SPECS[t]["subject"]} (key "{t}"). Look for:\n{SCHEDULE_PROMPT_SPECS[t]["look_for"]}'
+            for t in schedule_types
+        )
+        result_fields = ",\n".join(
+            f'  "{t}": {{\n'
+            + "\n".join(f"  {line}" for line in SCHEDULE_PROMPT_SPECS[t]["json_fields"].splitlines())
+            + "\n  }"
+            for t in schedule_types
+        )
+
+        return f"""
 You are an expert at extracting Catholic parish schedule information.
-Analyze the following webpage content and extract ONLY Reconciliation/Confession schedule information.
+Analyze the following webpage content and extract the {len(schedule_types)} schedule types below.
+Judge each schedule type independently and give each its own confidence_score.
 
-Look for:
-- Confession times and schedules
-- Reconciliation service schedules
-- Sacrament of Penance availability
-- Weekly recurring schedules (e.g., "Saturdays 3:30-4:30 PM")
-- "By appointment" availability
-- Before/after Mass schedules
+{sections}
 
 WEBPAGE CONTENT:
 {cleaned_content}
 
-Please respond ONLY in this JSON format:
+Please respond ONLY in this JSON format, with one entry per schedule type:
 {{
-    "has_weekly_schedule": true/false,
-    "schedule_found": true/false,
-    "days_offered": ["Saturday", "Sunday", etc.],
-    "times": ["3:30 PM - 4:30 PM", "Before 5:00 PM Mass", etc.],
-    "frequency": "weekly" | "daily" | "by_appointment" | "before_mass" | "unknown",
-    "schedule_details": "Full text description of the schedule",
-    "by_appointment": true/false,
-    "confidence_score": 0-100,
-    "notes": "Any additional relevant information"
+{result_fields}
 }}
 
-If no reconciliation schedule is found, return has_weekly_schedule: false and schedule_found: false.
+If a schedule type is not found, return has_weekly_schedule: false and schedule_found: false for that type.
 """
-        elif schedule_type == "mass":
-            return f"""
+
+    def _create_batch_prompt(self, pages: List[Tuple[str, str, str]], schedule_type: str) -> str:
+        """
+        Create one prompt asking for the schedule of several pages.
+
+        Args:
+            pages: List of (page_id, url, cleaned_content) tuples
+            schedule_type: 'adoration', 'reconciliation', or 'mass'
+        """
+        spec = SCHEDULE_PROMPT_SPECS[schedule_type]
+        page_sections = "\n\n".join(
+            f"=== PAGE {page_id} ({url}) ===\n{cleaned_content}" for page_id, url, cleaned_content in pages
+        )
+        result_fields = "\n".join(f"    {line}" for line in spec["json_fields"].splitlines())
+
+        return f"""
 You are an expert at extracting Catholic parish schedule information.
-Analyze the following webpage content and extract ONLY Mass schedule information.
+Below are {len(pages)} separate webpages, each from a different parish or page. Analyze EACH page independently
+and extract ONLY {spec["subject"]} information. Never combine information across pages.
 
 Look for:
-- Mass times and schedules
-- Sunday Mass schedules
-- Weekday Mass schedules
-- Saturday Vigil Mass schedules
-- Holy Day schedules
-- Liturgy and Eucharistic celebration times
-- Weekly recurring schedules (e.g., "Sunday 8:00 AM, 10:30 AM, 12:00 PM")
-- Daily Mass offerings
-- Special liturgical schedules
+{spec["look_for"]}
 
-WEBPAGE CONTENT:
-{cleaned_content}
+{page_sections}
 
-Please respond ONLY in this JSON format:
+Please respond ONLY in this JSON format, with exactly one entry per page:
 {{
-    "has_weekly_schedule": true/false,
-    "schedule_found": true/false,
-    "days_offered": ["Sunday", "Monday", "Tuesday", etc.],
-    "times": ["8:00 AM", "10:30 AM", "12:00 PM", etc.],
-    "frequency": "weekly" | "daily" | "weekends_only" | "special_events" | "unknown",
-    "schedule_details": "Full text description of the Mass schedule",
-    "has_vigil_mass": true/false,
-    "has_daily_mass": true/false,
-    "confidence_score": 0-100,
-    "notes": "Any additional relevant information"
+  "results": [
+    {{
+        "page_id": "the PAGE id exactly as given",
+{result_fields}
+    }}
+  ]
 }}
 
-If no Mass schedule is found, return has_weekly_schedule: false and schedule_found: false.
+If no {spec["label"]} is found on a page, return has_weekly_schedule: false and schedule_found: false for that page.
 """
 
+    def _ai_cache_key(self, cleaned_content: str, schedule_type: str) -> str:
+        """
+        Content-addressed key for an AI result.
+
+        The key covers exactly what the model sees (the cleaned page text), the
+        schedule type, the prompt fingerprint and the model id, so a prompt or
+        model change never serves a result produced by the old one.
+        """
+        model_id = getattr(self, "model_id", None) or getattr(self.model, "model_name", type(self.model).__name__)
+        content_hash = hashlib.sha256(cleaned_content.encode("utf-8")).hexdigest()
+        return f"{AI_RESULT_CACHE_PREFIX}:{model_id}:{SCHEDULE_PROMPT_FINGERPRINT}:{schedule_type}:{content_hash}"
+
+    def _get_cached_result(self, cache_key: str, content: str, url: str) -> Optional[Dict]:
+        """Return a copy of a cached AI result filled in for this page, or None."""
+        cache = getattr(self, "ai_result_cache", None)
+        if cache is None:
+            return None
+
+        cached = cache.get(cache_key)
+        with self._ai_cache_lock:
+            self._ai_cache_stats["hits" if cached is not None else "misses"] += 1
+        if cached is None:
+            return None
+
+        result = dict(cached)
+        result["source_url"] = url
+        result["url"] = url
+        result["content"] = (content or "")[:1000]
+        result["cache_hit"] = True
+        logger.info(f"AI result cache hit for {result.get('schedule_type')} at {url}")
+        return result
+
+    def _store_cached_result(self, cache_key: str, result: Dict):
+        """Cache a successfully parsed AI result; error results are never cached."""
+        cache = getattr(self, "ai_result_cache", None)
+        if cache is None or "source_url" not in result:
+            return
+
+        ttl = config.AI_RESULT_CACHE_TTL_DAYS * 86400
+        value = {key: value for key, value in result.items() if key not in AI_RESULT_UNCACHED_FIELDS}
+        if cache.set(cache_key, value, ttl=ttl, content_type=ContentType.SCHEDULE_DATA):
+            with self._ai_cache_lock:
+                self._ai_cache_stats["stores"] += 1
+
+    def get_ai_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counts for the AI result cache since this extractor was created."""
+        stats = dict(getattr(self, "_ai_cache_stats", {"hits": 0, "misses": 0, "stores": 0}))
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["enabled"] = getattr(self, "ai_result_cache", None) is not None
+        return stats
+
     def _clean_content_for_ai(self, content: str) -> str:
         """Clean and intelligently truncate content for AI processing."""
         # Remove HTML tags
@@ -479,34 +745,172 @@ If no Mass schedule is found, return has_weekly_schedule: false and schedule_fou
             "extracted_at": datetime.now(timezone.utc).isoformat(),
         }
 
-    def batch_extract_schedules(self, parish_urls: List[Tuple[str, int, str]], schedule_type: str) -> List[Dict]:
+    def batch_extract_schedules(
+        self,
+        parish_urls: List[Tuple[str, int, str]],
+        schedule_type: str,
+        max_pages_per_request: Optional[int] = None,
+        max_concurrent_requests: Optional[int] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> List[Dict]:
         """
         Extract schedules for multiple parish URLs.
 
+        Pages are cleaned once and packed into multi-page prompts up to the
+        configured page and character budgets. Batches run concurrently,
+        paced by a token bucket. Any page missing from a batched answer is
+        retried on its own.
+
         Args:
             parish_urls: List of (url, parish_id, content) tuples
             schedule_type: 'adoration', 'reconciliation', or 'mass'
+            max_pages_per_request: Pages per prompt (default config.AI_BATCH_MAX_PAGES; 1 disables packing)
+            max_concurrent_requests: Parallel AI requests (default config.AI_MAX_CONCURRENT_REQUESTS)
+            rate_limiter: Token bucket to pace requests (default: the process-wide get_ai_rate_limiter())
 
         Returns:
-            List of extraction results
+            List of extraction results, in the same order as parish_urls
         """
-        results = []
+        if not parish_urls:
+            return []
+        if not self.model or schedule_type not in SCHEDULE_PROMPT_SPECS:
+            return [
+                {**self._get_empty_result("AI model not available"), "parish_id": parish_id, "url": url}
+                for url, parish_id, _ in parish_urls
+            ]
+
+        max_pages_per_request = max_pages_per_request or config.AI_BATCH_MAX_PAGES
+        max_concurrent_requests = max_concurrent_requests or config.AI_MAX_CONCURRENT_REQUESTS
+        rate_limiter = rate_limiter or get_ai_rate_limiter()
+
+        cleaned_pages = [self._clean_content_for_ai(content or "") for _, _, content in parish_urls]
+        cache_keys = [self._ai_cache_key(cleaned, schedule_type) for cleaned in cleaned_pages]
+
+        results_by_index: Dict[int, Dict] = {}
+        for index, (url, _, content) in enumerate(parish_urls):
+            cached = self._get_cached_result(cache_keys[index], content, url)
+            if cached is not None:
+                results_by_index[index] = cached
+
+        pending = [index for index in range(len(parish_urls)) if index not in results_by_index]
+        batches = [
+            [pending[position] for position in batch]
+            for batch in self._pack_batches([len(cleaned_pages[index]) for index in pending], max_pages_per_request)
+        ]
+        logger.info(
+            f"Batched {schedule_type} extraction: {len(parish_urls)} pages ({len(results_by_index)} cached) "
+            f"in {len(batches)} requests ({max_concurrent_requests} concurrent)"
+        )
+
+        def extract_alone(index: int) -> Dict:
+            # The cache lookup for this page already missed above
+            url, _, content = parish_urls[index]
+            return self._extract_single(
+                content or "", url, schedule_type, cleaned_pages[index], cache_keys[index], rate_limiter
+            )
+
+        def run_batch(batch: List[int]) -> Dict[int, Dict]:
+            if len(batch) == 1:
+                return {batch[0]: extract_alone(batch[0])}
+
+            results = self._extract_batch(parish_urls, cleaned_pages, batch, schedule_type, rate_limiter)
+            for index, result in results.items():
+                self._store_cached_result(cache_keys[index], result)
+            for index in batch:
+                if index not in results:
+                    logger.info(f"Page missing from batched answer, extracting individually: {parish_urls[index][0]}")
+                    results[index] = extract_alone(index)
+            return results
 
-        for url, parish_id, content in parish_urls:
-            logger.info(f"Processing {schedule_type} extraction for parish {parish_id}: {url}")
+        if batches:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+                for batch_results in executor.map(run_batch, batches):
+                    results_by_index.update(batch_results)
 
-            result = self.extract_schedule_from_content(content, url, schedule_type)
+        results = []
+        for index, (url, parish_id, content) in enumerate(parish_urls):
+            result = results_by_index[index]
             result["parish_id"] = parish_id
             results.append(result)
+        return results
 
-            # Small delay to be respectful to the API
-            import time
+    @staticmethod
+    def _pack_batches(page_sizes: List[int], max_pages_per_request: int) -> List[List[int]]:
+        """Group page indexes into prompts within the page and cleaned-character budgets."""
+        max_chars = config.AI_BATCH_MAX_CHARS
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+
+        for index, size in enumerate(page_sizes):
+            if current and (len(current) >= max_pages_per_request or current_chars + size > max_chars):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(index)
+            current_chars += size
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _extract_batch(
+        self,
+        parish_urls: List[Tuple[str, int, str]],
+        cleaned_pages: List[str],
+        batch: List[int],
+        schedule_type: str,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> Dict[int, Dict]:
+        """
+        Run one multi-page prompt.
+
+        Returns:
+            Results keyed by index into parish_urls; pages the model did not answer for are omitted
+        """
+        pages = [(str(index), parish_urls[index][0], cleaned_pages[index]) for index in batch]
+        prompt = self._create_batch_prompt(pages, schedule_type)
+        timeout_seconds = self._timeout_for_content_size(sum(len(cleaned) for _, _, cleaned in pages))
 
-            time.sleep(0.5)
+        try:
+            response = self._generate_with_timeout(prompt, timeout_seconds, rate_limiter)
+            if response is None:
+                logger.warning(f"Batched AI request timed out ({timeout_seconds}s) for {len(pages)} pages")
+                return {}
+            json_match = re.search(r"\{.*\}", response.text, re.DOTALL)
+            answers = json.loads(json_match.group(0)).get("results", []) if json_match else []
+        except Exception as e:
+            logger.warning(f"Batched AI extraction failed for {len(pages)} pages, falling back to single pages: {e}")
+            return {}
+
+        results = {}
+        for answer in answers:
+            if not isinstance(answer, dict):
+                continue
+            try:
+                index = int(str(answer.pop("page_id", "")).strip())
+            except ValueError:
+                continue
+            if index not in batch or index in results:
+                continue
+
+            url, _, content = parish_urls[index]
+            result = self._parse_ai_response(json.dumps(answer), url, schedule_type)
+            result["url"] = url
+            result["content"] = (content or "")[:1000]
+            results[index] = result
 
+        logger.info(f"Batched AI extraction answered {len(results)}/{len(pages)} {schedule_type} pages")
         return results
 
 
+def get_fact_writer(supabase):
+    """The write-behind batch manager that Step 4 ParishData facts go through."""
+    fact_writer = get_write_behind_manager(supabase)
+    if "ParishData" not in fact_writer.batch_configs:
+        fact_writer.configure_table("ParishData", "parish_id,fact_type", timestamp_column=None)
+    return fact_writer
+
+
 def save_ai_schedule_results(supabase, results: List[Dict]):
     """Save AI extraction results to database."""
     if not results:
@@ -561,8 +965,10 @@ def save_ai_schedule_results(supabase, results: List[Dict]):
 
     if facts_to_save:
         try:
-            supabase.table("ParishData").upsert(facts_to_save, on_conflict="parish_id,fact_type").execute()
-            logger.info(f"Successfully saved {len(facts_to_save)} AI schedule facts to database")
+            fact_writer = get_fact_writer(supabase)
+            for fact in facts_to_save:
+                fact_writer.add_record("ParishData", fact)
+            logger.info(f"Queued {len(facts_to_save)} AI schedule facts for the database")
         except Exception as e:
             logger.error(f"Error saving AI schedule facts: {e}")
     else:
@@ -6,20 +6,34 @@ This module provides functionality to load schedule extraction keywords
 from the ScheduleKeywords database table instead of hardcoding them.
 """
 
-from typing import Dict, List, Tuple
-
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from pipeline import config
+from core.keyword_matcher import KeywordScorer
 from core.logger import get_logger
 from supabase import Client
 
 logger = get_logger(__name__)
 
+SCHEDULE_TYPES = ("reconciliation", "adoration", "mass")
+
 
 def load_keywords_from_database(
-    supabase: Client,
+    supabase: Client, use_cache: bool = True
 ) -> Tuple[Dict[str, int], List[str], Dict[str, int], List[str], Dict[str, int], List[str]]:
     """
     Loads reconciliation, adoration, and mass times keywords from the ScheduleKeywords database table.
 
+    Results are cached process-wide for config.SCHEDULE_KEYWORDS_CACHE_TTL_SECONDS and
+    shared by every caller, so treat them as read-only. Changes made through
+    add_keyword, update_keyword_weight and deactivate_keyword invalidate the cache;
+    use_cache=False forces a fresh query.
+
     Returns:
         Tuple containing:
         - reconciliation_keywords: Dict of positive reconciliation keywords and their weights
@@ -29,93 +43,94 @@ def load_keywords_from_database(
         - mass_keywords: Dict of positive mass times keywords and their weights
         - mass_negative_keywords: List of negative mass times keywords
     """
-    try:
-        # Fetch all active keywords from database
-        response = (
-            supabase.table("ScheduleKeywords")
-            .select("keyword, schedule_type, weight, is_negative")
-            .eq("is_active", True)
-            .execute()
-        )
+    return _get_keyword_tables(supabase, use_cache)["keyword_sets"]
 
-        if not response.data:
-            logger.warning("No schedule keywords found in database, using fallback defaults")
-            return get_fallback_keywords()
-
-        # Initialize containers
-        reconciliation_keywords = {}
-        reconciliation_negative = []
-        adoration_keywords = {}
-        adoration_negative = []
-        mass_keywords = {}
-        mass_negative = []
-
-        # Process each keyword
-        for row in response.data:
-            keyword = row["keyword"]
-            schedule_type = row["schedule_type"]
-            weight = row["weight"]
-            is_negative = row["is_negative"]
-
-            if schedule_type == "reconciliation":
-                if is_negative:
-                    reconciliation_negative.append(keyword)
-                else:
-                    reconciliation_keywords[keyword] = weight
-
-            elif schedule_type == "adoration":
-                if is_negative:
-                    adoration_negative.append(keyword)
-                else:
-                    adoration_keywords[keyword] = weight
-
-            elif schedule_type == "mass":
-                if is_negative:
-                    mass_negative.append(keyword)
-                else:
-                    mass_keywords[keyword] = weight
-
-            elif schedule_type == "both":
-                if is_negative:
-                    reconciliation_negative.append(keyword)
-                    adoration_negative.append(keyword)
-                else:
-                    reconciliation_keywords[keyword] = weight
-                    adoration_keywords[keyword] = weight
-
-            elif schedule_type == "all":
-                if is_negative:
-                    reconciliation_negative.append(keyword)
-                    adoration_negative.append(keyword)
-                    mass_negative.append(keyword)
-                else:
-                    reconciliation_keywords[keyword] = weight
-                    adoration_keywords[keyword] = weight
-                    mass_keywords[keyword] = weight
-
-        logger.info(
-            f"Loaded from database: {len(reconciliation_keywords)} reconciliation keywords, "
-            f"{len(reconciliation_negative)} reconciliation negative keywords, "
-            f"{len(adoration_keywords)} adoration keywords, "
-            f"{len(adoration_negative)} adoration negative keywords, "
-            f"{len(mass_keywords)} mass keywords, "
-            f"{len(mass_negative)} mass negative keywords"
-        )
 
-        return (
-            reconciliation_keywords,
-            reconciliation_negative,
-            adoration_keywords,
-            adoration_negative,
-            mass_keywords,
-            mass_negative,
-        )
+def _query_keywords(
+    supabase: Client,
+) -> Tuple[Dict[str, int], List[str], Dict[str, int], List[str], Dict[str, int], List[str]]:
+    """Query the active keywords and group them per schedule type; database errors propagate."""
+    # Fetch all active keywords from database
+    response = (
+        supabase.table("ScheduleKeywords")
+        .select("keyword, schedule_type, weight, is_negative")
+        .eq("is_active", True)
+        .execute()
+    )
 
-    except Exception as e:
-        logger.error(f"Error loading keywords from database: {e}")
-        logger.info("Falling back to hardcoded keywords")
+    if not response.data:
+        logger.warning("No schedule keywords found in database, using fallback defaults")
         return get_fallback_keywords()
 
+    # Initialize containers
+    reconciliation_keywords = {}
+    reconciliation_negative = []
+    adoration_keywords = {}
+    adoration_negative = []
+    mass_keywords = {}
+    mass_negative = []
+
+    # Process each keyword
+    for row in response.data:
+        keyword = row["keyword"]
+        schedule_type = row["schedule_type"]
+        weight = row["weight"]
+        is_negative = row["is_negative"]
+
+        if schedule_type == "reconciliation":
+            if is_negative:
+                reconciliation_negative.append(keyword)
+            else:
+                reconciliation_keywords[keyword] = weight
+
+        elif schedule_type == "adoration":
+            if is_negative:
+                adoration_negative.append(keyword)
+            else:
+                adoration_keywords[keyword] = weight
+
+        elif schedule_type == "mass":
+            if is_negative:
+                mass_negative.append(keyword)
+            else:
+                mass_keywords[keyword] = weight
+
+        elif schedule_type == "both":
+            if is_negative:
+                reconciliation_negative.append(keyword)
+                adoration_negative.append(keyword)
+            else:
+                reconciliation_keywords[keyword] = weight
+                adoration_keywords[keyword] = weight
+
+        elif schedule_type == "all":
+            if is_negative:
+                reconciliation_negative.append(keyword)
+                adoration_negative.append(keyword)
+                mass_negative.append(keyword)
+            else:
+                reconciliation_keywords[keyword] = weight
+                adoration_keywords[keyword] = weight
+                mass_keywords[keyword] = weight
+
+    logger.info(
+        f"Loaded from database: {len(reconciliation_keywords)} reconciliation keywords, "
+        f"{len(reconciliation_negative)} reconciliation negative keywords, "
+        f"{len(adoration_keywords)} adoration keywords, "
+        f"{len(adoration_negative)} adoration negative keywords, "
+        f"{len(mass_keywords)} mass keywords, "
+        f"{len(mass_negative)} mass negative keywords"
+    )
+
+    return (
+        reconciliation_keywords,
+        reconciliation_negative,
+        adoration_keywords,
+        adoration_negative,
+        mass_keywords,
+        mass_negative,
+    )
+
 
 def get_fallback_keywords() -> Tuple[Dict[str, int], List[str], Dict[str, int], List[str], Dict[str, int], List[str]]:
     """
@@ -160,7 +175,12 @@ def get_all_keywords_for_priority_calculation(supabase: Client) -> Dict[str, int
     Gets combined keywords dictionary for URL priority calculation.
     Merges reconciliation, adoration, and mass keywords, taking the higher weight if there are duplicates.
     """
-    recon_kw, _, ador_kw, _, mass_kw, _ = load_keywords_from_database(supabase)
+    return _get_keyword_tables(supabase)["all_keywords"]
+
+
+def merge_priority_keywords(keyword_sets: Tuple) -> Dict[str, int]:
+    """Merge the positive keywords of the sets returned by load_keywords_from_database, keeping the higher weight."""
+    recon_kw, _, ador_kw, _, mass_kw, _ = keyword_sets
 
     # Merge dictionaries, taking higher weight for duplicate keys
     all_keywords = recon_kw.copy()
@@ -179,6 +199,135 @@ def get_all_keywords_for_priority_calculation(supabase: Client) -> Dict[str, int
     return all_keywords
 
 
+@dataclass(frozen=True)
+class ScheduleKeywordMatchers:
+    """Compiled keyword scorers for one version of the keyword table."""
+
+    version: str
+    priority: KeywordScorer  # Merged positive keywords, used to order the crawl frontier
+    by_type: Dict[str, KeywordScorer]  # Per schedule type, with that type's negative keywords
+
+
+_matchers_lock = threading.Lock()
+_cached_matchers: Optional[ScheduleKeywordMatchers] = None
+
+
+def keyword_table_version(keyword_sets: Tuple, all_keywords: Optional[Dict[str, int]] = None) -> str:
+    """Fingerprint of the loaded keyword sets; it changes whenever a keyword, weight or negative changes."""
+    payload = json.dumps([keyword_sets, all_keywords], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def get_keyword_matchers(keyword_sets: Tuple, all_keywords: Optional[Dict[str, int]] = None) -> ScheduleKeywordMatchers:
+    """
+    Compiled scorers for the given keyword sets, rebuilt only when the keyword table version changes.
+
+    Args:
+        keyword_sets: Tuple returned by load_keywords_from_database (an empty tuple gives no per-type scorers)
+        all_keywords: Priority keywords; merged from keyword_sets when omitted
+
+    Returns:
+        ScheduleKeywordMatchers shared by every caller with the same keyword table
+    """
+    global _cached_matchers
+
+    # The keyword table cache keeps the matchers built for the sets it hands out
+    entry = _keyword_cache
+    if (
+        entry is not None
+        and keyword_sets is entry["keyword_sets"]
+        and (all_keywords is None or all_keywords is entry["all_keywords"])
+    ):
+        return entry["matchers"]
+
+    if all_keywords is None:
+        all_keywords = merge_priority_keywords(keyword_sets) if keyword_sets else {}
+    version = keyword_table_version(keyword_sets, all_keywords)
+
+    with _matchers_lock:
+        if _cached_matchers is not None and _cached_matchers.version == version:
+            return _cached_matchers
+
+    by_type = {}
+    if keyword_sets:
+        for index, schedule_type in enumerate(SCHEDULE_TYPES):
+            by_type[schedule_type] = KeywordScorer(keyword_sets[2 * index], keyword_sets[2 * index + 1])
+    matchers = ScheduleKeywordMatchers(version=version, priority=KeywordScorer(all_keywords), by_type=by_type)
+    logger.debug(f"Compiled schedule keyword matchers for keyword table version {version}")
+
+    with _matchers_lock:
+        _cached_matchers = matchers
+    return matchers
+
+
+_keyword_cache_lock = threading.Lock()
+_keyword_cache: Optional[Dict[str, Any]] = None  # version, keyword_sets, all_keywords, matchers, loaded_at
+_keyword_cache_version = 0
+_keyword_cache_stats = {"hits": 0, "loads": 0, "invalidations": 0, "errors": 0}
+
+
+def _get_keyword_tables(supabase: Client, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Return the cached keyword tables, querying ScheduleKeywords when they are missing or older than the TTL.
+
+    Loads are serialized, so parishes starting together trigger a single query.
+    When a query fails, stale tables are kept in service; with nothing cached,
+    the hardcoded fallback keywords are returned without being cached.
+    """
+    global _keyword_cache, _keyword_cache_version
+
+    ttl = getattr(config, "SCHEDULE_KEYWORDS_CACHE_TTL_SECONDS", 600)
+    with _keyword_cache_lock:
+        entry = _keyword_cache
+        if use_cache and entry is not None and time.monotonic() - entry["loaded_at"] < ttl:
+            _keyword_cache_stats["hits"] += 1
+            return entry
+
+        try:
+            keyword_sets = _query_keywords(supabase)
+        except Exception as e:
+            _keyword_cache_stats["errors"] += 1
+            logger.error(f"Error loading keywords from database: {e}")
+            if entry is not None:
+                logger.info(f"Keeping cached keywords (version {entry['version']}) until the next refresh")
+                return entry
+            logger.info("Falling back to hardcoded keywords")
+            keyword_sets = get_fallback_keywords()
+            all_keywords = merge_priority_keywords(keyword_sets)
+            return {"version": None, "keyword_sets": keyword_sets, "all_keywords": all_keywords, "loaded_at": None}
+
+        _keyword_cache_version += 1
+        _keyword_cache_stats["loads"] += 1
+        all_keywords = merge_priority_keywords(keyword_sets)
+        _keyword_cache = {
+            "version": _keyword_cache_version,
+            "keyword_sets": keyword_sets,
+            "all_keywords": all_keywords,
+            "matchers": get_keyword_matchers(keyword_sets, all_keywords),
+            "loaded_at": time.monotonic(),
+        }
+        return _keyword_cache
+
+
+def invalidate_keyword_cache():
+    """Drop the cached keyword tables so the next lookup queries ScheduleKeywords again."""
+    global _keyword_cache
+
+    with _keyword_cache_lock:
+        if _keyword_cache is not None:
+            logger.debug(f"Invalidating cached schedule keywords (version {_keyword_cache['version']})")
+        _keyword_cache = None
+        _keyword_cache_stats["invalidations"] += 1
+
+
+def get_keyword_cache_stats() -> Dict[str, Any]:
+    """Cache hits, database loads, invalidations and failed loads since startup, with the cached version."""
+    with _keyword_cache_lock:
+        stats = dict(_keyword_cache_stats)
+        stats["version"] = _keyword_cache["version"] if _keyword_cache is not None else None
+    return stats
+
+
 def add_keyword(
     supabase: Client, keyword: str, schedule_type: str, weight: int = 1, is_negative: bool = False, description: str = None
 ) -> bool:
@@ -212,6 +361,7 @@ def add_keyword(
 
         if response.data:
             logger.info(f"Successfully added keyword '{keyword}' for {schedule_type}")
+            invalidate_keyword_cache()
             return True
         else:
             logger.error(f"Failed to add keyword '{keyword}'")
@@ -246,6 +396,7 @@ def update_keyword_weight(supabase: Client, keyword: str, schedule_type: str, ne
 
         if response.data:
             logger.info(f"Updated weight for '{keyword}' ({schedule_type}) to {new_weight}")
+            invalidate_keyword_cache()
             return True
         else:
             logger.error(f"Failed to update weight for '{keyword}'")
@@ -279,6 +430,7 @@ def deactivate_keyword(supabase: Client, keyword: str, schedule_type: str) -> bo
 
         if response.data:
             logger.info(f"Deactivated keyword '{keyword}' for {schedule_type}")
+            invalidate_keyword_cache()
             return True
         else:
             logger.error(f"Failed to deactivate keyword '{keyword}'")
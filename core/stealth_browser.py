@@ -8,6 +8,7 @@ advanced bot detection systems that block traditional HTTP requests.
 
 import logging
 import random
+import threading
 import time
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
@@ -33,6 +34,8 @@ class StealthBrowser:
     def __init__(self):
         """Initialize stealth browser."""
         self.driver = None
+        # One Selenium session: page loads from different threads must not interleave
+        self._lock = threading.RLock()
         self.is_available = SELENIUM_AVAILABLE
 
         if not SELENIUM_AVAILABLE:
@@ -100,6 +103,10 @@ class StealthBrowser:
         Returns:
             Page HTML content or None if failed
         """
+        with self._lock:
+            return self._get_page_content(url, timeout)
+
+    def _get_page_content(self, url: str, timeout: int) -> Optional[str]:
         if not self.is_available or not self.driver:
             logger.warning("Stealth browser not available")
             return None
@@ -141,6 +148,10 @@ class StealthBrowser:
         Returns:
             List of discovered URLs
         """
+        with self._lock:
+            return self._get_navigation_links(url)
+
+    def _get_navigation_links(self, url: str) -> list:
         if not self.is_available or not self.driver:
             return []
 
@@ -171,34 +182,38 @@ class StealthBrowser:
 
     def close(self):
         """Close the browser and cleanup resources."""
-        if self.driver:
-            try:
-                self.driver.quit()
-                logger.info("Stealth browser closed")
-            except Exception as e:
-                logger.error(f"Error closing stealth browser: {e}")
-            finally:
-                self.driver = None
+        with self._lock:
+            if self.driver:
+                try:
+                    self.driver.quit()
+                    logger.info("Stealth browser closed")
+                except Exception as e:
+                    logger.error(f"Error closing stealth browser: {e}")
+                finally:
+                    self.driver = None
 
 
 # Global stealth browser instance for reuse
 _stealth_browser = None
+_stealth_browser_lock = threading.Lock()
 
 
 def get_stealth_browser() -> StealthBrowser:
     """Get global stealth browser instance."""
     global _stealth_browser
-    if _stealth_browser is None:
-        _stealth_browser = StealthBrowser()
-    return _stealth_browser
+    with _stealth_browser_lock:
+        if _stealth_browser is None:
+            _stealth_browser = StealthBrowser()
+        return _stealth_browser
 
 
 def cleanup_stealth_browser():
     """Cleanup global stealth browser instance."""
     global _stealth_browser
-    if _stealth_browser:
-        _stealth_browser.close()
-        _stealth_browser = None
+    with _stealth_browser_lock:
+        if _stealth_browser:
+            _stealth_browser.close()
+            _stealth_browser = None
 
 
 # Context manager for automatic cleanup
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Token bucket rate limiter usable from threads and asyncio tasks.
+
+Tokens refill continuously at ``rate`` per second up to ``capacity``; each
+acquire takes tokens, waiting until enough have accumulated. Unlike a fixed
+sleep between calls, this allows bursts up to ``capacity`` while holding the
+long-run rate.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: float = 1.0) -> "TokenBucket":
+        return cls(requests_per_minute / 60.0, burst)
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens now, going into debt if necessary.
+
+        Returns:
+            Seconds the caller must wait before proceeding (0 if tokens were available)
+        """
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens only if they are available immediately."""
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block the calling thread until tokens are available; returns seconds waited."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Wait without blocking the event loop until tokens are available; returns seconds waited."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
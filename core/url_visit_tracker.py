@@ -6,8 +6,11 @@ This module provides comprehensive tracking of URL visits during schedule extrac
 recording detailed results for optimization, ML training, and debugging purposes.
 """
 
+import atexit
 import re
+import threading
 import time
+import weakref
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -83,10 +86,22 @@ class URLVisitTracker:
     Comprehensive URL visit tracking system for schedule extraction optimization.
     """
 
-    def __init__(self, supabase: Client = None):
-        """Initialize the URL visit tracker."""
+    def __init__(self, supabase: Client = None, max_buffered_visits: int = 100):
+        """
+        Initialize the URL visit tracker.
+
+        Args:
+            supabase: Supabase client
+            max_buffered_visits: Buffered URLs that trigger a bulk write
+        """
         self.supabase = supabase or get_supabase_client()
         self.logger = logger
+        self.max_buffered_visits = max_buffered_visits
+        self._pending_visits = {}  # (url, parish_id) -> DiscoveredUrls row
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._visit_rpc_available = True
+        _active_trackers.add(self)
 
         # Schedule-related keywords for content assessment
         self.schedule_keywords = {
@@ -164,60 +179,156 @@ class URLVisitTracker:
 
     def record_visit(self, visit_result: VisitResult) -> bool:
         """
-        Record a URL visit result in the database.
+        Buffer a URL visit result for the next bulk write.
+
+        Visits are written when the buffer holds max_buffered_visits URLs, when
+        the parish completes (flush) and at interpreter shutdown, so the crawl
+        loop never waits on the database.
 
         Args:
             visit_result: Complete visit result data
 
         Returns:
-            bool: True if recording was successful
+            bool: True if the visit was buffered
         """
         try:
-            # Calculate priority score from quality score
-            priority_score = int(max(visit_result.quality_score * 100, 1))
+            row = self._build_visit_row(visit_result)
+        except Exception as e:
+            logger.error(f"🔍 Error recording visit for {visit_result.url}: {e}")
+            return False
 
-            # Prepare data based on available schema
-            if self.has_enhanced_schema:
-                # Full enhanced tracking
-                update_data = {
-                    "visited": True,
-                    "score": priority_score,  # Required field
-                    "visited_at": visit_result.visited_at.isoformat(),
-                    "http_status": visit_result.http_status,
-                    "response_time_ms": visit_result.response_time_ms,
-                    "content_type": visit_result.content_type,
-                    "content_size_bytes": visit_result.content_size_bytes,
-                    "extraction_success": visit_result.extraction_success,
-                    "schedule_data_found": visit_result.schedule_data_found,
-                    "schedule_keywords_count": visit_result.schedule_keywords_count,
-                    "error_type": visit_result.error_type,
-                    "error_message": visit_result.error_message,
-                    "quality_score": visit_result.quality_score,
-                    "visit_count": 1,  # Will be incremented if record exists
-                }
-
-                if visit_result.extraction_success:
-                    update_data["last_successful_visit"] = visit_result.visited_at.isoformat()
+        key = (visit_result.url, visit_result.parish_id)
+        with self._buffer_lock:
+            previous = self._pending_visits.get(key)
+            if previous is not None:
+                row = self._merge_visit_rows(previous, row)
+            self._pending_visits[key] = row
+            buffer_full = len(self._pending_visits) >= self.max_buffered_visits
+
+        logger.debug(f"🔍 Buffered visit for {visit_result.url}: {visit_result.visit_status.value}")
+        if buffer_full:
+            self.flush()
+        return True
+
+    def _build_visit_row(self, visit_result: VisitResult) -> Dict[str, Any]:
+        """DiscoveredUrls row for one visit, shaped for the detected schema."""
+        # Calculate priority score from quality score
+        priority_score = int(max(visit_result.quality_score * 100, 1))
+
+        # Prepare data based on available schema
+        if self.has_enhanced_schema:
+            # Full enhanced tracking
+            update_data = {
+                "visited": True,
+                "score": priority_score,  # Required field
+                "visited_at": visit_result.visited_at.isoformat(),
+                "http_status": visit_result.http_status,
+                "response_time_ms": visit_result.response_time_ms,
+                "content_type": visit_result.content_type,
+                "content_size_bytes": visit_result.content_size_bytes,
+                "extraction_success": visit_result.extraction_success,
+                "schedule_data_found": visit_result.schedule_data_found,
+                "schedule_keywords_count": visit_result.schedule_keywords_count,
+                "error_type": visit_result.error_type,
+                "error_message": visit_result.error_message,
+                "quality_score": visit_result.quality_score,
+                "visit_count": 1,  # Added to the stored count by record_url_visits
+                "last_successful_visit": (
+                    visit_result.visited_at.isoformat() if visit_result.extraction_success else None
+                ),
+            }
 
-            else:
-                # Basic schema tracking
-                update_data = {"visited": True, "score": priority_score}  # Required field
-
-            # Update existing record or create if not exists
-            result = (
-                self.supabase.table("DiscoveredUrls")
-                .upsert(
-                    {"url": visit_result.url, "parish_id": visit_result.parish_id, **update_data}, on_conflict="url,parish_id"
-                )
-                .execute()
-            )
+        else:
+            # Basic schema tracking
+            update_data = {"visited": True, "score": priority_score}  # Required field
+
+        return {"url": visit_result.url, "parish_id": visit_result.parish_id, **update_data}
+
+    @staticmethod
+    def _merge_visit_rows(previous: Dict[str, Any], latest: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine two buffered visits to the same URL: latest fields, summed visit counts."""
+        merged = {**previous, **latest}
+        if "visit_count" in merged:
+            merged["visit_count"] = previous["visit_count"] + latest["visit_count"]
+            merged["last_successful_visit"] = latest["last_successful_visit"] or previous["last_successful_visit"]
+        return merged
+
+    def get_pending_visit_count(self) -> int:
+        """Number of URLs with visits waiting to be written."""
+        with self._buffer_lock:
+            return len(self._pending_visits)
+
+    def flush(self, parish_id: int = None) -> bool:
+        """
+        Write buffered visits in one bulk call.
 
-            logger.debug(f"🔍 Recorded visit for {visit_result.url}: {visit_result.visit_status.value}")
+        With the enhanced schema the record_url_visits database function upserts
+        the rows and adds each row's visit_count to the stored count. Without it
+        (or if the function is not installed) the rows go through a plain bulk
+        upsert, which sets visit_count instead of incrementing it.
+
+        Args:
+            parish_id: Only write this parish's visits (default: all)
+
+        Returns:
+            bool: True if the buffered visits were written
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                keys = [key for key in self._pending_visits if parish_id is None or key[1] == parish_id]
+                rows = [self._pending_visits.pop(key) for key in keys]
+
+            if not rows:
+                return True
+
+            try:
+                if self.has_enhanced_schema and self._visit_rpc_available:
+                    try:
+                        self.supabase.rpc("record_url_visits", {"p_visits": rows}).execute()
+                    except Exception as e:
+                        if self._is_missing_function_error(e):
+                            self._visit_rpc_available = False
+                            logger.warning(f"🔍 record_url_visits not installed ({e}), using bulk upsert from now on")
+                        else:
+                            logger.warning(f"🔍 record_url_visits failed ({e}), falling back to bulk upsert for this flush")
+                        self._upsert_visit_rows(rows)
+                else:
+                    self._upsert_visit_rows(rows)
+            except Exception as e:
+                logger.error(f"🔍 Error recording {len(rows)} visits: {e}")
+                # Keep the visits for the next flush unless newer visits to the same URLs arrived meanwhile
+                with self._buffer_lock:
+                    for row in rows:
+                        key = (row["url"], row["parish_id"])
+                        newer = self._pending_visits.get(key)
+                        self._pending_visits[key] = self._merge_visit_rows(row, newer) if newer else row
+                return False
+
+            logger.debug(f"🔍 Recorded {len(rows)} buffered visits")
             return True
 
-        except Exception as e:
-            logger.error(f"🔍 Error recording visit for {visit_result.url}: {e}")
-            return False
+    @staticmethod
+    def _is_missing_function_error(error: Exception) -> bool:
+        """Whether an RPC error means the database function is not installed (as opposed to a transient failure)."""
+        if getattr(error, "code", None) in ("PGRST202", "42883"):
+            return True
+        message = str(error).lower()
+        return "pgrst202" in message or "could not find the function" in message or (
+            "function" in message and "does not exist" in message
+        )
+
+    def _upsert_visit_rows(self, rows: List[Dict[str, Any]]):
+        """Bulk upsert visit rows without the server-side visit_count increment."""
+        # Leave last_successful_visit alone for failed visits; rows of each shape go in their own upsert
+        # since a bulk upsert fills columns missing from a row with NULL
+        shapes = {}
+        for row in rows:
+            if "last_successful_visit" in row and row["last_successful_visit"] is None:
+                row = {column: value for column, value in row.items() if column != "last_successful_visit"}
+            shapes.setdefault(tuple(sorted(row)), []).append(row)
+
+        for shaped_rows in shapes.values():
+            self.supabase.table("DiscoveredUrls").upsert(shaped_rows, on_conflict="url,parish_id").execute()
 
     def create_visit_result(self, url: str, parish_id: int) -> VisitResult:
         """
@@ -430,7 +541,21 @@ class URLVisitTracker:
 
 def get_url_visit_tracker(supabase: Client = None) -> URLVisitTracker:
     """Factory function to create URL visit tracker."""
-    return URLVisitTracker(supabase)
+    from pipeline import config
+
+    return URLVisitTracker(supabase, max_buffered_visits=config.VISIT_BUFFER_MAX)
+
+
+def flush_visit_trackers():
+    """Write the buffered visits of every live tracker (registered to run at shutdown)."""
+    for tracker in list(_active_trackers):
+        if tracker.get_pending_visit_count():
+            tracker.flush()
+
+
+# Trackers whose buffers are flushed at shutdown
+_active_trackers = weakref.WeakSet()
+atexit.register(flush_visit_trackers)
 
 
 # Context manager for automatic visit tracking
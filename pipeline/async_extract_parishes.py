@@ -17,10 +17,13 @@ from pipeline import config
 from core.async_driver import get_async_driver_pool, shutdown_async_driver_pool
 from core.async_parish_extractor import get_async_parish_extractor
 from core.db import get_supabase_client
+from core.db_batch_operations import close_write_behind_manager, get_write_behind_manager
+from core.driver import close_browser_pool, get_browser_pool
+from core.hybrid_fetcher import get_hybrid_fetcher, has_static_content
 from core.logger import get_logger
 from core.monitoring_client import get_monitoring_client
 from pipeline.parish_extraction_core import PatternDetector, enhanced_safe_upsert_to_supabase
-from pipeline.parish_extractors import ensure_chrome_installed
+from pipeline.parish_extractors import PARISH_LISTING_SELECTORS, ensure_chrome_installed
 
 logger = get_logger(__name__)
 
@@ -287,9 +290,20 @@ class AsyncDioceseProcessor:
                 driver.get(parish_directory_url)
                 return driver.page_source
 
-            html_content = await self.driver_pool.submit_request(
-                url=parish_directory_url, callback=load_parish_directory, priority=1
+            # Static sites skip the browser entirely; the fetcher remembers which domains need it
+            fetcher = get_hybrid_fetcher()
+            html_content = await asyncio.to_thread(
+                fetcher.try_static,
+                parish_directory_url,
+                PatternDetector()._requires_javascript,
+                lambda html: has_static_content(html, PARISH_LISTING_SELECTORS),
             )
+            if html_content is None:
+                html_content = await self.driver_pool.submit_request(
+                    url=parish_directory_url, callback=load_parish_directory, priority=1
+                )
+                if isinstance(html_content, str) and html_content:
+                    fetcher.record_browser_success(parish_directory_url)
 
             # Step 2: Extract basic parish information (synchronous for now)
             from bs4 import BeautifulSoup
@@ -344,7 +358,13 @@ class AsyncDioceseProcessor:
                 if enhanced_parishes:
                     supabase = get_supabase_client()
                     enhanced_safe_upsert_to_supabase(
-                        enhanced_parishes, diocese_id, diocese_name, diocese_info["url"], parish_directory_url, supabase
+                        enhanced_parishes,
+                        diocese_id,
+                        diocese_name,
+                        diocese_info["url"],
+                        parish_directory_url,
+                        supabase,
+                        batch_manager=get_write_behind_manager(supabase),
                     )
 
             result["success"] = True
@@ -399,8 +419,9 @@ class AsyncDioceseProcessor:
             if monitoring_client:
                 monitoring_client.send_log(f"Step 3 │ {message}", level)
 
+        browser_pool = get_browser_pool()
+        driver = None
         try:
-            from core.driver import get_protected_driver
             from pipeline.parish_extractors import get_extractor_for_pattern
 
             # Log pattern detection results
@@ -416,11 +437,11 @@ class AsyncDioceseProcessor:
             # Get the appropriate extractor using factory function
             extractor = get_extractor_for_pattern(pattern)
 
-            # Get driver for extraction
-            driver = get_protected_driver()
+            # Lease a browser for extraction; it is reset and returned to the pool afterwards
+            driver = browser_pool.acquire()
             if not driver:
                 logger.error(f"    ❌ Failed to create WebDriver for {diocese_name}")
-                return []
+                return [], extraction_details
 
             # Perform extraction with fallback chain
             log_both(f"    🚀 Starting extraction for {diocese_name}...")
@@ -536,7 +557,6 @@ class AsyncDioceseProcessor:
                 log_both("       • This diocese needs manual investigation", "ERROR")
             log_both("    " + "=" * 80)
 
-            driver.quit()
             return parishes_found, extraction_details
 
         except ImportError as e:
@@ -560,6 +580,8 @@ class AsyncDioceseProcessor:
             extraction_details["failures"]["exception"] = f"{type(e).__name__}: {str(e)}"
             extraction_details["url_accessible"] = "error" in str(e).lower() or "timeout" in str(e).lower()
             return [], extraction_details
+        finally:
+            browser_pool.release(driver)
 
     def _log_final_results(self, results: Dict[str, Any]):
         """Log comprehensive final results"""
@@ -589,6 +611,9 @@ class AsyncDioceseProcessor:
             self.parish_extractor.log_stats()
 
         await shutdown_async_driver_pool()
+        close_browser_pool()
+        await asyncio.to_thread(close_write_behind_manager)
+        logger.info(f"🔀 Page fetch paths: {get_hybrid_fetcher().get_stats()}")
         logger.info("✅ Async diocese processor shutdown complete")
 
 
@@ -27,6 +27,40 @@ DEFAULT_MAX_DIOCESES = 5
 DEFAULT_MAX_PARISHES_PER_DIOCESE = None  # No cap - extract all parishes
 DEFAULT_NUM_PARISHES_FOR_SCHEDULE = 5
 DEFAULT_MAX_PAGES_TO_SCAN = 200
+DEFAULT_MAX_CONCURRENT_PARISHES = 1  # Parishes crawled at once in Step 4; raise to opt in to concurrent crawling
+DEFAULT_MAX_PARISHES_PER_DOMAIN = 1  # Parishes on the same site crawled at once in Step 4
+
+# --- AI Schedule Extraction Limits ---
+AI_REQUESTS_PER_MINUTE = float(os.getenv("AI_REQUESTS_PER_MINUTE", "60"))
+AI_REQUEST_BURST = int(os.getenv("AI_REQUEST_BURST", "5"))
+AI_MAX_CONCURRENT_REQUESTS = int(os.getenv("AI_MAX_CONCURRENT_REQUESTS", "4"))
+AI_BATCH_MAX_PAGES = 4  # Pages packed into one batched extraction prompt
+AI_BATCH_MAX_CHARS = 48000  # Cleaned page characters per batched prompt
+AI_RESULT_CACHE_ENABLED = os.getenv("AI_RESULT_CACHE_ENABLED", "true").lower() == "true"
+AI_RESULT_CACHE_TTL_DAYS = float(os.getenv("AI_RESULT_CACHE_TTL_DAYS", "30"))
+AI_COMBINED_EXTRACTION_ENABLED = os.getenv("AI_COMBINED_EXTRACTION_ENABLED", "true").lower() == "true"  # One prompt per page
+PAGE_CHANGE_TRACKING_ENABLED = os.getenv("PAGE_CHANGE_TRACKING_ENABLED", "true").lower() == "true"
+PAGE_VALIDATOR_TTL_DAYS = float(os.getenv("PAGE_VALIDATOR_TTL_DAYS", "30"))
+VISIT_BUFFER_MAX = int(os.getenv("VISIT_BUFFER_MAX", "100"))  # Page visits buffered before a bulk DiscoveredUrls write
+SCHEDULE_KEYWORDS_CACHE_TTL_SECONDS = int(os.getenv("SCHEDULE_KEYWORDS_CACHE_TTL_SECONDS", "600"))  # Keyword table reuse
+PAGE_STORE_MAX_PARSED = int(os.getenv("PAGE_STORE_MAX_PARSED", "16"))  # Parsed pages kept in memory per parish crawl
+
+# --- Browser Pool (Step 3) ---
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_PAGES = int(os.getenv("BROWSER_MAX_PAGES", "200"))  # Page loads before a browser is relaunched
+BROWSER_MAX_RSS_MB = float(os.getenv("BROWSER_MAX_RSS_MB", "1500"))  # Browser memory before it is relaunched
+STATIC_FETCH_ENABLED = os.getenv("STATIC_FETCH_ENABLED", "true").lower() == "true"  # Plain HTTP before Selenium
+FETCH_PATH_TTL_DAYS = float(os.getenv("FETCH_PATH_TTL_DAYS", "14"))  # How long a domain's HTTP decision holds
+FETCH_BROWSER_PATH_TTL_HOURS = float(os.getenv("FETCH_BROWSER_PATH_TTL_HOURS", "24"))  # Browser-only domains are re-probed after this
+DETAIL_FETCH_MAX_PER_DOMAIN = int(os.getenv("DETAIL_FETCH_MAX_PER_DOMAIN", "4"))  # Concurrent parish detail fetches per site
+DETAIL_BROWSER_WORKERS = int(os.getenv("DETAIL_BROWSER_WORKERS", "2"))  # Browsers used for script-driven detail pages
+
+# --- Write-Behind Database Writer (Steps 3 and 4) ---
+WRITE_BEHIND_BATCH_SIZE = int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "50"))  # Records per upsert
+WRITE_BEHIND_MAX_BYTES = int(os.getenv("WRITE_BEHIND_MAX_BYTES", str(512 * 1024)))  # Payload size that forces a flush
+WRITE_BEHIND_MAX_AGE_SECONDS = float(os.getenv("WRITE_BEHIND_MAX_AGE_SECONDS", "2"))  # Longest a record waits to be written
+WRITE_BEHIND_MAX_QUEUE = int(os.getenv("WRITE_BEHIND_MAX_QUEUE", "5000"))  # Queued records before writers block
+WRITE_BEHIND_MAX_RETRIES = int(os.getenv("WRITE_BEHIND_MAX_RETRIES", "3"))  # Retries before a failed batch is bisected
 
 
 def get_genai_api_key():
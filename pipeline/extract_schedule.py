@@ -2,14 +2,22 @@
 # coding: utf-8
 
 import argparse
+import asyncio
+import functools
 import heapq
 import random
 import re
+import threading
 import time
 import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Callable
 from urllib.parse import urljoin, urlparse
 
+import httpx
 import requests
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 from bs4.element import Tag
@@ -18,15 +26,30 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from pipeline import config
+from core.async_crawler import AsyncCrawler
 from core.db import get_supabase_client  # Import the get_supabase_client function
+from core.db_batch_operations import when_saved
 from core.enhanced_url_manager import get_enhanced_url_manager
 from core.intelligent_parish_prioritizer import get_intelligent_parish_prioritizer
+from core.keyword_matcher import KeywordMatcher, KeywordScorer
 from core.logger import get_logger
 from core.monitoring_client import MonitoringClient
-from core.schedule_ai_extractor import ScheduleAIExtractor, save_ai_schedule_results
-from core.schedule_keywords import get_all_keywords_for_priority_calculation, load_keywords_from_database
+from core.page_change_tracker import PageSnapshot, get_page_change_tracker
+from core.page_store import PageStore
+from core.schedule_ai_extractor import (
+    ScheduleAIExtractor,
+    get_ai_rate_limiter,
+    get_fact_writer,
+    save_ai_schedule_results,
+)
+from core.schedule_keywords import (
+    ScheduleKeywordMatchers,
+    get_all_keywords_for_priority_calculation,
+    get_keyword_matchers,
+    load_keywords_from_database,
+)
 from core.stealth_browser import get_stealth_browser
-from core.url_visit_tracker import VisitTracker, get_url_visit_tracker
+from core.url_visit_tracker import URLVisitTracker, VisitTracker, get_url_visit_tracker
 from core.utils import normalize_url  # Import normalize_url
 from supabase import Client
 
@@ -35,6 +58,7 @@ warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 logger = get_logger(__name__)
 
 _sitemap_cache = {}
+_sitemap_cache_lock = threading.Lock()
 
 # List of realistic user agents to rotate between
 USER_AGENTS = [
@@ -87,8 +111,8 @@ def make_request_with_delay(session: requests.Session, url: str, **kwargs) -> re
     delay = random.uniform(0.5, 2.0)
     time.sleep(delay)
 
-    # Rotate user agent for this request
-    session.headers.update({"User-Agent": random.choice(USER_AGENTS)})
+    # Rotate user agent for this request only; the session is shared by concurrent parish workers
+    kwargs["headers"] = {"User-Agent": random.choice(USER_AGENTS), **(kwargs.get("headers") or {})}
 
     try:
         response = session.get(url, **kwargs)
@@ -156,16 +180,44 @@ def make_request_with_delay(session: requests.Session, url: str, **kwargs) -> re
 # Create a global resilient session
 requests_session = get_resilient_session()
 
+
+def fetch_page(url: str, timeout: int = 10) -> PageSnapshot:
+    """
+    Conditionally GET a page through the shared session.
+
+    Stored ETag/Last-Modified validators are sent with the request; a 304 is
+    answered from the stored copy and marked unchanged.
+
+    Raises:
+        requests.exceptions.RequestException: On network errors or error statuses
+    """
+    tracker = get_page_change_tracker()
+    response = make_request_with_delay(requests_session, url, timeout=timeout, headers=tracker.conditional_headers(url))
+    if response.status_code != 304:
+        response.raise_for_status()
+    return tracker.resolve(url, response.status_code, response.headers, response.content)
+
+
+async def fetch_page_async(crawler: AsyncCrawler, url: str, timeout: float = 10.0) -> PageSnapshot:
+    """Async variant of fetch_page through the shared crawler."""
+    tracker = get_page_change_tracker()
+    response = await crawler.fetch(url, timeout=timeout, headers=tracker.conditional_headers(url))
+    if response.status_code != 304:
+        response.raise_for_status()
+    return tracker.resolve(url, response.status_code, response.headers, response.content)
+
 # Global AI extractor instance
 _ai_extractor = None
+_ai_extractor_lock = threading.Lock()
 
 
 def get_ai_extractor() -> ScheduleAIExtractor:
     """Get or create the global AI extractor instance."""
     global _ai_extractor
-    if _ai_extractor is None:
-        _ai_extractor = ScheduleAIExtractor()
-    return _ai_extractor
+    with _ai_extractor_lock:
+        if _ai_extractor is None:
+            _ai_extractor = ScheduleAIExtractor()
+        return _ai_extractor
 
 
 def get_suppression_urls(supabase: Client) -> set[str]:
@@ -419,84 +471,54 @@ def is_relevant_url(discovered_url: str, base_url: str) -> bool:
         return False
 
 
-def get_sitemap_urls(url: str) -> list[str]:
-    """Fetches sitemap.xml and extracts URLs. Falls back to navigation parsing if sitemap fails."""
-    normalized_url = normalize_url(url)  # Normalize URL for consistent caching key
-    if normalized_url in _sitemap_cache:
-        logger.debug(f"Returning sitemap from cache for {url}")
-        return _sitemap_cache[normalized_url]
-
-    # Try multiple sitemap locations and formats
-    sitemap_locations = [
-        "/sitemap.xml",
-        "/sitemap_index.xml",
-        "/sitemaps.xml",
-        "/sitemap/sitemap.xml",
-        "/wp-sitemap.xml",  # WordPress default
-        "/site-map.xml",
-        "/sitemap1.xml",
+SITEMAP_LOCATIONS = [
+    "/sitemap.xml",
+    "/sitemap_index.xml",
+    "/sitemaps.xml",
+    "/sitemap/sitemap.xml",
+    "/wp-sitemap.xml",  # WordPress default
+    "/site-map.xml",
+    "/sitemap1.xml",
+]
+
+
+def _parse_sitemap_locs(content: bytes) -> tuple[list[str], list[str]]:
+    """Parse a sitemap document into (page URLs, nested sitemap URLs)."""
+    # Try XML parsing first
+    soup = BeautifulSoup(content, "xml")
+    urls_found = [loc.text for loc in soup.find_all("loc") if loc.text and loc.text.startswith(("http://", "https://"))]
+
+    # If XML parsing didn't work, try HTML parsing
+    if not urls_found:
+        soup = BeautifulSoup(content, "html.parser")
+        urls_found = [loc.text for loc in soup.find_all("loc") if loc.text and loc.text.startswith(("http://", "https://"))]
+
+    # Check for sitemap index files (contain links to other sitemaps)
+    sitemap_links = [
+        loc.text
+        for loc in soup.find_all("loc")
+        if loc.text and "sitemap" in loc.text.lower() and loc.text.startswith(("http://", "https://"))
     ]
+    return urls_found, sitemap_links
 
-    for sitemap_path in sitemap_locations:
-        try:
-            sitemap_url = urljoin(url, sitemap_path)
-            response = make_request_with_delay(requests_session, sitemap_url, timeout=10)
-            response.raise_for_status()
-
-            # Try XML parsing first
-            soup = BeautifulSoup(response.content, "xml")
-            urls_found = [
-                loc.text for loc in soup.find_all("loc") if loc.text and loc.text.startswith(("http://", "https://"))
-            ]
-
-            # If XML parsing didn't work, try HTML parsing
-            if not urls_found:
-                soup = BeautifulSoup(response.content, "html.parser")
-                urls_found = [
-                    loc.text for loc in soup.find_all("loc") if loc.text and loc.text.startswith(("http://", "https://"))
-                ]
-
-            # Check for sitemap index files (contain links to other sitemaps)
-            sitemap_links = [
-                loc.text
-                for loc in soup.find_all("loc")
-                if loc.text and "sitemap" in loc.text.lower() and loc.text.startswith(("http://", "https://"))
-            ]
 
-            # If we found sitemap links, fetch those too
-            for sitemap_link in sitemap_links[:5]:  # Limit to prevent infinite recursion
-                try:
-                    sub_response = make_request_with_delay(requests_session, sitemap_link, timeout=10)
-                    sub_response.raise_for_status()
-                    sub_soup = BeautifulSoup(sub_response.content, "xml")
-                    sub_urls = [
-                        loc.text
-                        for loc in sub_soup.find_all("loc")
-                        if loc.text and loc.text.startswith(("http://", "https://"))
-                    ]
-                    urls_found.extend(sub_urls)
-                except Exception as sub_e:
-                    logger.debug(f"Failed to fetch sub-sitemap {sitemap_link}: {sub_e}")
-                    continue
+def _parse_sub_sitemap_locs(content: bytes) -> list[str]:
+    """Parse the page URLs out of a nested sitemap."""
+    sub_soup = BeautifulSoup(content, "xml")
+    return [loc.text for loc in sub_soup.find_all("loc") if loc.text and loc.text.startswith(("http://", "https://"))]
 
-            if urls_found:
-                # Filter out unwanted URLs
-                filtered_urls = [
-                    u
-                    for u in urls_found
-                    if not any(
-                        exclude in u.lower() for exclude in ["default", "template", "admin", "wp-content", "attachment"]
-                    )
-                ]
-                logger.debug(f"Found {len(filtered_urls)} URLs in sitemap {sitemap_path} for {url}")
-                _sitemap_cache[normalized_url] = filtered_urls
-                return filtered_urls
 
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Could not fetch sitemap {sitemap_path} for {url}: {e}")
-            continue
+def _filter_sitemap_urls(urls_found: list[str]) -> list[str]:
+    """Filter out unwanted URLs from sitemap results."""
+    return [
+        u
+        for u in urls_found
+        if not any(exclude in u.lower() for exclude in ["default", "template", "admin", "wp-content", "attachment"])
+    ]
 
-    # All sitemap attempts failed, try fallback methods
+
+def _discover_fallback_urls(url: str) -> list[str]:
+    """Discover candidate URLs without a sitemap (common paths, navigation, stealth browser, robots.txt)."""
     logger.info(f"All sitemap attempts failed for {url}, trying fallback URL discovery methods")
 
     # Method 1: Common schedule paths
@@ -540,10 +562,118 @@ def get_sitemap_urls(url: str) -> list[str]:
                 seen.add(normalized_discovered)
 
     logger.info(f"Discovered {len(unique_urls)} URLs using fallback methods for {url}")
-    _sitemap_cache[normalized_url] = unique_urls
     return unique_urls
 
 
+def _sitemap_locations_to_probe(url: str) -> list[str]:
+    """SITEMAP_LOCATIONS with the ones that yielded URLs on an earlier run moved to the front."""
+    tracker = get_page_change_tracker()
+    return sorted(SITEMAP_LOCATIONS, key=lambda path: not tracker.has_outcome(urljoin(url, path)))
+
+
+def _record_sitemap_outcome(sitemap_url: str, sitemap_links: list[str], filtered_urls: list[str]):
+    """Remember a sitemap's URLs so an unchanged copy is not parsed again."""
+    # A sitemap index can stay the same while its children change, so only leaf sitemaps are replayed
+    if not sitemap_links:
+        get_page_change_tracker().record_outcome(sitemap_url, {"links": filtered_urls})
+
+
+def _cached_sitemap_urls(normalized_url: str) -> list[str] | None:
+    """Sitemap URLs already discovered for a site this run, or None."""
+    with _sitemap_cache_lock:
+        return _sitemap_cache.get(normalized_url)
+
+
+def _cache_sitemap_urls(normalized_url: str, urls: list[str]) -> list[str]:
+    """Remember a site's sitemap URLs for the rest of the run and return them."""
+    with _sitemap_cache_lock:
+        _sitemap_cache[normalized_url] = urls
+    return urls
+
+
+def get_sitemap_urls(url: str) -> list[str]:
+    """Fetches sitemap.xml and extracts URLs. Falls back to navigation parsing if sitemap fails."""
+    normalized_url = normalize_url(url)  # Normalize URL for consistent caching key
+    cached_urls = _cached_sitemap_urls(normalized_url)
+    if cached_urls is not None:
+        logger.debug(f"Returning sitemap from cache for {url}")
+        return cached_urls
+
+    # Try multiple sitemap locations and formats, starting with any that worked last time
+    for sitemap_path in _sitemap_locations_to_probe(url):
+        try:
+            sitemap_url = urljoin(url, sitemap_path)
+            sitemap = fetch_page(sitemap_url, timeout=10)
+            if sitemap.unchanged and sitemap.outcome is not None:
+                logger.debug(f"Sitemap {sitemap_path} unchanged for {url}, reusing its URLs")
+                return _cache_sitemap_urls(normalized_url, sitemap.outcome["links"])
+
+            urls_found, sitemap_links = _parse_sitemap_locs(sitemap.content)
+
+            # If we found sitemap links, fetch those too
+            for sitemap_link in sitemap_links[:5]:  # Limit to prevent infinite recursion
+                try:
+                    urls_found.extend(_parse_sub_sitemap_locs(fetch_page(sitemap_link, timeout=10).content))
+                except Exception as sub_e:
+                    logger.debug(f"Failed to fetch sub-sitemap {sitemap_link}: {sub_e}")
+                    continue
+
+            if urls_found:
+                filtered_urls = _filter_sitemap_urls(urls_found)
+                logger.debug(f"Found {len(filtered_urls)} URLs in sitemap {sitemap_path} for {url}")
+                _record_sitemap_outcome(sitemap_url, sitemap_links, filtered_urls)
+                return _cache_sitemap_urls(normalized_url, filtered_urls)
+
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Could not fetch sitemap {sitemap_path} for {url}: {e}")
+            continue
+
+    # All sitemap attempts failed, try fallback methods
+    unique_urls = _discover_fallback_urls(url)
+    return _cache_sitemap_urls(normalized_url, unique_urls)
+
+
+async def get_sitemap_urls_async(url: str, crawler: AsyncCrawler) -> list[str]:
+    """Async variant of get_sitemap_urls that probes sitemaps through the shared crawler."""
+    normalized_url = normalize_url(url)
+    cached_urls = _cached_sitemap_urls(normalized_url)
+    if cached_urls is not None:
+        logger.debug(f"Returning sitemap from cache for {url}")
+        return cached_urls
+
+    for sitemap_path in _sitemap_locations_to_probe(url):
+        try:
+            sitemap_url = urljoin(url, sitemap_path)
+            sitemap = await fetch_page_async(crawler, sitemap_url, timeout=10)
+            if sitemap.unchanged and sitemap.outcome is not None:
+                logger.debug(f"Sitemap {sitemap_path} unchanged for {url}, reusing its URLs")
+                return _cache_sitemap_urls(normalized_url, sitemap.outcome["links"])
+
+            urls_found, sitemap_links = _parse_sitemap_locs(sitemap.content)
+
+            for sitemap_link in sitemap_links[:5]:  # Limit to prevent infinite recursion
+                try:
+                    sub_sitemap = await fetch_page_async(crawler, sitemap_link, timeout=10)
+                    urls_found.extend(_parse_sub_sitemap_locs(sub_sitemap.content))
+                except Exception as sub_e:
+                    logger.debug(f"Failed to fetch sub-sitemap {sitemap_link}: {sub_e}")
+                    continue
+
+            if urls_found:
+                filtered_urls = _filter_sitemap_urls(urls_found)
+                logger.debug(f"Found {len(filtered_urls)} URLs in sitemap {sitemap_path} for {url}")
+                _record_sitemap_outcome(sitemap_url, sitemap_links, filtered_urls)
+                return _cache_sitemap_urls(normalized_url, filtered_urls)
+
+        except httpx.HTTPError as e:
+            logger.debug(f"Could not fetch sitemap {sitemap_path} for {url}: {e}")
+            continue
+
+    # Fallback discovery mixes HTTP and the stealth browser, so run it off the event loop
+    unique_urls = await asyncio.to_thread(_discover_fallback_urls, url)
+    return _cache_sitemap_urls(normalized_url, unique_urls)
+
+
 def extract_time_info_from_soup(soup: BeautifulSoup, keyword: str) -> tuple[str, str | None]:
     """Extracts schedule information from a BeautifulSoup object."""
 
@@ -613,80 +743,131 @@ def extract_schedule_ai_first(url: str, schedule_type: str, suppression_urls: se
         return {"info": "Information not found", "method": "suppressed"}, False
 
     try:
-        # Fetch page content
-        response = make_request_with_delay(requests_session, url, timeout=15)
-        response.raise_for_status()
-        content = response.text
+        # Fetch page content (a 304 is answered from the stored copy)
+        page = fetch_page(url, timeout=15)
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Could not fetch {url} for {schedule_type} extraction: {e}")
+        return {"info": "Information not found", "method": "network_error", "error": str(e)}, False
+    except Exception as e:
+        logger.error(f"Unexpected error in AI-first extraction for {url}: {e}")
+        return {"info": "Information not found", "method": "extraction_error", "error": str(e)}, False
+
+    return extract_schedule_from_page_content(url, page.content.decode("utf-8", errors="replace"), schedule_type, parish_id)
+
+
+def extract_schedule_from_page_content(
+    url: str, content: str, schedule_type: str, parish_id: int, soup: BeautifulSoup | None = None
+) -> tuple[dict, bool]:
+    """
+    AI-first schedule extraction from already-fetched page content, with keyword fallback.
+
+    Pass ``soup`` when the page has already been parsed so the keyword fallback reuses it.
+
+    Returns:
+        (result_dict, used_ai): Tuple of extraction result and whether AI was used
+    """
+    return extract_schedules_from_page_content(url, content, [schedule_type], parish_id, soup=soup)[schedule_type]
+
+
+def extract_schedules_from_page_content(
+    url: str, content: str, schedule_types: list[str], parish_id: int, soup: BeautifulSoup | None = None
+) -> dict[str, tuple[dict, bool]]:
+    """
+    AI-first extraction of several schedule types from one page, with keyword fallback per type.
 
+    All types are requested from the AI in a single call. The adaptive confidence
+    threshold is then applied to each type on its own, and the types that miss it
+    fall back to keywords.
+
+    Returns:
+        (result_dict, used_ai) keyed by schedule type
+    """
+    results = {}
+    try:
         # Try AI extraction first
         ai_extractor = get_ai_extractor()
         if ai_extractor.model:  # Check if AI is available
-            logger.info(f"🤖 Attempting AI extraction for {schedule_type} at {url}")
+            logger.info(f"🤖 Attempting AI extraction for {', '.join(schedule_types)} at {url}")
 
-            ai_result = ai_extractor.extract_schedule_from_content(content, url, schedule_type)
+            ai_results = ai_extractor.extract_schedules_from_content(
+                content, url, schedule_types, rate_limiter=get_ai_rate_limiter()
+            )
 
             # Calculate adaptive confidence threshold
             adaptive_threshold = ai_extractor.get_adaptive_confidence_threshold(url, content)
-            confidence_score = ai_result.get("confidence_score", 0)
-
-            logger.info(f"🤖 AI confidence: {confidence_score}, threshold: {adaptive_threshold}")
-
-            # Use AI result if confidence meets adaptive threshold
-            if ai_result.get("schedule_found") and confidence_score >= adaptive_threshold:
-                logger.info(f"🤖 AI extraction successful for {schedule_type} at {url}")
-
-                # Format for compatibility with existing code
-                schedule_details = ai_result.get("schedule_details", "")
-                if not schedule_details and ai_result.get("times"):
-                    # Create readable schedule from structured data
-                    times = ai_result.get("times", [])
-                    days = ai_result.get("days_offered", [])
-                    if days and times:
-                        schedule_details = f"{', '.join(days)}: {', '.join(times)}"
-                    elif times:
-                        schedule_details = ", ".join(times)
-
-                result = {
-                    "info": schedule_details or "Schedule found via AI",
-                    "method": "ai_gemini",
-                    "confidence": confidence_score,
-                    "ai_data": ai_result,
-                    "fact_string": schedule_details,
-                }
-
-                # Save AI result to database immediately
-                ai_result["parish_id"] = parish_id
-                save_ai_schedule_results(get_supabase_client(), [ai_result])
+            confident_results = []
+
+            for schedule_type, ai_result in ai_results.items():
+                confidence_score = ai_result.get("confidence_score", 0)
+                logger.info(f"🤖 AI confidence for {schedule_type}: {confidence_score}, threshold: {adaptive_threshold}")
+
+                # Use AI result if confidence meets adaptive threshold
+                if ai_result.get("schedule_found") and confidence_score >= adaptive_threshold:
+                    logger.info(f"🤖 AI extraction successful for {schedule_type} at {url}")
+                    results[schedule_type] = (_ai_schedule_result(ai_result), True)
+                    ai_result["parish_id"] = parish_id
+                    confident_results.append(ai_result)
+                else:
+                    logger.info(
+                        f"🤖 AI confidence too low for {schedule_type} ({confidence_score} < {adaptive_threshold}), "
+                        "falling back to keywords"
+                    )
 
-                return result, True
-            else:
-                logger.info(f"🤖 AI confidence too low ({confidence_score} < {adaptive_threshold}), falling back to keywords")
+            # Save AI results to database immediately
+            if confident_results:
+                save_ai_schedule_results(get_supabase_client(), confident_results)
         else:
             logger.warning("🤖 AI extractor not available, falling back to keywords")
 
         # Fallback to keyword extraction
-        logger.info(f"🔍 Using keyword fallback for {schedule_type} at {url}")
-        soup = BeautifulSoup(content, "html.parser")
-        keyword_map = {"reconciliation": "Reconciliation", "adoration": "Adoration", "mass": "Mass"}
-        keyword = keyword_map.get(schedule_type, schedule_type.title())
-
-        info, fact_string = extract_time_info_from_soup(soup, keyword)
-
-        result = {
-            "info": info,
-            "method": "keyword_extraction",
-            "confidence": 50 if info != "Information not found" else 0,
-            "fact_string": fact_string,
-        }
+        for schedule_type in schedule_types:
+            if schedule_type in results:
+                continue
+            logger.info(f"🔍 Using keyword fallback for {schedule_type} at {url}")
+            if soup is None:
+                soup = BeautifulSoup(content, "html.parser")
+            keyword_map = {"reconciliation": "Reconciliation", "adoration": "Adoration", "mass": "Mass"}
+            keyword = keyword_map.get(schedule_type, schedule_type.title())
+
+            info, fact_string = extract_time_info_from_soup(soup, keyword)
+
+            results[schedule_type] = (
+                {
+                    "info": info,
+                    "method": "keyword_extraction",
+                    "confidence": 50 if info != "Information not found" else 0,
+                    "fact_string": fact_string,
+                },
+                False,
+            )
 
-        return result, False
+        return results
 
-    except requests.exceptions.RequestException as e:
-        logger.warning(f"Could not fetch {url} for {schedule_type} extraction: {e}")
-        return {"info": "Information not found", "method": "network_error", "error": str(e)}, False
     except Exception as e:
         logger.error(f"Unexpected error in AI-first extraction for {url}: {e}")
-        return {"info": "Information not found", "method": "extraction_error", "error": str(e)}, False
+        error_result = {"info": "Information not found", "method": "extraction_error", "error": str(e)}
+        return {schedule_type: results.get(schedule_type, (dict(error_result), False)) for schedule_type in schedule_types}
+
+
+def _ai_schedule_result(ai_result: dict) -> dict:
+    """Format a confident AI result for compatibility with the keyword extraction results."""
+    schedule_details = ai_result.get("schedule_details", "")
+    if not schedule_details and ai_result.get("times"):
+        # Create readable schedule from structured data
+        times = ai_result.get("times", [])
+        days = ai_result.get("days_offered", [])
+        if days and times:
+            schedule_details = f"{', '.join(days)}: {', '.join(times)}"
+        elif times:
+            schedule_details = ", ".join(times)
+
+    return {
+        "info": schedule_details or "Schedule found via AI",
+        "method": "ai_gemini",
+        "confidence": ai_result.get("confidence_score", 0),
+        "ai_data": ai_result,
+        "fact_string": schedule_details,
+    }
 
 
 def extract_time_info(url: str, keyword: str, suppression_urls: set[str]) -> tuple[str, str | None]:
@@ -695,17 +876,17 @@ def extract_time_info(url: str, keyword: str, suppression_urls: set[str]) -> tup
         logger.info(f"Skipping extraction for {url} as it is in the suppression list.")
         return "Information not found", None
     try:
-        response = make_request_with_delay(requests_session, url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(fetch_page(url, timeout=10).content, "html.parser")
         return extract_time_info_from_soup(soup, keyword)
     except requests.exceptions.RequestException as e:
         logger.warning(f"Could not fetch {url} for time info extraction: {e}")
         return "Information not found", None
 
 
-def choose_best_url(urls: list[str], keywords: dict, negative_keywords: list[str], base_domain: str) -> str:
-    """Chooses the best URL from a list based on a scoring system."""
+def choose_best_url(
+    urls: list[str], keywords: dict, negative_keywords: list[str], base_domain: str, scorer: KeywordScorer | None = None
+) -> str:
+    """Chooses the best URL from a list based on a scoring system (see calculate_priority for ``scorer``)."""
     if not urls:
         return ""
     if len(urls) == 1:
@@ -715,7 +896,7 @@ def choose_best_url(urls: list[str], keywords: dict, negative_keywords: list[str
     max_score = -1
 
     for url in urls:
-        score = calculate_priority(url, keywords, negative_keywords, base_domain)
+        score = calculate_priority(url, keywords, negative_keywords, base_domain, scorer=scorer)
 
         if score > max_score:
             max_score = score
@@ -728,19 +909,30 @@ def choose_best_url(urls: list[str], keywords: dict, negative_keywords: list[str
     return best_url
 
 
-def calculate_priority(url: str, keywords: dict, negative_keywords: list[str], base_domain: str = None) -> int:
-    """Calculates the priority of a URL based on keywords in its path and domain relevance."""
-    score = 0
-    url_path = urlparse(url).path.lower()
-    url_domain = urlparse(url).netloc.lower().replace("www.", "")
+def calculate_priority(
+    url: str, keywords: dict, negative_keywords: list[str], base_domain: str = None, scorer: KeywordScorer | None = None
+) -> int:
+    """
+    Calculates the priority of a URL based on keywords in its path and domain relevance.
 
-    for kw, kw_score in keywords.items():
-        if kw in url_path:
-            score += kw_score
+    Hot paths pass ``scorer``, the same keywords compiled once (see get_keyword_matchers),
+    so the path is scanned a single time instead of once per keyword.
+    """
+    parsed = urlparse(url)
+    url_path = parsed.path.lower()
+    url_domain = parsed.netloc.lower().replace("www.", "")
 
-    for neg_kw in negative_keywords:
-        if neg_kw in url_path:
-            score -= 2
+    if scorer is not None:
+        score = scorer.score(url_path)
+    else:
+        score = 0
+        for kw, kw_score in keywords.items():
+            if kw in url_path:
+                score += kw_score
+
+        for neg_kw in negative_keywords:
+            if neg_kw in url_path:
+                score -= 2
 
     if len(url_path.split("/")) > 2:
         score += 1
@@ -752,42 +944,146 @@ def calculate_priority(url: str, keywords: dict, negative_keywords: list[str], b
     return score
 
 
-def scrape_parish_data(
-    url: str,
-    parish_id: int,
-    supabase: Client,
-    suppression_urls: set[str],
-    max_pages_to_scan: int = config.DEFAULT_MAX_PAGES_TO_SCAN,
-) -> dict:
-    """
-    Enhanced parish website scraping with intelligent URL discovery and optimization.
+# Schedule types looked for on every crawled page; one AI call covers all of them
+CRAWL_SCHEDULE_TYPES = ["reconciliation", "adoration", "mass"]
+
+# Words that suggest a page carries schedule information worth an AI extraction pass
+SCHEDULE_INDICATORS = [
+    "reconciliation",
+    "confession",
+    "adoration",
+    "mass",
+    "schedule",
+    "hours",
+    "times",
+    "sacrament",
+    "worship",
+    "liturgy",
+]
 
-    Uses Enhanced URL Manager for:
-    - Success-based URL memory (golden URLs)
-    - Smart protocol detection and DNS resolution
-    - Dynamic page limits based on success history
-    - Improved timeout strategies
-    """
+# Page relevance words, scanned in a single pass over each crawled page's text
+RECONCILIATION_PAGE_KEYWORDS = {"reconciliation", "confession"}
+PAGE_RELEVANCE_MATCHER = KeywordMatcher(SCHEDULE_INDICATORS + sorted(RECONCILIATION_PAGE_KEYWORDS))
+
+# Errors that mean a page could not be fetched (sync requests or async httpx crawl)
+FETCH_ERRORS = (requests.exceptions.RequestException, httpx.HTTPError)
+
+
+@dataclass
+class ParishCrawlState:
+    """Priority frontier and findings for a single parish crawl, shared by the sync and async scrapers."""
+
+    url: str
+    parish_id: int
+    suppression_urls: set
+    base_domain: str
+    max_pages: int
+    all_keywords: dict
+    keyword_sets: tuple
+    urls_to_visit: list = field(default_factory=list)
+    visited_urls: set = field(default_factory=set)
+    candidate_pages: dict = field(default_factory=lambda: {"reconciliation": [], "adoration": [], "mass": []})
+    discovered_urls: dict = field(default_factory=dict)
+    page_store: PageStore = field(default_factory=lambda: PageStore(config.PAGE_STORE_MAX_PARSED))
+    keyword_matchers: ScheduleKeywordMatchers | None = None
+
+    def __post_init__(self):
+        if self.keyword_matchers is None:
+            self.keyword_matchers = get_keyword_matchers(self.keyword_sets, self.all_keywords)
+
+    def next_url(self) -> tuple[int, str] | None:
+        """Pop the highest-priority URL still worth visiting, or None when the scan is over."""
+        while self.urls_to_visit and len(self.visited_urls) < self.max_pages:
+            priority, current_url = heapq.heappop(self.urls_to_visit)
+            priority = -priority
+
+            if current_url in self.visited_urls:
+                continue
+
+            if normalize_url(current_url) in self.suppression_urls:
+                logger.info(f"Skipping {current_url} as it is in the suppression list.")
+                self.visited_urls.add(current_url)  # Mark as visited to avoid re-processing
+                continue
+
+            if re.search(r"\.(pdf|jpg|jpeg|png|gif|svg|zip|docx|xlsx|pptx|mp3|mp4|avi|mov)$", current_url, re.IGNORECASE):
+                self.visited_urls.add(current_url)
+                continue
+
+            logger.debug(f"Checking {current_url} (Priority: {priority}, Visited: {len(self.visited_urls) + 1}/{self.max_pages})")
+            self.visited_urls.add(current_url)
+
+            key = (current_url, self.parish_id)
+            if key in self.discovered_urls:
+                self.discovered_urls[key]["visited"] = True
+            else:
+                self.discovered_urls[key] = {
+                    "parish_id": self.parish_id,
+                    "url": current_url,
+                    "score": int(priority),
+                    "visited": True,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                }
+            return priority, current_url
+
+        return None
+
+    def add_links(self, current_url: str, soup: BeautifulSoup) -> list[str]:
+        """Push the links found on a page onto the frontier; returns them so they can be replayed later."""
+        links = list(dict.fromkeys(urljoin(current_url, a["href"]).split("#")[0] for a in soup.find_all("a", href=True)))
+        self.add_link_urls(current_url, links)
+        return links
+
+    def add_link_urls(self, current_url: str, links: list[str]):
+        """Push already-resolved links found on current_url onto the frontier."""
+        for link in links:
+            # Check if the link is a valid HTTP/HTTPS URL and does not contain an email pattern
+            if (
+                link.startswith(("http://", "https://"))
+                and link not in self.visited_urls
+                and not re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", link)
+            ):
+                if normalize_url(link) in self.suppression_urls:
+                    logger.debug(f"Skipping discovered link {link} as it is in the suppression list.")
+                    continue
+                link_priority = calculate_priority(
+                    link, self.all_keywords, [], self.base_domain, scorer=self.keyword_matchers.priority
+                )
+                heapq.heappush(self.urls_to_visit, (-link_priority, link))
+                key = (link, self.parish_id)
+                if key not in self.discovered_urls:
+                    self.discovered_urls[key] = {
+                        "parish_id": self.parish_id,
+                        "url": link,
+                        "score": int(link_priority),
+                        "source_url": current_url,
+                        "visited": False,
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                    }
+
+
+def _skip_parish_result(url: str, suppression_urls: set[str]) -> dict | None:
+    """Return an empty result if the parish should not be crawled at all, else None."""
     # Initial check for the starting URL
     if normalize_url(url) in suppression_urls:
         logger.info(f"Skipping initial URL {url} as it is in the suppression list.")
-        return {
-            "url": url,
-            "scraped_at": datetime.now(timezone.utc).isoformat(),
-            "offers_reconciliation": False,
-            "offers_adoration": False,
-        }
-
     # Temporary workaround for saintbrigid.org network issues
-    if url == "http://www.saintbrigid.org/":
+    elif url == "http://www.saintbrigid.org/":
         logger.warning(f"Temporarily skipping {url} due to persistent network issues.")
-        return {
-            "url": url,
-            "scraped_at": datetime.now(timezone.utc).isoformat(),
-            "offers_reconciliation": False,
-            "offers_adoration": False,
-        }
+    else:
+        return None
+
+    return {
+        "url": url,
+        "scraped_at": datetime.now(timezone.utc).isoformat(),
+        "offers_reconciliation": False,
+        "offers_adoration": False,
+    }
 
+
+def _prepare_crawl_state(
+    url: str, parish_id: int, supabase: Client, suppression_urls: set[str], sitemap_urls: list[str]
+) -> tuple[ParishCrawlState, URLVisitTracker]:
+    """Build the initial priority frontier for a parish from its base URL and sitemap."""
     # Initialize Enhanced URL Manager and Visit Tracker
     url_manager = get_enhanced_url_manager(supabase)
     visit_tracker = get_url_visit_tracker(supabase)
@@ -799,27 +1095,22 @@ def scrape_parish_data(
     optimized_max_pages = extraction_context.page_scan_limit
     logger.info(f"🔗 Using optimized page scan limit: {optimized_max_pages}")
 
-    urls_to_visit = []
-    visited_urls = set()
-    candidate_pages = {"reconciliation": [], "adoration": []}
-    discovered_urls = {}
-
     # Load keywords from database
-    (
-        recon_keywords,
-        recon_negative_keywords,
-        adoration_keywords,
-        adoration_negative_keywords,
-        mass_keywords,
-        mass_negative_keywords,
-    ) = load_keywords_from_database(supabase)
+    keyword_sets = load_keywords_from_database(supabase)
     all_keywords = get_all_keywords_for_priority_calculation(supabase)
 
-    base_domain = urlparse(url).netloc.lower().replace("www.", "")
+    state = ParishCrawlState(
+        url=url,
+        parish_id=parish_id,
+        suppression_urls=suppression_urls,
+        base_domain=urlparse(url).netloc.lower().replace("www.", ""),
+        max_pages=optimized_max_pages,
+        all_keywords=all_keywords,
+        keyword_sets=keyword_sets,
+    )
 
     # Collect initial URLs (base + sitemap)
     initial_urls = [url]
-    sitemap_urls = get_sitemap_urls(url)
     if sitemap_urls:
         initial_urls.extend(sitemap_urls)
 
@@ -835,55 +1126,139 @@ def scrape_parish_data(
 
         # Use Enhanced URL Manager priority score (negative for max-heap)
         priority = -candidate.priority_score
-        heapq.heappush(urls_to_visit, (priority, candidate.url))
+        heapq.heappush(state.urls_to_visit, (priority, candidate.url))
 
     # Add any remaining initial URLs not covered by optimization
     for initial_url in initial_urls:
         if not any(candidate.url == initial_url for candidate in optimized_candidates):
             if normalize_url(initial_url) not in suppression_urls:
-                priority = calculate_priority(initial_url, all_keywords, [], base_domain)
-                heapq.heappush(urls_to_visit, (-priority, initial_url))
+                priority = calculate_priority(
+                    initial_url, all_keywords, [], state.base_domain, scorer=state.keyword_matchers.priority
+                )
+                heapq.heappush(state.urls_to_visit, (-priority, initial_url))
 
-    logger.info(f"🔗 Starting enhanced scan with {len(urls_to_visit)} optimized URLs in priority queue.")
+    logger.info(f"🔗 Starting enhanced scan with {len(state.urls_to_visit)} optimized URLs in priority queue.")
+    return state, visit_tracker
 
-    while urls_to_visit and len(visited_urls) < optimized_max_pages:
-        priority, current_url = heapq.heappop(urls_to_visit)
-        priority = -priority
 
-        if current_url in visited_urls:
-            continue
+def _replay_page_outcome(
+    state: ParishCrawlState, current_url: str, outcome: dict, visit_tracker: URLVisitTracker, visit_result
+):
+    """Reuse what an earlier crawl learned from a page whose content has not changed."""
+    logger.info(f"♻️ {current_url} unchanged since last crawl, reusing previous findings")
+    for schedule_type in outcome.get("schedule_types", []):
+        state.candidate_pages[schedule_type].append(current_url)
 
-        if normalize_url(current_url) in suppression_urls:
-            logger.info(f"Skipping {current_url} as it is in the suppression list.")
-            visited_urls.add(current_url)  # Mark as visited to avoid re-processing
-            continue
+    visit_tracker.record_extraction_attempt(visit_result, True)
+    for attribute, value in outcome.get("quality", {}).items():
+        setattr(visit_result, attribute, value)
 
-        if re.search(r"\.(pdf|jpg|jpeg|png|gif|svg|zip|docx|xlsx|pptx|mp3|mp4|avi|mov)$", current_url, re.IGNORECASE):
-            visited_urls.add(current_url)
-            continue
+    state.add_link_urls(current_url, outcome.get("links", []))
 
-        logger.debug(f"Checking {current_url} (Priority: {priority}, Visited: {len(visited_urls) + 1}/{max_pages_to_scan})")
-        visited_urls.add(current_url)
 
-        key = (current_url, parish_id)
-        if key in discovered_urls:
-            discovered_urls[key]["visited"] = True
-        else:
-            discovered_urls[key] = {
-                "parish_id": parish_id,
-                "url": current_url,
-                "score": int(priority),
-                "visited": True,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-            }
+def _process_page(
+    state: ParishCrawlState,
+    current_url: str,
+    page: PageSnapshot,
+    visit_tracker: URLVisitTracker,
+    visit_result,
+    extract_fn: Callable[[str, str, bytes], tuple[dict, bool]],
+):
+    """
+    Look for schedules on a fetched page, record its quality and queue its links.
 
-        # Use VisitTracker context manager for comprehensive visit tracking
-        with VisitTracker(current_url, parish_id, visit_tracker) as visit_result:
-            try:
-                start_time = time.time()
-                response = make_request_with_delay(requests_session, current_url, timeout=10)
-                response_time = time.time() - start_time
+    The page is added to the crawl's page store, and its parsed tree and text
+    are shared by extraction, quality scoring and link discovery. Pages that
+    answered 304 or hash-identical to the last crawl skip parsing and AI
+    extraction; the findings recorded for them last time are replayed instead.
+    """
+    # Keep the body so final extraction never downloads this page again
+    stored = state.page_store.put(current_url, page.content)
+
+    if page.unchanged and page.outcome is not None:
+        _replay_page_outcome(state, current_url, page.outcome, visit_tracker, visit_result)
+        return
+
+    content = page.content
+    soup = stored.soup
+
+    page_text = stored.text
+    page_words = PAGE_RELEVANCE_MATCHER.find(page_text.lower())
+
+    # Track schedule data discovery
+    schedule_found = False
+    schedule_types_found = []
+
+    # AI-first approach: Try extracting schedules immediately
+    ai_extraction_attempted = False
+
+    # Check if page likely contains schedule information
+    if not page_words.isdisjoint(SCHEDULE_INDICATORS):
+        logger.info(f"🤖 Schedule indicators found on {current_url}, attempting AI extraction")
+        ai_extraction_attempted = True
+
+        # Try AI extraction for all schedule types
+        for schedule_type in CRAWL_SCHEDULE_TYPES:
+            result, used_ai = extract_fn(current_url, schedule_type, content)
+
+            if result.get("confidence", 0) > 0:
+                logger.info(f"🤖 AI found {schedule_type} schedule: {result.get('info', 'N/A')[:100]}")
+                schedule_types_found.append(schedule_type)
+                schedule_found = True
+
+    # Fallback to keyword detection only if AI wasn't attempted or found nothing
+    if not ai_extraction_attempted or not schedule_found:
+        if not page_words.isdisjoint(RECONCILIATION_PAGE_KEYWORDS):
+            logger.info(f"Found 'Reconciliation' keywords on {current_url}")
+            schedule_types_found.append("reconciliation")
+            schedule_found = True
+
+        if "adoration" in page_words:
+            logger.info(f"Found 'Adoration' keyword on {current_url}")
+            schedule_types_found.append("adoration")
+            schedule_found = True
+
+    for schedule_type in schedule_types_found:
+        state.candidate_pages[schedule_type].append(current_url)
+
+    # Record extraction success and assess content quality
+    visit_tracker.record_extraction_attempt(visit_result, True)
+    quality_score = visit_tracker.assess_content_quality(visit_result, page_text, schedule_found)
 
+    logger.debug(f"🔍 Visit tracked for {current_url}: quality={quality_score:.2f}, schedule_found={schedule_found}")
+
+    # Continue with link discovery
+    links = state.add_links(current_url, soup)
+
+    get_page_change_tracker().record_outcome(
+        current_url,
+        {
+            "schedule_types": schedule_types_found,
+            "links": links,
+            "quality": {
+                "schedule_data_found": visit_result.schedule_data_found,
+                "schedule_keywords_count": visit_result.schedule_keywords_count,
+                "quality_score": visit_result.quality_score,
+                "relevance_indicators": visit_result.relevance_indicators,
+            },
+        },
+    )
+
+
+def _track_page_visit(
+    state: ParishCrawlState,
+    current_url: str,
+    response,
+    response_time: float,
+    fetch_error: Exception | None,
+    visit_tracker: URLVisitTracker,
+    extract_fn: Callable[[str, str, bytes], tuple[dict, bool]],
+):
+    """Record a page visit and process the page if it was fetched successfully."""
+    # Use VisitTracker context manager for comprehensive visit tracking
+    with VisitTracker(current_url, state.parish_id, visit_tracker) as visit_result:
+        if fetch_error is None:
+            try:
                 # Record HTTP response details
                 visit_tracker.record_http_response(
                     visit_result,
@@ -891,176 +1266,477 @@ def scrape_parish_data(
                     response_time,
                     response.headers.get("content-type"),
                     len(response.content) if response.content else 0,
-                    response.url,
+                    str(response.url),
                 )
 
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                page_text = soup.get_text()
-                page_text_lower = page_text.lower()
-
-                # Track schedule data discovery
-                schedule_found = False
-
-                # AI-first approach: Try extracting schedules immediately
-                ai_extraction_attempted = False
-
-                # Check if page likely contains schedule information
-                schedule_indicators = [
-                    "reconciliation",
-                    "confession",
-                    "adoration",
-                    "mass",
-                    "schedule",
-                    "hours",
-                    "times",
-                    "sacrament",
-                    "worship",
-                    "liturgy",
-                ]
-
-                if any(indicator in page_text_lower for indicator in schedule_indicators):
-                    logger.info(f"🤖 Schedule indicators found on {current_url}, attempting AI extraction")
-                    ai_extraction_attempted = True
-
-                    # Try AI extraction for all schedule types
-                    for schedule_type in ["reconciliation", "adoration", "mass"]:
-                        result, used_ai = extract_schedule_ai_first(current_url, schedule_type, suppression_urls, parish_id)
-
-                        if result.get("confidence", 0) > 0:
-                            logger.info(f"🤖 AI found {schedule_type} schedule: {result.get('info', 'N/A')[:100]}")
-                            candidate_pages[schedule_type].append(current_url)
-                            schedule_found = True
-
-                # Fallback to keyword detection only if AI wasn't attempted or found nothing
-                if not ai_extraction_attempted or not schedule_found:
-                    if any(kw in page_text_lower for kw in ["reconciliation", "confession"]):
-                        logger.info(f"Found 'Reconciliation' keywords on {current_url}")
-                        candidate_pages["reconciliation"].append(current_url)
-                        schedule_found = True
-
-                    if "adoration" in page_text_lower:
-                        logger.info(f"Found 'Adoration' keyword on {current_url}")
-                        candidate_pages["adoration"].append(current_url)
-                        schedule_found = True
-
-                # Record extraction success and assess content quality
-                visit_tracker.record_extraction_attempt(visit_result, True)
-                quality_score = visit_tracker.assess_content_quality(visit_result, page_text, schedule_found)
-
-                logger.debug(
-                    f"🔍 Visit tracked for {current_url}: quality={quality_score:.2f}, schedule_found={schedule_found}"
+                if response.status_code != 304:
+                    response.raise_for_status()
+                page = get_page_change_tracker().resolve(
+                    current_url, response.status_code, response.headers, response.content
                 )
+                _process_page(state, current_url, page, visit_tracker, visit_result, extract_fn)
+            except FETCH_ERRORS as e:
+                fetch_error = e
 
-                # Continue with link discovery
-                for a in soup.find_all("a", href=True):
-                    link = urljoin(current_url, a["href"]).split("#")[0]
-                    # Check if the link is a valid HTTP/HTTPS URL and does not contain an email pattern
-                    if (
-                        link.startswith(("http://", "https://"))
-                        and link not in visited_urls
-                        and not re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", link)
-                    ):
-                        if normalize_url(link) in suppression_urls:
-                            logger.debug(f"Skipping discovered link {link} as it is in the suppression list.")
-                            continue
-                        link_priority = calculate_priority(link, all_keywords, [], base_domain)
-                        heapq.heappush(urls_to_visit, (-link_priority, link))
-                        key = (link, parish_id)
-                        if key not in discovered_urls:
-                            discovered_urls[key] = {
-                                "parish_id": parish_id,
-                                "url": link,
-                                "score": int(link_priority),
-                                "source_url": current_url,
-                                "visited": False,
-                                "created_at": datetime.now(timezone.utc).isoformat(),
-                            }
+        if fetch_error is not None:
+            logger.warning(f"Could not fetch or process {current_url}: {fetch_error}")
+            # Record extraction failure
+            visit_tracker.record_extraction_attempt(visit_result, False, fetch_error)
+            if visit_result.response_time_ms is None:
+                visit_result.response_time_ms = int(response_time * 1000)
 
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Could not fetch or process {current_url}: {e}")
-                # Record extraction failure
-                visit_tracker.record_extraction_attempt(visit_result, False, e)
 
-    if len(visited_urls) >= optimized_max_pages:
-        logger.warning(f"🔗 Reached optimized scan limit of {optimized_max_pages} pages for {url}.")
+def _save_discovered_urls(supabase: Client, state: ParishCrawlState):
+    """Persist the crawl frontier to DiscoveredUrls."""
+    if len(state.visited_urls) >= state.max_pages:
+        logger.warning(f"🔗 Reached optimized scan limit of {state.max_pages} pages for {state.url}.")
 
-    if discovered_urls:
-        urls_to_insert = list(discovered_urls.values())
+    if state.discovered_urls:
+        urls_to_insert = list(state.discovered_urls.values())
         try:
             supabase.table("DiscoveredUrls").upsert(urls_to_insert, on_conflict="url,parish_id").execute()
             logger.info(f"Saved {len(urls_to_insert)} discovered URLs to Supabase.")
         except Exception as e:
             logger.error(f"Error saving discovered URLs to Supabase: {e}")
 
-    result = {"url": url, "scraped_at": datetime.now(timezone.utc).isoformat()}
 
-    # Process reconciliation results (AI-first with keyword fallback)
-    if candidate_pages["reconciliation"]:
-        best_page = choose_best_url(candidate_pages["reconciliation"], recon_keywords, recon_negative_keywords, base_domain)
-        result["reconciliation_page"] = best_page
-        result["offers_reconciliation"] = True
+def _choose_best_pages(state: ParishCrawlState) -> dict[str, str]:
+    """Pick the best candidate page per schedule type."""
+    (
+        recon_keywords,
+        recon_negative_keywords,
+        adoration_keywords,
+        adoration_negative_keywords,
+        _mass_keywords,
+        _mass_negative_keywords,
+    ) = state.keyword_sets
+
+    scorers = state.keyword_matchers.by_type
+    best_pages = {}
+    if state.candidate_pages["reconciliation"]:
+        best_pages["reconciliation"] = choose_best_url(
+            state.candidate_pages["reconciliation"],
+            recon_keywords,
+            recon_negative_keywords,
+            state.base_domain,
+            scorer=scorers.get("reconciliation"),
+        )
+    if state.candidate_pages["adoration"]:
+        best_pages["adoration"] = choose_best_url(
+            state.candidate_pages["adoration"],
+            adoration_keywords,
+            adoration_negative_keywords,
+            state.base_domain,
+            scorer=scorers.get("adoration"),
+        )
+    return best_pages
 
-        # Try AI-first extraction
-        recon_result, used_ai = extract_schedule_ai_first(best_page, "reconciliation", suppression_urls, parish_id)
-
-        if recon_result.get("confidence", 0) > 0:
-            result["reconciliation_info"] = recon_result.get("info", "Information not found")
-            result["reconciliation_fact_string"] = recon_result.get("fact_string")
-            result["reconciliation_method"] = recon_result.get("method", "unknown")
-            result["reconciliation_confidence"] = recon_result.get("confidence", 0)
-            logger.info(f"🤖 Reconciliation extraction ({'AI' if used_ai else 'keyword'}): '{result['reconciliation_info']}'")
-        else:
-            # Final fallback to legacy extraction
-            result["reconciliation_info"], result["reconciliation_fact_string"] = extract_time_info(
-                best_page, "Reconciliation", suppression_urls
+
+def _store_extractors(
+    state: ParishCrawlState, fetch: Callable[[str], bytes] | None = None
+) -> tuple[Callable[..., tuple[dict, bool]], Callable[[str, str], tuple[str, str | None]]]:
+    """
+    Build extraction callbacks that read pages from the crawl's page store.
+
+    Args:
+        state: Crawl whose page store holds the fetched pages
+        fetch: Downloads a page missing from the store; without it a miss counts as a network error
+
+    Returns:
+        (extract_fn, legacy_fn) for _process_page and _build_schedule_result
+    """
+
+    # Results per page for every crawl schedule type, so a page costs one AI call however often it is asked about
+    extractions: dict[str, dict[str, tuple[dict, bool]]] = {}
+
+    def load(page_url: str):
+        if fetch is None:
+            return state.page_store.get(page_url)
+        return state.page_store.get_or_fetch(page_url, fetch)
+
+    def extract_fn(page_url: str, schedule_type: str, _content: bytes = None) -> tuple[dict, bool]:
+        if page_url in state.suppression_urls:
+            logger.info(f"Skipping AI extraction for {page_url} as it is in the suppression list.")
+            return {"info": "Information not found", "method": "suppressed"}, False
+        try:
+            page = load(page_url)
+        except FETCH_ERRORS as e:
+            logger.warning(f"Could not fetch {page_url} for {schedule_type} extraction: {e}")
+            return {"info": "Information not found", "method": "network_error", "error": str(e)}, False
+        if page is None:
+            return {"info": "Information not found", "method": "network_error"}, False
+
+        key = normalize_url(page_url)
+        if key not in extractions:
+            schedule_types = list(dict.fromkeys(CRAWL_SCHEDULE_TYPES + [schedule_type]))
+            extractions[key] = extract_schedules_from_page_content(
+                page_url, page.html, schedule_types, state.parish_id, soup=page.soup
             )
-            result["reconciliation_method"] = "keyword_legacy"
-            result["reconciliation_confidence"] = 25
-            logger.info(f"🔍 Reconciliation legacy extraction: '{result['reconciliation_info']}'")
-    else:
-        result["offers_reconciliation"] = False
-        result["reconciliation_info"] = "No relevant page found"
-        result["reconciliation_page"] = ""
-        result["reconciliation_fact_string"] = None
-        result["reconciliation_method"] = "none"
-        result["reconciliation_confidence"] = 0
-
-    # Process adoration results (AI-first with keyword fallback)
-    if candidate_pages["adoration"]:
-        best_page = choose_best_url(candidate_pages["adoration"], adoration_keywords, adoration_negative_keywords, base_domain)
-        result["adoration_page"] = best_page
-        result["offers_adoration"] = True
+        elif schedule_type not in extractions[key]:
+            extractions[key].update(
+                extract_schedules_from_page_content(page_url, page.html, [schedule_type], state.parish_id, soup=page.soup)
+            )
+        return extractions[key][schedule_type]
+
+    def legacy_fn(page_url: str, keyword: str) -> tuple[str, str | None]:
+        if page_url in state.suppression_urls:
+            logger.info(f"Skipping extraction for {page_url} as it is in the suppression list.")
+            return "Information not found", None
+        try:
+            page = load(page_url)
+        except FETCH_ERRORS as e:
+            logger.warning(f"Could not fetch {page_url} for time info extraction: {e}")
+            return "Information not found", None
+        if page is None:
+            return "Information not found", None
+        return extract_time_info_from_soup(page.soup, keyword)
+
+    return extract_fn, legacy_fn
+
+
+def _build_schedule_result(
+    state: ParishCrawlState,
+    best_pages: dict[str, str],
+    extract_fn: Callable[[str, str], tuple[dict, bool]],
+    legacy_fn: Callable[[str, str], tuple[str, str | None]],
+) -> dict:
+    """Run final extraction on the best page per schedule type and assemble the parish result."""
+    result = {"url": state.url, "scraped_at": datetime.now(timezone.utc).isoformat()}
+
+    for schedule_type, label in (("reconciliation", "Reconciliation"), ("adoration", "Adoration")):
+        best_page = best_pages.get(schedule_type)
+        if not best_page:
+            result[f"offers_{schedule_type}"] = False
+            result[f"{schedule_type}_info"] = "No relevant page found"
+            result[f"{schedule_type}_page"] = ""
+            result[f"{schedule_type}_fact_string"] = None
+            result[f"{schedule_type}_method"] = "none"
+            result[f"{schedule_type}_confidence"] = 0
+            continue
+
+        result[f"{schedule_type}_page"] = best_page
+        result[f"offers_{schedule_type}"] = True
 
         # Try AI-first extraction
-        adoration_result, used_ai = extract_schedule_ai_first(best_page, "adoration", suppression_urls, parish_id)
-
-        if adoration_result.get("confidence", 0) > 0:
-            result["adoration_info"] = adoration_result.get("info", "Information not found")
-            result["adoration_fact_string"] = adoration_result.get("fact_string")
-            result["adoration_method"] = adoration_result.get("method", "unknown")
-            result["adoration_confidence"] = adoration_result.get("confidence", 0)
-            logger.info(f"🤖 Adoration extraction ({'AI' if used_ai else 'keyword'}): '{result['adoration_info']}'")
+        schedule_result, used_ai = extract_fn(best_page, schedule_type)
+
+        if schedule_result.get("confidence", 0) > 0:
+            result[f"{schedule_type}_info"] = schedule_result.get("info", "Information not found")
+            result[f"{schedule_type}_fact_string"] = schedule_result.get("fact_string")
+            result[f"{schedule_type}_method"] = schedule_result.get("method", "unknown")
+            result[f"{schedule_type}_confidence"] = schedule_result.get("confidence", 0)
+            logger.info(f"🤖 {label} extraction ({'AI' if used_ai else 'keyword'}): '{result[f'{schedule_type}_info']}'")
         else:
             # Final fallback to legacy extraction
-            result["adoration_info"], result["adoration_fact_string"] = extract_time_info(
-                best_page, "Adoration", suppression_urls
+            result[f"{schedule_type}_info"], result[f"{schedule_type}_fact_string"] = legacy_fn(best_page, label)
+            result[f"{schedule_type}_method"] = "keyword_legacy"
+            result[f"{schedule_type}_confidence"] = 25
+            logger.info(f"🔍 {label} legacy extraction: '{result[f'{schedule_type}_info']}'")
+
+    return result
+
+
+def scrape_parish_data(
+    url: str,
+    parish_id: int,
+    supabase: Client,
+    suppression_urls: set[str],
+    max_pages_to_scan: int = config.DEFAULT_MAX_PAGES_TO_SCAN,
+) -> dict:
+    """
+    Enhanced parish website scraping with intelligent URL discovery and optimization.
+
+    Uses Enhanced URL Manager for:
+    - Success-based URL memory (golden URLs)
+    - Smart protocol detection and DNS resolution
+    - Dynamic page limits based on success history
+    - Improved timeout strategies
+    """
+    skipped = _skip_parish_result(url, suppression_urls)
+    if skipped:
+        return skipped
+
+    state, visit_tracker = _prepare_crawl_state(url, parish_id, supabase, suppression_urls, get_sitemap_urls(url))
+
+    # Every consumer reads from the page store; only pages the crawl never fetched are downloaded again
+    extract_fn, legacy_fn = _store_extractors(state, lambda page_url: fetch_page(page_url, timeout=15).content)
+
+    try:
+        while (next_item := state.next_url()) is not None:
+            _, current_url = next_item
+
+            start_time = time.time()
+            response, fetch_error = None, None
+            try:
+                response = make_request_with_delay(
+                    requests_session,
+                    current_url,
+                    timeout=10,
+                    headers=get_page_change_tracker().conditional_headers(current_url),
+                )
+            except requests.exceptions.RequestException as e:
+                fetch_error = e
+            response_time = time.time() - start_time
+
+            _track_page_visit(state, current_url, response, response_time, fetch_error, visit_tracker, extract_fn)
+    finally:
+        # Visits are buffered during the crawl; write them before the frontier save, as the crawl used to
+        visit_tracker.flush(parish_id)
+
+    _save_discovered_urls(supabase, state)
+
+    # Process reconciliation and adoration results (AI-first with keyword fallback)
+    result = _build_schedule_result(state, _choose_best_pages(state), extract_fn, legacy_fn)
+    logger.debug(f"📄 Page store for parish {parish_id}: {state.page_store.get_stats()}")
+    return result
+
+
+async def scrape_parish_data_async(
+    url: str,
+    parish_id: int,
+    supabase: Client,
+    suppression_urls: set[str],
+    crawler: AsyncCrawler,
+    max_pages_to_scan: int = config.DEFAULT_MAX_PAGES_TO_SCAN,
+) -> dict:
+    """
+    Async variant of scrape_parish_data.
+
+    Pages are fetched through the shared AsyncCrawler, which enforces per-domain
+    politeness with non-blocking timers, so many parishes can be crawled from one
+    event loop. The frontier keeps the same priority ordering and suppression rules
+    as the sync path. Parsing, AI extraction and database writes are blocking, so
+    they run in worker threads.
+    """
+    skipped = _skip_parish_result(url, suppression_urls)
+    if skipped:
+        return skipped
+
+    sitemap_urls = await get_sitemap_urls_async(url, crawler)
+    state, visit_tracker = await asyncio.to_thread(
+        _prepare_crawl_state, url, parish_id, supabase, suppression_urls, sitemap_urls
+    )
+
+    extract_fn, legacy_fn = _store_extractors(state)
+
+    try:
+        while (next_item := state.next_url()) is not None:
+            _, current_url = next_item
+
+            start_time = time.time()
+            response, fetch_error = None, None
+            try:
+                response = await crawler.fetch(
+                    current_url, timeout=10, headers=get_page_change_tracker().conditional_headers(current_url)
+                )
+            except httpx.HTTPError as e:
+                fetch_error = e
+            response_time = time.time() - start_time
+
+            await asyncio.to_thread(
+                _track_page_visit, state, current_url, response, response_time, fetch_error, visit_tracker, extract_fn
             )
-            result["adoration_method"] = "keyword_legacy"
-            result["adoration_confidence"] = 25
-            logger.info(f"🔍 Adoration legacy extraction: '{result['adoration_info']}'")
-    else:
-        result["offers_adoration"] = False
-        result["adoration_info"] = "No relevant page found"
-        result["adoration_page"] = ""
-        result["adoration_fact_string"] = None
-        result["adoration_method"] = "none"
-        result["adoration_confidence"] = 0
+    finally:
+        await asyncio.to_thread(visit_tracker.flush, parish_id)
+
+    await asyncio.to_thread(_save_discovered_urls, supabase, state)
+
+    # The winning pages were stored during the crawl; only fetch any the store is missing
+    best_pages = _choose_best_pages(state)
+    for page_url in set(best_pages.values()):
+        if page_url in state.page_store:
+            continue
+        try:
+            state.page_store.put(page_url, (await fetch_page_async(crawler, page_url, timeout=15)).content)
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not fetch {page_url} for final extraction: {e}")
 
+    result = await asyncio.to_thread(_build_schedule_result, state, best_pages, extract_fn, legacy_fn)
+    logger.debug(f"📄 Page store for parish {parish_id}: {state.page_store.get_stats()}")
     return result
 
 
+def _failed_parish_result(parish_url: str) -> dict:
+    """Result recorded for a parish whose crawl raised."""
+    return {
+        "url": parish_url,
+        "scraped_at": datetime.now(timezone.utc).isoformat(),
+        "offers_reconciliation": False,
+        "offers_adoration": False,
+    }
+
+
+def _parish_domain(parish_url: str) -> str:
+    """Host a parish site is served from, used to keep same-site parishes from being crawled at once."""
+    return urlparse(parish_url).netloc.lower().removeprefix("www.")
+
+
+class ParishProgress:
+    """Thread-safe start/finish counters for a batch of parishes, with an ETA from the completion rate so far."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.started = 0
+        self.completed = 0
+        self.start_time = time.time()
+        self._lock = threading.Lock()
+
+    def start(self) -> int:
+        """Count a parish as started; returns its 1-based start position."""
+        with self._lock:
+            self.started += 1
+            return self.started
+
+    def complete(self) -> int:
+        """Count a parish as finished; returns its 1-based completion position."""
+        with self._lock:
+            self.completed += 1
+            return self.completed
+
+    def eta_seconds(self) -> float | None:
+        """Estimated seconds until the batch finishes, or None before the first parish completes."""
+        with self._lock:
+            completed = self.completed
+        if not completed:
+            return None
+        return (time.time() - self.start_time) / completed * (self.total - completed)
+
+    def describe(self) -> str:
+        """One-line progress summary with throughput and ETA for the logs."""
+        elapsed = time.time() - self.start_time
+        eta = self.eta_seconds()
+        rate = self.completed / elapsed * 60 if elapsed > 0 else 0.0
+        eta_text = f"{eta / 60:.1f} min" if eta is not None else "unknown"
+        return f"{self.completed}/{self.total} parishes done, {rate:.1f}/min, ETA {eta_text}"
+
+
+def run_parishes_concurrently(
+    parishes: list[tuple[str, int]],
+    scrape_fn: Callable[[str, int], dict],
+    on_result: Callable[[str, int, dict], None],
+    max_in_flight: int = config.DEFAULT_MAX_CONCURRENT_PARISHES,
+    max_per_domain: int = config.DEFAULT_MAX_PARISHES_PER_DOMAIN,
+) -> list[dict]:
+    """
+    Scrape several parishes at once on worker threads.
+
+    Parishes start in the given order as slots free up. A parish whose domain
+    already has ``max_per_domain`` crawls running waits, and later parishes on
+    other domains go ahead of it. Each result is handed to ``on_result`` on the
+    calling thread as soon as it finishes, so saves stream while the rest of
+    the batch is still crawling.
+
+    Args:
+        parishes: (url, parish_id) tuples to scrape
+        scrape_fn: Scrapes one parish; exceptions are logged and recorded as an empty result
+        on_result: Called with (url, parish_id, result) for each finished parish
+        max_in_flight: Parishes scraped at once (1 processes them one after another)
+        max_per_domain: Parishes of the same domain scraped at once
+
+    Returns:
+        Results in the same order as ``parishes``
+    """
+    max_in_flight = max(1, max_in_flight)
+    max_per_domain = max(1, max_per_domain)
+    pending = deque(enumerate(parishes))
+    results: list[dict | None] = [None] * len(parishes)
+    active_domains: dict[str, int] = {}
+    in_flight = {}
+
+    def run(parish_url: str, p_id: int) -> dict:
+        try:
+            return scrape_fn(parish_url, p_id)
+        except Exception as e:
+            logger.error(f"Crawl failed for parish {p_id} ({parish_url}): {e}", exc_info=True)
+            return _failed_parish_result(parish_url)
+
+    if max_in_flight == 1:
+        # Sequential path: no worker threads, each parish scraped and saved on the calling thread
+        for index, (parish_url, p_id) in enumerate(parishes):
+            results[index] = run(parish_url, p_id)
+            on_result(parish_url, p_id, results[index])
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="parish") as executor:
+        while pending or in_flight:
+            # Start the earliest waiting parishes whose domain has a free slot
+            for item in list(pending):
+                if len(in_flight) >= max_in_flight:
+                    break
+                index, (parish_url, p_id) = item
+                domain = _parish_domain(parish_url)
+                if active_domains.get(domain, 0) >= max_per_domain:
+                    continue
+                pending.remove(item)
+                active_domains[domain] = active_domains.get(domain, 0) + 1
+                in_flight[executor.submit(run, parish_url, p_id)] = (index, domain)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, domain = in_flight.pop(future)
+                active_domains[domain] -= 1
+                parish_url, p_id = parishes[index]
+                results[index] = future.result()
+                on_result(parish_url, p_id, results[index])
+
+    return results
+
+
+async def crawl_parishes_async(
+    parishes: list[tuple[str, int]],
+    supabase: Client,
+    suppression_urls: set[str],
+    max_pages_to_scan: int = config.DEFAULT_MAX_PAGES_TO_SCAN,
+    max_concurrent_parishes: int = config.DEFAULT_MAX_CONCURRENT_PARISHES,
+    max_per_domain: int = config.DEFAULT_MAX_PARISHES_PER_DOMAIN,
+    on_start: Callable[[str, int], None] | None = None,
+    on_result: Callable[[str, int, dict], None] | None = None,
+) -> list[dict]:
+    """
+    Crawl many parishes concurrently with the async engine.
+
+    Args:
+        parishes: (url, parish_id) tuples to crawl
+        supabase: Supabase client
+        suppression_urls: Normalized URLs to skip
+        max_pages_to_scan: Maximum pages per parish
+        max_concurrent_parishes: Number of parish frontiers crawled at once
+        max_per_domain: Parish frontiers of the same domain crawled at once
+        on_start: Called in a worker thread with (url, parish_id) as each parish's crawl begins
+        on_result: Called in a worker thread with (url, parish_id, result) as each parish finishes
+
+    Returns:
+        Results in the same order as ``parishes``, each with ``duration`` set
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent_parishes))
+    domain_limits: dict[str, asyncio.Semaphore] = {}
+
+    async with AsyncCrawler(USER_AGENTS) as crawler:
+
+        async def crawl_one(parish_url: str, p_id: int) -> dict:
+            # Wait for the domain before taking a slot, so a busy domain never holds slots idle
+            domain_limit = domain_limits.setdefault(_parish_domain(parish_url), asyncio.Semaphore(max(1, max_per_domain)))
+            async with domain_limit, semaphore:
+                if on_start is not None:
+                    await asyncio.to_thread(on_start, parish_url, p_id)
+                extraction_start = time.time()
+                try:
+                    result = await scrape_parish_data_async(
+                        parish_url, p_id, supabase, suppression_urls, crawler, max_pages_to_scan=max_pages_to_scan
+                    )
+                except Exception as e:
+                    logger.error(f"Async crawl failed for parish {p_id} ({parish_url}): {e}", exc_info=True)
+                    result = _failed_parish_result(parish_url)
+                result["duration"] = time.time() - extraction_start
+
+            if on_result is not None:
+                await asyncio.to_thread(on_result, parish_url, p_id, result)
+            return result
+
+        logger.info(f"🕸️ Async crawl of {len(parishes)} parishes ({max_concurrent_parishes} concurrent)")
+        return await asyncio.gather(*(crawl_one(parish_url, p_id) for parish_url, p_id in parishes))
+
+
 def get_parishes_to_process(
     supabase: Client, num_parishes: int, parish_id: int = None, diocese_id: int = None
 ) -> list[tuple[str, int]]:
@@ -1267,44 +1943,116 @@ def save_facts_to_supabase(supabase: Client, results: list, monitoring_client=No
             parish_ids = list(set(fact["parish_id"] for fact in facts_to_save))
             parish_metadata = get_parish_metadata(supabase, parish_ids)
 
-        supabase.table("ParishData").upsert(facts_to_save, on_conflict="parish_id,fact_type").execute()
-        logger.info(f"Successfully saved {len(facts_to_save)} facts to Supabase table 'ParishData'.")
+        fact_writer = get_fact_writer(supabase)
+        for fact in facts_to_save:
+            on_result = (
+                when_saved(functools.partial(_report_fact_saved, fact, parish_metadata, monitoring_client))
+                if monitoring_client
+                else None
+            )
+            fact_writer.add_record("ParishData", fact, on_result=on_result)
+        logger.info(f"Queued {len(facts_to_save)} facts for Supabase table 'ParishData'.")
 
-        # Send monitoring logs for ParishData insertions with complete parish data
-        if monitoring_client:
-            for fact in facts_to_save:
-                parish_id = fact["parish_id"]
-                parish_info = parish_metadata.get(
-                    parish_id, {"name": "Unknown Parish", "website": "", "address": "", "diocese_name": "Unknown Diocese"}
-                )
+    except Exception as e:
+        logger.error(f"An unexpected error occurred during Supabase upsert: {e}", exc_info=True)
 
-                fact_type = fact["fact_type"].replace("Schedule", "")  # Remove 'Schedule' from type
-                fact_value = fact["fact_value"]
-                source_url = fact.get("fact_source_url", "")
 
-                # Create descriptive message with links
-                parish_link = (
-                    f" → <a href='{parish_info['website']}' target='_blank'>{parish_info['website']}</a>"
-                    if parish_info["website"]
-                    else ""
-                )
-                source_link = f" | <a href='{source_url}' target='_blank'>Source</a>" if source_url else ""
+def _report_fact_saved(fact: dict, parish_metadata: dict, monitoring_client):
+    """Send the monitoring log line for one saved ParishData fact."""
+    parish_id = fact["parish_id"]
+    parish_info = parish_metadata.get(
+        parish_id, {"name": "Unknown Parish", "website": "", "address": "", "diocese_name": "Unknown Diocese"}
+    )
 
-                monitoring_client.send_log(
-                    f"Step 4 │ ✅ {fact_type} saved: {parish_info['name']} ({parish_info['address']}): "
-                    f"{fact_value[:80]}{'...' if len(fact_value) > 80 else ''}{parish_link}{source_link}",
-                    "INFO",
-                    worker_type="schedule",
-                )
+    fact_type = fact["fact_type"].replace("Schedule", "")  # Remove 'Schedule' from type
+    fact_value = fact["fact_value"]
+    source_url = fact.get("fact_source_url", "")
 
-    except Exception as e:
-        logger.error(f"An unexpected error occurred during Supabase upsert: {e}", exc_info=True)
+    # Create descriptive message with links
+    parish_link = (
+        f" → <a href='{parish_info['website']}' target='_blank'>{parish_info['website']}</a>"
+        if parish_info["website"]
+        else ""
+    )
+    source_link = f" | <a href='{source_url}' target='_blank'>Source</a>" if source_url else ""
+
+    monitoring_client.send_log(
+        f"Step 4 │ ✅ {fact_type} saved: {parish_info['name']} ({parish_info['address']}): "
+        f"{fact_value[:80]}{'...' if len(fact_value) > 80 else ''}{parish_link}{source_link}",
+        "INFO",
+        worker_type="schedule",
+    )
+
+
+def _complete_parish(
+    supabase: Client, result: dict, url: str, p_id: int, parish_info: dict, idx: int, total: int, monitoring_client=None
+):
+    """Annotate a parish result, report it to monitoring and save its facts."""
+    extraction_duration = result.get("duration", 0.0)
+
+    result["parish_id"] = p_id
+    result["parish_name"] = parish_info["name"]
+    result["parish_address"] = parish_info["address"]
+    result["diocese_name"] = parish_info["diocese_name"]
+    result["duration"] = extraction_duration
+
+    logger.info(f"[{idx}/{total}] Completed {parish_info['name']} in {extraction_duration:.1f}s")
+
+    schedules_found = sum(1 for key in ("offers_reconciliation", "offers_adoration") if result.get(key))
+
+    # Send completion message to monitoring
+    if monitoring_client:
+        status_emoji = "✅" if schedules_found > 0 else "⚠️"
+        monitoring_client.send_log(
+            f"Step 4 │ {status_emoji} [{idx}/{total}] Completed {parish_info['name']} "
+            f"({parish_info['address']}) - {schedules_found} schedule(s) found in {extraction_duration:.1f}s",
+            "INFO" if schedules_found > 0 else "WARNING",
+            worker_type="schedule",
+        )
+
+    # Queue results after each parish; the fact writer saves them in batches and main() flushes the rest
+    logger.info(f"Queueing results for parish {p_id} for the background fact writer...")
+    save_facts_to_supabase(supabase, [result], monitoring_client)
+
+    # Send extraction_complete message for dashboard Recent History
+    if monitoring_client and hasattr(monitoring_client, "report_extraction_complete"):
+        # Construct mass_times from schedule data
+        mass_times_parts = []
+        if result.get("offers_reconciliation") and result.get("reconciliation_info"):
+            mass_times_parts.append(f"Reconciliation: {result['reconciliation_info'][:50]}")
+        if result.get("offers_adoration") and result.get("adoration_info"):
+            mass_times_parts.append(f"Adoration: {result['adoration_info'][:50]}")
+
+        mass_times = " | ".join(mass_times_parts) if mass_times_parts else "No schedules found"
+
+        monitoring_client.report_extraction_complete(
+            diocese_name=parish_info["diocese_name"],
+            parish_name=parish_info["name"],
+            parish_url=url,
+            parish_address=parish_info["address"],
+            schedules_found=schedules_found,
+            mass_times=mass_times,
+            duration=extraction_duration,
+            status="completed",
+        )
 
 
 def main(
-    num_parishes: int, parish_id: int = None, max_pages_to_scan: int = config.DEFAULT_MAX_PAGES_TO_SCAN, monitoring_client=None
+    num_parishes: int,
+    parish_id: int = None,
+    max_pages_to_scan: int = config.DEFAULT_MAX_PAGES_TO_SCAN,
+    monitoring_client=None,
+    async_crawl: bool = False,
+    max_concurrent_parishes: int = config.DEFAULT_MAX_CONCURRENT_PARISHES,
+    max_per_domain: int = config.DEFAULT_MAX_PARISHES_PER_DOMAIN,
 ):
-    """Main function to run the scraping pipeline."""
+    """
+    Main function to run the scraping pipeline.
+
+    Parishes are scraped one after another unless ``max_concurrent_parishes``
+    is raised, with at most ``max_per_domain`` running for the same site, and
+    each result is queued for saving as soon as it finishes.
+    """
     load_dotenv()
 
     supabase: Client = get_supabase_client()
@@ -1329,84 +2077,83 @@ def main(
 
     results = []
     start_time = time.time()
+    total = len(parishes_to_process)
+    progress = ParishProgress(total)
 
-    for idx, (url, p_id) in enumerate(parishes_to_process, 1):
-        parish_info = parish_metadata.get(
+    def info_for(url: str, p_id: int) -> dict:
+        return parish_metadata.get(
             p_id, {"name": "Unknown Parish", "website": url, "address": "", "diocese_name": "Unknown Diocese"}
         )
 
-        logger.info(f"[{idx}/{len(parishes_to_process)}] Scraping {parish_info['name']} (ID: {p_id})...")
+    def announce(url: str, p_id: int):
+        parish_info = info_for(url, p_id)
+        idx = progress.start()
+
+        logger.info(f"[{idx}/{total}] Scraping {parish_info['name']} (ID: {p_id})...")
 
         # Send start message to monitoring
         if monitoring_client:
             monitoring_client.send_log(
-                f"Step 4 │ 🔍 [{idx}/{len(parishes_to_process)}] Visiting {parish_info['name']} "
+                f"Step 4 │ 🔍 [{idx}/{total}] Visiting {parish_info['name']} "
                 f"→ <a href='{url}' target='_blank'>{url}</a>",
                 "INFO",
                 worker_type="schedule",
             )
 
-        extraction_start = time.time()
-        result = scrape_parish_data(url, p_id, supabase, suppression_urls, max_pages_to_scan=max_pages_to_scan)
-        extraction_duration = time.time() - extraction_start
-
-        result["parish_id"] = p_id
-        result["parish_name"] = parish_info["name"]
-        result["parish_address"] = parish_info["address"]
-        result["diocese_name"] = parish_info["diocese_name"]
-        result["duration"] = extraction_duration
+    def complete(url: str, p_id: int, result: dict):
+        # Results are queued for saving as each parish finishes, not after the whole batch
+        _complete_parish(supabase, result, url, p_id, info_for(url, p_id), progress.complete(), total, monitoring_client)
         results.append(result)
+        logger.info(f"📈 Step 4 progress: {progress.describe()}")
+
+    if async_crawl:
+        # Crawl parish frontiers concurrently on one event loop
+        asyncio.run(
+            crawl_parishes_async(
+                parishes_to_process,
+                supabase,
+                suppression_urls,
+                max_pages_to_scan=max_pages_to_scan,
+                max_concurrent_parishes=max_concurrent_parishes,
+                max_per_domain=max_per_domain,
+                on_start=announce,
+                on_result=complete,
+            )
+        )
+    else:
 
-        logger.info(f"[{idx}/{len(parishes_to_process)}] Completed {parish_info['name']} in {extraction_duration:.1f}s")
+        def scrape(url: str, p_id: int) -> dict:
+            announce(url, p_id)
+            extraction_start = time.time()
+            result = scrape_parish_data(url, p_id, supabase, suppression_urls, max_pages_to_scan=max_pages_to_scan)
+            result["duration"] = time.time() - extraction_start
+            return result
 
-        # Send completion message to monitoring
-        if monitoring_client:
-            schedules_found = 0
-            if result.get("offers_reconciliation"):
-                schedules_found += 1
-            if result.get("offers_adoration"):
-                schedules_found += 1
+        if max_concurrent_parishes > 1:
+            logger.info(f"Scraping up to {max_concurrent_parishes} parishes at once ({max_per_domain} per domain)")
+        run_parishes_concurrently(parishes_to_process, scrape, complete, max_concurrent_parishes, max_per_domain)
 
-            status_emoji = "✅" if schedules_found > 0 else "⚠️"
-            monitoring_client.send_log(
-                f"Step 4 │ {status_emoji} [{idx}/{len(parishes_to_process)}] Completed {parish_info['name']} "
-                f"({parish_info['address']}) - {schedules_found} schedule(s) found in {extraction_duration:.1f}s",
-                "INFO" if schedules_found > 0 else "WARNING",
-                worker_type="schedule",
-            )
+    # Write out facts still queued; failed batches were already retried and bisected by the writer
+    fact_writer = get_fact_writer(supabase)
+    fact_writer.flush_all()
+    logger.info(f"Fact writes: {fact_writer.get_stats()}")
 
-        # Save results after each parish to avoid data loss if script is interrupted
-        logger.info(f"Saving results for parish {p_id} immediately...")
-        save_facts_to_supabase(supabase, [result], monitoring_client)
-
-        # Send extraction_complete message for dashboard Recent History
-        if monitoring_client and hasattr(monitoring_client, "report_extraction_complete"):
-            # Construct mass_times from schedule data
-            mass_times_parts = []
-            if result.get("offers_reconciliation") and result.get("reconciliation_info"):
-                mass_times_parts.append(f"Reconciliation: {result['reconciliation_info'][:50]}")
-            if result.get("offers_adoration") and result.get("adoration_info"):
-                mass_times_parts.append(f"Adoration: {result['adoration_info'][:50]}")
-
-            mass_times = " | ".join(mass_times_parts) if mass_times_parts else "No schedules found"
-
-            monitoring_client.report_extraction_complete(
-                diocese_name=parish_info["diocese_name"],
-                parish_name=parish_info["name"],
-                parish_url=url,
-                parish_address=parish_info["address"],
-                schedules_found=schedules_found,
-                mass_times=mass_times,
-                duration=extraction_duration,
-                status="completed",
-            )
+    if _ai_extractor is not None:
+        cache_stats = _ai_extractor.get_ai_cache_stats()
+        logger.info(
+            f"AI result cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+            f"(hit rate {cache_stats['hit_rate']:.0%})"
+        )
 
-    # Also save all results at the end (in case any individual saves failed)
-    logger.info("Final batch save of all results...")
-    save_facts_to_supabase(supabase, results, monitoring_client)
+    page_stats = get_page_change_tracker().get_stats()
+    logger.info(
+        f"Page change detection: {page_stats['not_modified']} not modified, {page_stats['unchanged']} unchanged, "
+        f"{page_stats['changed']} changed, {page_stats['new']} new"
+    )
 
     # Send final summary to monitoring
     total_time = time.time() - start_time
+    logger.info(f"Step 4 finished {len(results)} parishes in {total_time:.1f}s ({progress.describe()})")
     if monitoring_client:
         total_schedules = sum(
             1 for r in results if (r.get("offers_reconciliation") or r.get("offers_adoration"))
@@ -1439,6 +2186,24 @@ if __name__ == "__main__":
         default=config.DEFAULT_MAX_PAGES_TO_SCAN,  # Use the existing constant as default
         help=f"Maximum number of pages to scan per parish. Defaults to {config.DEFAULT_MAX_PAGES_TO_SCAN}.",
     )
+    parser.add_argument(
+        "--async_crawl",
+        action="store_true",
+        help="Crawl parishes concurrently with the async engine (per-domain politeness instead of global sleeps).",
+    )
+    parser.add_argument(
+        "--max_concurrent_parishes",
+        type=int,
+        default=config.DEFAULT_MAX_CONCURRENT_PARISHES,
+        help=f"Parishes crawled at once (1 runs them one after another). "
+        f"Defaults to {config.DEFAULT_MAX_CONCURRENT_PARISHES}.",
+    )
+    parser.add_argument(
+        "--max_per_domain",
+        type=int,
+        default=config.DEFAULT_MAX_PARISHES_PER_DOMAIN,
+        help=f"Parishes on the same site crawled at once. Defaults to {config.DEFAULT_MAX_PARISHES_PER_DOMAIN}.",
+    )
     args = parser.parse_args()
 
     # Initialize monitoring client if MONITORING_URL is set
@@ -1449,4 +2214,12 @@ if __name__ == "__main__":
         monitoring_client = MonitoringClient(monitoring_url, worker_id="schedule-local")
         logger.info(f"Monitoring enabled: {monitoring_url}")
 
-    main(args.num_parishes, args.parish_id, args.max_pages_to_scan, monitoring_client)
+    main(
+        args.num_parishes,
+        args.parish_id,
+        args.max_pages_to_scan,
+        monitoring_client,
+        async_crawl=args.async_crawl,
+        max_concurrent_parishes=args.max_concurrent_parishes,
+        max_per_domain=args.max_per_domain,
+    )
@@ -16,7 +16,7 @@ from bs4 import BeautifulSoup
 from core.db import get_supabase_client
 from core.logger import get_logger
 from core.monitoring_client import MonitoringClient
-from core.schedule_ai_extractor import ScheduleAIExtractor, save_ai_schedule_results
+from core.schedule_ai_extractor import ScheduleAIExtractor, get_fact_writer, save_ai_schedule_results
 from core.schedule_keywords import load_keywords_from_database
 from pipeline.respectful_automation import RespectfulAutomation
 
@@ -219,31 +219,30 @@ def process_parish_with_blocking_detection(
         ai_extractor = ScheduleAIExtractor()
         extraction_results = {}
 
-        # Process reconciliation pages
+        # Pick the best page per schedule type; a page that wins several types is analyzed once
+        best_pages = {}
         if candidate_pages["reconciliation"]:
-            best_recon_url = choose_best_url(
+            best_pages["reconciliation"] = choose_best_url(
                 candidate_pages["reconciliation"], recon_kw, recon_neg, urlparse(parish_url).netloc
             )
-
-            logger.info(f"  🤖 [{parish_id}] Analyzing reconciliation page with AI: {best_recon_url}")
-            recon_content, _ = extract_content_with_respectful_automation(best_recon_url, automation, suppression_urls)
-
-            if recon_content:
-                recon_result = ai_extractor.extract_schedule_from_content(recon_content, best_recon_url, "reconciliation")
-                recon_result["parish_id"] = parish_id
-                extraction_results["reconciliation"] = recon_result
-
-        # Process adoration pages
         if candidate_pages["adoration"]:
-            best_ador_url = choose_best_url(candidate_pages["adoration"], ador_kw, ador_neg, urlparse(parish_url).netloc)
+            best_pages["adoration"] = choose_best_url(
+                candidate_pages["adoration"], ador_kw, ador_neg, urlparse(parish_url).netloc
+            )
+
+        types_by_page = {}
+        for schedule_type, best_url in best_pages.items():
+            types_by_page.setdefault(best_url, []).append(schedule_type)
 
-            logger.info(f"  🤖 [{parish_id}] Analyzing adoration page with AI: {best_ador_url}")
-            ador_content, _ = extract_content_with_respectful_automation(best_ador_url, automation, suppression_urls)
+        for best_url, schedule_types in types_by_page.items():
+            logger.info(f"  🤖 [{parish_id}] Analyzing {' and '.join(schedule_types)} page with AI: {best_url}")
+            page_content, _ = extract_content_with_respectful_automation(best_url, automation, suppression_urls)
 
-            if ador_content:
-                ador_result = ai_extractor.extract_schedule_from_content(ador_content, best_ador_url, "adoration")
-                ador_result["parish_id"] = parish_id
-                extraction_results["adoration"] = ador_result
+            if page_content:
+                page_results = ai_extractor.extract_schedules_from_content(page_content, best_url, schedule_types)
+                for schedule_type, schedule_result in page_results.items():
+                    schedule_result["parish_id"] = parish_id
+                    extraction_results[schedule_type] = schedule_result
 
         # Save AI results if any found
         if extraction_results:
@@ -437,6 +436,9 @@ def main(
             logger.error(f"❌ [{processed_count}/{total_parishes}] Error processing parish {p_id}: {e}")
             continue
 
+    # Write out facts still queued by the write-behind writer
+    get_fact_writer(supabase).flush_all()
+
     # Send final summary to monitoring
     total_time = time.time() - start_time
     if monitoring_client:
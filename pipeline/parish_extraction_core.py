@@ -14,6 +14,7 @@ This module contains:
 # DEPENDENCIES AND IMPORTS
 # =============================================================================
 
+import functools
 import json
 import os
 import re
@@ -24,6 +25,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
+from core.db_batch_operations import when_saved
 from core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -742,8 +744,18 @@ def enhanced_safe_upsert_to_supabase(
     parish_directory_url: str,
     supabase,
     monitoring_client=None,
+    batch_manager=None,
 ):
-    """Enhanced version of Supabase upsert function with batch operations and Parish Finder support"""
+    """Enhanced version of Supabase upsert function with batch operations and Parish Finder support
+
+    With a write-behind batch_manager the rows are queued instead of written here;
+    monitoring logs are sent as the manager's flusher saves each one.
+
+    Returns:
+        bool: Without a batch_manager, True if at least one parish was saved. With
+        one, True once the rows are queued; that does not mean they were written,
+        since rows the flusher cannot save are dead-lettered.
+    """
 
     if not supabase:
         logger.error("  ❌ Supabase not available")
@@ -797,7 +809,23 @@ def enhanced_safe_upsert_to_supabase(
         logger.info(f"  📊 Results: 0 saved, {skipped_count} skipped, 0 with detailed info")
         return False
 
-    # Phase 2: Batch upsert with optimized batch size
+    # Phase 2: Look up which parishes already exist in one pass, so each row can be labelled added vs updated
+    db_stats = {"calls": 0}
+    existing_names = _fetch_existing_parish_names(
+        supabase, diocese_id, [item["data"]["Name"] for item in valid_parishes], db_stats
+    )
+    for item in valid_parishes:
+        item["existing"] = existing_names is not None and item["data"]["Name"] in existing_names
+
+    if batch_manager is not None:
+        _queue_parish_writes(valid_parishes, existing_names is not None, batch_manager, diocese_name, monitoring_client)
+        logger.info(
+            f"  📊 Results: {len(valid_parishes)} queued for write-behind, "
+            f"{skipped_count} skipped, {detail_success_count} with detailed info"
+        )
+        return True
+
+    # Phase 3: Batch upsert with optimized batch size
     batch_size = min(50, len(valid_parishes))  # Optimal batch size for Supabase
     success_count = 0
     updated_count = 0
@@ -811,83 +839,52 @@ def enhanced_safe_upsert_to_supabase(
         end_idx = min(start_idx + batch_size, len(valid_parishes))
         batch = valid_parishes[start_idx:end_idx]
 
-        # Prepare batch data and check existing parishes before upsert
-        batch_data = []
-        parish_actions = {}  # Store whether each parish is new or existing
+        logger.info(f"    📦 Batch {batch_num + 1}/{total_batches}: Upserting {len(batch)} parishes...")
+        saved, failed = _bisect_upsert_parishes(batch, supabase, db_stats)
+        success_count += len(saved)
 
-        for item in batch:
-            parish = item["original"]
-            parish_data = item["data"]
-            batch_data.append(parish_data)
+        if failed:
+            logger.warning(f"    ⚠️ Batch {batch_num + 1}: saved {len(saved)}, {len(failed)} rejected")
+        else:
+            logger.info(f"    ✅ Batch {batch_num + 1}: Successfully saved {len(saved)} parishes")
 
-            # Check if parish already exists to determine insert vs update
+        for item in saved:
+            if existing_names is not None:
+                if item["existing"]:
+                    updated_count += 1
+                else:
+                    new_count += 1
+
+            # Send monitoring logs for each parish saved
             if monitoring_client:
-                try:
-                    existing = (
-                        supabase.table("Parishes").select("id").eq("Name", parish.name).eq("diocese_id", diocese_id).execute()
-                    )
-                    is_new_parish = not existing.data
-                    parish_actions[parish.name] = "Parish added" if is_new_parish else "Parish updated"
-                except Exception as e:
-                    parish_actions[parish.name] = "Parish saved"
-                    logger.debug(f"Could not determine insert/update status for {parish.name}: {e}")
+                _report_parish_saved(item, existing_names is not None, diocese_name, monitoring_client)
 
-        try:
-            # Execute batch upsert
-            logger.info(f"    📦 Batch {batch_num + 1}/{total_batches}: Upserting {len(batch_data)} parishes...")
-            response = supabase.table("Parishes").upsert(batch_data, on_conflict="Name,diocese_id").execute()
-
-            if hasattr(response, "error") and response.error:
-                logger.error(f"    ❌ Batch {batch_num + 1} database error: {response.error}")
-                # Try individual upserts as fallback for this batch
-                logger.info(f"    🔄 Falling back to individual upserts for batch {batch_num + 1}...")
-                batch_success = _fallback_individual_upserts(batch, supabase, monitoring_client, diocese_name, parish_actions)
-                success_count += batch_success
-            else:
-                batch_success = len(batch_data)
-                success_count += batch_success
-                logger.info(f"    ✅ Batch {batch_num + 1}: Successfully saved {batch_success} parishes")
-
-                # Send monitoring logs for each parish inserted
-                if monitoring_client:
-                    for item in batch:
-                        parish = item["original"]
-                        action = parish_actions.get(parish.name, "Parish saved")
-                        website_link = (
-                            f" → <a href='{parish.website}' target='_blank'>{parish.website}</a>" if parish.website else ""
-                        )
-                        monitoring_client.send_log(
-                            f"Step 3 │ ✅ {action}: {parish.name}, {diocese_name}{website_link}", "INFO"
-                        )
-
-                # Log sample of saved parishes for verification (console only)
-                for i, item in enumerate(batch[:3]):  # Show first 3 parishes in batch
-                    parish = item["original"]
-                    detail_indicator = "📍" if parish.detail_extraction_success else "📌"
-                    method_short = parish.extraction_method.replace("_extraction", "").replace("_", " ")
-                    logger.info(f"      {detail_indicator} {parish.name} ({method_short}, {parish.confidence_score:.2f})")
-
-                if len(batch) > 3:
-                    logger.info(f"      ... and {len(batch) - 3} more parishes")
+        # Log sample of saved parishes for verification (console only)
+        for item in saved[:3]:  # Show first 3 parishes in batch
+            parish = item["original"]
+            detail_indicator = "📍" if parish.detail_extraction_success else "📌"
+            method_short = parish.extraction_method.replace("_extraction", "").replace("_", " ")
+            logger.info(f"      {detail_indicator} {parish.name} ({method_short}, {parish.confidence_score:.2f})")
 
-        except Exception as e:
-            logger.error(f"    ❌ Batch {batch_num + 1} failed: {e}")
-            # Try individual upserts as fallback
-            logger.info(f"    🔄 Falling back to individual upserts for batch {batch_num + 1}...")
-            batch_success, batch_updated, batch_new = _fallback_individual_upserts(batch, supabase, monitoring_client, diocese_name, parish_actions)
-            success_count += batch_success
-            updated_count += batch_updated
-            new_count += batch_new
-
-    # Phase 3: Summary reporting
-    logger.info(f"  📊 Results: {success_count} saved ({new_count} new, {updated_count} updated), {skipped_count} skipped, {detail_success_count} with detailed info")
+        if len(saved) > 3:
+            logger.info(f"      ... and {len(saved) - 3} more parishes")
+
+        # Later batches may repeat a name from this one; those rows are now updates
+        if existing_names is not None:
+            existing_names.update(item["data"]["Name"] for item in saved)
+
+    # Phase 4: Summary reporting
+    logger.info(
+        f"  📊 Results: {success_count} saved ({new_count} new, {updated_count} updated), "
+        f"{skipped_count} skipped, {detail_success_count} with detailed info"
+    )
     if success_count > 0:
         success_rate = (success_count / (success_count + skipped_count)) * 100
         logger.info(f"  📈 Success rate: {success_rate:.1f}%")
 
         # Performance improvement calculation
         individual_calls_would_be = success_count + skipped_count
-        actual_db_calls = total_batches + (skipped_count if success_count < len(valid_parishes) else 0)
+        actual_db_calls = db_stats["calls"]
         performance_improvement = ((individual_calls_would_be - actual_db_calls) / individual_calls_would_be) * 100
         logger.info(
             f"  ⚡ Performance: {actual_db_calls} DB calls vs {individual_calls_would_be} individual ({performance_improvement:.0f}% reduction)"
@@ -896,88 +893,128 @@ def enhanced_safe_upsert_to_supabase(
     return success_count > 0
 
 
-def _fallback_individual_upserts(
-    batch: List[Dict], supabase, monitoring_client=None, diocese_name=None, parish_actions=None
-) -> tuple:
-    """Fallback function for individual upserts when batch fails
+# Names per existence query; keeps the PostgREST in.() filter well under URL length limits
+EXISTING_PARISH_LOOKUP_CHUNK = 100
 
-    Handles duplicate constraints by checking if parish exists and updating instead of inserting.
+
+def _fetch_existing_parish_names(supabase, diocese_id: int, names: List[str], db_stats: Dict) -> Optional[set]:
+    """Return which of the given parish names already exist for the diocese, or None if the lookup fails"""
+    existing = set()
+    unique_names = list(dict.fromkeys(names))
+    try:
+        for start in range(0, len(unique_names), EXISTING_PARISH_LOOKUP_CHUNK):
+            chunk = unique_names[start : start + EXISTING_PARISH_LOOKUP_CHUNK]
+            db_stats["calls"] += 1
+            response = supabase.table("Parishes").select("Name").eq("diocese_id", diocese_id).in_("Name", chunk).execute()
+            existing.update(row["Name"] for row in response.data or [])
+    except Exception as e:
+        logger.debug(f"Could not determine insert/update status for diocese {diocese_id}: {e}")
+        return None
+    return existing
+
+
+def _bisect_upsert_parishes(batch: List[Dict], supabase, db_stats: Dict) -> tuple:
+    """Upsert a batch, splitting it in half on failure until the rejected rows are isolated
+
+    A batch with one bad row costs about 2*log2(n) extra calls instead of one call per parish.
 
     Returns:
-        tuple: (success_count, updated_count, new_count)
+        tuple: (saved_items, failed_items)
     """
-    success_count = 0
-    updated_count = 0
-    new_count = 0
+    db_stats["calls"] += 1
+    try:
+        rows = [item["data"] for item in batch]
+        response = supabase.table("Parishes").upsert(rows, on_conflict="Name,diocese_id").execute()
+        error = response.error if hasattr(response, "error") and response.error else None
+    except Exception as e:
+        error = e
+
+    if error is None:
+        return batch, []
+
+    if len(batch) == 1:
+        status = _save_conflicting_parish(batch[0]["data"], supabase, error, db_stats)
+        if status == "updated":
+            batch[0]["existing"] = True
+        if status:
+            return batch, []
+        return [], batch
+
+    logger.debug(f"      Upsert of {len(batch)} parishes failed ({str(error)[:100]}), splitting batch")
+    middle = len(batch) // 2
+    saved_left, failed_left = _bisect_upsert_parishes(batch[:middle], supabase, db_stats)
+    saved_right, failed_right = _bisect_upsert_parishes(batch[middle:], supabase, db_stats)
+    return saved_left + saved_right, failed_left + failed_right
+
+
+def _save_conflicting_parish(data: Dict, supabase, error, db_stats: Optional[Dict] = None) -> Optional[str]:
+    """Recover a single parish row whose upsert was rejected
+
+    The Web column is unique too, so a parish renamed on the diocese site collides
+    with its old row by URL; that row is updated in place.
+
+    Returns:
+        "updated" if the row matching its website was updated, "exists" if the
+        row is already stored, or None if the parish could not be saved
+    """
+    db_stats = db_stats if db_stats is not None else {"calls": 0}
+    name = data.get("Name")
+
+    try:
+        if data.get("Web"):
+            db_stats["calls"] += 1
+            web_check = (
+                supabase.table("Parishes").select("id").eq("diocese_id", data["diocese_id"]).eq("Web", data["Web"]).execute()
+            )
+            if web_check.data:
+                db_stats["calls"] += 1
+                supabase.table("Parishes").update(data).eq("id", web_check.data[0]["id"]).execute()
+                logger.info(f"      ✅ 📌 Parish updated by website match: {name}")
+                return "updated"
+    except Exception as e:
+        error = e
+
+    # Check if it's a duplicate error that we can ignore
+    if "duplicate key" in str(error).lower() or "unique constraint" in str(error).lower():
+        logger.warning(f"      ⚠️ Parish already exists (skipping): {name}")
+        return "exists"  # Count as success since data is in DB
+
+    logger.error(f"      ❌ Upsert failed for {name}: {error}")
+    return None
 
-    for item in batch:
-        try:
-            parish = item["original"]
-            data = item["data"]
-
-            # Check if parish exists by Name or Web URL (both have unique constraints)
-            existing = None
-            try:
-                # Check by name first
-                name_check = (
-                    supabase.table("Parishes")
-                    .select("id")
-                    .eq("diocese_id", data["diocese_id"])
-                    .eq("Name", data["Name"])
-                    .execute()
-                )
-                if name_check.data:
-                    existing = name_check.data[0]
-                # If not found by name, check by Web URL (if provided)
-                elif data.get("Web"):
-                    web_check = (
-                        supabase.table("Parishes")
-                        .select("id")
-                        .eq("diocese_id", data["diocese_id"])
-                        .eq("Web", data["Web"])
-                        .execute()
-                    )
-                    if web_check.data:
-                        existing = web_check.data[0]
-            except Exception as check_error:
-                logger.debug(f"      Error checking existing parish {parish.name}: {check_error}")
-
-            # Update if exists, insert if new
-            if existing:
-                response = supabase.table("Parishes").update(data).eq("id", existing["id"]).execute()
-                action_verb = "updated"
-                updated_count += 1
-            else:
-                response = supabase.table("Parishes").insert(data).execute()
-                action_verb = "added"
-                new_count += 1
-
-            if not (hasattr(response, "error") and response.error):
-                success_count += 1
-                logger.info(f"      ✅ 📌 Parish {action_verb}: {parish.name}")
-
-                # Send to monitoring if available
-                if monitoring_client and diocese_name:
-                    action = f"Parish {action_verb}"
-                    website_link = (
-                        f" → <a href='{parish.website}' target='_blank'>{parish.website}</a>" if parish.website else ""
-                    )
-                    monitoring_client.send_log(f"Step 3 │ ✅ {action}: {parish.name}, {diocese_name}{website_link}", "INFO")
-            else:
-                logger.error(f"      ❌ Individual {action_verb} error for {parish.name}: {response.error}")
-        except Exception as e:
-            parish = item["original"]
-            # Check if it's a duplicate error that we can ignore
-            if "duplicate key" in str(e).lower() or "unique constraint" in str(e).lower():
-                logger.warning(f"      ⚠️ Parish already exists (skipping): {parish.name}")
-                success_count += 1  # Count as success since data is in DB
-            else:
-                logger.error(f"      ❌ Individual upsert failed for {parish.name}: {e}")
 
-    if updated_count > 0 or new_count > 0:
-        logger.info(f"      📊 Batch summary: {success_count} saved ({updated_count} updated, {new_count} new)")
+def _recover_rejected_parish(supabase, record: Dict, error) -> bool:
+    """Write-behind recovery hook for a Parishes row the batch upsert keeps rejecting"""
+    return _save_conflicting_parish(record, supabase, error) is not None
 
-    return success_count, updated_count, new_count
+
+def _report_parish_saved(item: Dict, status_known: bool, diocese_name: str, monitoring_client):
+    """Send the monitoring log line for one saved parish"""
+    parish = item["original"]
+    if not status_known:
+        action = "Parish saved"
+    else:
+        action = "Parish updated" if item["existing"] else "Parish added"
+    website_link = f" → <a href='{parish.website}' target='_blank'>{parish.website}</a>" if parish.website else ""
+    monitoring_client.send_log(f"Step 3 │ ✅ {action}: {parish.name}, {diocese_name}{website_link}", "INFO")
+
+
+def _queue_parish_writes(
+    valid_parishes: List[Dict], status_known: bool, batch_manager, diocese_name: str, monitoring_client=None
+):
+    """Hand prepared parish rows to a write-behind batch manager"""
+    if "Parishes" not in batch_manager.batch_configs:
+        batch_manager.configure_table(
+            "Parishes", "Name,diocese_id", timestamp_column=None, recover=_recover_rejected_parish
+        )
+
+    for item in valid_parishes:
+        on_result = (
+            when_saved(functools.partial(_report_parish_saved, item, status_known, diocese_name, monitoring_client))
+            if monitoring_client
+            else None
+        )
+        batch_manager.add_record("Parishes", item["data"], on_result=on_result)
 
 
 def analyze_parish_finder_quality(parishes: List[ParishData]) -> Dict:
@@ -19,12 +19,19 @@ This module contains:
 import gc
 import re
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from queue import Empty, Queue
 from typing import Dict, List, Optional
+from urllib.parse import urlparse
 
 from core.circuit_breaker import CircuitBreakerConfig, CircuitBreakerOpenError, circuit_breaker
+from core.driver import get_browser_pool
+from core.hybrid_fetcher import PATH_BROWSER, PATH_HTTP, DeferredPageDriver, get_hybrid_fetcher, has_static_content
 from core.logger import get_logger
+from pipeline import config
 
 logger = get_logger(__name__)
 
@@ -125,21 +132,29 @@ class EnhancedDiocesesCardExtractor(BaseExtractor):
             parish_cards = soup.find_all("div", class_="col-lg location")
             logger.info(f"    📊 Found {len(parish_cards)} parish cards")
 
+            # Pass 1: basic information from every card, collecting detail URLs
             for i, card in enumerate(parish_cards, 1):
                 try:
-                    logger.info(f"    🔄 Processing parish {i}/{len(parish_cards)}")
-                    parish_data = self._extract_parish_from_card_with_details(card, url, driver, i)
+                    parish_data = self._parse_parish_card(card, url, i)
                     if parish_data:
                         parishes.append(parish_data)
-                        if parish_data.detail_extraction_success:
-                            self.detail_extraction_count += 1
-                        else:
-                            self.detail_extraction_errors += 1
                 except Exception as e:
                     logger.warning(f"    ⚠️ Error extracting from card {i}: {str(e)[:100]}...")
                     self.detail_extraction_errors += 1
                     continue
 
+            # Pass 2: fetch all detail pages concurrently and merge them into the cards
+            details = self._fetch_parish_details(driver, parishes)
+            for parish_data in parishes:
+                detailed_info = details.get(
+                    parish_data.parish_detail_url, {"success": False, "error": "No detail URL available"}
+                )
+                self._apply_parish_details(parish_data, detailed_info)
+                if parish_data.detail_extraction_success:
+                    self.detail_extraction_count += 1
+                else:
+                    self.detail_extraction_errors += 1
+
             logger.info(
                 f"    📊 Summary: {self.detail_extraction_count} detailed extractions successful, {self.detail_extraction_errors} failed"
             )
@@ -151,6 +166,14 @@ class EnhancedDiocesesCardExtractor(BaseExtractor):
 
     def _extract_parish_from_card_with_details(self, card, base_url: str, driver, card_number: int) -> Optional[ParishData]:
         """Extract parish data from a single card and navigate to detail page"""
+        parish_data = self._parse_parish_card(card, base_url, card_number)
+        if parish_data:
+            detailed_info = self._extract_details_from_parish_page(driver, parish_data.parish_detail_url, parish_data.name)
+            self._apply_parish_details(parish_data, detailed_info)
+        return parish_data
+
+    def _parse_parish_card(self, card, base_url: str, card_number: int) -> Optional[ParishData]:
+        """Extract the basic parish data and detail page URL from a single card"""
         try:
             # Step 1: Extract basic information from the card
             card_link = card.find("a", class_="card")
@@ -221,11 +244,7 @@ class EnhancedDiocesesCardExtractor(BaseExtractor):
                 else:
                     parish_detail_url = href
 
-            # Step 2: Navigate to detail page and extract additional information
-            detailed_info = self._extract_details_from_parish_page(driver, parish_detail_url, name)
-
-            # Step 3: Create comprehensive parish data object
-            parish_data = ParishData(
+            return ParishData(
                 name=name,
                 city=city,
                 state=state,
@@ -238,29 +257,130 @@ class EnhancedDiocesesCardExtractor(BaseExtractor):
                 extraction_method="enhanced_diocese_card_extraction",
             )
 
-            # Add detailed information if extraction was successful
-            if detailed_info["success"]:
-                parish_data.street_address = parish_data.street_address or detailed_info.get("street_address")
-                parish_data.full_address = parish_data.full_address or detailed_info.get("full_address")
-                parish_data.zip_code = parish_data.zip_code or detailed_info.get("zip_code")
-                parish_data.phone = detailed_info.get("phone")
-                parish_data.website = detailed_info.get("website")
-                parish_data.clergy_info = detailed_info.get("clergy_info")
-                parish_data.service_times = detailed_info.get("service_times")
-                parish_data.detail_extraction_success = True
-                parish_data.confidence_score = 0.95
-                logger.info(f"      ✅ {name}: Complete details extracted")
-            else:
-                parish_data.detail_extraction_success = False
-                parish_data.detail_extraction_error = detailed_info.get("error")
-                logger.warning(f"      ⚠️ {name}: Basic info only - {detailed_info.get('error', 'Unknown error')}")
-
-            return parish_data
-
         except Exception as e:
             logger.warning(f"    ⚠️ Error parsing card {card_number}: {str(e)[:50]}...")
             return None
 
+    def _apply_parish_details(self, parish_data: ParishData, detailed_info: Dict):
+        """Merge detail page fields into the parish data from its card"""
+        name = parish_data.name
+        if detailed_info["success"]:
+            parish_data.street_address = parish_data.street_address or detailed_info.get("street_address")
+            parish_data.full_address = parish_data.full_address or detailed_info.get("full_address")
+            parish_data.zip_code = parish_data.zip_code or detailed_info.get("zip_code")
+            parish_data.phone = detailed_info.get("phone")
+            parish_data.website = detailed_info.get("website")
+            parish_data.clergy_info = detailed_info.get("clergy_info")
+            parish_data.service_times = detailed_info.get("service_times")
+            parish_data.detail_extraction_success = True
+            parish_data.confidence_score = 0.95
+            logger.info(f"      ✅ {name}: Complete details extracted")
+        else:
+            parish_data.detail_extraction_success = False
+            parish_data.detail_extraction_error = detailed_info.get("error")
+            logger.warning(f"      ⚠️ {name}: Basic info only - {detailed_info.get('error', 'Unknown error')}")
+
+    def _fetch_parish_details(self, driver, parishes: List[ParishData]) -> Dict[str, Dict]:
+        """
+        Fetch and parse every parish detail page, keyed by detail URL.
+
+        Static pages are fetched concurrently over HTTP, at most
+        DETAIL_FETCH_MAX_PER_DOMAIN at a time per site. Pages that need the
+        browser are then split across the caller's driver and any idle pooled
+        browsers.
+        """
+        targets = {}
+        for parish_data in parishes:
+            if parish_data.parish_detail_url and parish_data.parish_detail_url not in targets:
+                targets[parish_data.parish_detail_url] = parish_data.name
+        if not targets:
+            return {}
+
+        started = time.time()
+        fetcher = get_hybrid_fetcher()
+        requires_javascript = PatternDetector()._requires_javascript
+        domain_slots = {
+            domain: threading.BoundedSemaphore(config.DETAIL_FETCH_MAX_PER_DOMAIN)
+            for domain in {urlparse(detail_url).netloc for detail_url in targets}
+        }
+
+        def fetch_static(detail_url: str) -> Optional[Dict]:
+            try:
+                with domain_slots[urlparse(detail_url).netloc]:
+                    html = fetcher.try_static(detail_url, requires_javascript)
+                return None if html is None else self._parse_detail_page(BeautifulSoup(html, "lxml"))
+            except Exception as e:
+                logger.debug(f"      Static detail fetch failed for {detail_url}: {e}")
+                return None
+
+        details = {}
+        workers = min(len(targets), config.DETAIL_FETCH_MAX_PER_DOMAIN * len(domain_slots))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parish-detail") as executor:
+            for detail_url, detailed_info in zip(targets, executor.map(fetch_static, targets)):
+                if detailed_info is not None:
+                    details[detail_url] = detailed_info
+
+        browser_targets = [(detail_url, name) for detail_url, name in targets.items() if detail_url not in details]
+        if browser_targets:
+            details.update(self._fetch_details_with_browsers(driver, browser_targets))
+
+        logger.info(
+            f"    ⚡ Fetched {len(targets)} detail pages in {time.time() - started:.1f}s "
+            f"({len(targets) - len(browser_targets)} static, {len(browser_targets)} via browser)"
+        )
+        return details
+
+    def _fetch_details_with_browsers(self, driver, browser_targets: List) -> Dict[str, Dict]:
+        """Load detail pages that need JavaScript, sharing them across the caller's driver and idle pooled browsers"""
+        pool = get_browser_pool()
+        extra_drivers = []
+        for _ in range(min(config.DETAIL_BROWSER_WORKERS, len(browser_targets)) - 1):
+            try:
+                leased = pool.acquire(timeout=0)
+            except Exception as e:
+                logger.debug(f"      No extra browser for detail pages: {e}")
+                break
+            if leased is None:
+                break
+            extra_drivers.append(leased)
+
+        pending = Queue()
+        for target in browser_targets:
+            pending.put(target)
+        details = {}
+
+        def work(worker_driver):
+            while True:
+                try:
+                    detail_url, parish_name = pending.get_nowait()
+                except Empty:
+                    return
+                details[detail_url] = self._load_details_with_browser(worker_driver, detail_url, parish_name)
+
+        try:
+            drivers = [driver] + extra_drivers
+            with ThreadPoolExecutor(max_workers=len(drivers), thread_name_prefix="parish-detail-browser") as executor:
+                list(executor.map(work, drivers))
+        finally:
+            for leased in extra_drivers:
+                pool.release(leased)
+        return details
+
+    def _load_details_with_browser(self, driver, parish_url: str, parish_name: str) -> Dict:
+        """Load one detail page through the browser and parse it"""
+        try:
+            logger.info(f"      🔗 Navigating to: {parish_url}")
+            detail_html = _protected_load_parish_detail(driver, parish_url, parish_name)
+            # Pins the domain to the browser only if its static copy was rejected, not after a failed request
+            get_hybrid_fetcher().record_browser_success(parish_url)
+            return self._parse_detail_page(BeautifulSoup(detail_html, "html.parser"))
+        except CircuitBreakerOpenError as e:
+            logger.warning(f"🚫 Circuit breaker OPEN for parish detail: {parish_name}")
+            return {"success": False, "error": f"Circuit breaker blocked request: {str(e)}"}
+        except Exception as e:
+            logger.warning(f"❌ Failed to load parish detail page: {e}")
+            return {"success": False, "error": f"Page load failed: {str(e)}"}
+
     def _extract_details_from_parish_page(self, driver, parish_url: str, parish_name: str) -> Dict:
         """Navigate to parish detail page and extract detailed information with circuit breaker protection"""
 
@@ -272,8 +392,12 @@ class EnhancedDiocesesCardExtractor(BaseExtractor):
 
             # Use protected loading with circuit breaker
             try:
-                detail_html = _protected_load_parish_detail(driver, parish_url, parish_name)
-                detail_soup = BeautifulSoup(detail_html, "html.parser")
+                detail_html, fetch_path = get_hybrid_fetcher().fetch(
+                    parish_url,
+                    lambda: _protected_load_parish_detail(driver, parish_url, parish_name),
+                    requires_javascript=PatternDetector()._requires_javascript,
+                )
+                detail_soup = BeautifulSoup(detail_html, "lxml" if fetch_path == PATH_HTTP else "html.parser")
             except CircuitBreakerOpenError as e:
                 logger.warning(f"🚫 Circuit breaker OPEN for parish detail: {parish_name}")
                 return {"success": False, "error": f"Circuit breaker blocked request: {str(e)}"}
@@ -281,30 +405,33 @@ class EnhancedDiocesesCardExtractor(BaseExtractor):
                 logger.warning(f"❌ Failed to load parish detail page: {e}")
                 return {"success": False, "error": f"Page load failed: {str(e)}"}
 
-            # Initialize result dictionary
-            result = {
-                "success": True,
-                "street_address": None,
-                "full_address": None,
-                "zip_code": None,
-                "phone": None,
-                "website": None,
-                "clergy_info": None,
-                "service_times": None,
-            }
-
-            # Extract contact information from the detail page
-            self._extract_contact_info(detail_soup, result)
-            self._extract_service_times(detail_soup, result)
-            self._extract_clergy_info(detail_soup, result)
-
-            return result
+            return self._parse_detail_page(detail_soup)
 
         except Exception as e:
             error_msg = f"Failed to extract details: {str(e)[:100]}"
             print(f"      ❌ {parish_name}: {error_msg}")
             return {"success": False, "error": error_msg}
 
+    def _parse_detail_page(self, detail_soup: BeautifulSoup) -> Dict:
+        """Extract contact, service time and clergy fields from a parish detail page"""
+        result = {
+            "success": True,
+            "street_address": None,
+            "full_address": None,
+            "zip_code": None,
+            "phone": None,
+            "website": None,
+            "clergy_info": None,
+            "service_times": None,
+        }
+
+        # Extract contact information from the detail page
+        self._extract_contact_info(detail_soup, result)
+        self._extract_service_times(detail_soup, result)
+        self._extract_clergy_info(detail_soup, result)
+
+        return result
+
     def _extract_contact_info(self, soup: BeautifulSoup, result: Dict):
         """Extract contact information from parish detail page"""
         try:
@@ -1515,6 +1642,9 @@ class ImprovedGenericExtractor(BaseExtractor):
 # MAIN PROCESSING FUNCTION
 # =============================================================================
 
+# Elements that show a directory page has rendered its parish listing
+PARISH_LISTING_SELECTORS = "li.site, .parish-item, .parish-card, .location, table tr, .finder-result"
+
 
 @circuit_breaker(
     "diocese_page_load",
@@ -1534,7 +1664,7 @@ def _protected_load_diocese_page(driver, url: str):
     try:
         WebDriverWait(driver, 15).until(
             lambda d: len(
-                d.find_elements(By.CSS_SELECTOR, "li.site, .parish-item, .parish-card, .location, table tr, .finder-result")
+                d.find_elements(By.CSS_SELECTOR, PARISH_LISTING_SELECTORS)
             )
             > 0
         )
@@ -1566,61 +1696,28 @@ def _protected_load_parish_detail(driver, parish_url: str, parish_name: str):
     return driver.page_source
 
 
-def process_diocese_with_detailed_extraction(diocese_info: Dict, driver, max_parishes: int = 0) -> Dict:
-    """
-    Enhanced processing function that extracts detailed parish information
-    by navigating to individual parish detail pages
-    """
+def _load_directory_in_browser(driver, parish_directory_url: str, result: Dict) -> Optional[str]:
+    """Load the directory page through the browser; records the error in result and returns None on failure"""
+    try:
+        return _protected_load_diocese_page(driver, parish_directory_url)
+    except CircuitBreakerOpenError as e:
+        logger.error(f"🚫 Circuit breaker OPEN for diocese page load: {e}")
+        result["errors"].append(f"Circuit breaker blocked diocese page load: {str(e)}")
+    except Exception as e:
+        logger.error(f"❌ Failed to load diocese page: {e}")
+        result["errors"].append(f"Failed to load diocese page: {str(e)}")
+    return None
 
-    diocese_url = diocese_info["url"]
+
+def _extract_parishes_from_directory(
+    driver, html_content: str, diocese_info: Dict, max_parishes: int, result: Dict
+) -> List[ParishData]:
+    """Detect the directory's pattern and run the extractor chain over it (steps 2-3 of detailed processing)"""
     diocese_name = diocese_info["name"]
     parish_directory_url = diocese_info["parish_directory_url"]
-
-    print(f"\n{'='*60}")
-    print(f"🔍 ENHANCED DETAILED PROCESSING: {diocese_name}")
-    print(f"📍 Main URL: {diocese_url}")
-    print(f"📂 Parish Directory URL: {parish_directory_url}")
-    print(f"{'='*60}")
-
-    result = {
-        "diocese_name": diocese_name,
-        "diocese_url": diocese_url,
-        "parish_directory_url": parish_directory_url,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "pattern_detected": None,
-        "parishes_found": [],
-        "success": False,
-        "extraction_methods_used": [],
-        "processing_time": 0,
-        "errors": [],
-        "detail_extraction_stats": {"attempted": 0, "successful": 0, "failed": 0, "success_rate": 0.0},
-        "field_extraction_stats": {
-            "addresses_extracted": 0,
-            "phones_extracted": 0,
-            "websites_extracted": 0,
-            "zip_codes_extracted": 0,
-            "clergy_info_extracted": 0,
-            "service_times_extracted": 0,
-        },
-    }
-
-    start_time = time.time()
+    soup = BeautifulSoup(html_content, "html.parser")
 
     try:
-        # Step 1: Load the parish directory page with circuit breaker protection
-        print("  📥 Loading parish directory page with circuit breaker protection...")
-        try:
-            html_content = _protected_load_diocese_page(driver, parish_directory_url)
-            soup = BeautifulSoup(html_content, "html.parser")
-        except CircuitBreakerOpenError as e:
-            logger.error(f"🚫 Circuit breaker OPEN for diocese page load: {e}")
-            result["errors"].append(f"Circuit breaker blocked diocese page load: {str(e)}")
-            return result
-        except Exception as e:
-            logger.error(f"❌ Failed to load diocese page: {e}")
-            result["errors"].append(f"Failed to load diocese page: {str(e)}")
-            return result
-
         # Step 2: Detect pattern
         print("  🔍 Detecting website pattern...")
         detector = PatternDetector()
@@ -1694,6 +1791,7 @@ def process_diocese_with_detailed_extraction(diocese_info: Dict, driver, max_par
 
         # OPTIMIZATION 2: Optimize extractor sequence based on page analysis
         optimized_extractors = optimizer.optimize_extractor_sequence(extractors_to_try, page_analysis)
+        result["extractors_considered"] = len(optimized_extractors)
 
         # Try each extractor with optimization
         for extractor_name, extractor in optimized_extractors:
@@ -1738,6 +1836,86 @@ def process_diocese_with_detailed_extraction(diocese_info: Dict, driver, max_par
                 print(f"    ❌ {extractor_name} failed: {str(e)[:100]}")
                 result["errors"].append(f"{extractor_name}: {str(e)[:100]}")
 
+        return parishes
+    finally:
+        soup.decompose()
+
+
+def process_diocese_with_detailed_extraction(diocese_info: Dict, driver, max_parishes: int = 0) -> Dict:
+    """
+    Enhanced processing function that extracts detailed parish information
+    by navigating to individual parish detail pages
+    """
+
+    diocese_url = diocese_info["url"]
+    diocese_name = diocese_info["name"]
+    parish_directory_url = diocese_info["parish_directory_url"]
+
+    print(f"\n{'='*60}")
+    print(f"🔍 ENHANCED DETAILED PROCESSING: {diocese_name}")
+    print(f"📍 Main URL: {diocese_url}")
+    print(f"📂 Parish Directory URL: {parish_directory_url}")
+    print(f"{'='*60}")
+
+    result = {
+        "diocese_name": diocese_name,
+        "diocese_url": diocese_url,
+        "parish_directory_url": parish_directory_url,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "pattern_detected": None,
+        "parishes_found": [],
+        "success": False,
+        "extraction_methods_used": [],
+        "processing_time": 0,
+        "errors": [],
+        "detail_extraction_stats": {"attempted": 0, "successful": 0, "failed": 0, "success_rate": 0.0},
+        "field_extraction_stats": {
+            "addresses_extracted": 0,
+            "phones_extracted": 0,
+            "websites_extracted": 0,
+            "zip_codes_extracted": 0,
+            "clergy_info_extracted": 0,
+            "service_times_extracted": 0,
+        },
+    }
+
+    start_time = time.time()
+
+    try:
+        # Step 1: Load the parish directory page, over plain HTTP when the site serves it statically
+        fetcher = get_hybrid_fetcher()
+        html_content = fetcher.try_static(
+            parish_directory_url,
+            requires_javascript=PatternDetector()._requires_javascript,
+            is_usable=lambda html: has_static_content(html, PARISH_LISTING_SELECTORS),
+        )
+        extraction_driver = driver
+        if html_content is not None:
+            print("  ⚡ Parish directory served as static HTML - browser load deferred until an extractor needs it")
+            extraction_driver = DeferredPageDriver(driver, parish_directory_url, _protected_load_diocese_page)
+            result["fetch_path"] = PATH_HTTP
+        else:
+            print("  📥 Loading parish directory page with circuit breaker protection...")
+            html_content = _load_directory_in_browser(driver, parish_directory_url, result)
+            if html_content is None:
+                return result
+            fetcher.record_browser_success(parish_directory_url)
+            result["fetch_path"] = PATH_BROWSER
+
+        # Steps 2-3: Detect the pattern and run the extractor chain
+        parishes = _extract_parishes_from_directory(extraction_driver, html_content, diocese_info, max_parishes, result)
+
+        if not parishes and result["fetch_path"] == PATH_HTTP and not extraction_driver.page_loaded:
+            # The static copy yielded nothing and no extractor looked at the rendered page; try that before giving up
+            print("  🔁 No parishes in the static HTML - retrying with the browser")
+            html_content = _load_directory_in_browser(driver, parish_directory_url, result)
+            if html_content is None:
+                return result
+            result["fetch_path"] = PATH_BROWSER
+            parishes = _extract_parishes_from_directory(driver, html_content, diocese_info, max_parishes, result)
+            if parishes:
+                fetcher.record_path(parish_directory_url, PATH_BROWSER)
+
         # Step 4: Process results and calculate statistics
         if parishes:
             # Import the enhanced deduplication system
@@ -1831,9 +2009,11 @@ def process_diocese_with_detailed_extraction(diocese_info: Dict, driver, max_par
             print(f"      ⏰ Service Times: {field_stats['service_times_extracted']}/{total_parishes}")
 
             # Log optimization performance statistics
-            opt_stats = optimizer.get_optimization_stats()
+            from core.extraction_optimizer import get_extractor_optimizer
+
+            opt_stats = get_extractor_optimizer().get_optimization_stats()
             print(f"  🚀 Optimization Performance:")
-            print(f"      🔧 Extractors optimized: {len([name for name in optimized_extractors])}")
+            print(f"      🔧 Extractors optimized: {result.get('extractors_considered', 0)}")
             print(f"      ⚡ Extractors skipped: {len(opt_stats.get('skipped_extractors', []))}")
             print(
                 f"      🔌 Circuit breakers active: {len([cb for cb in opt_stats['circuit_breakers'].values() if cb['state'] != 'CLOSED'])}"
@@ -1853,9 +2033,6 @@ def process_diocese_with_detailed_extraction(diocese_info: Dict, driver, max_par
         # Clean up large objects that accumulate during processing
 
         # Clear local variables that might hold references
-        if "soup" in locals():
-            soup.decompose()  # Release BeautifulSoup memory
-            del soup
         if "html_content" in locals():
             del html_content
         if "parishes" in locals():
@@ -3317,7 +3494,7 @@ import os
 import re
 import tempfile
 from typing import Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 import pdfplumber
 import PyPDF2
@@ -112,6 +112,7 @@ def main():
             extract_dioceses_main(args.max_dioceses)
 
             monitoring_client.send_log("Step 1 │ ✅ Diocese extraction completed successfully", "INFO")
+            monitoring_client.report_data_changed("dioceses")
             monitoring_client.report_circuit_breaker_status()
 
         except Exception as e:
@@ -135,6 +136,7 @@ def main():
             find_parish_directories(diocese_id=args.diocese_id, max_dioceses_to_process=args.max_dioceses)
 
             monitoring_client.send_log("Step 2 │ ✅ Parish directory discovery completed", "INFO")
+            monitoring_client.report_data_changed("parish_directories")
             monitoring_client.report_circuit_breaker_status()
 
         except Exception as e:
@@ -180,6 +182,7 @@ def main():
                 monitor.update_progress(args.max_parishes_per_diocese, int(args.max_parishes_per_diocese * 0.85))
 
             monitoring_client.send_log("Step 3 │ ✅ Parish extraction completed successfully", "INFO")
+            monitoring_client.report_data_changed("parishes")
             monitoring_client.report_circuit_breaker_status()
 
         except Exception as e:
@@ -217,6 +220,7 @@ def main():
             )
 
             monitoring_client.send_log("Step 4 │ ✅ Schedule extraction completed successfully", "INFO")
+            monitoring_client.report_data_changed("schedules")
             monitoring_client.report_circuit_breaker_status()
 
         except Exception as e:
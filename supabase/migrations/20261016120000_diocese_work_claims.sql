@@ -0,0 +1,48 @@
+-- Atomic diocese work claims for the distributed work coordinator
+-- Guarantees that concurrent pipeline workers can never hold the same diocese.
+
+BEGIN;
+
+-- Release duplicate active assignments left by earlier racing workers (keep the earliest)
+UPDATE diocese_work_assignments AS later
+SET status = 'failed', completed_at = NOW()
+FROM diocese_work_assignments AS earlier
+WHERE later.status = 'processing'
+  AND earlier.status = 'processing'
+  AND later.diocese_id = earlier.diocese_id
+  AND (later.assigned_at, later.id) > (earlier.assigned_at, earlier.id);
+
+-- At most one active assignment per diocese
+CREATE UNIQUE INDEX IF NOT EXISTS uq_diocese_assignments_processing
+    ON diocese_work_assignments(diocese_id) WHERE status = 'processing';
+
+-- Claim up to p_limit dioceses, in the order given, for a worker.
+-- Returns only the dioceses this call actually claimed.
+CREATE OR REPLACE FUNCTION claim_diocese_work(p_worker_id TEXT, p_diocese_ids INTEGER[], p_limit INTEGER)
+RETURNS TABLE (claimed_diocese_id INTEGER)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    candidate INTEGER;
+    claimed_count INTEGER := 0;
+BEGIN
+    FOREACH candidate IN ARRAY p_diocese_ids LOOP
+        EXIT WHEN claimed_count >= p_limit;
+
+        INSERT INTO diocese_work_assignments (diocese_id, worker_id, status, assigned_at, estimated_completion)
+        VALUES (candidate, p_worker_id, 'processing', NOW(), NOW() + INTERVAL '1 hour')
+        ON CONFLICT (diocese_id) WHERE status = 'processing' DO NOTHING;
+
+        IF FOUND THEN
+            claimed_count := claimed_count + 1;
+            claimed_diocese_id := candidate;
+            RETURN NEXT;
+        END IF;
+    END LOOP;
+END;
+$$;
+
+COMMENT ON FUNCTION claim_diocese_work(TEXT, INTEGER[], INTEGER) IS
+    'Atomically assigns up to p_limit unclaimed dioceses to a pipeline worker';
+
+COMMIT;
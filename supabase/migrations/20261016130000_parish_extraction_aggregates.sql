@@ -0,0 +1,68 @@
+-- Server-side extraction aggregates for the dashboard read API
+-- Replaces full ParishData scans in the backend with indexed views so that
+-- data_extracted can be filtered, sorted and counted by Postgres.
+
+BEGIN;
+
+-- Facts that count as "data extracted" (mirrors the backend definition)
+CREATE INDEX IF NOT EXISTS idx_parishdata_extracted_parish_id
+    ON public."ParishData"(parish_id)
+    WHERE fact_value IS NOT NULL AND fact_value <> '' AND fact_value <> 'Information not found';
+
+-- Keyset pagination tie-breakers for the parish listings
+CREATE INDEX IF NOT EXISTS idx_parishes_name_id ON public."Parishes"("Name", id);
+CREATE INDEX IF NOT EXISTS idx_parishes_diocese_name_id ON public."Parishes"(diocese_id, "Name", id);
+
+-- Parish listing with a per-parish extraction flag
+CREATE OR REPLACE VIEW public.parishes_with_extraction_status AS
+SELECT
+    p.*,
+    EXISTS (
+        SELECT 1
+        FROM public."ParishData" pd
+        WHERE pd.parish_id = p.id
+          AND pd.fact_value IS NOT NULL
+          AND pd.fact_value <> ''
+          AND pd.fact_value <> 'Information not found'
+    ) AS data_extracted
+FROM public.parishes_with_diocese_name p;
+
+COMMENT ON VIEW public.parishes_with_extraction_status IS
+    'parishes_with_diocese_name plus a data_extracted flag for push-down filtering and sorting';
+
+-- Per-diocese parish counts, keyed by diocese website like Parishes.diocese_url
+CREATE OR REPLACE VIEW public.diocese_parish_counts AS
+SELECT
+    p.diocese_url,
+    COUNT(*) AS parishes_in_db_count,
+    COUNT(*) FILTER (
+        WHERE EXISTS (
+            SELECT 1
+            FROM public."ParishData" pd
+            WHERE pd.parish_id = p.id
+              AND pd.fact_value IS NOT NULL
+              AND pd.fact_value <> ''
+              AND pd.fact_value <> 'Information not found'
+        )
+    ) AS parishes_with_data_extracted_count
+FROM public."Parishes" p
+GROUP BY p.diocese_url;
+
+COMMENT ON VIEW public.diocese_parish_counts IS
+    'Parish and extracted-parish counts per diocese for the dioceses listing';
+
+-- Single-row dashboard summary
+CREATE OR REPLACE VIEW public.extraction_summary AS
+SELECT
+    (SELECT COUNT(*) FROM public."Dioceses") AS total_dioceses_processed,
+    (SELECT COUNT(DISTINCT diocese_id) FROM public."DiocesesParishDirectory") AS found_parish_directories,
+    (SELECT COUNT(*) FROM public."Parishes") AS parishes_extracted,
+    (
+        SELECT COUNT(DISTINCT parish_id)
+        FROM public."ParishData"
+        WHERE fact_value IS NOT NULL AND fact_value <> '' AND fact_value <> 'Information not found'
+    ) AS parishes_with_data_extracted;
+
+COMMENT ON VIEW public.extraction_summary IS 'Dashboard summary counts computed in one round trip';
+
+COMMIT;
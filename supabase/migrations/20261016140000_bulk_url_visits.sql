@@ -0,0 +1,84 @@
+-- Bulk visit recording for the URL visit tracker
+-- Lets Step 4 write a parish's buffered page visits in one call and have
+-- visit_count incremented by Postgres instead of overwritten by the client.
+
+BEGIN;
+
+-- Visit tracking columns read by URLVisitTracker and the ML URL predictor
+ALTER TABLE public."DiscoveredUrls"
+    ADD COLUMN IF NOT EXISTS visited_at TIMESTAMPTZ,
+    ADD COLUMN IF NOT EXISTS http_status INTEGER,
+    ADD COLUMN IF NOT EXISTS response_time_ms INTEGER,
+    ADD COLUMN IF NOT EXISTS content_type TEXT,
+    ADD COLUMN IF NOT EXISTS content_size_bytes BIGINT,
+    ADD COLUMN IF NOT EXISTS extraction_success BOOLEAN DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS schedule_data_found BOOLEAN DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS schedule_keywords_count INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS error_type TEXT,
+    ADD COLUMN IF NOT EXISTS error_message TEXT,
+    ADD COLUMN IF NOT EXISTS quality_score DOUBLE PRECISION DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS visit_count INTEGER DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS last_successful_visit TIMESTAMPTZ;
+
+-- Upsert a batch of visits (one row per url/parish_id; the client merges repeats).
+-- visit_count is added to the stored count; last_successful_visit only moves forward.
+CREATE OR REPLACE FUNCTION record_url_visits(p_visits JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    written INTEGER;
+BEGIN
+    INSERT INTO public."DiscoveredUrls" AS d (
+        url, parish_id, visited, score, visited_at, http_status, response_time_ms, content_type,
+        content_size_bytes, extraction_success, schedule_data_found, schedule_keywords_count,
+        error_type, error_message, quality_score, visit_count, last_successful_visit
+    )
+    SELECT
+        v.url, v.parish_id, TRUE, v.score, v.visited_at, v.http_status, v.response_time_ms, v.content_type,
+        v.content_size_bytes, v.extraction_success, v.schedule_data_found, v.schedule_keywords_count,
+        v.error_type, v.error_message, v.quality_score, COALESCE(v.visit_count, 1), v.last_successful_visit
+    FROM jsonb_to_recordset(p_visits) AS v(
+        url TEXT,
+        parish_id BIGINT,
+        score INTEGER,
+        visited_at TIMESTAMPTZ,
+        http_status INTEGER,
+        response_time_ms INTEGER,
+        content_type TEXT,
+        content_size_bytes BIGINT,
+        extraction_success BOOLEAN,
+        schedule_data_found BOOLEAN,
+        schedule_keywords_count INTEGER,
+        error_type TEXT,
+        error_message TEXT,
+        quality_score DOUBLE PRECISION,
+        visit_count INTEGER,
+        last_successful_visit TIMESTAMPTZ
+    )
+    ON CONFLICT (url, parish_id) DO UPDATE SET
+        visited = TRUE,
+        score = EXCLUDED.score,
+        visited_at = EXCLUDED.visited_at,
+        http_status = EXCLUDED.http_status,
+        response_time_ms = EXCLUDED.response_time_ms,
+        content_type = EXCLUDED.content_type,
+        content_size_bytes = EXCLUDED.content_size_bytes,
+        extraction_success = EXCLUDED.extraction_success,
+        schedule_data_found = EXCLUDED.schedule_data_found,
+        schedule_keywords_count = EXCLUDED.schedule_keywords_count,
+        error_type = EXCLUDED.error_type,
+        error_message = EXCLUDED.error_message,
+        quality_score = EXCLUDED.quality_score,
+        visit_count = COALESCE(d.visit_count, 0) + EXCLUDED.visit_count,
+        last_successful_visit = GREATEST(d.last_successful_visit, EXCLUDED.last_successful_visit);
+
+    GET DIAGNOSTICS written = ROW_COUNT;
+    RETURN written;
+END;
+$$;
+
+COMMENT ON FUNCTION record_url_visits(JSONB) IS
+    'Bulk-records URL visits for schedule extraction, incrementing visit_count server-side';
+
+COMMIT;
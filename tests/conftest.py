@@ -9,6 +9,7 @@ import os
 import shutil
 import sys
 import tempfile
+import types
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -236,6 +237,54 @@ def performance_benchmark():
 
 
 # Skip markers for conditional test execution
+@pytest.fixture
+def page_tracker(tmp_path, monkeypatch):
+    """PageChangeTracker on a temporary cache, installed as the global tracker."""
+    from core import page_change_tracker
+    from core.intelligent_cache_manager import IntelligentCacheManager
+
+    tracker = page_change_tracker.PageChangeTracker(IntelligentCacheManager(cache_dir=str(tmp_path)))
+    monkeypatch.setattr(page_change_tracker, "_page_change_tracker", tracker)
+    return tracker
+
+
+class RecordingVisitTracker:
+    """Minimal stand-in for URLVisitTracker that records what the schedule crawl reports."""
+
+    def __init__(self):
+        self.extraction_attempts = []
+
+    def record_extraction_attempt(self, visit_result, success, error=None):
+        self.extraction_attempts.append(success)
+
+    def assess_content_quality(self, visit_result, content, schedule_found=False):
+        visit_result.schedule_data_found = schedule_found
+        visit_result.quality_score = 1.0 if schedule_found else 0.1
+        return visit_result.quality_score
+
+
+def make_visit_result():
+    """Blank visit result as handed to the schedule crawl's page processing."""
+    return types.SimpleNamespace(
+        schedule_data_found=False, schedule_keywords_count=0, quality_score=0.0, relevance_indicators=[]
+    )
+
+
+def make_crawl_state():
+    """Crawl state for a single parish at https://parish.org/."""
+    from pipeline.extract_schedule import ParishCrawlState
+
+    return ParishCrawlState(
+        url="https://parish.org/",
+        parish_id=1,
+        suppression_urls=set(),
+        base_domain="parish.org",
+        max_pages=10,
+        all_keywords={},
+        keyword_sets=(),
+    )
+
+
 def pytest_runtest_setup(item):
     """Skip tests based on environment conditions."""
     # Skip database tests if no database available
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the async schedule crawl engine: per-domain politeness, retries and
+the priority frontier shared by the sync and async scrapers.
+"""
+
+import asyncio
+import heapq
+import time
+
+import httpx
+
+from core.async_crawler import AsyncCrawler, DomainPolitenessScheduler, PolitenessConfig
+from pipeline.extract_schedule import ParishCrawlState
+
+
+def _make_crawler(handler, **kwargs) -> AsyncCrawler:
+    return AsyncCrawler(["test-agent"], transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_same_domain_requests_are_spaced():
+    """Requests to one domain wait for that domain's timer."""
+    politeness = PolitenessConfig(min_delay=0.2, max_delay=0.2)
+
+    async def run():
+        start_times = []
+
+        def handler(request):
+            start_times.append(time.monotonic())
+            return httpx.Response(200, text="ok")
+
+        async with _make_crawler(handler, politeness=politeness) as crawler:
+            await asyncio.gather(*(crawler.fetch(f"https://parish.org/page{i}") for i in range(3)))
+        return start_times
+
+    start_times = asyncio.run(run())
+    gaps = [b - a for a, b in zip(start_times, start_times[1:])]
+    assert all(gap >= 0.18 for gap in gaps)
+
+
+def test_different_domains_do_not_wait_on_each_other():
+    """Politeness timers are per domain, not global."""
+    politeness = PolitenessConfig(min_delay=1.0, max_delay=1.0)
+
+    async def run():
+        def handler(request):
+            return httpx.Response(200, text="ok")
+
+        async with _make_crawler(handler, politeness=politeness) as crawler:
+            started = time.monotonic()
+            await asyncio.gather(*(crawler.fetch(f"https://parish{i}.org/") for i in range(5)))
+            return time.monotonic() - started, crawler.get_stats()
+
+    elapsed, stats = asyncio.run(run())
+    assert elapsed < 0.5
+    assert stats["politeness"]["delayed_requests"] == 0
+    assert stats["successful_fetches"] == 5
+
+
+def test_retries_transient_status():
+    """Transient statuses are retried with non-blocking backoff."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(503 if len(calls) == 1 else 200, text="ok")
+
+    async def run():
+        async with _make_crawler(handler, politeness=PolitenessConfig(0, 0), backoff_factor=0.01) as crawler:
+            return await crawler.fetch("https://parish.org/")
+
+    response = asyncio.run(run())
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_domain_key_ignores_www_and_case():
+    assert DomainPolitenessScheduler.domain_key("https://WWW.Parish.org/a") == "parish.org"
+    assert DomainPolitenessScheduler.domain_key("http://parish.org/b") == "parish.org"
+
+
+def test_crawl_state_pops_by_priority_and_skips_suppressed():
+    """The frontier pops highest priority first and never visits suppressed or binary URLs."""
+    state = ParishCrawlState(
+        url="https://parish.org",
+        parish_id=1,
+        suppression_urls={"https://parish.org/suppressed"},
+        base_domain="parish.org",
+        max_pages=10,
+        all_keywords={},
+        keyword_sets=(),
+    )
+    for priority, url in [
+        (5, "https://parish.org/low"),
+        (50, "https://parish.org/suppressed"),
+        (40, "https://parish.org/bulletin.pdf"),
+        (20, "https://parish.org/high"),
+    ]:
+        heapq.heappush(state.urls_to_visit, (-priority, url))
+
+    visited = []
+    while (next_item := state.next_url()) is not None:
+        visited.append(next_item[1])
+
+    assert visited == ["https://parish.org/high", "https://parish.org/low"]
+    assert state.discovered_urls[("https://parish.org/high", 1)]["visited"] is True
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for BrowserPool leasing, resets and recycling.
+"""
+
+import threading
+
+import pytest
+
+from core.driver import BrowserPool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_handle = handle
+
+
+class FakeRawDriver:
+    """Records the calls BrowserPool and ProtectedWebDriver make on a Selenium driver."""
+
+    def __init__(self):
+        self.handles = ["main"]
+        self.current_handle = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.cookies = {"session": "diocese-a"}
+        self.cdp_calls = []
+        self.loaded = []
+        self.quit_called = False
+        self.alive = True
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise ConnectionError("session gone")
+        return list(self.handles)
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def get(self, url):
+        self.loaded.append(url)
+
+    def execute_script(self, script):
+        pass
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append((command, params.get("origin")))
+
+    def close(self):
+        self.handles.remove(self.current_handle)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def launched():
+    return []
+
+
+@pytest.fixture
+def pool(launched):
+    def factory():
+        launched.append(FakeRawDriver())
+        return launched[-1]
+
+    return BrowserPool(size=2, max_pages=3, max_rss_mb=0, factory=factory)
+
+
+def test_browsers_are_reused_and_reset_between_leases(pool, launched):
+    with pool.lease() as driver:
+        driver.get("https://diocese-a.org/parishes")
+        driver.driver.handles.append("detail-tab")
+
+    with pool.lease() as driver:
+        assert driver.driver is launched[0]
+
+    raw = launched[0]
+    assert len(launched) == 1 and not raw.quit_called
+    assert raw.cookies == {} and raw.handles == ["main"]
+    assert ("Storage.clearDataForOrigin", "https://diocese-a.org") in raw.cdp_calls
+    assert raw.loaded[-1] == "about:blank"
+    assert pool.get_stats()["reused"] == 1
+
+
+def test_browser_is_recycled_after_page_limit(pool, launched):
+    with pool.lease() as driver:
+        for i in range(3):
+            driver.get(f"https://diocese-a.org/parish/{i}")
+
+    with pool.lease() as driver:
+        assert driver.driver is launched[1]
+
+    assert launched[0].quit_called
+    assert pool.get_stats()["recycled_pages"] == 1
+
+
+def test_dead_browser_is_replaced_on_lease(pool, launched):
+    with pool.lease():
+        pass
+    launched[0].alive = False
+
+    with pool.lease() as driver:
+        assert driver.driver is launched[1]
+    assert pool.get_stats()["unhealthy"] == 1
+
+
+def test_leases_are_bounded_by_pool_size(pool, launched):
+    first, second = pool.acquire(), pool.acquire()
+    assert pool.acquire(timeout=0.05) is None
+
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.acquire(timeout=5)))
+    waiter.start()
+    pool.release(first)
+    waiter.join()
+
+    assert got[0] is first
+    assert len(launched) == 2
+    pool.release(second)
+    pool.release(got[0])
+    pool.close()
+    assert all(raw.quit_called for raw in launched)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent parish detail-page fetching in EnhancedDiocesesCardExtractor.
+"""
+
+import threading
+import time
+
+import pytest
+from bs4 import BeautifulSoup
+
+from pipeline import parish_extractors
+from pipeline.parish_extraction_core import DiocesePlatform, DioceseSitePattern, ParishListingType
+from pipeline.parish_extractors import EnhancedDiocesesCardExtractor
+
+DETAIL_PAGE = """
+<html><body>
+  <ul class="fa-ul">
+    <li>1200 Main Street, Springfield, UT 84000</li>
+    <li><a href="tel:8015550100">(801) 555-0100</a></li>
+    <li><a href="https://stmary.example.org">Website</a></li>
+  </ul>
+</body></html>
+"""
+
+
+def _listing(count, domain="parishes.example.org"):
+    cards = "".join(
+        f'<div class="col-lg location"><a class="card" href="https://{domain}/parish/{i}">'
+        f'<h4 class="card-title">St. Parish {i}</h4><div class="card-body">St. Parish {i}\nSpringfield, UT</div></a></div>'
+        for i in range(count)
+    )
+    return BeautifulSoup(f"<html><body>{cards}</body></html>", "html.parser")
+
+
+class FakeFetcher:
+    """Serves detail pages statically, except for URLs marked as script-driven."""
+
+    def __init__(self, browser_only=()):
+        self.browser_only = set(browser_only)
+        self.browser_successes = []
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def try_static(self, url, requires_javascript=None):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return None if url in self.browser_only else DETAIL_PAGE
+
+    def record_browser_success(self, url):
+        with self.lock:
+            self.browser_successes.append(url)
+
+
+class FakePool:
+    def __init__(self, idle):
+        self.idle = list(idle)
+        self.released = []
+
+    def acquire(self, timeout=None):
+        return self.idle.pop() if self.idle else None
+
+    def release(self, driver):
+        self.released.append(driver)
+
+
+@pytest.fixture
+def extractor():
+    pattern = DioceseSitePattern(
+        platform=DiocesePlatform.CUSTOM_CMS,
+        listing_type=ParishListingType.CARD_GRID,
+        confidence_score=0.9,
+        extraction_method="enhanced_diocese_card_extraction",
+        specific_selectors={},
+        javascript_required=False,
+    )
+    return EnhancedDiocesesCardExtractor(pattern)
+
+
+@pytest.fixture
+def browser_loads(monkeypatch):
+    loads = []
+
+    def load(driver, url, name):
+        loads.append((driver, url))
+        return DETAIL_PAGE
+
+    monkeypatch.setattr(parish_extractors, "_protected_load_parish_detail", load)
+    return loads
+
+
+def test_detail_pages_are_fetched_concurrently_under_domain_limit(monkeypatch, extractor, browser_loads):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(parish_extractors, "get_hybrid_fetcher", lambda: fetcher)
+    monkeypatch.setattr(parish_extractors.config, "DETAIL_FETCH_MAX_PER_DOMAIN", 3)
+
+    started = time.monotonic()
+    parishes = extractor.extract("main-driver", _listing(9), "https://parishes.example.org/")
+
+    assert len(parishes) == 9
+    assert time.monotonic() - started < 0.4
+    assert fetcher.peak == 3
+    assert browser_loads == []
+    assert all(p.detail_extraction_success and p.phone == "(801) 555-0100" for p in parishes)
+    assert {p.website for p in parishes} == {"https://stmary.example.org"}
+    assert extractor.detail_extraction_count == 9
+
+
+def test_script_driven_pages_use_the_driver_and_idle_pooled_browsers(monkeypatch, extractor, browser_loads):
+    browser_only = [f"https://parishes.example.org/parish/{i}" for i in (1, 3, 5, 7)]
+    pool = FakePool(["pooled-driver"])
+    fetcher = FakeFetcher(browser_only)
+    monkeypatch.setattr(parish_extractors, "get_hybrid_fetcher", lambda: fetcher)
+    monkeypatch.setattr(parish_extractors, "get_browser_pool", lambda: pool)
+    monkeypatch.setattr(parish_extractors.config, "DETAIL_BROWSER_WORKERS", 2)
+
+    parishes = extractor.extract("main-driver", _listing(8), "https://parishes.example.org/")
+
+    assert sorted(url for _, url in browser_loads) == browser_only
+    assert {driver for driver, _ in browser_loads} <= {"main-driver", "pooled-driver"}
+    assert pool.released == ["pooled-driver"]
+    assert sorted(fetcher.browser_successes) == browser_only
+    assert all(p.detail_extraction_success for p in parishes)
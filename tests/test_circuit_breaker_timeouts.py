@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for signal-free circuit breaker timeouts and the async call path.
+"""
+
+import asyncio
+import concurrent.futures
+import time
+
+import pytest
+
+from core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerOpenError,
+    CircuitState,
+    check_deadline,
+    remaining_time,
+)
+
+
+def _breaker(name, **overrides) -> CircuitBreaker:
+    settings = {"failure_threshold": 2, "recovery_timeout": 60, "request_timeout": 0.2, "max_retries": 0}
+    settings.update(overrides)
+    return CircuitBreaker(name, CircuitBreakerConfig(**settings))
+
+
+def test_sub_second_timeout_from_worker_threads():
+    breaker = _breaker("worker_threads", failure_threshold=10)
+
+    def call_slow():
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            breaker.call(time.sleep, 2)
+        return time.monotonic() - started
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        elapsed = list(pool.map(lambda _: call_slow(), range(4)))
+
+    assert all(0.15 <= seconds < 1.0 for seconds in elapsed)
+    assert breaker.get_stats()["total_timeouts"] == 4
+
+
+def test_results_and_errors_pass_through():
+    breaker = _breaker("pass_through")
+    assert breaker.call(lambda a, b: a + b, 2, b=3) == 5
+
+    with pytest.raises(ValueError):
+        breaker.call(lambda: int("not a number"))
+
+
+def test_nested_breakers_inherit_the_outer_deadline():
+    outer = _breaker("outer", request_timeout=0.3)
+    inner = _breaker("inner", request_timeout=10)
+    seen = {}
+
+    def inner_call():
+        seen["inner_remaining"] = remaining_time()
+        return "ok"
+
+    assert outer.call(lambda: inner.call(inner_call)) == "ok"
+    assert remaining_time() is None
+    assert seen["inner_remaining"] <= 0.3
+
+
+def test_abandoned_call_can_stop_cooperatively():
+    breaker = _breaker("cooperative", request_timeout=0.1)
+    finished_loops = []
+
+    def long_loop():
+        for i in range(50):
+            check_deadline()
+            time.sleep(0.02)
+            finished_loops.append(i)
+
+    with pytest.raises(TimeoutError):
+        breaker.call(long_loop)
+    time.sleep(0.2)
+    assert len(finished_loops) < 10
+
+
+def test_async_call_times_out_without_blocking_the_loop():
+    breaker = _breaker("async_timeout", max_retries=1, retry_delay=0.1)
+    ticks = []
+
+    async def ticker():
+        for _ in range(10):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.05)
+
+    async def run():
+        tick_task = asyncio.create_task(ticker())
+        with pytest.raises(TimeoutError):
+            await breaker.call_async(asyncio.sleep, 5)
+        await tick_task
+
+    asyncio.run(run())
+    assert len(ticks) == 10
+    assert breaker.get_stats()["total_timeouts"] == 2
+
+
+def test_async_call_opens_circuit_and_wraps_plain_functions():
+    breaker = _breaker("async_failures")
+
+    async def failing():
+        raise ConnectionError("down")
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await breaker.call_async(failing)
+        with pytest.raises(CircuitBreakerOpenError):
+            await breaker.call_async(failing)
+
+        breaker.reset()
+        return await breaker.call_async(lambda: "from a thread")
+
+    assert asyncio.run(run()) == "from a thread"
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_no_retry_while_timed_out_call_is_still_running():
+    breaker = _breaker("no_overlap", request_timeout=0.1, max_retries=2, retry_delay=0.01)
+    calls = []
+
+    def slow():
+        calls.append(time.monotonic())
+        time.sleep(0.5)
+
+    with pytest.raises(TimeoutError):
+        breaker.call(slow)
+    assert len(calls) == 1
+
+
+def test_retry_after_timed_out_call_has_finished():
+    breaker = _breaker("retry_after_finish", request_timeout=0.1, max_retries=1, retry_delay=0.2)
+    calls = []
+
+    def slow_then_fast():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            time.sleep(0.15)
+        return "ok"
+
+    assert breaker.call(slow_then_fast) == "ok"
+    assert len(calls) == 2
+
+
+def test_async_no_retry_while_timed_out_thread_is_still_running():
+    breaker = _breaker("async_no_overlap", request_timeout=0.1, max_retries=2, retry_delay=0.01)
+    calls = []
+
+    def slow():
+        calls.append(time.monotonic())
+        time.sleep(0.3)
+
+    async def run():
+        with pytest.raises(TimeoutError):
+            await breaker.call_async(slow)
+
+    asyncio.run(run())
+    assert len(calls) == 1
+
+
+def test_retry_backoff_stops_at_the_enclosing_deadline():
+    outer = _breaker("outer_deadline", request_timeout=0.3)
+    inner = _breaker("inner_retries", request_timeout=10, max_retries=3, retry_delay=5)
+    calls = []
+    gave_up = {}
+
+    def failing():
+        calls.append(time.monotonic())
+        raise ConnectionError("down")
+
+    def retry_inside_outer():
+        try:
+            inner.call(failing)
+        except ConnectionError:
+            gave_up["at"] = time.monotonic()
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        outer.call(retry_inside_outer)
+    time.sleep(0.2)
+
+    # The 5s backoff is cut to the outer deadline and no retry starts after it
+    assert len(calls) == 1
+    assert gave_up["at"] - started < 0.5
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for coalescing, retry/bisection and the write-behind mode of DatabaseBatchManager.
+"""
+
+import threading
+import time
+import types
+
+from core.db_batch_operations import DatabaseBatchManager
+
+
+class FakeUpsert:
+    def __init__(self, db, table, rows):
+        self.db = db
+        self.table = table
+        self.rows = rows
+
+    def execute(self):
+        time.sleep(self.db.latency)
+        with self.db.lock:
+            self.db.calls.append([dict(row) for row in self.rows])
+            if self.db.transient_failures:
+                self.db.transient_failures -= 1
+                raise ConnectionError("connection reset")
+        if any(row.get("fact_value") == "poison" for row in self.rows):
+            raise Exception("violates check constraint")
+        with self.db.lock:
+            self.db.saved.extend(self.rows)
+        return types.SimpleNamespace(data=self.rows)
+
+
+class FakeSupabase:
+    def __init__(self, latency=0.0, transient_failures=0):
+        self.latency = latency
+        self.transient_failures = transient_failures
+        self.calls = []
+        self.saved = []
+        self.lock = threading.Lock()
+
+    def table(self, name):
+        return types.SimpleNamespace(upsert=lambda rows, on_conflict=None: FakeUpsert(self, name, rows))
+
+
+def _manager(supabase, **kwargs):
+    kwargs.setdefault("retry_backoff", 0)
+    manager = DatabaseBatchManager(supabase, **kwargs)
+    manager.configure_table("ParishData", "parish_id,fact_type", timestamp_column=None)
+    return manager
+
+
+def _fact(parish_id, value, fact_type="AdorationSchedule", **extra):
+    return {"parish_id": parish_id, "fact_type": fact_type, "fact_value": value, **extra}
+
+
+def test_duplicate_keys_are_coalesced_and_row_shapes_kept_apart():
+    supabase = FakeSupabase()
+    manager = _manager(supabase, batch_size=10)
+
+    manager.add_record("ParishData", _fact(1, "Fri 9am", confidence_score=0.9))
+    manager.add_record("ParishData", _fact(1, "Fri 9am-5pm"))
+    manager.add_record("ParishData", _fact(2, "Tue 7pm"))
+    assert manager.get_pending_count("ParishData") == 2
+
+    assert manager.flush_all() == {"ParishData": True}
+
+    # The merged row keeps the earlier confidence score and never shares an upsert with a narrower row
+    assert sorted(len(call) for call in supabase.calls) == [1, 1]
+    assert _fact(1, "Fri 9am-5pm", confidence_score=0.9) in supabase.saved
+    assert manager.get_stats()["coalesced"] == 1
+
+
+def test_transient_errors_are_retried_and_poison_records_isolated():
+    supabase = FakeSupabase(transient_failures=1)
+    manager = _manager(supabase, batch_size=8, max_retries=1)
+    outcomes = {}
+
+    def on_result(record, saved):
+        outcomes[record["parish_id"]] = saved
+
+    for parish_id in range(8):
+        value = "poison" if parish_id == 5 else f"Sat {parish_id}pm"
+        manager.add_record("ParishData", _fact(parish_id, value), on_result=on_result)
+
+    assert manager.get_pending_count() == 0
+    assert outcomes == {parish_id: parish_id != 5 for parish_id in range(8)}
+    assert manager.failed_records["ParishData"] == [_fact(5, "poison")]
+
+    stats = manager.get_stats()
+    assert stats["retries"] == 1 and stats["dead_letters"] == 1 and stats["total_records"] == 7
+
+
+def test_write_behind_flushes_on_age_without_blocking_the_caller():
+    supabase = FakeSupabase(latency=0.2)
+    manager = _manager(supabase, batch_size=50, write_behind=True, max_batch_age=0.05)
+    written = threading.Event()
+
+    started = time.monotonic()
+    manager.add_record("ParishData", _fact(1, "Sun 3pm"), on_result=lambda record, saved: written.set())
+    assert time.monotonic() - started < 0.1
+
+    assert written.wait(timeout=2)
+    assert manager.get_stats()["flush_triggers"] == {"age": 1}
+    manager.close()
+
+
+def test_full_queue_applies_backpressure_and_close_drains_it():
+    supabase = FakeSupabase(latency=0.1)
+    manager = _manager(supabase, batch_size=2, write_behind=True, max_queue_records=2, max_batch_age=10)
+
+    for parish_id in range(6):
+        manager.add_record("ParishData", _fact(parish_id, f"Wed {parish_id}pm"))
+        assert manager.get_stats()["queue_depth"] <= 2
+
+    manager.close()
+
+    stats = manager.get_stats()
+    assert len(supabase.saved) == 6
+    assert stats["backpressure_waits"] >= 1
+    assert stats["queue_depth"] == 0
+    assert sum(stats["flush_latency_histogram"].values()) == stats["total_batches"]
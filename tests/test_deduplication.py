@@ -11,7 +11,7 @@ import sys
 
 sys.path.append(".")
 
-from core.deduplication import ParishDeduplicator
+from core.deduplication import ParishDeduplicator, soundex
 
 
 # Mock Parish class for testing
@@ -143,6 +143,50 @@ def test_similarity_calculation():
     print("   ✅ Similarity calculation test passed\n")
 
 
+def test_transitive_duplicates_collapse():
+    """Test that chains of duplicates merge into a single parish."""
+    print("🔍 Testing transitive duplicate merging...")
+
+    parishes = [
+        MockParish("St. Cecilia Parish", phone="(555) 111-2222"),
+        MockParish("Saint Cecilia Church", phone="555-111-2222", website="https://stcecilia.org"),
+        MockParish("St Cecilia Catholic Church", website="https://www.stcecilia.org"),
+        MockParish("Holy Trinity Parish"),
+    ]
+
+    deduplicator = ParishDeduplicator(name_similarity_threshold=0.85)
+    unique_parishes, metrics = deduplicator.deduplicate_parishes(parishes)
+
+    assert [p.name for p in unique_parishes] == ["St. Cecilia Parish", "Holy Trinity Parish"]
+    assert unique_parishes[0].website == "https://stcecilia.org"
+    assert metrics.duplicates_removed == 2
+    print("   ✅ Transitive merging test passed\n")
+
+
+def test_blocking_limits_comparisons():
+    """Test that only parishes sharing a blocking key are compared."""
+    print("🔍 Testing blocking index...")
+
+    names = ["Cecilia", "Augustine", "Benedict", "Dominic", "Gregory", "Lawrence", "Martin", "Nicholas", "Raphael"]
+    parishes = [MockParish(f"St. {name} Parish", phone=f"(555) 200-00{i:02d}") for i, name in enumerate(names)]
+    parishes.append(MockParish("Saint Cecilia Church", phone="555-200-0000"))
+
+    deduplicator = ParishDeduplicator()
+    unique_parishes, metrics = deduplicator.deduplicate_parishes(parishes)
+
+    print(f"   📊 Comparisons: {metrics.comparisons}")
+    assert metrics.duplicates_removed == 1
+    assert metrics.comparisons == 1
+    print("   ✅ Blocking index test passed\n")
+
+
+def test_soundex_groups_spelling_variants():
+    """Test the phonetic key used for name blocking."""
+    assert soundex("Michael") == soundex("Micheal") == "M240"
+    assert soundex("Ashcraft") == "A261"
+    assert soundex("") == ""
+
+
 if __name__ == "__main__":
     print("🧪 Testing Enhanced Parish Deduplication System")
     print("=" * 60)
@@ -153,6 +197,9 @@ if __name__ == "__main__":
         test_basic_deduplication()
         test_address_based_deduplication()
         test_phone_website_matching()
+        test_transitive_duplicates_collapse()
+        test_blocking_limits_comparisons()
+        test_soundex_groups_spelling_variants()
 
         print("🎉 All deduplication tests passed!")
         print("✅ The enhanced deduplication system is working correctly.")
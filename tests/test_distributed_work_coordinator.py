@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for DistributedWorkCoordinator diocese selection and atomic work claims.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from core.distributed_work_coordinator import DistributedWorkCoordinator
+
+
+class FakeQuery:
+    """Minimal stand-in for a Supabase query builder over in-memory rows."""
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.filters = []
+        self.insert_rows = None
+        self.start, self.end = 0, None
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def range(self, start, end):
+        self.start, self.end = start, end
+        return self
+
+    def insert(self, rows):
+        self.insert_rows = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def execute(self):
+        self.db.queries.append(self.table)
+        rows = self.db.tables.setdefault(self.table, [])
+        if self.insert_rows is not None:
+            for row in self.insert_rows:
+                if any(r["diocese_id"] == row["diocese_id"] and r["status"] == "processing" for r in rows):
+                    raise Exception("duplicate key value violates unique constraint")
+            rows.extend(self.insert_rows)
+            return type("Response", (), {"data": self.insert_rows})()
+        matched = [row for row in rows if all(f(row) for f in self.filters)]
+        end = len(matched) if self.end is None else self.end + 1
+        return type("Response", (), {"data": matched[self.start : end]})()
+
+
+class FakeSupabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params):
+        raise Exception("function claim_diocese_work does not exist")
+
+
+def _make_db(num_dioceses=50):
+    return FakeSupabase(
+        {
+            "Dioceses": [{"id": i, "Name": f"Diocese {i}", "Website": f"https://d{i}.org"} for i in range(1, num_dioceses + 1)],
+            "DiocesesParishDirectory": [
+                {"diocese_url": f"https://d{i}.org", "parish_directory_url": f"https://d{i}.org/parishes"}
+                for i in range(1, num_dioceses + 1)
+                if i % 5
+            ],
+            "DioceseParishDirectoryOverride": [{"diocese_id": 5, "parish_directory_url": "https://d5.org/override"}],
+            "diocese_work_assignments": [{"diocese_id": 1, "worker_id": "other", "status": "processing"}],
+        }
+    )
+
+
+def _make_coordinator(db, worker_id):
+    with patch("core.distributed_work_coordinator.get_supabase_client", return_value=db):
+        return DistributedWorkCoordinator(worker_id=worker_id)
+
+
+def test_selection_uses_constant_number_of_queries():
+    """Directory URLs, overrides and assignments are fetched in bulk, not per diocese."""
+    db = _make_db(num_dioceses=50)
+    coordinator = _make_coordinator(db, "worker-a")
+
+    available = asyncio.run(coordinator._get_unassigned_dioceses())
+
+    assert len(db.queries) == 4
+    ids = [d["id"] for d in available]
+    assert 1 not in ids  # already assigned
+    assert 10 not in ids  # no directory URL
+    assert ids == sorted(ids)
+    assert next(d for d in available if d["id"] == 5)["parish_directory_url"] == "https://d5.org/override"
+
+
+def test_concurrent_workers_never_double_assign():
+    """Two workers claiming from the same candidate list receive disjoint dioceses."""
+    db = _make_db(num_dioceses=10)
+    worker_a = _make_coordinator(db, "worker-a")
+    worker_b = _make_coordinator(db, "worker-b")
+
+    candidates = asyncio.run(worker_a._get_unassigned_dioceses())
+    claimed_a = asyncio.run(worker_a._claim_dioceses(candidates, 3))
+    claimed_b = asyncio.run(worker_b._claim_dioceses(candidates, 3))
+
+    ids_a = {d["id"] for d in claimed_a}
+    ids_b = {d["id"] for d in claimed_b}
+    assert len(ids_a) == 3 and len(ids_b) == 3
+    assert not ids_a & ids_b
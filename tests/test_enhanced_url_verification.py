@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for host-level batched URL verification in EnhancedURLManager.
+"""
+
+import threading
+import types
+
+import pytest
+
+from core import enhanced_url_manager
+from core.enhanced_url_manager import EnhancedURLManager, URLCandidate
+from core.intelligent_cache_manager import IntelligentCacheManager
+from core.robust_error_handler import get_error_handler
+
+
+class RecordingTimeoutManager:
+    def get_optimal_timeout(self, url, operation_type=None, context=None):
+        return 5.0
+
+    def record_response(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = EnhancedURLManager.__new__(EnhancedURLManager)
+    manager.cache_manager = IntelligentCacheManager(cache_dir=str(tmp_path))
+    manager.timeout_manager = RecordingTimeoutManager()
+    manager.error_handler = get_error_handler()
+    return manager
+
+
+@pytest.fixture
+def network(monkeypatch):
+    calls = {"dns": [], "head": []}
+    lock = threading.Lock()
+
+    def getaddrinfo(host, port):
+        with lock:
+            calls["dns"].append(host)
+        if host.startswith("missing"):
+            raise enhanced_url_manager.socket.gaierror("no such host")
+        return [("addr",)]
+
+    def head(url, timeout=None, allow_redirects=True):
+        with lock:
+            calls["head"].append(url)
+        # http-only.org has no TLS listener
+        if url.startswith("https://http-only.org"):
+            raise ConnectionError("refused")
+        elapsed = types.SimpleNamespace(total_seconds=lambda: 0.1)
+        return types.SimpleNamespace(status_code=200, elapsed=elapsed)
+
+    monkeypatch.setattr(enhanced_url_manager.socket, "getaddrinfo", getaddrinfo)
+    monkeypatch.setattr(enhanced_url_manager.requests, "head", head)
+    return calls
+
+
+def _candidates(*urls):
+    return [URLCandidate(url=url, parish_id=1, priority_score=10 - i) for i, url in enumerate(urls)]
+
+
+def test_each_host_is_resolved_and_probed_once(manager, network):
+    candidates = _candidates(
+        "http://parish.org/confession",
+        "https://http-only.org/mass-times",
+        "http://parish.org/adoration",
+        "http://parish.org/bulletin",
+        "https://http-only.org/",
+        "https://missing.org/",
+    )
+
+    verified = manager._verify_url_candidates(candidates)
+
+    assert [c.url for c in verified] == [
+        "https://parish.org/confession",
+        "http://http-only.org/mass-times",
+        "https://parish.org/adoration",
+        "https://parish.org/bulletin",
+        "http://http-only.org/",
+    ]
+    assert all(c.protocol_verified for c in verified)
+    assert sorted(network["dns"]) == ["http-only.org", "missing.org", "parish.org"]
+    assert sorted(network["head"]) == [
+        "http://http-only.org/mass-times",
+        "https://http-only.org/mass-times",
+        "https://parish.org/confession",
+    ]
+
+
+def test_resolver_and_scheme_answers_are_shared_across_calls(manager, network):
+    manager._verify_url_candidates(_candidates("http://parish.org/", "https://missing.org/"))
+    network["dns"].clear()
+    network["head"].clear()
+
+    verified = manager._verify_url_candidates(_candidates("http://parish.org/events", "https://missing.org/contact"))
+
+    assert [c.url for c in verified] == ["https://parish.org/events"]
+    assert network["dns"] == [] and network["head"] == []
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the static-HTML fast path and its per-domain fetch path memory.
+"""
+
+import types
+
+import pytest
+
+from core.hybrid_fetcher import PATH_BROWSER, PATH_HTTP, DeferredPageDriver, HybridPageFetcher, has_static_content
+from core.intelligent_cache_manager import IntelligentCacheManager
+from pipeline.parish_extraction_core import PatternDetector
+
+STATIC_PAGE = "<html><body><ul>" + "".join(
+    f"<li class='site'>St. Parish {i} - 100 Main Street, Springfield</li>" for i in range(10)
+) + "</ul></body></html>"
+SCRIPT_PAGE = "<html><head><script src='/finder.js'></script></head><body><div id='app'></div></body></html>"
+
+
+class FakeHTTPClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        if url not in self.pages:
+            raise ConnectionError("refused")
+        return types.SimpleNamespace(text=self.pages[url], headers={"Content-Type": "text/html; charset=utf-8"})
+
+
+@pytest.fixture
+def make_fetcher(tmp_path):
+    cache = IntelligentCacheManager(cache_dir=str(tmp_path))
+
+    def make(pages):
+        return HybridPageFetcher(http_client=FakeHTTPClient(pages), cache=cache)
+
+    return make
+
+
+def _browser(calls, html="<html><body>rendered</body></html>"):
+    def load():
+        calls.append("browser")
+        return html
+
+    return load
+
+
+def test_static_pages_skip_the_browser(make_fetcher):
+    fetcher = make_fetcher({"https://diocese.org/parishes": STATIC_PAGE})
+    calls = []
+
+    html, path = fetcher.fetch("https://diocese.org/parishes", _browser(calls), PatternDetector()._requires_javascript)
+
+    assert (html, path) == (STATIC_PAGE, PATH_HTTP)
+    assert calls == []
+    assert fetcher.preferred_path("https://diocese.org/other") == PATH_HTTP
+
+
+def test_script_driven_page_falls_back_and_domain_is_remembered(make_fetcher):
+    fetcher = make_fetcher({"https://finder.org/parishes": SCRIPT_PAGE})
+    calls = []
+
+    _, path = fetcher.fetch("https://finder.org/parishes", _browser(calls), PatternDetector()._requires_javascript)
+    assert path == PATH_BROWSER and calls == ["browser"]
+
+    # The next page on the domain goes straight to the browser without an HTTP attempt
+    _, path = fetcher.fetch("https://finder.org/parish/1", _browser(calls))
+    assert path == PATH_BROWSER
+    assert fetcher.http_client.requested == ["https://finder.org/parishes"]
+    assert fetcher.get_stats()["skipped_http"] == 1
+
+
+def test_missing_listing_selectors_reject_static_copy():
+    assert has_static_content(STATIC_PAGE, "li.site, .parish-card")
+    assert not has_static_content(STATIC_PAGE, ".parish-card")
+    assert not has_static_content(SCRIPT_PAGE)
+
+
+def test_deferred_driver_loads_page_only_when_touched():
+    loads = []
+    raw = types.SimpleNamespace(page_source="<html>rendered</html>", get=lambda url: loads.append(("get", url)))
+    deferred = DeferredPageDriver(raw, "https://diocese.org/parishes", lambda d, url: loads.append(("load", url)))
+
+    assert not deferred.page_loaded and loads == []
+    assert deferred.page_source == "<html>rendered</html>"
+    assert loads == [("load", "https://diocese.org/parishes")]
+
+    deferred.get("https://diocese.org/parish/1")
+    assert loads[-1] == ("get", "https://diocese.org/parish/1")
+
+
+def test_failed_request_does_not_pin_the_browser(make_fetcher):
+    fetcher = make_fetcher({})
+    calls = []
+
+    _, path = fetcher.fetch("https://flaky.org/parishes", _browser(calls))
+    assert path == PATH_BROWSER and calls == ["browser"]
+    assert fetcher.preferred_path("https://flaky.org/parishes") is None
+
+    fetcher.fetch("https://flaky.org/parish/1", _browser(calls))
+    assert fetcher.http_client.requested == ["https://flaky.org/parishes", "https://flaky.org/parish/1"]
+
+
+def test_rejected_static_copy_pins_only_after_browser_success(make_fetcher):
+    fetcher = make_fetcher({"https://finder.org/parishes": SCRIPT_PAGE})
+
+    assert fetcher.try_static("https://finder.org/parishes", PatternDetector()._requires_javascript) is None
+    assert fetcher.preferred_path("https://finder.org/parishes") is None
+
+    def broken_browser():
+        raise RuntimeError("browser down")
+
+    with pytest.raises(RuntimeError):
+        fetcher.fetch("https://finder.org/parishes", broken_browser)
+    assert fetcher.preferred_path("https://finder.org/parishes") is None
+
+    fetcher.record_browser_success("https://finder.org/parishes")
+    assert fetcher.preferred_path("https://finder.org/parish/2") == PATH_BROWSER
+
+
+def test_browser_decision_expires_sooner_than_http(make_fetcher):
+    ttls = []
+    fetcher = make_fetcher({})
+    fetcher.cache = types.SimpleNamespace(
+        get=lambda key, default=None: None,
+        set=lambda key, value, ttl, content_type: ttls.append((value, ttl)),
+    )
+
+    fetcher.record_path("https://a.org/", PATH_HTTP)
+    fetcher.record_path("https://b.org/", PATH_BROWSER)
+
+    assert ttls == [(PATH_HTTP, 14 * 86400), (PATH_BROWSER, 24 * 3600)]
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for the two-tier (memory + SQLite) IntelligentCacheManager.
+"""
+
+import os
+
+from core.intelligent_cache_manager import ContentType, IntelligentCacheManager
+
+
+def _manager(cache_dir, **kwargs) -> IntelligentCacheManager:
+    return IntelligentCacheManager(cache_dir=str(cache_dir), **kwargs)
+
+
+def test_values_survive_restart(tmp_path):
+    first = _manager(tmp_path)
+    first.set("https://parish.org/sitemap.xml", "<urlset/>" * 500, content_type=ContentType.HTML_PAGE)
+    first.set("dns:parish.org", True, content_type=ContentType.DNS_RESULT)
+    first.close()
+
+    second = _manager(tmp_path)
+    assert second.get("https://parish.org/sitemap.xml") == "<urlset/>" * 500
+    assert second.get("dns:parish.org") is True
+    assert second.get_statistics()["disk_hits"] == 2
+
+
+def test_identical_payloads_are_stored_once(tmp_path):
+    cache = _manager(tmp_path)
+    page = "<html>Mass times</html>" * 100
+    cache.set("https://parish.org/", page)
+    cache.set("https://www.parish.org/", page)
+
+    disk_stats = cache.get_statistics()["disk"]
+    assert disk_stats["entries"] == 2
+    assert disk_stats["unique_payloads"] == 1
+
+
+def test_memory_eviction_falls_back_to_disk(tmp_path):
+    cache = _manager(tmp_path, max_size=2)
+    for i in range(4):
+        cache.set(f"key{i}", f"value{i}", content_type=ContentType.API_RESPONSE)
+
+    assert "key0" not in cache._cache
+    assert cache.get("key0") == "value0"
+    assert "key0" in cache._cache
+
+
+def test_disk_tier_is_size_bounded(tmp_path):
+    cache = _manager(tmp_path, max_disk_mb=1)
+    cache.disk.size_check_interval = 1
+    for i in range(20):
+        cache.set(f"page{i}", os.urandom(100 * 1024), compress=False)
+
+    assert cache.disk.total_size() <= 1024 * 1024
+    assert cache.disk.get("page19") is not None
+    assert cache.disk.get("page0") is None
+
+
+def test_invalidation_reaches_disk_and_warm_start(tmp_path):
+    shared = _manager(tmp_path / "shared")
+    shared.set("https://a.org/", "a")
+    shared.set("https://b.org/", "b")
+    shared.close()
+
+    local = _manager(tmp_path / "local", warm_start_from=str(tmp_path / "shared" / "cache.sqlite3"))
+    assert local.get("https://b.org/") == "b"
+
+    assert local.invalidate_pattern(r"a\.org") == 1
+    local.close()
+    assert _manager(tmp_path / "local").get("https://a.org/") is None
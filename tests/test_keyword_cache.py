@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the process-wide ScheduleKeywords cache and its invalidation.
+"""
+
+import types
+
+import pytest
+
+from core import schedule_keywords
+from core.schedule_keywords import (
+    get_all_keywords_for_priority_calculation,
+    get_keyword_cache_stats,
+    get_keyword_matchers,
+    invalidate_keyword_cache,
+    load_keywords_from_database,
+    update_keyword_weight,
+)
+
+ROWS = [
+    {"keyword": "confession", "schedule_type": "reconciliation", "weight": 5, "is_negative": False},
+    {"keyword": "adoration", "schedule_type": "adoration", "weight": 5, "is_negative": False},
+    {"keyword": "schedule", "schedule_type": "all", "weight": 3, "is_negative": False},
+    {"keyword": "donate", "schedule_type": "all", "weight": 1, "is_negative": True},
+]
+
+
+class FakeQuery:
+    def __init__(self, db, update=None):
+        self.db = db
+        self.update_values = update
+
+    def select(self, columns):
+        return self
+
+    def update(self, values):
+        return FakeQuery(self.db, values)
+
+    def eq(self, column, value):
+        return self
+
+    def execute(self):
+        if self.update_values is not None:
+            self.db.rows[0] = {**self.db.rows[0], **self.update_values}
+            return types.SimpleNamespace(data=[self.db.rows[0]])
+        self.db.queries += 1
+        if self.db.fail:
+            raise ConnectionError("database unavailable")
+        return types.SimpleNamespace(data=[dict(row) for row in self.db.rows])
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.rows = list(ROWS)
+        self.queries = 0
+        self.fail = False
+
+    def table(self, name):
+        return FakeQuery(self)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    invalidate_keyword_cache()
+    yield
+    invalidate_keyword_cache()
+
+
+def test_steady_state_needs_no_keyword_queries():
+    supabase = FakeSupabase()
+
+    keyword_sets = load_keywords_from_database(supabase)
+    all_keywords = get_all_keywords_for_priority_calculation(supabase)
+    for _ in range(5):  # later parishes
+        assert load_keywords_from_database(supabase) is keyword_sets
+        assert get_all_keywords_for_priority_calculation(supabase) is all_keywords
+
+    assert supabase.queries == 1
+    assert all_keywords == {"confession": 5, "adoration": 5, "schedule": 3}
+    # Compiled matchers are cached along with the tables
+    assert get_keyword_matchers(keyword_sets, all_keywords) is get_keyword_matchers(keyword_sets)
+    assert get_keyword_cache_stats()["hits"] >= 11
+
+
+def test_keyword_changes_and_ttl_expiry_reload_the_tables(monkeypatch):
+    supabase = FakeSupabase()
+    first = load_keywords_from_database(supabase)
+
+    assert update_keyword_weight(supabase, "confession", "reconciliation", 9)
+    reloaded = load_keywords_from_database(supabase)
+    assert supabase.queries == 2
+    assert reloaded[0]["confession"] == 9
+    assert get_keyword_matchers(reloaded).version != get_keyword_matchers(first).version
+
+    monkeypatch.setattr(schedule_keywords.config, "SCHEDULE_KEYWORDS_CACHE_TTL_SECONDS", 0)
+    load_keywords_from_database(supabase)
+    assert supabase.queries == 3
+
+
+def test_failed_refresh_keeps_cached_tables(monkeypatch):
+    supabase = FakeSupabase()
+    cached = load_keywords_from_database(supabase)
+    errors_before = get_keyword_cache_stats()["errors"]
+
+    supabase.fail = True
+    monkeypatch.setattr(schedule_keywords.config, "SCHEDULE_KEYWORDS_CACHE_TTL_SECONDS", 0)
+    assert load_keywords_from_database(supabase) is cached
+
+    invalidate_keyword_cache()
+    fallback = load_keywords_from_database(supabase)
+    assert fallback == schedule_keywords.get_fallback_keywords()
+    assert get_keyword_cache_stats()["errors"] == errors_before + 2
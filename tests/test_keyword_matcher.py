@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled keyword matcher and the schedule keyword scorers built on it.
+"""
+
+import random
+
+from core.keyword_matcher import KeywordMatcher
+from core.schedule_keywords import get_fallback_keywords, get_keyword_matchers, merge_priority_keywords
+from pipeline.extract_schedule import calculate_priority
+
+
+def test_matcher_agrees_with_substring_checks_including_overlaps():
+    keywords = ["mass", "masses", "ass", "sat", "saturday", "day", "hour", "hours", "our", "ur", "x.y"]
+    matcher = KeywordMatcher(keywords)
+
+    assert matcher.find("/holy-hours/saturday-masses") == set(keywords) - {"x.y"}
+    assert matcher.find("x-y") == set()  # keywords are literal, not regex
+
+    rng = random.Random(7)
+    for _ in range(500):
+        text = "".join(rng.choice("masturdyhox.-") for _ in range(rng.randint(0, 40)))
+        assert matcher.find(text) == {keyword for keyword in keywords if keyword in text}
+        assert matcher.contains_any(text) == any(keyword in text for keyword in keywords)
+
+
+def test_compiled_priority_matches_the_keyword_loop_and_is_built_once_per_version():
+    keyword_sets = get_fallback_keywords()
+    all_keywords = merge_priority_keywords(keyword_sets)
+    matchers = get_keyword_matchers(keyword_sets, all_keywords)
+
+    urls = [
+        "https://parish.org/sacraments/reconciliation-schedule",
+        "https://www.parish.org/mass-times/sunday",
+        "https://other.org/giving/donate-adoration",
+        "https://parish.org/",
+    ]
+    for url in urls:
+        assert calculate_priority(url, all_keywords, [], "parish.org", scorer=matchers.priority) == calculate_priority(
+            url, all_keywords, [], "parish.org"
+        )
+        recon_kw, recon_neg = keyword_sets[0], keyword_sets[1]
+        assert calculate_priority(url, recon_kw, recon_neg, scorer=matchers.by_type["reconciliation"]) == calculate_priority(
+            url, recon_kw, recon_neg
+        )
+
+    assert get_keyword_matchers(keyword_sets, all_keywords) is matchers
+
+    changed = (dict(keyword_sets[0], penance=4),) + keyword_sets[1:]
+    rebuilt = get_keyword_matchers(changed)
+    assert rebuilt.version != matchers.version
+    assert rebuilt.by_type["reconciliation"].score("/penance") == 4
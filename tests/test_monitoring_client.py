@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for MonitoringClient's background batched sender.
+"""
+
+import threading
+import time
+
+from core.monitoring_client import MonitoringClient
+
+
+class RecordingSession:
+    """Stands in for requests.Session, optionally blocking or returning a fixed status."""
+
+    def __init__(self, status_code=200, delay=0.0):
+        self.posts = []
+        self.status_code = status_code
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def post(self, url, json=None):
+        time.sleep(self.delay)
+        with self.lock:
+            self.posts.append((url, json))
+        status_code = self.status_code
+        return type("Response", (), {"status_code": status_code, "raise_for_status": lambda self: None})()
+
+
+def _client(session, **kwargs) -> MonitoringClient:
+    client = MonitoringClient("http://dashboard", worker_id="w1", **kwargs)
+    client.session = session
+    return client
+
+
+def test_updates_are_batched_and_status_coalesced():
+    session = RecordingSession()
+    client = _client(session, flush_interval=60)
+
+    for processed in range(1, 6):
+        client.update_extraction_status("running", parishes_processed=processed)
+        client.send_log(f"parish {processed} saved")
+    assert session.posts == []  # nothing is sent from the calling thread
+
+    assert client.flush(timeout=5)
+    client.close()
+
+    assert len(session.posts) == 1
+    url, body = session.posts[0]
+    assert url == "http://dashboard/api/monitoring/batch"
+    assert body["worker_id"] == "w1"
+    statuses = [item for item in body["items"] if item["endpoint"] == "/extraction_status"]
+    logs = [item["data"]["message"] for item in body["items"] if item["endpoint"] == "/log"]
+    assert len(statuses) == 1 and statuses[0]["data"]["parishes_processed"] == 5
+    assert logs == [f"parish {i} saved" for i in range(1, 6)]
+    assert client.get_telemetry_stats()["coalesced"] == 4
+
+
+def test_slow_backend_does_not_block_callers():
+    client = _client(RecordingSession(delay=0.5), flush_interval=0.01)
+    client.send_log("warm up")
+    time.sleep(0.05)  # the sender is now stuck in a slow POST
+
+    started = time.monotonic()
+    for i in range(50):
+        client.send_log(f"line {i}")
+    assert time.monotonic() - started < 0.1
+    client.close(timeout=0.1)
+
+
+def test_backpressure_samples_info_logs_but_keeps_warnings():
+    client = _client(RecordingSession(), max_buffer=10, pressure_sample_rate=5, flush_interval=60)
+    client._ensure_sender = lambda: None  # keep everything in the buffer
+
+    for i in range(8):
+        client.send_log(f"info {i}")
+    accepted = [client.send_log(f"info late {i}") for i in range(5)]
+    client.send_log("something broke", "WARNING")
+
+    stats = client.get_telemetry_stats()
+    assert accepted.count(True) == 1
+    assert stats["sampled_out"] == 4
+    assert client._events[-1][1]["message"] == "something broke"
+
+
+def test_falls_back_to_individual_requests_without_batch_endpoint():
+    session = RecordingSession(status_code=404)
+    client = _client(session, flush_interval=60)
+    client.send_log("hello")
+    client.report_error("Timeout", "parish site timed out")
+    client.flush(timeout=5)
+    client.close()
+
+    urls = [url for url, _ in session.posts]
+    assert urls == [
+        "http://dashboard/api/monitoring/batch",
+        "http://dashboard/api/monitoring/log",
+        "http://dashboard/api/monitoring/error",
+    ]
+
+
+def test_synchronous_mode_posts_immediately():
+    session = RecordingSession()
+    client = _client(session, background=False)
+    assert client.update_extraction_status("running")
+    assert session.posts[0][0] == "http://dashboard/api/monitoring/worker/w1/extraction_status"
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for conditional fetching and page change detection in the schedule crawl.
+"""
+
+import asyncio
+
+import httpx
+
+from core.async_crawler import AsyncCrawler
+from pipeline.extract_schedule import _process_page, fetch_page_async
+from tests.conftest import RecordingVisitTracker, make_crawl_state, make_visit_result
+
+PAGE = b"<html><body>Confession Saturday 3:30 PM <a href='/adoration'>Adoration</a></body></html>"
+
+
+def test_validators_are_sent_and_304_serves_stored_body(page_tracker):
+    url = "https://parish.org/confession"
+    assert page_tracker.conditional_headers(url) == {}
+
+    first = page_tracker.resolve(url, 200, {"etag": '"v1"', "last-modified": "Wed, 01 Oct 2026 10:00:00 GMT"}, PAGE)
+    assert not first.unchanged
+    assert page_tracker.conditional_headers(url) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Oct 2026 10:00:00 GMT",
+    }
+
+    cached = page_tracker.resolve(url, 304, {}, b"")
+    assert cached.unchanged and cached.content == PAGE
+    assert page_tracker.get_stats()["not_modified"] == 1
+
+
+def test_identical_body_is_unchanged_and_new_body_drops_outcome(page_tracker):
+    url = "https://parish.org/confession"
+    page_tracker.resolve(url, 200, {}, PAGE)
+    page_tracker.record_outcome(url, {"schedule_types": ["reconciliation"], "links": []})
+
+    same = page_tracker.resolve(url, 200, {}, PAGE)
+    assert same.unchanged and same.outcome["schedule_types"] == ["reconciliation"]
+
+    edited = page_tracker.resolve(url, 200, {}, PAGE.replace(b"3:30", b"4:00"))
+    assert not edited.unchanged and edited.outcome is None
+    assert not page_tracker.has_outcome(url)
+
+
+def test_unchanged_page_replays_findings_without_extraction(page_tracker):
+    url = "https://parish.org/confession"
+    calls = []
+
+    def extract_fn(page_url, schedule_type, content):
+        calls.append(schedule_type)
+        confidence = 80 if schedule_type == "reconciliation" else 0
+        return {"confidence": confidence, "info": "Saturday 3:30 PM"}, True
+
+    first_state = make_crawl_state()
+    first_page = page_tracker.resolve(url, 200, {}, PAGE)
+    _process_page(first_state, url, first_page, RecordingVisitTracker(), make_visit_result(), extract_fn)
+    assert calls == ["reconciliation", "adoration", "mass"]
+
+    calls.clear()
+    second_state = make_crawl_state()
+    visit_result = make_visit_result()
+    second_page = page_tracker.resolve(url, 304, {}, b"")
+    _process_page(second_state, url, second_page, RecordingVisitTracker(), visit_result, extract_fn)
+
+    assert calls == []
+    assert second_state.candidate_pages == first_state.candidate_pages
+    assert sorted(second_state.urls_to_visit) == sorted(first_state.urls_to_visit)
+    assert visit_result.schedule_data_found is True
+
+
+def test_async_fetch_sends_validators_and_handles_304(page_tracker):
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=PAGE, headers={"ETag": '"v1"'})
+
+    async def run():
+        async with AsyncCrawler(["test-agent"], transport=httpx.MockTransport(handler)) as crawler:
+            first = await fetch_page_async(crawler, "https://parish.org/confession")
+            second = await fetch_page_async(crawler, "https://parish.org/confession")
+            return first, second, crawler.get_stats()
+
+    first, second, stats = asyncio.run(run())
+    assert seen_headers == [None, '"v1"']
+    assert not first.unchanged
+    assert second.unchanged and second.content == PAGE
+    assert stats["failed_fetches"] == 0
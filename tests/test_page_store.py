@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the fetch-once page store used by the schedule crawl.
+"""
+
+import types
+
+import pytest
+
+from core.page_store import PageStore
+from pipeline import extract_schedule
+from pipeline.extract_schedule import _build_schedule_result, _process_page, _store_extractors
+from tests.conftest import RecordingVisitTracker, make_crawl_state, make_visit_result
+
+PAGE = b"<html><body><p>Reconciliation Saturday 3:30 PM</p><a href='/adoration'>Adoration</a></body></html>"
+
+
+@pytest.fixture
+def keyword_extraction_only(monkeypatch):
+    # No model configured, so extraction goes straight to the keyword fallback
+    monkeypatch.setattr(extract_schedule, "get_ai_extractor", lambda: types.SimpleNamespace(model=None))
+
+
+def test_store_is_keyed_by_normalized_url_and_parses_lazily():
+    store = PageStore(max_parsed=1)
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return PAGE
+
+    page = store.get_or_fetch("https://www.parish.org/confession/", fetch)
+    assert store.get_or_fetch("https://parish.org/confession", fetch) is page
+    assert fetched == ["https://www.parish.org/confession/"]
+    assert store.get_stats()["parses"] == 0
+
+    assert page.soup is page.soup
+    assert "Saturday 3:30 PM" in page.text
+    store.put("https://parish.org/other", b"<p>Other</p>").soup
+    page.soup  # evicted by the newer tree, parsed again
+    assert store.get_stats()["parses"] == 3
+
+
+def test_crawled_page_is_fetched_and_parsed_once_for_every_consumer(page_tracker, keyword_extraction_only):
+    url = "https://parish.org/confession"
+    fetched = []
+    state = make_crawl_state()
+    extract_fn, legacy_fn = _store_extractors(state, lambda page_url: fetched.append(page_url) or PAGE)
+
+    page = page_tracker.resolve(url, 200, {}, PAGE)
+    _process_page(state, url, page, RecordingVisitTracker(), make_visit_result(), extract_fn)
+    assert state.candidate_pages["reconciliation"] == [url]
+
+    result = _build_schedule_result(state, {"reconciliation": url}, extract_fn, legacy_fn)
+    assert result["reconciliation_info"].startswith("Reconciliation Saturday 3:30 PM")
+    assert legacy_fn(url, "Reconciliation")[1] == result["reconciliation_fact_string"]
+
+    assert fetched == []
+    assert state.page_store.get_stats()["parses"] == 1
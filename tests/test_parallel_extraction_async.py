@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the asyncio scheduler mode of ParallelExtractionManager.
+"""
+
+import asyncio
+import hashlib
+import time
+
+import pytest
+
+from core.intelligent_cache_manager import IntelligentCacheManager
+from core.parallel_extraction_manager import ExtractionTask, ParallelExtractionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = ParallelExtractionManager(max_workers=4)
+    manager.cache_manager = IntelligentCacheManager(cache_dir=str(tmp_path))
+    return manager
+
+
+def _task(task_id, url, priority=1.0, max_retries=0):
+    return ExtractionTask(
+        task_id=task_id, url=url, parish_id=None, diocese_id=None, priority=priority, max_retries=max_retries
+    )
+
+
+def test_throttled_domain_does_not_hold_workers(manager):
+    manager.configure_domain_limits("slow.org", max_concurrent=1, requests_per_second=2.0, burst_limit=1)
+    for name in ("a.org", "b.org", "c.org"):
+        manager.configure_domain_limits(name, max_concurrent=2, requests_per_second=100.0, burst_limit=10)
+
+    tasks = [_task(f"slow-{i}", f"https://slow.org/{i}", priority=10) for i in range(3)]
+    tasks += [_task(f"{name}-{i}", f"https://{name}/{i}") for name in ("a.org", "b.org", "c.org") for i in range(4)]
+    manager.add_batch_tasks(tasks)
+    finished = {}
+
+    async def extract(task, timeout):
+        await asyncio.sleep(0.05)
+        finished[task.task_id] = time.monotonic()
+        return {"url": task.url}
+
+    results = manager.extract_parallel(extract, mode="async")
+
+    assert results["completed"] == 15 and results["failed"] == 0
+    # The two later slow.org requests wait 0.5s each for tokens; the fast domains finish meanwhile
+    last_fast = max(t for task_id, t in finished.items() if not task_id.startswith("slow"))
+    slow = sorted(t for task_id, t in finished.items() if task_id.startswith("slow"))
+    assert last_fast < slow[1] < slow[2]
+    assert results["duration"] < 1.5
+    assert results["throttled_dispatches"] >= 2
+
+
+def test_domain_concurrency_limit_is_respected(manager):
+    manager.configure_domain_limits("parish.org", max_concurrent=2, requests_per_second=100.0, burst_limit=10)
+    manager.add_batch_tasks([_task(str(i), f"https://parish.org/{i}") for i in range(8)])
+    running = {"now": 0, "peak": 0}
+
+    async def extract(task, timeout):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.02)
+        running["now"] -= 1
+        return {"ok": True}
+
+    results = manager.extract_parallel(extract, mode="async")
+
+    assert results["completed"] == 8
+    assert running["peak"] == 2
+    assert manager.domain_limits["parish.org"].active_requests == 0
+
+
+def test_timeouts_cancel_the_task_and_retries_are_rescheduled(manager):
+    manager.configure_domain_limits("parish.org", max_concurrent=2, requests_per_second=100.0, burst_limit=10)
+    manager.add_batch_tasks(
+        [_task("hangs", "https://parish.org/hangs"), _task("flaky", "https://parish.org/flaky", max_retries=1)]
+    )
+    attempts = []
+    cancelled = []
+
+    async def extract(task, timeout):
+        attempts.append(task.task_id)
+        if task.task_id == "hangs":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(task.task_id)
+                raise
+        if attempts.count("flaky") == 1:
+            raise ConnectionError("reset")
+        return {"ok": True}
+
+    results = manager.extract_parallel(extract, timeout_per_task=0.1, mode="async")
+
+    assert cancelled == ["hangs"]
+    assert attempts.count("flaky") == 2
+    assert set(results["completed_tasks"]) == {"flaky"}
+    assert set(results["failed_tasks"]) == {"hangs"}
+
+
+def test_cache_key_is_stable_across_processes(manager):
+    first = _task("a", "http://www.parish.org/", max_retries=0)
+    first.metadata = {"schedule": "mass", "depth": 2}
+    second = _task("b", "https://parish.org", max_retries=0)
+    second.metadata = {"depth": 2, "schedule": "mass"}
+
+    key = manager._extraction_cache_key(first)
+    digest = hashlib.sha256(b'https://parish.org\n{"depth": 2, "schedule": "mass"}').hexdigest()
+    assert key == manager._extraction_cache_key(second) == f"extraction:{digest}"
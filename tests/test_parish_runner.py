@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent Step 4 parish runner and its per-domain limits.
+"""
+
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline import extract_schedule
+from pipeline.extract_schedule import ParishProgress, run_parishes_concurrently
+
+PARISHES = [
+    ("https://www.stmary.org/", 1),
+    ("https://stmary.org/confession", 2),
+    ("https://stjoseph.org/", 3),
+    ("https://holycross.org/", 4),
+]
+
+
+class FakeScraper:
+    """Sleeps per parish and records how many parishes and same-domain parishes overlap."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.lock = threading.Lock()
+        self.running = set()
+        self.max_running = 0
+        self.stmary_overlap = False
+
+    def __call__(self, url, p_id):
+        with self.lock:
+            self.running.add(p_id)
+            self.max_running = max(self.max_running, len(self.running))
+            self.stmary_overlap |= {1, 2} <= self.running
+        time.sleep(self.delays[p_id])
+        with self.lock:
+            self.running.discard(p_id)
+        if p_id == 4:
+            raise RuntimeError("site down")
+        return {"url": url, "offers_reconciliation": True}
+
+
+def test_parishes_run_concurrently_but_one_at_a_time_per_domain():
+    scraper = FakeScraper({1: 0.15, 2: 0.01, 3: 0.05, 4: 0.01})
+    finished = []
+    callback_threads = set()
+
+    def on_result(url, p_id, result):
+        callback_threads.add(threading.current_thread())
+        finished.append(p_id)
+
+    results = run_parishes_concurrently(PARISHES, scraper, on_result, max_in_flight=3, max_per_domain=1)
+
+    assert scraper.max_running >= 2
+    assert not scraper.stmary_overlap
+    # Results are saved as they finish, while the slow site is still crawling
+    assert finished.index(3) < finished.index(1) and finished.index(4) < finished.index(1)
+    assert finished.index(2) > finished.index(1)
+    assert callback_threads == {threading.current_thread()}
+    # Returned in input order, with the failed parish recorded as an empty result
+    assert [r["url"] for r in results] == [url for url, _ in PARISHES]
+    assert results[3]["offers_reconciliation"] is False
+
+
+def test_single_slot_processes_parishes_in_order():
+    scraper = FakeScraper({1: 0.01, 2: 0.0, 3: 0.0, 4: 0.0})
+    finished = []
+
+    run_parishes_concurrently(PARISHES, scraper, lambda url, p_id, result: finished.append(p_id), max_in_flight=1)
+
+    assert finished == [1, 2, 3, 4]
+    assert scraper.max_running == 1
+
+
+def test_progress_reports_eta_once_parishes_complete():
+    progress = ParishProgress(4)
+    assert progress.eta_seconds() is None
+    assert "ETA unknown" in progress.describe()
+
+    progress.start_time -= 10
+    assert progress.complete() == 1
+    assert 25 <= progress.eta_seconds() <= 35
+    assert progress.describe().startswith("1/4 parishes done")
+
+
+def test_request_headers_do_not_touch_the_shared_session(monkeypatch):
+    monkeypatch.setattr(extract_schedule.time, "sleep", lambda seconds: None)
+    sent = []
+
+    class FakeSession:
+        headers = {"User-Agent": "session default"}
+
+        def get(self, url, **kwargs):
+            sent.append(kwargs["headers"])
+            return types.SimpleNamespace(status_code=200)
+
+    session = FakeSession()
+    extract_schedule.make_request_with_delay(session, "https://stmary.org/", headers={"If-None-Match": '"v1"'})
+
+    assert session.headers == {"User-Agent": "session default"}
+    assert sent[0]["User-Agent"] in extract_schedule.USER_AGENTS and sent[0]["If-None-Match"] == '"v1"'
+
+
+def test_ai_extractor_is_created_once_across_threads(monkeypatch):
+    created = []
+
+    def slow_extractor():
+        time.sleep(0.05)
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr(extract_schedule, "_ai_extractor", None)
+    monkeypatch.setattr(extract_schedule, "ScheduleAIExtractor", slow_extractor)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        extractors = list(pool.map(lambda _: extract_schedule.get_ai_extractor(), range(4)))
+
+    assert len(created) == 1 and all(extractor is created[0] for extractor in extractors)
+
+
+def test_single_slot_runs_on_the_calling_thread():
+    scrape_threads = []
+
+    def scrape(url, p_id):
+        scrape_threads.append(threading.current_thread())
+        return {"url": url}
+
+    run_parishes_concurrently(PARISHES, scrape, lambda url, p_id, result: None, max_in_flight=1)
+
+    assert scrape_threads == [threading.current_thread()] * len(PARISHES)
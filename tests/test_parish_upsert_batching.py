@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk insert/update detection and batch bisection in enhanced_safe_upsert_to_supabase.
+"""
+
+import types
+
+from pipeline.parish_extraction_core import ParishData, enhanced_safe_upsert_to_supabase
+
+
+class FakeQuery:
+    def __init__(self, db, action, payload=None):
+        self.db = db
+        self.action = action
+        self.payload = payload
+        self.filters = []
+
+    def eq(self, column, value):
+        self.filters.append((column, lambda v, value=value: v == value))
+        return self
+
+    def in_(self, column, values):
+        self.filters.append((column, lambda v, values=tuple(values): v in values))
+        return self
+
+    def execute(self):
+        self.db.calls.append((self.action, self.payload))
+        if self.action == "select":
+            rows = [row for row in self.db.rows if all(match(row.get(col)) for col, match in self.filters)]
+            return types.SimpleNamespace(data=rows)
+        if any(row["Name"] in self.db.rejected for row in self.payload):
+            raise Exception("violates check constraint")
+        for row in self.payload:
+            self.db.rows = [r for r in self.db.rows if r["Name"] != row["Name"]] + [row]
+        return types.SimpleNamespace(data=self.payload)
+
+
+class FakeTable:
+    def __init__(self, db):
+        self.db = db
+
+    def select(self, columns):
+        return FakeQuery(self.db, "select")
+
+    def upsert(self, rows, on_conflict=None):
+        return FakeQuery(self.db, "upsert", rows)
+
+
+class FakeSupabase:
+    def __init__(self, existing=(), rejected=()):
+        self.rows = [{"Name": name, "diocese_id": 7} for name in existing]
+        self.rejected = set(rejected)
+        self.calls = []
+
+    def table(self, name):
+        return FakeTable(self)
+
+
+class FakeMonitoring:
+    def __init__(self):
+        self.logs = []
+
+    def send_log(self, message, level):
+        self.logs.append(message)
+
+
+def _parishes(count):
+    return [ParishData(name=f"St. Parish {i}", city="Springfield") for i in range(count)]
+
+
+def _upsert(supabase, parishes, monitoring_client=None):
+    return enhanced_safe_upsert_to_supabase(
+        parishes, 7, "Diocese of Springfield", "https://diocese.org", "https://diocese.org/parishes", supabase, monitoring_client
+    )
+
+
+def test_insert_or_update_is_decided_by_one_prefetch():
+    supabase = FakeSupabase(existing=["St. Parish 1", "St. Parish 3"])
+    monitoring = FakeMonitoring()
+
+    assert _upsert(supabase, _parishes(5), monitoring)
+
+    assert [action for action, _ in supabase.calls] == ["select", "upsert"]
+    assert sum("Parish updated" in log for log in monitoring.logs) == 2
+    assert sum("Parish added" in log for log in monitoring.logs) == 3
+
+
+def test_failed_batch_is_bisected_down_to_the_bad_row():
+    supabase = FakeSupabase(rejected=["St. Parish 5"])
+    monitoring = FakeMonitoring()
+
+    assert _upsert(supabase, _parishes(8), monitoring)
+
+    upserts = [rows for action, rows in supabase.calls if action == "upsert"]
+    # Depth-first halving: only the halves containing the bad row are split further
+    assert [len(rows) for rows in upserts] == [8, 4, 4, 2, 1, 1, 2]
+    assert len(monitoring.logs) == 7
+    assert not any("St. Parish 5," in log for log in monitoring.logs)
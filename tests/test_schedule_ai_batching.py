@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for batched AI schedule extraction and the token bucket that paces it.
+"""
+
+import json
+import re
+import threading
+import time
+
+from core.schedule_ai_extractor import ScheduleAIExtractor, get_ai_rate_limiter
+from core.token_bucket import TokenBucket
+
+
+class FakeModel:
+    """Answers batched prompts per page id; optionally drops one page from the answer."""
+
+    def __init__(self, skip_page_id=None):
+        self.prompts = []
+        self.skip_page_id = skip_page_id
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+
+        page_ids = re.findall(r"=== PAGE (\d+) \((.*?)\) ===", prompt)
+        if page_ids:
+            results = [
+                {"page_id": page_id, "schedule_found": True, "times": [url], "confidence_score": 90}
+                for page_id, url in page_ids
+                if page_id != self.skip_page_id
+            ]
+            text = json.dumps({"results": results})
+        else:
+            text = json.dumps({"schedule_found": True, "times": ["single"], "confidence_score": 80})
+        return type("Response", (), {"text": text})()
+
+
+def _extractor(model) -> ScheduleAIExtractor:
+    extractor = ScheduleAIExtractor.__new__(ScheduleAIExtractor)
+    extractor.model = model
+    return extractor
+
+
+def _pages(count):
+    return [(f"https://parish{i}.org/mass", i, f"<p>Sunday Mass {i}:00 AM</p>") for i in range(count)]
+
+
+def test_pages_are_packed_and_mapped_back_in_order():
+    model = FakeModel()
+    results = _extractor(model).batch_extract_schedules(
+        _pages(5), "mass", max_pages_per_request=2, rate_limiter=TokenBucket(1000, 1000)
+    )
+
+    assert len(model.prompts) == 3
+    assert [r["parish_id"] for r in results] == [0, 1, 2, 3, 4]
+    assert [r["times"] for r in results[:4]] == [[f"https://parish{i}.org/mass"] for i in range(4)]
+    assert results[4]["times"] == ["single"]  # a lone page uses the regular single-page prompt
+    assert all(r["schedule_type"] == "mass" for r in results)
+
+
+def test_page_missing_from_batch_answer_is_retried_alone():
+    model = FakeModel(skip_page_id="1")
+    results = _extractor(model).batch_extract_schedules(
+        _pages(2), "adoration", max_pages_per_request=2, rate_limiter=TokenBucket(1000, 1000)
+    )
+
+    assert len(model.prompts) == 2
+    assert results[0]["times"] == ["https://parish0.org/mass"]
+    assert results[1]["times"] == ["single"]
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=20, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    assert 0.08 <= elapsed < 0.5
+    assert not bucket.try_acquire()
+
+
+def test_default_rate_limiter_is_shared_across_calls():
+    limiter = get_ai_rate_limiter()
+
+    assert get_ai_rate_limiter() is limiter
+    assert limiter.rate > 0
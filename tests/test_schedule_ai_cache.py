@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed AI result cache in ScheduleAIExtractor.
+"""
+
+import json
+import threading
+
+from core import schedule_ai_extractor
+from core.intelligent_cache_manager import IntelligentCacheManager
+from core.schedule_ai_extractor import ScheduleAIExtractor
+from core.token_bucket import TokenBucket
+
+
+class CountingModel:
+    """Returns a fixed single-page answer and counts calls."""
+
+    def __init__(self, text=None):
+        self.calls = 0
+        self.text = text or json.dumps({"schedule_found": True, "times": ["3:30 PM"], "confidence_score": 85})
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        return type("Response", (), {"text": self.text})()
+
+
+def _extractor(model, cache, model_id="gemini-1.5-flash") -> ScheduleAIExtractor:
+    extractor = ScheduleAIExtractor.__new__(ScheduleAIExtractor)
+    extractor.model = model
+    extractor.model_id = model_id
+    extractor.ai_result_cache = cache
+    extractor._ai_cache_stats = {"hits": 0, "misses": 0, "stores": 0}
+    extractor._ai_cache_lock = threading.Lock()
+    return extractor
+
+
+def test_identical_content_is_answered_from_cache_across_restarts(tmp_path):
+    model = CountingModel()
+    first = _extractor(model, IntelligentCacheManager(cache_dir=str(tmp_path)))
+    original = first.extract_schedule_from_content("<p>Confession Saturday 3:30 PM</p>", "https://a.org/", "reconciliation")
+    first.ai_result_cache.close()
+
+    second = _extractor(model, IntelligentCacheManager(cache_dir=str(tmp_path)))
+    # Same text behind different markup and a different URL cleans to the same content
+    cached = second.extract_schedule_from_content(
+        "<div>Confession   Saturday 3:30 PM</div>", "https://b.org/", "reconciliation"
+    )
+
+    assert model.calls == 1
+    assert cached["cache_hit"] is True
+    assert cached["source_url"] == "https://b.org/"
+    assert cached["times"] == original["times"]
+    assert cached["confidence_score"] == 85
+    assert second.get_ai_cache_stats()["hit_rate"] == 1.0
+
+
+def test_schedule_type_model_and_prompt_changes_miss(tmp_path, monkeypatch):
+    model = CountingModel()
+    cache = IntelligentCacheManager(cache_dir=str(tmp_path))
+    content = "<p>Adoration and Confession Wednesday 6 PM</p>"
+
+    _extractor(model, cache).extract_schedule_from_content(content, "https://a.org/", "reconciliation")
+    _extractor(model, cache).extract_schedule_from_content(content, "https://a.org/", "adoration")
+    _extractor(model, cache, model_id="gemini-2.0-flash").extract_schedule_from_content(
+        content, "https://a.org/", "adoration"
+    )
+    monkeypatch.setattr(schedule_ai_extractor, "SCHEDULE_PROMPT_FINGERPRINT", "changed")
+    _extractor(model, cache).extract_schedule_from_content(content, "https://a.org/", "adoration")
+
+    assert model.calls == 4
+
+
+def test_failed_responses_are_not_cached(tmp_path):
+    model = CountingModel(text="not json")
+    extractor = _extractor(model, IntelligentCacheManager(cache_dir=str(tmp_path)))
+    for _ in range(2):
+        extractor.extract_schedule_from_content("<p>Mass 9 AM</p>", "https://a.org/", "mass")
+
+    assert model.calls == 2
+    assert extractor.get_ai_cache_stats()["stores"] == 0
+
+
+def test_batched_extraction_only_sends_uncached_pages(tmp_path):
+    model = CountingModel()
+    extractor = _extractor(model, IntelligentCacheManager(cache_dir=str(tmp_path)))
+    extractor.extract_schedule_from_content("<p>Mass 0</p>", "https://parish0.org/", "mass")
+
+    pages = [(f"https://parish{i}.org/", i, f"<p>Mass {i}</p>") for i in range(2)]
+    results = extractor.batch_extract_schedules(pages, "mass", max_pages_per_request=4, rate_limiter=TokenBucket(1000, 1000))
+
+    assert model.calls == 2  # the warm-up call plus one single-page call for parish1
+    assert extractor.get_ai_cache_stats()["misses"] == 2  # each uncached page is looked up once
+    assert results[0]["cache_hit"] is True and results[0]["parish_id"] == 0
+    assert "cache_hit" not in results[1]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for combined extraction of several schedule types from one page in a single AI request.
+"""
+
+import json
+import threading
+
+from core.intelligent_cache_manager import IntelligentCacheManager
+from core.schedule_ai_extractor import ScheduleAIExtractor
+from pipeline import extract_schedule
+from pipeline.extract_schedule import ParishCrawlState, _store_extractors
+
+PAGE = "<p>Confession Saturday 3:30 PM. Adoration Friday 9 AM. Sunday Mass 10 AM.</p>"
+
+
+class CombinedModel:
+    """Answers combined prompts with a fixed per-type answer and single prompts with a generic one."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.prompts = []
+
+    def generate_content(self, prompt):
+        self.prompts.append(prompt)
+        if "one entry per schedule type" in prompt:
+            text = json.dumps(self.answers)
+        else:
+            text = json.dumps({"schedule_found": True, "times": ["single"], "confidence_score": 70})
+        return type("Response", (), {"text": text})()
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquired = 0
+
+    def acquire(self, tokens=1.0):
+        self.acquired += tokens
+
+
+def _extractor(model, cache=None) -> ScheduleAIExtractor:
+    extractor = ScheduleAIExtractor.__new__(ScheduleAIExtractor)
+    extractor.model = model
+    extractor.model_id = "gemini-1.5-flash"
+    extractor.ai_result_cache = cache
+    extractor._ai_cache_stats = {"hits": 0, "misses": 0, "stores": 0}
+    extractor._ai_cache_lock = threading.Lock()
+    return extractor
+
+
+ANSWERS = {
+    "reconciliation": {"schedule_found": True, "times": ["3:30 PM"], "confidence_score": 90},
+    "adoration": {"schedule_found": True, "times": ["9:00 AM"], "confidence_score": 10},
+    "mass": {"schedule_found": False, "confidence_score": 0},
+}
+
+
+def test_all_types_come_from_one_request_and_are_cached_per_type(tmp_path):
+    model = CombinedModel(ANSWERS)
+    cache = IntelligentCacheManager(cache_dir=str(tmp_path))
+
+    results = _extractor(model, cache).extract_schedules_from_content(PAGE, "https://parish.org/", None)
+
+    assert len(model.prompts) == 1
+    assert list(results) == ["adoration", "reconciliation", "mass"]
+    assert {t: r["confidence_score"] for t, r in results.items()} == {"adoration": 10, "reconciliation": 90, "mass": 0}
+    assert all(r["schedule_type"] == t and r["url"] == "https://parish.org/" for t, r in results.items())
+
+    # The single-type entry point is answered from the combined request's cache entry
+    cached = _extractor(model, cache).extract_schedule_from_content(PAGE, "https://parish.org/", "reconciliation")
+    assert cached["cache_hit"] is True and cached["times"] == ["3:30 PM"]
+    assert len(model.prompts) == 1
+
+
+def test_type_missing_from_combined_answer_is_retried_alone():
+    model = CombinedModel({"reconciliation": ANSWERS["reconciliation"]})
+
+    results = _extractor(model).extract_schedules_from_content(PAGE, "https://parish.org/", ["reconciliation", "mass"])
+
+    assert len(model.prompts) == 2
+    assert "one entry per schedule type" not in model.prompts[1] and "ONLY Mass schedule" in model.prompts[1]
+    assert results["reconciliation"]["times"] == ["3:30 PM"]
+    assert results["mass"]["times"] == ["single"]
+
+
+def test_rate_limiter_is_taken_per_model_request_not_per_cache_hit(tmp_path):
+    model = CombinedModel({"reconciliation": ANSWERS["reconciliation"]})
+    cache = IntelligentCacheManager(cache_dir=str(tmp_path))
+    limiter = CountingLimiter()
+
+    _extractor(model, cache).extract_schedules_from_content(PAGE, "https://parish.org/", ["reconciliation", "mass"], limiter)
+    assert limiter.acquired == len(model.prompts) == 2
+
+    _extractor(model, cache).extract_schedules_from_content(PAGE, "https://parish.org/", ["reconciliation", "mass"], limiter)
+    assert limiter.acquired == 2
+
+
+def test_crawl_asks_the_ai_once_per_page_and_saves_confident_types(monkeypatch):
+    model = CombinedModel(ANSWERS)
+    saved = []
+    monkeypatch.setattr(extract_schedule, "get_ai_extractor", lambda: _extractor(model))
+    monkeypatch.setattr(extract_schedule, "get_supabase_client", lambda: None)
+    monkeypatch.setattr(extract_schedule, "save_ai_schedule_results", lambda supabase, results: saved.append(results))
+
+    state = ParishCrawlState(
+        url="https://parish.org/",
+        parish_id=3,
+        suppression_urls=set(),
+        base_domain="parish.org",
+        max_pages=10,
+        all_keywords={},
+        keyword_sets=(),
+    )
+    state.page_store.put("https://parish.org/schedule", PAGE.encode())
+    extract_fn, _ = _store_extractors(state)
+
+    results = {t: extract_fn("https://parish.org/schedule", t) for t in ["reconciliation", "adoration", "mass"]}
+    extract_fn("https://parish.org/schedule", "reconciliation")  # final extraction on the best page
+
+    assert len(model.prompts) == 1
+    assert results["reconciliation"] == (results["reconciliation"][0], True)
+    assert results["reconciliation"][0]["method"] == "ai_gemini"
+    # Adoration misses the adaptive threshold and falls back to keywords on the stored page
+    assert results["adoration"][1] is False and results["adoration"][0]["method"] == "keyword_extraction"
+    assert [[r["schedule_type"] for r in batch] for batch in saved] == [["reconciliation"]]
+    assert saved[0][0]["parish_id"] == 3
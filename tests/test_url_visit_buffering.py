@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for buffered, bulk visit recording in URLVisitTracker.
+"""
+
+import types
+
+from core.url_visit_tracker import URLVisitTracker, VisitTracker
+
+ENHANCED_ROW = {"id": 1, "url": "https://parish.org/", "parish_id": 7, "visited_at": None, "visit_count": 3}
+
+
+class FakeTable:
+    def __init__(self, db):
+        self.db = db
+
+    def select(self, columns):
+        return self
+
+    def limit(self, count):
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.db.calls.append(("upsert", rows))
+        return self
+
+    def execute(self):
+        return types.SimpleNamespace(data=[ENHANCED_ROW] if self.db.enhanced else [])
+
+
+class FakeSupabase:
+    def __init__(self, enhanced=True, rpc_installed=True, rpc_failures=0):
+        self.enhanced = enhanced
+        self.rpc_installed = rpc_installed
+        self.rpc_failures = rpc_failures
+        self.calls = []
+
+    def table(self, name):
+        return FakeTable(self)
+
+    def rpc(self, name, params):
+        self.calls.append((name, params["p_visits"]))
+        if not self.rpc_installed:
+            raise Exception("Could not find the function public.record_url_visits")
+        if self.rpc_failures:
+            self.rpc_failures -= 1
+            raise TimeoutError("read timed out")
+        return types.SimpleNamespace(execute=lambda: types.SimpleNamespace(data=len(params["p_visits"])))
+
+
+def _visit(tracker, url, parish_id=7, fail=False):
+    with VisitTracker(url, parish_id, tracker) as visit_result:
+        tracker.record_extraction_attempt(visit_result, not fail)
+
+
+def test_visits_are_buffered_until_the_parish_completes():
+    supabase = FakeSupabase()
+    tracker = URLVisitTracker(supabase)
+
+    _visit(tracker, "https://parish.org/")
+    _visit(tracker, "https://parish.org/confession")
+    _visit(tracker, "https://parish.org/", fail=True)
+    _visit(tracker, "https://other.org/", parish_id=8)
+    assert supabase.calls == []
+
+    assert tracker.flush(7)
+
+    [(name, rows)] = supabase.calls
+    assert name == "record_url_visits"
+    by_url = {row["url"]: row for row in rows}
+    assert set(by_url) == {"https://parish.org/", "https://parish.org/confession"}
+    # Repeat visits are merged: counts add up, the last success is kept
+    assert by_url["https://parish.org/"]["visit_count"] == 2
+    assert by_url["https://parish.org/"]["extraction_success"] is False
+    assert by_url["https://parish.org/"]["last_successful_visit"] is not None
+    assert tracker.get_pending_visit_count() == 1
+
+
+def test_full_buffer_flushes_and_missing_function_falls_back_to_upsert():
+    supabase = FakeSupabase(rpc_installed=False)
+    tracker = URLVisitTracker(supabase, max_buffered_visits=3)
+
+    for i in range(3):
+        _visit(tracker, f"https://parish.org/page-{i}", fail=i == 0)
+
+    assert [call[0] for call in supabase.calls] == ["record_url_visits", "upsert", "upsert"]
+    upserted = [row for name, rows in supabase.calls if name == "upsert" for row in rows]
+    assert len(upserted) == 3
+    assert "last_successful_visit" not in next(row for row in upserted if row["url"].endswith("page-0"))
+
+    _visit(tracker, "https://parish.org/page-3")
+    tracker.flush()
+    assert supabase.calls[-1][0] == "upsert"
+    assert sum(1 for name, _ in supabase.calls if name == "record_url_visits") == 1
+
+
+def test_transient_rpc_error_falls_back_once_and_keeps_the_rpc():
+    supabase = FakeSupabase(rpc_failures=1)
+    tracker = URLVisitTracker(supabase)
+
+    _visit(tracker, "https://parish.org/")
+    assert tracker.flush()
+    assert [call[0] for call in supabase.calls] == ["record_url_visits", "upsert"]
+
+    _visit(tracker, "https://parish.org/confession")
+    assert tracker.flush()
+    assert supabase.calls[-1][0] == "record_url_visits"